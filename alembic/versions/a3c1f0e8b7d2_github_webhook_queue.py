@@ -0,0 +1,109 @@
+"""github webhook queue
+
+Revision ID: a3c1f0e8b7d2
+Revises: 165d1c91bd7b
+Create Date: 2026-10-18 09:12:41.204318
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c1f0e8b7d2"
+down_revision: Union[str, None] = "165d1c91bd7b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    webhook_delivery_status = postgresql.ENUM(
+        "PENDING",
+        "PROCESSING",
+        "PROCESSED",
+        "SUPERSEDED",
+        "FAILED",
+        name="webhookdeliverystatus",
+        schema="private",
+    )
+    webhook_delivery_status.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "github_webhook_delivery",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("delivery_id", sa.String(), nullable=False),
+        sa.Column("event_type", sa.String(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column("repository_full_name", sa.String(), nullable=True),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                name="webhookdeliverystatus", schema="private", create_type=False
+            ),
+            nullable=False,
+            server_default="PENDING",
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column(
+            "received_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("delivery_id"),
+        schema="private",
+    )
+
+    op.create_index(
+        "ix_github_webhook_delivery_status",
+        "github_webhook_delivery",
+        ["status"],
+        schema="private",
+    )
+    op.create_index(
+        "ix_github_webhook_delivery_repository_full_name",
+        "github_webhook_delivery",
+        ["repository_full_name"],
+        schema="private",
+    )
+    # Worker claim query: oldest pending deliveries first
+    op.create_index(
+        "ix_github_webhook_delivery_pending_received_at",
+        "github_webhook_delivery",
+        ["received_at"],
+        schema="private",
+        postgresql_where=sa.text("status IN ('PENDING', 'PROCESSING')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_github_webhook_delivery_pending_received_at",
+        table_name="github_webhook_delivery",
+        schema="private",
+    )
+    op.drop_index(
+        "ix_github_webhook_delivery_repository_full_name",
+        table_name="github_webhook_delivery",
+        schema="private",
+    )
+    op.drop_index(
+        "ix_github_webhook_delivery_status",
+        table_name="github_webhook_delivery",
+        schema="private",
+    )
+    op.drop_table("github_webhook_delivery", schema="private")
+    op.execute("DROP TYPE IF EXISTS private.webhookdeliverystatus")
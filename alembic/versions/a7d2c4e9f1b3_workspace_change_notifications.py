@@ -0,0 +1,93 @@
+"""workspace change notifications
+
+Revision ID: a7d2c4e9f1b3
+Revises: f3c9a1d7e5b2
+Create Date: 2026-10-19 00:32:05.118274
+
+"""
+
+from textwrap import dedent
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d2c4e9f1b3"
+down_revision: Union[str, None] = "f3c9a1d7e5b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Workspace entities whose changes are pushed to the web app
+NOTIFYING_TABLES = [
+    "task",
+    "checklist",
+    "initiative",
+    "group",
+    "orderings",
+    "workspace_vision",
+    "strategic_pillars",
+    "product_outcomes",
+    "roadmap_themes",
+    "prioritized_roadmaps",
+    "strategic_initiatives",
+    "heroes",
+    "villains",
+    "conflicts",
+    "turning_points",
+]
+
+
+def upgrade() -> None:
+    # Postgres delivers notifications on commit and drops duplicates within a
+    # transaction, so a bulk change sends one notification per entity type
+    op.execute(
+        dedent(
+            """
+            CREATE OR REPLACE FUNCTION private.notify_workspace_change()
+            RETURNS trigger
+            LANGUAGE plpgsql
+            AS $$
+            DECLARE
+                changed jsonb := to_jsonb(COALESCE(NEW, OLD));
+                changed_workspace_id uuid;
+            BEGIN
+                IF TG_TABLE_NAME = 'checklist' THEN
+                    SELECT workspace_id INTO changed_workspace_id
+                    FROM dev.task
+                    WHERE id = (changed->>'task_id')::uuid;
+                ELSE
+                    changed_workspace_id := (changed->>'workspace_id')::uuid;
+                END IF;
+
+                IF changed_workspace_id IS NOT NULL THEN
+                    PERFORM pg_notify(
+                        'workspace_changes',
+                        json_build_object(
+                            'workspace_id', changed_workspace_id,
+                            'entity', TG_TABLE_NAME,
+                            'op', lower(TG_OP)
+                        )::text
+                    );
+                END IF;
+                RETURN NULL;
+            END;
+            $$;
+            """
+        )
+    )
+    for table in NOTIFYING_TABLES:
+        op.execute(
+            dedent(
+                f"""
+                CREATE TRIGGER notify_workspace_change
+                AFTER INSERT OR UPDATE OR DELETE ON dev."{table}"
+                FOR EACH ROW EXECUTE FUNCTION private.notify_workspace_change();
+                """
+            )
+        )
+
+
+def downgrade() -> None:
+    for table in NOTIFYING_TABLES:
+        op.execute(f'DROP TRIGGER notify_workspace_change ON dev."{table}"')
+    op.execute("DROP FUNCTION private.notify_workspace_change()")
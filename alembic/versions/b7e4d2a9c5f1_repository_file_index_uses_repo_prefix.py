@@ -0,0 +1,54 @@
+"""repository file index uses_repo_prefix
+
+Revision ID: b7e4d2a9c5f1
+Revises: a3c1f0e8b7d2
+Create Date: 2026-10-18 11:03:27.518903
+
+"""
+
+from textwrap import dedent
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4d2a9c5f1"
+down_revision: Union[str, None] = "a3c1f0e8b7d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "repository_file_index",
+        sa.Column(
+            "uses_repo_prefix",
+            sa.Boolean(),
+            server_default=sa.text("false"),
+            nullable=False,
+        ),
+        schema="private",
+    )
+
+    # Existing indexes were rendered with @RepoName/ prefixes whenever their
+    # installation had more than one indexed repository
+    op.execute(
+        dedent(
+            """
+            UPDATE private.repository_file_index AS rfi
+            SET uses_repo_prefix = counts.repo_count > 1
+            FROM (
+                SELECT github_installation_id, COUNT(*) AS repo_count
+                FROM private.repository_file_index
+                GROUP BY github_installation_id
+            ) AS counts
+            WHERE counts.github_installation_id = rfi.github_installation_id
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("repository_file_index", "uses_repo_prefix", schema="private")
@@ -0,0 +1,120 @@
+"""compress repository file index
+
+Revision ID: c2f8a6d1e4b9
+Revises: b7e4d2a9c5f1
+Create Date: 2026-10-18 13:26:54.730112
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import zstandard
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c2f8a6d1e4b9"
+down_revision: Union[str, None] = "b7e4d2a9c5f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 100
+ZSTD_LEVEL = 3
+
+
+def _convert_rows(select_sql: str, update_sql: str, convert) -> None:
+    """Rewrite rows in id order, one batch at a time."""
+    connection = op.get_bind()
+    last_id = None
+    while True:
+        rows = connection.execute(
+            sa.text(select_sql), {"last_id": last_id, "limit": BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            break
+        for row_id, value in rows:
+            connection.execute(sa.text(update_sql), {"id": row_id, **convert(value)})
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "repository_file_index",
+        sa.Column("compressed_file_search_string", sa.LargeBinary(), nullable=True),
+        schema="private",
+    )
+    op.add_column(
+        "repository_file_index",
+        sa.Column(
+            "file_count", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+        schema="private",
+    )
+    # The value is already compressed; skip TOAST's own pglz attempt
+    op.execute(
+        "ALTER TABLE private.repository_file_index "
+        "ALTER COLUMN compressed_file_search_string SET STORAGE EXTERNAL"
+    )
+
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    _convert_rows(
+        """
+        SELECT id, file_search_string FROM private.repository_file_index
+        WHERE :last_id IS NULL OR id > CAST(:last_id AS uuid)
+        ORDER BY id LIMIT :limit
+        """,
+        """
+        UPDATE private.repository_file_index
+        SET compressed_file_search_string = :compressed, file_count = :file_count
+        WHERE id = :id
+        """,
+        lambda value: {
+            "compressed": compressor.compress(value.encode("utf-8")),
+            "file_count": sum(1 for line in value.split("\n") if line),
+        },
+    )
+
+    op.alter_column(
+        "repository_file_index",
+        "compressed_file_search_string",
+        nullable=False,
+        schema="private",
+    )
+    op.drop_column("repository_file_index", "file_search_string", schema="private")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "repository_file_index",
+        sa.Column("file_search_string", sa.Text(), nullable=True),
+        schema="private",
+    )
+
+    decompressor = zstandard.ZstdDecompressor()
+    _convert_rows(
+        """
+        SELECT id, compressed_file_search_string FROM private.repository_file_index
+        WHERE :last_id IS NULL OR id > CAST(:last_id AS uuid)
+        ORDER BY id LIMIT :limit
+        """,
+        """
+        UPDATE private.repository_file_index
+        SET file_search_string = :file_search_string
+        WHERE id = :id
+        """,
+        lambda value: {
+            "file_search_string": decompressor.decompress(value).decode("utf-8")
+        },
+    )
+
+    op.alter_column(
+        "repository_file_index",
+        "file_search_string",
+        nullable=False,
+        schema="private",
+    )
+    op.drop_column("repository_file_index", "file_count", schema="private")
+    op.drop_column(
+        "repository_file_index", "compressed_file_search_string", schema="private"
+    )
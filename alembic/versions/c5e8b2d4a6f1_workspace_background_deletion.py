@@ -0,0 +1,187 @@
+"""workspace background deletion
+
+Revision ID: c5e8b2d4a6f1
+Revises: a7d2c4e9f1b3
+Create Date: 2026-10-19 09:14:27.530912
+
+"""
+
+from textwrap import dedent
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e8b2d4a6f1"
+down_revision: Union[str, None] = "a7d2c4e9f1b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Foreign keys followed by ON DELETE CASCADE / SET NULL when a workspace is
+# purged, which Postgres can only find without a scan if they are indexed,
+# as (index, schema, table, column)
+FOREIGN_KEY_INDEXES = [
+    ("ix_dev_task_initiative_id", "dev", "task", "initiative_id"),
+    ("ix_dev_checklist_task_id", "dev", "checklist", "task_id"),
+    ("ix_dev_checklist_user_id", "dev", "checklist", "user_id"),
+    ("ix_dev_context_document_user_id", "dev", "context_document", "user_id"),
+    (
+        "ix_dev_context_document_workspace_id",
+        "dev",
+        "context_document",
+        "workspace_id",
+    ),
+    (
+        "ix_dev_field_definition_initiative_id",
+        "dev",
+        "field_definition",
+        "initiative_id",
+    ),
+    ("ix_dev_field_definition_task_id", "dev", "field_definition", "task_id"),
+    ("ix_dev_group_parent_group_id", "dev", "group", "parent_group_id"),
+    ("ix_dev_initiative_group_group_id", "dev", "initiative_group", "group_id"),
+    ("ix_orderings_workspace_id", "dev", "orderings", "workspace_id"),
+    ("ix_conflicts_story_arc_id", "dev", "conflicts", "story_arc_id"),
+    (
+        "ix_conflicts_resolved_by_initiative_id",
+        "dev",
+        "conflicts",
+        "resolved_by_initiative_id",
+    ),
+    ("ix_turning_points_story_arc_id", "dev", "turning_points", "story_arc_id"),
+    ("ix_turning_points_initiative_id", "dev", "turning_points", "initiative_id"),
+    ("ix_turning_points_task_id", "dev", "turning_points", "task_id"),
+    (
+        "ix_workspace_projections_workspace_id",
+        "private",
+        "workspace_projections",
+        "workspace_id",
+    ),
+]
+
+# Tables whose rows belong to one workspace and are guarded by the user_id
+# policy, as (table, whether workspace_id is nullable); their rows are hidden
+# with the workspace while it is being purged. The workspace counters already
+# check dev.workspace, and domain_events outlive the workspace.
+WORKSPACE_SCOPED_TABLES = [
+    ("conflicts", False),
+    ("context_document", False),
+    ("field_definition", False),
+    ("group", False),
+    ("heroes", False),
+    ("initiative", False),
+    ("orderings", True),
+    ("prioritized_roadmaps", False),
+    ("product_outcomes", False),
+    ("roadmap_themes", False),
+    ("strategic_initiatives", False),
+    ("strategic_pillars", False),
+    ("task", False),
+    ("turning_points", False),
+    ("villains", False),
+    ("workspace_vision", False),
+]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workspace",
+        sa.Column("deleting_at", sa.DateTime(), nullable=True),
+        schema="dev",
+    )
+    op.add_column(
+        "users",
+        sa.Column("deleting_at", sa.DateTime(), nullable=True),
+        schema="private",
+    )
+
+    # A workspace being purged no longer counts towards the one-per-user limit
+    op.execute(
+        dedent(
+            """
+            DROP INDEX dev.unique_workspace_per_user;
+            CREATE UNIQUE INDEX unique_workspace_per_user ON dev.workspace(user_id)
+            WHERE deleting_at IS NULL;
+            """
+        )
+    )
+
+    # PostgREST reads go through RLS, so a marked workspace (and the rows in
+    # it) is hidden there as well, and it no longer blocks creating another
+    op.execute(
+        dedent(
+            """
+            ALTER POLICY workspace_policy ON dev.workspace
+            USING (
+                user_id = private.get_user_id_from_jwt() AND deleting_at IS NULL
+            );
+            ALTER POLICY no_multiple_workspace_for_user ON dev.workspace
+            WITH CHECK (
+                NOT EXISTS (
+                    SELECT 1 FROM dev.workspace AS ws
+                    WHERE ws.user_id = private.get_user_id_from_jwt()
+                        AND ws.deleting_at IS NULL
+                )
+            );
+            """
+        )
+    )
+    # The subquery is itself subject to the workspace policy above
+    for table, nullable in WORKSPACE_SCOPED_TABLES:
+        in_visible_workspace = "workspace_id IN (SELECT id FROM dev.workspace)"
+        if nullable:
+            in_visible_workspace = f"(workspace_id IS NULL OR {in_visible_workspace})"
+        op.execute(
+            dedent(
+                f"""
+                ALTER POLICY {table}_policy ON dev."{table}"
+                USING (
+                    user_id = private.get_user_id_from_jwt()
+                    AND {in_visible_workspace}
+                );
+                """
+            )
+        )
+
+    for name, schema, table, column in FOREIGN_KEY_INDEXES:
+        op.create_index(name, table, [column], schema=schema, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, schema, table, _ in reversed(FOREIGN_KEY_INDEXES):
+        op.drop_index(name, table_name=table, schema=schema, if_exists=True)
+
+    for table, _ in WORKSPACE_SCOPED_TABLES:
+        op.execute(
+            f'ALTER POLICY {table}_policy ON dev."{table}" '
+            "USING (user_id = private.get_user_id_from_jwt())"
+        )
+    op.execute(
+        dedent(
+            """
+            ALTER POLICY workspace_policy ON dev.workspace
+            USING (user_id = private.get_user_id_from_jwt());
+            ALTER POLICY no_multiple_workspace_for_user ON dev.workspace
+            WITH CHECK (
+                NOT EXISTS (
+                    SELECT 1 FROM dev.workspace AS ws
+                    WHERE ws.user_id = private.get_user_id_from_jwt()
+                )
+            );
+            """
+        )
+    )
+
+    op.execute(
+        dedent(
+            """
+            DROP INDEX dev.unique_workspace_per_user;
+            CREATE UNIQUE INDEX unique_workspace_per_user ON dev.workspace(user_id)
+            WHERE id IS NOT NULL;
+            """
+        )
+    )
+    op.drop_column("users", "deleting_at", schema="private")
+    op.drop_column("workspace", "deleting_at", schema="dev")
@@ -0,0 +1,42 @@
+"""github installation repository cache
+
+Revision ID: d5a3e7c9b1f2
+Revises: c2f8a6d1e4b9
+Create Date: 2026-10-18 15:42:08.113094
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a3e7c9b1f2"
+down_revision: Union[str, None] = "c2f8a6d1e4b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "github_installation",
+        sa.Column(
+            "repositories_cache",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+        ),
+        schema="private",
+    )
+    op.add_column(
+        "github_installation",
+        sa.Column("repositories_cached_at", sa.DateTime(), nullable=True),
+        schema="private",
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("github_installation", "repositories_cached_at", schema="private")
+    op.drop_column("github_installation", "repositories_cache", schema="private")
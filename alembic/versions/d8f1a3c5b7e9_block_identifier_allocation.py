@@ -0,0 +1,141 @@
+"""block identifier allocation
+
+Revision ID: d8f1a3c5b7e9
+Revises: c5e8b2d4a6f1
+Create Date: 2026-10-19 11:02:48.204417
+
+"""
+
+from textwrap import dedent
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d8f1a3c5b7e9"
+down_revision: Union[str, None] = "c5e8b2d4a6f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Identifier triggers, as (entity, prefix, counter table, owner column, width)
+IDENTIFIER_TRIGGERS = [
+    ("initiative", "I-", "user_initiative_counter", "user_id", 3),
+    ("task", "TM-", "user_task_counter", "user_id", 3),
+    ("pillar", "P-", "user_pillar_counter", "user_id", 3),
+    ("outcome", "O-", "user_outcome_counter", "user_id", 3),
+    ("theme", "T-", "user_theme_counter", "user_id", 3),
+    ("hero", "H-", "user_hero_counter", "user_id", 3),
+    ("villain", "V-", "user_villain_counter", "user_id", 3),
+    ("conflict", "C-", "user_conflict_counter", "user_id", 3),
+    ("turning_point", "TP-", "workspace_turning_point_counter", "workspace_id", 4),
+]
+
+
+def upgrade() -> None:
+    op.execute(
+        dedent(
+            """
+            -- Reserve a block of identifier numbers in one counter update.
+            -- Returns the last number in use before the block, so the block
+            -- is (returned value + 1) .. (returned value + amount).
+            CREATE FUNCTION dev.reserve_identifiers(
+                counter text, owner_id uuid, amount integer
+            ) RETURNS bigint AS $$
+            DECLARE
+                owner_column text := CASE
+                    WHEN counter LIKE 'workspace\\_%' THEN 'workspace_id'
+                    ELSE 'user_id'
+                END;
+                reserved bigint;
+            BEGIN
+                EXECUTE format(
+                    'INSERT INTO dev.%1$I AS c (%2$I, last_value) VALUES ($1, $2)
+                     ON CONFLICT (%2$I) DO UPDATE
+                     SET last_value = c.last_value + EXCLUDED.last_value
+                     RETURNING c.last_value',
+                    counter, owner_column
+                )
+                INTO reserved
+                USING owner_id, amount;
+                RETURN reserved - amount;
+            END;
+            $$ LANGUAGE plpgsql;
+
+            -- Zero-padded to at least width digits, e.g. ('TM-', 7, 3) -> 'TM-007'
+            CREATE FUNCTION dev.format_identifier(
+                prefix text, value bigint, width integer
+            ) RETURNS text AS $$
+                SELECT prefix || lpad(value::text, greatest(width, length(value::text)), '0')
+            $$ LANGUAGE sql IMMUTABLE;
+            """
+        )
+    )
+
+    for entity, prefix, counter, owner, width in IDENTIFIER_TRIGGERS:
+        op.execute(
+            dedent(
+                f"""
+                CREATE OR REPLACE FUNCTION dev.set_{entity}_identifier()
+                RETURNS trigger AS $$
+                BEGIN
+                    -- If identifier is already supplied (e.g. reserved in bulk), skip
+                    IF NEW.identifier IS NOT NULL AND NEW.identifier != '' THEN
+                        RETURN NEW;
+                    END IF;
+
+                    -- Ensure user_id is set from JWT if not already set
+                    IF NEW.user_id IS NULL THEN
+                        NEW.user_id = private.get_user_id_from_jwt();
+                    END IF;
+
+                    NEW.identifier = dev.format_identifier(
+                        '{prefix}',
+                        dev.reserve_identifiers('{counter}', NEW.{owner}, 1) + 1,
+                        {width}
+                    );
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+
+
+def downgrade() -> None:
+    for entity, prefix, counter, owner, width in IDENTIFIER_TRIGGERS:
+        op.execute(
+            dedent(
+                f"""
+                CREATE OR REPLACE FUNCTION dev.set_{entity}_identifier()
+                RETURNS trigger AS $$
+                DECLARE
+                    new_value INT;
+                BEGIN
+                    IF NEW.identifier IS NOT NULL AND NEW.identifier != '' THEN
+                        RETURN NEW;
+                    END IF;
+
+                    IF NEW.user_id IS NULL THEN
+                        NEW.user_id = private.get_user_id_from_jwt();
+                    END IF;
+
+                    INSERT INTO dev.{counter}({owner}, last_value)
+                        VALUES (NEW.{owner}, 0)
+                        ON CONFLICT ({owner}) DO NOTHING;
+
+                    UPDATE dev.{counter}
+                        SET last_value = last_value + 1
+                        WHERE {owner} = NEW.{owner}
+                        RETURNING last_value INTO new_value;
+
+                    NEW.identifier = '{prefix}' || to_char(new_value, 'FM{"0" * width}');
+
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+
+    op.execute("DROP FUNCTION dev.format_identifier(text, bigint, integer)")
+    op.execute("DROP FUNCTION dev.reserve_identifiers(text, uuid, integer)")
@@ -0,0 +1,176 @@
+"""statement level workspace change notifications
+
+Revision ID: e2b7c9d4f6a8
+Revises: d8f1a3c5b7e9
+Create Date: 2026-10-19 14:21:37.562019
+
+"""
+
+from textwrap import dedent
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7c9d4f6a8"
+down_revision: Union[str, None] = "d8f1a3c5b7e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Workspace entities whose changes are pushed to the web app
+NOTIFYING_TABLES = [
+    "task",
+    "checklist",
+    "initiative",
+    "group",
+    "orderings",
+    "workspace_vision",
+    "strategic_pillars",
+    "product_outcomes",
+    "roadmap_themes",
+    "prioritized_roadmaps",
+    "strategic_initiatives",
+    "heroes",
+    "villains",
+    "conflicts",
+    "turning_points",
+]
+
+# Transition tables can only be declared on single-event triggers, so each
+# table gets one trigger per operation, as (operation, REFERENCING clause)
+STATEMENT_TRIGGERS = [
+    ("insert", "NEW TABLE AS new_rows"),
+    ("update", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("delete", "OLD TABLE AS old_rows"),
+]
+
+
+def upgrade() -> None:
+    # The row-level triggers ran once per changed row and relied on
+    # pg_notify's deduplication at commit; these run once per statement and
+    # send one notification per (workspace, table) from the transition tables.
+    # Queries on new_rows/old_rows are only planned in the branch TG_OP
+    # reaches, so each trigger only sees the tables it declares.
+    op.execute(
+        dedent(
+            """
+            CREATE OR REPLACE FUNCTION private.notify_workspace_changes()
+            RETURNS trigger
+            LANGUAGE plpgsql
+            AS $$
+            DECLARE
+                changed_workspace_ids uuid[] := '{}';
+                changed_workspace_id uuid;
+            BEGIN
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    IF TG_TABLE_NAME = 'checklist' THEN
+                        changed_workspace_ids := changed_workspace_ids || ARRAY(
+                            SELECT t.workspace_id
+                            FROM new_rows r JOIN dev.task t ON t.id = r.task_id
+                        );
+                    ELSE
+                        changed_workspace_ids := changed_workspace_ids || ARRAY(
+                            SELECT workspace_id FROM new_rows
+                        );
+                    END IF;
+                END IF;
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    IF TG_TABLE_NAME = 'checklist' THEN
+                        changed_workspace_ids := changed_workspace_ids || ARRAY(
+                            SELECT t.workspace_id
+                            FROM old_rows r JOIN dev.task t ON t.id = r.task_id
+                        );
+                    ELSE
+                        changed_workspace_ids := changed_workspace_ids || ARRAY(
+                            SELECT workspace_id FROM old_rows
+                        );
+                    END IF;
+                END IF;
+
+                FOR changed_workspace_id IN
+                    SELECT DISTINCT id FROM unnest(changed_workspace_ids) AS id
+                    WHERE id IS NOT NULL
+                LOOP
+                    PERFORM pg_notify(
+                        'workspace_changes',
+                        json_build_object(
+                            'workspace_id', changed_workspace_id,
+                            'entity', TG_TABLE_NAME,
+                            'op', lower(TG_OP)
+                        )::text
+                    );
+                END LOOP;
+                RETURN NULL;
+            END;
+            $$;
+            """
+        )
+    )
+    for table in NOTIFYING_TABLES:
+        op.execute(f'DROP TRIGGER notify_workspace_change ON dev."{table}"')
+        for operation, referencing in STATEMENT_TRIGGERS:
+            op.execute(
+                dedent(
+                    f"""
+                    CREATE TRIGGER notify_workspace_change_{operation}
+                    AFTER {operation.upper()} ON dev."{table}"
+                    REFERENCING {referencing}
+                    FOR EACH STATEMENT
+                    EXECUTE FUNCTION private.notify_workspace_changes();
+                    """
+                )
+            )
+    op.execute("DROP FUNCTION private.notify_workspace_change()")
+
+
+def downgrade() -> None:
+    op.execute(
+        dedent(
+            """
+            CREATE OR REPLACE FUNCTION private.notify_workspace_change()
+            RETURNS trigger
+            LANGUAGE plpgsql
+            AS $$
+            DECLARE
+                changed jsonb := to_jsonb(COALESCE(NEW, OLD));
+                changed_workspace_id uuid;
+            BEGIN
+                IF TG_TABLE_NAME = 'checklist' THEN
+                    SELECT workspace_id INTO changed_workspace_id
+                    FROM dev.task
+                    WHERE id = (changed->>'task_id')::uuid;
+                ELSE
+                    changed_workspace_id := (changed->>'workspace_id')::uuid;
+                END IF;
+
+                IF changed_workspace_id IS NOT NULL THEN
+                    PERFORM pg_notify(
+                        'workspace_changes',
+                        json_build_object(
+                            'workspace_id', changed_workspace_id,
+                            'entity', TG_TABLE_NAME,
+                            'op', lower(TG_OP)
+                        )::text
+                    );
+                END IF;
+                RETURN NULL;
+            END;
+            $$;
+            """
+        )
+    )
+    for table in NOTIFYING_TABLES:
+        for operation, _ in STATEMENT_TRIGGERS:
+            op.execute(
+                f'DROP TRIGGER notify_workspace_change_{operation} ON dev."{table}"'
+            )
+        op.execute(
+            dedent(
+                f"""
+                CREATE TRIGGER notify_workspace_change
+                AFTER INSERT OR UPDATE OR DELETE ON dev."{table}"
+                FOR EACH ROW EXECUTE FUNCTION private.notify_workspace_change();
+                """
+            )
+        )
+    op.execute("DROP FUNCTION private.notify_workspace_changes()")
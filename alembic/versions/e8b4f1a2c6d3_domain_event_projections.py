@@ -0,0 +1,102 @@
+"""domain event projections
+
+Revision ID: e8b4f1a2c6d3
+Revises: d5a3e7c9b1f2
+Create Date: 2026-10-18 22:10:37.402118
+
+"""
+
+from textwrap import dedent
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b4f1a2c6d3"
+down_revision: Union[str, None] = "d5a3e7c9b1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing events get this migration's transaction id and a position in
+    # the order they occurred
+    op.execute(
+        dedent(
+            """
+            ALTER TABLE dev.domain_events
+                ADD COLUMN transaction_id xid8 NOT NULL DEFAULT pg_current_xact_id(),
+                ADD COLUMN position bigint;
+
+            UPDATE dev.domain_events AS e
+            SET position = ordered.position
+            FROM (
+                SELECT id, row_number() OVER (ORDER BY occurred_at, id) AS position
+                FROM dev.domain_events
+            ) AS ordered
+            WHERE e.id = ordered.id;
+
+            ALTER TABLE dev.domain_events ALTER COLUMN position SET NOT NULL;
+            ALTER TABLE dev.domain_events
+                ALTER COLUMN position ADD GENERATED BY DEFAULT AS IDENTITY;
+            SELECT setval(
+                pg_get_serial_sequence('dev.domain_events', 'position'),
+                COALESCE((SELECT max(position) FROM dev.domain_events), 0) + 1,
+                false
+            );
+            """
+        )
+    )
+    op.create_index(
+        "ix_domain_events_transaction_id_position",
+        "domain_events",
+        ["transaction_id", "position"],
+        schema="dev",
+    )
+
+    # sqlalchemy has no xid8 type, so this table is created in SQL
+    op.execute(
+        dedent(
+            """
+            CREATE TABLE private.projection_checkpoints (
+                projection_name varchar(100) PRIMARY KEY,
+                last_transaction_id xid8 NOT NULL DEFAULT '0'::xid8,
+                last_position bigint NOT NULL DEFAULT 0,
+                updated_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP
+            );
+            """
+        )
+    )
+
+    op.create_table(
+        "workspace_projections",
+        sa.Column("projection_name", sa.String(length=100), nullable=False),
+        sa.Column("workspace_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("data", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["workspace_id"], ["dev.workspace.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("projection_name", "workspace_id"),
+        schema="private",
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("workspace_projections", schema="private")
+    op.drop_table("projection_checkpoints", schema="private")
+    op.drop_index(
+        "ix_domain_events_transaction_id_position",
+        table_name="domain_events",
+        schema="dev",
+    )
+    op.drop_column("domain_events", "position", schema="dev")
+    op.drop_column("domain_events", "transaction_id", schema="dev")
@@ -0,0 +1,244 @@
+"""partition domain events by month
+
+Revision ID: f3c9a1d7e5b2
+Revises: e8b4f1a2c6d3
+Create Date: 2026-10-18 23:41:12.530917
+
+"""
+
+from textwrap import dedent
+from typing import Sequence, Union
+
+from alembic import op
+from src.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "f3c9a1d7e5b2"
+down_revision: Union[str, None] = "e8b4f1a2c6d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Aggregates whose events are attributed to the aggregate's workspace
+AGGREGATE_TABLES = [
+    "workspace_vision",
+    "strategic_pillars",
+    "product_outcomes",
+    "roadmap_themes",
+    "prioritized_roadmaps",
+    "heroes",
+    "villains",
+    "conflicts",
+    "strategic_initiatives",
+]
+
+COLUMNS = (
+    "id, user_id, event_type, aggregate_id, occurred_at, payload, "
+    "transaction_id, position"
+)
+
+
+def upgrade() -> None:
+    # A unique index on a partitioned table must contain the partition key, so
+    # turning points can no longer reference events by id with a foreign key
+    op.execute(
+        dedent(
+            """
+            ALTER TABLE dev.turning_points
+                DROP CONSTRAINT turning_points_domain_event_id_fkey;
+            ALTER TABLE dev.turning_points
+                ALTER COLUMN domain_event_id DROP NOT NULL;
+
+            ALTER TABLE dev.domain_events RENAME TO domain_events_unpartitioned;
+            ALTER TABLE dev.domain_events_unpartitioned
+                RENAME CONSTRAINT domain_events_pkey
+                TO domain_events_unpartitioned_pkey;
+            DROP INDEX dev.ix_domain_events_aggregate_id;
+            DROP INDEX dev.ix_domain_events_event_type;
+            DROP INDEX dev.ix_domain_events_occurred_at;
+            DROP INDEX dev.ix_domain_events_transaction_id_position;
+
+            CREATE TABLE dev.domain_events (
+                user_id uuid NOT NULL DEFAULT private.get_user_id_from_jwt(),
+                id uuid NOT NULL DEFAULT gen_random_uuid(),
+                event_type varchar(100) NOT NULL,
+                aggregate_id uuid NOT NULL,
+                workspace_id uuid,
+                occurred_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                payload jsonb NOT NULL,
+                transaction_id xid8 NOT NULL DEFAULT pg_current_xact_id(),
+                position bigint NOT NULL GENERATED BY DEFAULT AS IDENTITY,
+                CONSTRAINT domain_events_pkey PRIMARY KEY (id, occurred_at)
+            ) PARTITION BY RANGE (occurred_at);
+
+            -- Catches events outside the monthly partitions created ahead of
+            -- time; maintain_domain_events moves them into their month
+            CREATE TABLE dev.domain_events_default
+                PARTITION OF dev.domain_events DEFAULT;
+
+            DO $$
+            DECLARE
+                month date := date_trunc(
+                    'month',
+                    LEAST(
+                        (SELECT min(occurred_at) FROM dev.domain_events_unpartitioned),
+                        CURRENT_TIMESTAMP
+                    )
+                );
+                last_month date := date_trunc('month', CURRENT_TIMESTAMP)
+                    + interval '3 months';
+            BEGIN
+                WHILE month <= last_month LOOP
+                    EXECUTE format(
+                        'CREATE TABLE dev.%I PARTITION OF dev.domain_events '
+                        'FOR VALUES FROM (%L) TO (%L)',
+                        'domain_events_' || to_char(month, 'YYYY_MM'),
+                        month,
+                        month + interval '1 month'
+                    );
+                    month := month + interval '1 month';
+                END LOOP;
+            END $$;
+            """
+        )
+    )
+
+    aggregates = "\n                UNION ALL ".join(
+        f"SELECT id, workspace_id FROM dev.{table}" for table in AGGREGATE_TABLES
+    )
+    # Events of deleted aggregates fall back to the workspace in their payload
+    op.execute(
+        dedent(
+            f"""
+            INSERT INTO dev.domain_events ({COLUMNS}, workspace_id)
+            SELECT e.id, e.user_id, e.event_type, e.aggregate_id, e.occurred_at,
+                e.payload, e.transaction_id, e.position,
+                COALESCE(
+                    a.workspace_id,
+                    CASE
+                        WHEN e.payload->>'workspace_id' ~* '^[0-9a-f]{{8}}-[0-9a-f]{{4}}-[0-9a-f]{{4}}-[0-9a-f]{{4}}-[0-9a-f]{{12}}$'
+                        THEN (e.payload->>'workspace_id')::uuid
+                    END
+                )
+            FROM dev.domain_events_unpartitioned AS e
+            LEFT JOIN (
+                {aggregates}
+            ) AS a ON a.id = e.aggregate_id;
+
+            SELECT setval(
+                pg_get_serial_sequence('dev.domain_events', 'position'),
+                COALESCE(
+                    (SELECT max(position) FROM dev.domain_events_unpartitioned), 0
+                ) + 1,
+                false
+            );
+
+            DROP TABLE dev.domain_events_unpartitioned;
+            """
+        )
+    )
+
+    _create_indexes()
+    _secure_table()
+
+
+def downgrade() -> None:
+    op.execute(
+        dedent(
+            f"""
+            ALTER TABLE dev.domain_events RENAME TO domain_events_partitioned;
+            ALTER TABLE dev.domain_events_partitioned
+                RENAME CONSTRAINT domain_events_pkey
+                TO domain_events_partitioned_pkey;
+            DROP INDEX dev.ix_domain_events_aggregate_id;
+            DROP INDEX dev.ix_domain_events_event_type;
+            DROP INDEX dev.ix_domain_events_occurred_at;
+            DROP INDEX dev.ix_domain_events_transaction_id_position;
+            DROP INDEX dev.ix_domain_events_workspace_id_occurred_at;
+
+            CREATE TABLE dev.domain_events (
+                user_id uuid NOT NULL DEFAULT private.get_user_id_from_jwt(),
+                id uuid NOT NULL DEFAULT gen_random_uuid(),
+                event_type varchar(100) NOT NULL,
+                aggregate_id uuid NOT NULL,
+                occurred_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                payload jsonb NOT NULL,
+                transaction_id xid8 NOT NULL DEFAULT pg_current_xact_id(),
+                position bigint NOT NULL GENERATED BY DEFAULT AS IDENTITY,
+                CONSTRAINT domain_events_pkey PRIMARY KEY (id)
+            );
+
+            INSERT INTO dev.domain_events ({COLUMNS})
+            SELECT {COLUMNS} FROM dev.domain_events_partitioned;
+
+            SELECT setval(
+                pg_get_serial_sequence('dev.domain_events', 'position'),
+                COALESCE((SELECT max(position) FROM dev.domain_events), 0) + 1,
+                false
+            );
+
+            DROP TABLE dev.domain_events_partitioned;
+
+            DELETE FROM dev.turning_points AS t
+            WHERE NOT EXISTS (
+                SELECT 1 FROM dev.domain_events AS e WHERE e.id = t.domain_event_id
+            );
+            ALTER TABLE dev.turning_points
+                ALTER COLUMN domain_event_id SET NOT NULL;
+            ALTER TABLE dev.turning_points
+                ADD CONSTRAINT turning_points_domain_event_id_fkey
+                FOREIGN KEY (domain_event_id) REFERENCES dev.domain_events (id)
+                ON DELETE CASCADE;
+            """
+        )
+    )
+
+    _create_indexes(with_workspace=False)
+    _secure_table()
+
+
+def _create_indexes(with_workspace: bool = True) -> None:
+    op.create_index(
+        "ix_domain_events_aggregate_id", "domain_events", ["aggregate_id"], schema="dev"
+    )
+    op.create_index(
+        "ix_domain_events_event_type", "domain_events", ["event_type"], schema="dev"
+    )
+    op.create_index(
+        "ix_domain_events_occurred_at",
+        "domain_events",
+        ["occurred_at"],
+        schema="dev",
+        postgresql_using="btree",
+        postgresql_ops={"occurred_at": "DESC"},
+    )
+    op.create_index(
+        "ix_domain_events_transaction_id_position",
+        "domain_events",
+        ["transaction_id", "position"],
+        schema="dev",
+    )
+    if with_workspace:
+        op.create_index(
+            "ix_domain_events_workspace_id_occurred_at",
+            "domain_events",
+            ["workspace_id", "occurred_at", "id"],
+            schema="dev",
+            postgresql_using="btree",
+            postgresql_ops={"occurred_at": "DESC", "id": "DESC"},
+        )
+
+
+def _secure_table() -> None:
+    op.execute(
+        dedent(
+            f"""
+            ALTER TABLE dev.domain_events ENABLE ROW LEVEL SECURITY;
+
+            CREATE POLICY domain_events_policy ON dev.domain_events
+                USING (user_id = private.get_user_id_from_jwt())
+                WITH CHECK (user_id = private.get_user_id_from_jwt());
+
+            GRANT SELECT, UPDATE, DELETE, INSERT ON TABLE dev.domain_events TO {settings.postgrest_authenticated_role};
+            """
+        )
+    )
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark task inserts for one user from parallel sessions.
+
+Compares the ways identifiers can be numbered:
+
+- trigger: rows are inserted without identifiers, so the per-row trigger
+  takes one number (and the counter row lock) per row
+- block: each batch reserves its identifiers in one counter update, in the
+  transaction of the insert
+- block-ahead: each batch reserves its identifiers in a short transaction of
+  its own, so the inserts themselves never wait on the counter row
+
+Usage:
+    ENVIRONMENT=test python scripts/benchmark_identifier_allocation.py \\
+        --sessions 8 --batches 20 --batch-size 100
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+# Add the project root directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import text  # noqa: E402
+
+from src.db import SessionLocal  # noqa: E402
+from src.models import Initiative, User, Workspace  # noqa: E402
+from src.services.identifier_service import reserve_identifiers  # noqa: E402
+from src.services.workspace_deletion_service import purge_user  # noqa: E402
+
+MODES = ("trigger", "block", "block-ahead")
+
+INSERT_TASKS = text(
+    """
+    INSERT INTO dev.task (
+        id, identifier, title, status, user_id, workspace_id, initiative_id,
+        created_at, updated_at
+    )
+    SELECT
+        gen_random_uuid(),
+        CASE WHEN CAST(:base AS bigint) IS NULL THEN NULL
+             ELSE dev.format_identifier('TM-', :base + n, 3) END,
+        'Benchmark task ' || n,
+        'TO_DO',
+        :user_id,
+        :workspace_id,
+        :initiative_id,
+        now(),
+        now()
+    FROM generate_series(1, :count) AS n
+    """
+)
+
+
+def insert_batches(mode: str, params: dict, batches: int, batch_size: int) -> None:
+    db = SessionLocal()
+    try:
+        for _ in range(batches):
+            base = None
+            if mode == "block-ahead":
+                reserve_db = SessionLocal()
+                try:
+                    base = reserve_identifiers(
+                        reserve_db, "user_task_counter", params["user_id"], batch_size
+                    )
+                    reserve_db.commit()
+                finally:
+                    reserve_db.close()
+            elif mode == "block":
+                base = reserve_identifiers(
+                    db, "user_task_counter", params["user_id"], batch_size
+                )
+            db.execute(INSERT_TASKS, {**params, "base": base, "count": batch_size})
+            db.commit()
+    finally:
+        db.close()
+
+
+def run(mode: str, params: dict, sessions: int, batches: int, batch_size: int):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        futures = [
+            pool.submit(insert_batches, mode, params, batches, batch_size)
+            for _ in range(sessions)
+        ]
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - started
+    rows = sessions * batches * batch_size
+    print(f"{mode:<12} {rows:>8} rows  {elapsed:>7.2f}s  {rows / elapsed:>9.0f} rows/s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    user = User(
+        id=uuid.uuid4(),
+        name="Identifier benchmark",
+        email=f"identifier-benchmark-{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password="",
+        is_active=False,
+        is_superuser=False,
+        is_verified=False,
+        last_logged_in=datetime.now(),
+    )
+    db.add(user)
+    db.commit()
+    workspace = Workspace(name="Identifier benchmark", user_id=user.id)
+    db.add(workspace)
+    db.commit()
+    initiative = Initiative(
+        title="Benchmark", description="", user_id=user.id, workspace_id=workspace.id
+    )
+    db.add(initiative)
+    db.commit()
+    params = {
+        "user_id": user.id,
+        "workspace_id": workspace.id,
+        "initiative_id": initiative.id,
+    }
+
+    try:
+        print(
+            f"{args.sessions} sessions x {args.batches} batches x "
+            f"{args.batch_size} tasks, one user"
+        )
+        for mode in MODES:
+            run(mode, params, args.sessions, args.batches, args.batch_size)
+
+        duplicates = db.execute(
+            text(
+                """
+                SELECT count(*) - count(DISTINCT identifier)
+                FROM dev.task WHERE user_id = :user_id
+                """
+            ),
+            params,
+        ).scalar_one()
+        print(f"duplicate identifiers: {duplicates}")
+    finally:
+        purge_user(db, user.id)
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,16 @@
+import asyncio
 from enum import Enum
 from typing import Optional
 
-from fastapi import Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import BackgroundTasks, Depends, HTTPException, UploadFile
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, ConfigDict, field_validator
+from sse_starlette import EventSourceResponse
+from starlette.concurrency import run_in_threadpool
 
 from src import controller
+from src.change_feed import change_feed
+from src.config import settings
 from src.db import get_db
 from src.main import app
 from src.views import dependency_to_override
@@ -199,6 +204,85 @@ async def create_workspace(
     )
 
 
+@app.post("/api/workspaces/from-template", response_model=WorkspaceResponse)
+def create_workspace_from_template(
+    workspace: WorkspaceCreate,
+    user=Depends(dependency_to_override),
+    session=Depends(get_db),
+) -> WorkspaceResponse:
+    """Create a workspace as a copy of the template workspace.
+
+    The template's initiatives, tasks, strategy and narrative are copied in
+    the database, in one transaction. A plain ``def``, so FastAPI runs the
+    synchronous clone in its threadpool instead of on the event loop.
+    """
+    try:
+        new_workspace = controller.create_workspace_from_template(
+            user=user,
+            name=workspace.name,
+            description=workspace.description,
+            icon=workspace.icon,
+            db=session,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return WorkspaceResponse(
+        id=str(new_workspace.id),
+        name=new_workspace.name,
+        description=new_workspace.description,
+        icon=new_workspace.icon,
+    )
+
+
+@app.post("/api/workspaces/import", response_model=WorkspaceResponse)
+async def import_workspace(
+    file: UploadFile,
+    user=Depends(dependency_to_override),
+    session=Depends(get_db),
+) -> WorkspaceResponse:
+    """Restore a workspace export (NDJSON, optionally zstd-compressed)."""
+    try:
+        # Reading and restoring the export blocks; keep it off the event loop
+        workspace = await run_in_threadpool(
+            controller.import_workspace, user=user, file=file.file, db=session
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return WorkspaceResponse(
+        id=str(workspace.id),
+        name=workspace.name,
+        description=workspace.description,
+        icon=workspace.icon,
+    )
+
+
+@app.get("/api/workspaces/{workspace_id}/export")
+async def export_workspace(
+    workspace_id: str,
+    compression: Optional[str] = None,
+    user=Depends(dependency_to_override),
+    session=Depends(get_db),
+) -> StreamingResponse:
+    """Stream a workspace as NDJSON, zstd-compressed with ``?compression=zstd``."""
+    if compression not in (None, "zstd"):
+        raise HTTPException(status_code=400, detail="Unsupported compression")
+    try:
+        controller.get_user_workspace(user=user, workspace_id=workspace_id, db=session)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    session.close()
+
+    compressed = compression == "zstd"
+    filename = f"workspace-{workspace_id}.ndjson" + (".zst" if compressed else "")
+    return StreamingResponse(
+        controller.stream_workspace_export(workspace_id, compressed),
+        media_type="application/zstd" if compressed else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @app.post("/api/workspace", response_class=JSONResponse)
 async def update_workspace(
     workspace: WorkspaceUpdate,
@@ -214,8 +298,39 @@ async def update_workspace(
 @app.delete("/api/workspace/{workspace_id}", response_class=JSONResponse)
 async def delete_workspace(
     workspace_id: str,
+    background_tasks: BackgroundTasks,
     user=Depends(dependency_to_override),
     session=Depends(get_db),
 ) -> JSONResponse:
-    controller.delete_workspace(user=user, workspace_id=workspace_id, db=session)
+    controller.delete_workspace(
+        user=user,
+        workspace_id=workspace_id,
+        db=session,
+        background_tasks=background_tasks,
+    )
     return JSONResponse(content={})
+
+
+@app.get("/api/workspaces/{workspace_id}/changes")
+async def stream_workspace_changes(
+    workspace_id: str,
+    user=Depends(dependency_to_override),
+    session=Depends(get_db),
+) -> EventSourceResponse:
+    """Stream change notifications of a workspace as server-sent events."""
+    try:
+        controller.get_user_workspace(user=user, workspace_id=workspace_id, db=session)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    # Streams stay open for long; do not hold a database connection meanwhile
+    session.close()
+    # Connect before the response starts, while a failure can still be a 503
+    try:
+        await change_feed.start()
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="Change feed unavailable")
+
+    return EventSourceResponse(
+        controller.stream_workspace_changes(workspace_id),
+        ping=settings.change_feed_ping_seconds,
+    )
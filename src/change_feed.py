@@ -0,0 +1,145 @@
+"""
+Push workspace changes to connected clients.
+
+Writes to workspace entities fire ``pg_notify('workspace_changes', ...)``
+from a trigger, so every surface that changes the data (REST, MCP, PostgREST)
+is covered. Each worker process holds a single LISTEN connection and fans
+the notifications out to per-workspace subscriber queues, which the SSE
+endpoint streams to the web app.
+
+Notifications are compact ``{"workspace_id", "entity", "op"}`` hints to
+refetch, not the changed data. A subscriber that falls behind, or that was
+connected while the listener reconnected, gets a ``resync`` change instead.
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+import asyncpg
+import sentry_sdk
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "workspace_changes"
+
+RESYNC = {"entity": "*", "op": "resync"}
+
+_MAX_RECONNECT_DELAY_SECONDS = 30
+
+
+class ChangeFeed:
+    """Per-process fan-out of workspace change notifications."""
+
+    def __init__(self, dsn: str, queue_size: int, connect_timeout: float) -> None:
+        self.dsn = dsn
+        self.queue_size = queue_size
+        self.connect_timeout = connect_timeout
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        # Replaced with the listener task, which sets its own event
+        self._listening = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @asynccontextmanager
+    async def subscribe(self, workspace_id: Any) -> AsyncIterator[asyncio.Queue]:
+        """Receive the changes of a workspace while the context is open.
+
+        The queue yields change dicts. Changes committed after this returns
+        are never missed (the listener is up before it returns).
+
+        Raises:
+            asyncio.TimeoutError: If the listener cannot connect in time
+        """
+        key = str(workspace_id)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[key].add(queue)
+        try:
+            await self.start()
+            yield queue
+        finally:
+            self._subscribers[key].discard(queue)
+            if not self._subscribers[key]:
+                del self._subscribers[key]
+
+    async def close(self) -> None:
+        """Stop listening (the next subscriber starts the listener again)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def start(self) -> None:
+        """Wait until the listener is connected, starting it if needed.
+
+        Raises:
+            asyncio.TimeoutError: If the listener cannot connect in time
+        """
+        if self._task is None or self._task.done():
+            self._listening = asyncio.Event()
+            self._task = asyncio.create_task(self._listen(self._listening))
+        await asyncio.wait_for(self._listening.wait(), self.connect_timeout)
+
+    async def _listen(self, listening: asyncio.Event) -> None:
+        delay = 1
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                lost = asyncio.Event()
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(CHANNEL, self._dispatch)
+                listening.set()
+                delay = 1
+                await lost.wait()
+                logger.warning("Change feed connection lost, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Change feed listener failed: {str(e)}")
+                sentry_sdk.capture_exception(e)
+            finally:
+                listening.clear()
+                if connection is not None and not connection.is_closed():
+                    connection.terminate()
+
+            # Changes made while disconnected were not delivered
+            for queues in self._subscribers.values():
+                for queue in queues:
+                    self._offer(queue, RESYNC)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _MAX_RECONNECT_DELAY_SECONDS)
+
+    def _dispatch(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            change = json.loads(payload)
+            queues = self._subscribers.get(change["workspace_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed change notification: {payload}")
+            return
+
+        for queue in queues or ():
+            self._offer(queue, change)
+
+    def _offer(self, queue: asyncio.Queue, change: Dict[str, Any]) -> None:
+        if queue.full():
+            # The subscriber fell behind; it has to refetch everything anyway
+            while not queue.empty():
+                queue.get_nowait()
+            change = RESYNC
+        queue.put_nowait(change)
+
+
+change_feed = ChangeFeed(
+    settings.async_database_url.replace("postgresql+asyncpg://", "postgresql://"),
+    queue_size=settings.change_feed_queue_size,
+    connect_timeout=settings.change_feed_connect_timeout_seconds,
+)
@@ -82,12 +82,60 @@ class Settings(BaseSettings):
     r2_secret_access_key: str = Field(default="")
     r2_profile_picture_bucket_name: str = Field(default="")
     default_profile_picture: str = Field(default="")
+    r2_max_pool_connections: int = Field(default=20)
+    # R2 profile pictures are cached on local disk and evicted LRU past the cap
+    profile_picture_cache_dir: str = Field(default="/tmp/profile_picture_cache")
+    profile_picture_cache_max_bytes: int = Field(default=256 * 1024 * 1024)
 
     # GitHub (empty = feature disabled)
     github_app_id: str = Field(default="")
     github_app_name: str = Field(default="")
     github_app_private_key: str = Field(default="")
     github_webhook_secret: str = Field(default="")
+    github_http_pool_maxsize: int = Field(default=20)
+    github_etag_cache_max_bytes: int = Field(default=64 * 1024 * 1024)
+    github_rate_limit_low_watermark: int = Field(default=100)
+    github_rate_limit_max_backoff_seconds: float = Field(default=5.0)
+    # Process queued webhooks in the web process right after acknowledging
+    # them; disable when a dedicated process_github_webhooks worker runs
+    github_webhook_inline_processing: bool = Field(default=True)
+    github_webhook_batch_size: int = Field(default=50)
+    github_webhook_max_attempts: int = Field(default=3)
+    github_webhook_lock_timeout_seconds: int = Field(default=300)
+    github_webhook_delivery_retention_days: int = Field(default=7)
+    github_path_search_cache_size: int = Field(default=64)
+    github_indexing_concurrency: int = Field(default=8)
+    # Cached installation repository listings older than this are served as
+    # is and refreshed in the background
+    github_repository_list_cache_ttl_seconds: int = Field(default=300)
+
+    # Months of domain events kept besides the current one (0 keeps all);
+    # older months are dropped, or archived to the private schema
+    domain_event_retention_months: int = Field(default=0)
+    domain_event_archive_expired: bool = Field(default=True)
+    domain_event_partitions_ahead: int = Field(default=3)
+    # Events of transactions that started this long before a projection's
+    # checkpoint last moved are assumed applied when probing for pending ones
+    projection_pending_events_slack_seconds: int = Field(default=3600)
+    # Read models older than this are not served, since writes that publish
+    # no domain event (e.g. through PostgREST) never reach the runner; the
+    # runner rebuilds them after half of it
+    projection_max_age_seconds: int = Field(default=900)
+
+    # Cached initiative dependency graphs are reloaded at least this often,
+    # which bounds staleness from writes made by other processes
+    dependency_graph_cache_ttl_seconds: int = Field(default=30)
+
+    # Cached "Previously on..." recaps are rebuilt at least this often; events
+    # committed by other processes do not invalidate them
+    previously_on_cache_ttl_seconds: int = Field(default=60)
+
+    change_feed_queue_size: int = Field(default=100)
+    change_feed_connect_timeout_seconds: float = Field(default=5.0)
+    change_feed_ping_seconds: int = Field(default=15)
+
+    # Workspace new users can start from instead of an empty one ("" for none)
+    workspace_template_id: str = Field(default="")
 
     sentry_url: str = Field(default="")
 
@@ -2,20 +2,26 @@ import io
 import json
 import logging
 import sys
+import uuid
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Optional
+from typing import IO, TYPE_CHECKING, AsyncGenerator, Iterator, Optional
 
 import requests
-from fastapi import HTTPException, Request, Response
+from fastapi import BackgroundTasks, HTTPException, Request, Response
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
-from starlette.datastructures import UploadFile
+from sse_starlette import ServerSentEvent
+from starlette.datastructures import FormData, UploadFile
+from starlette.formparsers import MultiPartException, MultiPartParser
 
 from src import storage_service
+from src.change_feed import change_feed
 from src.config import settings
-from src.github_app.github_service import GitHubService
+from src.github_app.repository_cache import get_installation_repositories
 from src.main import templates
 from src.models import GitHubInstallation, User, UserAccountDetails, Workspace
+from src.services import workspace_deletion_service, workspace_export_service
+from src.services.workspace_clone_service import clone_workspace
 
 if TYPE_CHECKING:
     from src.api import WorkspaceUpdate
@@ -33,6 +39,10 @@ PARAMS_FOR_LOGIN_SCRIPT = {
 
 ASSETS_FILE_PATH = "static/react-components/webpack-assets.json"
 
+PROFILE_PICTURE_MAX_SIZE = 1024 * 1024 * 2  # 2MB
+# Room for the multipart boundaries and part headers around the file
+PROFILE_PICTURE_MAX_BODY_SIZE = PROFILE_PICTURE_MAX_SIZE + 64 * 1024
+
 
 def get_main_js_path() -> str:
     """
@@ -91,8 +101,17 @@ def get_changelog_template(request, user):
     )
 
 
-def get_account_template(request, user: User, session: Session):
-    workspaces = session.query(Workspace).filter(Workspace.user_id == user.id).all()
+def get_account_template(
+    request,
+    user: User,
+    session: Session,
+    background_tasks: Optional[BackgroundTasks] = None,
+):
+    workspaces = (
+        session.query(Workspace)
+        .filter(Workspace.user_id == user.id, Workspace.deleting_at.is_(None))
+        .all()
+    )
 
     # Check if user has a GitHub installation
     github_installation = (
@@ -103,8 +122,8 @@ def get_account_template(request, user: User, session: Session):
 
     repositories = []
     if github_installation:
-        repositories = GitHubService.get_user_repositories(
-            github_installation.installation_id
+        repositories = get_installation_repositories(
+            github_installation, session, background_tasks
         )
 
     return templates.TemplateResponse(
@@ -121,29 +140,83 @@ def get_account_template(request, user: User, session: Session):
     )
 
 
-def get_profile_picture(filename) -> FileResponse:
-    return FileResponse(storage_service.get_profile_picture(filename))
+def get_profile_picture(filename, if_none_match: Optional[str] = None) -> Response:
+    headers = {
+        "ETag": storage_service.profile_picture_etag(filename),
+        "Cache-Control": storage_service.PROFILE_PICTURE_CACHE_CONTROL,
+    }
+    if if_none_match and headers["ETag"] in [
+        tag.strip() for tag in if_none_match.split(",")
+    ]:
+        return Response(status_code=304, headers=headers)
+
+    try:
+        path = storage_service.get_profile_picture(filename)
+    except FileNotFoundError:
+        # A plain response: HTTPExceptions on page routes redirect to "/"
+        return Response(status_code=404, content="Profile picture not found")
+
+    return FileResponse(path, media_type="image/png", headers=headers)
+
+
+async def read_profile_picture_form(request: Request) -> FormData:
+    """
+    Parse a profile picture upload, rejecting oversized bodies while reading.
+
+    The body is counted as it streams in, so an oversized upload is cut off at
+    the limit instead of being spooled to disk in full first. The file part is
+    spooled by Starlette (in memory up to 1MB, then on disk).
+
+    Raises:
+        HTTPException: 413 if the body is too large, 400 if it is not a
+            valid multipart form
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > PROFILE_PICTURE_MAX_BODY_SIZE:
+            raise HTTPException(status_code=413, detail="Invalid file size")
+
+    content_type = request.headers.get("content-type", "")
+    if not content_type.startswith("multipart/form-data"):
+        raise HTTPException(status_code=400, detail="Expected a multipart upload")
+
+    async def limited_stream() -> AsyncGenerator[bytes, None]:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > PROFILE_PICTURE_MAX_BODY_SIZE:
+                raise HTTPException(status_code=413, detail="Invalid file size")
+            yield chunk
+
+    parser = MultiPartParser(
+        request.headers, limited_stream(), max_files=1, max_fields=10
+    )
+    try:
+        return await parser.parse()
+    except MultiPartException as e:
+        raise HTTPException(status_code=400, detail=e.message)
 
 
 def upload_profile_picture(user: User, file, db: Session) -> Response:
-    FILE_MAX_SIZE = 1024 * 1024 * 2  # 2MB
+    """
+    Store a new profile picture for the user.
 
+    Storage I/O blocks, so async callers should run this in a worker thread.
+    """
     # Determine if 'file' is an UploadFile or a path string and create a file-like object
     if isinstance(file, UploadFile):
         file_obj = file.file
-        if file.size is None or file.size > FILE_MAX_SIZE:
+        if file.size is None or file.size > PROFILE_PICTURE_MAX_SIZE:
             return Response(status_code=400, content="Invalid file size")
 
         if file.content_type != "image/png":
             return Response(status_code=400, content="Invalid file type")
-
-        logger.error(f"File object: {file.__dict__}")
     else:
-        logger.error(f"File path: {file}")
         file_obj = open(str(file), "rb")
 
-    logger.error(f"Uploading profile picture for user {user.id}")
+    logger.info(f"Uploading profile picture for user {user.id}")
 
+    previous_filename = user.profile_picture_url
     filename = storage_service.upload_profile_picture(user, file_obj)
 
     user.profile_picture_url = filename
@@ -153,6 +226,18 @@ def upload_profile_picture(user: User, file, db: Session) -> Response:
     db.commit()
     db.refresh(merged_user)
 
+    # Picture names change with their content, so the old one is now unused
+    if previous_filename and previous_filename not in (
+        filename,
+        settings.default_profile_picture,
+    ):
+        try:
+            storage_service.delete_profile_picture(previous_filename)
+        except Exception as e:
+            logger.error(
+                f"Error deleting profile picture {previous_filename}: {str(e)}"
+            )
+
     return Response(
         status_code=201, content=f"Profile picture uploaded for user {merged_user.id}"
     )
@@ -213,14 +298,23 @@ def get_delete_account_template(request: Request, user: User):
     )
 
 
-def confirm_delete_account(user: User, reason: str, db: Session) -> None:
+def confirm_delete_account(
+    user: User,
+    reason: str,
+    db: Session,
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> None:
     # Log the deletion reason to stdout
     print(f"Deleting user {user.id} because: {reason}", file=sys.stdout)
-    # Delete the user
+    # Deactivate the user now, delete their data after the response
     merged_user = db.merge(user)
-    db.commit()
-    db.delete(merged_user)
-    db.commit()
+    workspace_deletion_service.mark_user_for_deletion(db, merged_user)
+    if background_tasks is not None:
+        background_tasks.add_task(
+            workspace_deletion_service.purge_user_in_background, merged_user.id
+        )
+    else:
+        workspace_deletion_service.purge_user(db, merged_user.id)
 
 
 def create_workspace(
@@ -254,10 +348,42 @@ def create_workspace(
     return workspace
 
 
+def create_workspace_from_template(
+    user: User, name: str, description: str | None, icon: str | None, db: Session
+) -> Workspace:
+    """Create a user's workspace as a copy of the configured template workspace.
+
+    Raises:
+        ValueError: If no template workspace is configured or it does not
+            exist, or the user already has a workspace
+    """
+    if not settings.workspace_template_id:
+        raise ValueError("No workspace template is configured")
+    if (
+        db.query(Workspace)
+        .filter(Workspace.user_id == user.id, Workspace.deleting_at.is_(None))
+        .first()
+    ):
+        raise ValueError("User already has a workspace")
+
+    return clone_workspace(
+        db,
+        source_workspace_id=uuid.UUID(settings.workspace_template_id),
+        user_id=user.id,
+        name=name,
+        description=description,
+        icon=icon,
+    )
+
+
 def update_workspace(
     user: User, workspace_update: "WorkspaceUpdate", db: Session
 ) -> Workspace:
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_update.id).first()
+    workspace = (
+        db.query(Workspace)
+        .filter(Workspace.id == workspace_update.id, Workspace.deleting_at.is_(None))
+        .first()
+    )
     if workspace is None:
         raise ValueError(f"Workspace with id {workspace_update.id} not found")
 
@@ -276,16 +402,105 @@ def update_workspace(
     return merged_workspace
 
 
-def delete_workspace(user: User, workspace_id: str, db: Session):
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+def get_user_workspace(user: User, workspace_id: str, db: Session) -> Workspace:
+    workspace = (
+        db.query(Workspace)
+        .filter(Workspace.id == workspace_id, Workspace.deleting_at.is_(None))
+        .first()
+    )
+    if workspace is None or workspace.user_id != user.id:
+        raise ValueError(f"Workspace with id {workspace_id} not found")
+    return workspace
+
+
+async def stream_workspace_changes(
+    workspace_id: str,
+) -> AsyncGenerator[ServerSentEvent, None]:
+    """
+    Stream the changes of a workspace as server-sent events.
+
+    A ``ready`` event is sent once changes are being listened to, so a client
+    that loads its data after it never misses a change; every ``change``
+    event after that is a hint to refetch the entity it names.
+    """
+    async with change_feed.subscribe(workspace_id) as changes:
+        yield ServerSentEvent(event="ready", data="{}")
+        while True:
+            change = await changes.get()
+            yield ServerSentEvent(
+                event="change",
+                data=json.dumps({"entity": change["entity"], "op": change["op"]}),
+            )
+
+
+def stream_workspace_export(workspace_id: str, compressed: bool) -> Iterator[bytes]:
+    """
+    Stream a workspace export, optionally zstd-compressed.
+
+    The export reads from its own session, held until the stream ends, so
+    the request session can be released before the response starts.
+    """
+    from src.db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        chunks = workspace_export_service.export_workspace(db, uuid.UUID(workspace_id))
+        if compressed:
+            chunks = workspace_export_service.compress(chunks)
+        yield from chunks
+    finally:
+        db.close()
+
+
+def import_workspace(user: User, file: IO[bytes], db: Session) -> Workspace:
+    """
+    Restore a workspace export as the user's workspace.
+
+    Raises:
+        ValueError: If the user already has a workspace or the export is invalid
+    """
+    if (
+        db.query(Workspace)
+        .filter(Workspace.user_id == user.id, Workspace.deleting_at.is_(None))
+        .first()
+    ):
+        raise ValueError("User already has a workspace")
+
+    return workspace_export_service.import_workspace(
+        db, workspace_export_service.read_lines(file), user_id=user.id
+    )
+
+
+def delete_workspace(
+    user: User,
+    workspace_id: str,
+    db: Session,
+    background_tasks: Optional[BackgroundTasks] = None,
+):
+    """
+    Delete a workspace.
+
+    The workspace is hidden right away and its rows are purged in chunks,
+    after the response when background_tasks are given.
+    """
+    workspace = (
+        db.query(Workspace)
+        .filter(Workspace.id == workspace_id, Workspace.deleting_at.is_(None))
+        .first()
+    )
     if workspace is None:
         raise ValueError(f"Workspace with id {workspace_id} not found")
 
     if workspace.user_id != user.id:
         raise ValueError(f"Workspace with id {workspace_id} not found")
 
-    db.delete(workspace)
-    db.commit()
+    workspace_deletion_service.mark_workspace_for_deletion(db, workspace)
+    if background_tasks is not None:
+        background_tasks.add_task(
+            workspace_deletion_service.purge_workspace_in_background, workspace.id
+        )
+    else:
+        workspace_deletion_service.purge_workspace(db, workspace.id)
 
 
 def complete_onboarding(user: User, db: Session) -> UserAccountDetails:
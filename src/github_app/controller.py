@@ -1,22 +1,32 @@
-from typing import Annotated, Any, Dict, List
+import hashlib
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 
 import sentry_sdk
-from fastapi import HTTPException, Query, Request, Response
+from fastapi import BackgroundTasks, HTTPException, Query, Request, Response
 from fastapi.responses import RedirectResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 
 from src.config import settings
+from src.db import SessionLocal
 from src.github_app.github_service import GitHubService
 from src.github_app.models import RepositoryFileIndex
-
-# Import helper functions from webhook_controller (avoiding circular imports)
-from src.github_app.webhook_controller import _create_repository_file_index
+from src.github_app.path_search import merge_ranked_paths, path_search_cache
+from src.github_app.repository_cache import (
+    get_installation_repositories,
+    store_installation_repositories,
+)
+from src.github_app.repository_indexer import index_repositories
 from src.main import templates
 from src.models import GitHubInstallation, User
 
 
-def get_repositories_template(request: Request, user: User, db: Session):
+def get_repositories_template(
+    request: Request,
+    user: User,
+    db: Session,
+    background_tasks: Optional[BackgroundTasks] = None,
+):
     # Check if user has a GitHub installation
     github_installation = (
         db.query(GitHubInstallation)
@@ -26,8 +36,8 @@ def get_repositories_template(request: Request, user: User, db: Session):
 
     repositories: List[Dict[str, Any]] = []
     if github_installation:
-        repositories = GitHubService.get_user_repositories(
-            github_installation.installation_id
+        repositories = get_installation_repositories(
+            github_installation, db, background_tasks
         )
 
     return templates.TemplateResponse(
@@ -78,26 +88,14 @@ def populate_initial_file_index(
             # No repositories accessible, skip file indexing
             return
 
-        # Create file indexes for all accessible repositories using the helper function
-        success_count = 0
-        for repo in repositories:
-            try:
-                repo_full_name = repo.get("full_name")
-                if repo_full_name:
-                    # Use the reusable helper function to create file index
-                    # Pass commit=True to ensure records are available for prefixing strategy update
-                    if _create_repository_file_index(
-                        github_installation.installation_id,
-                        repo_full_name,
-                        session,
-                        commit=True,
-                    ):
-                        success_count += 1
-
-            except Exception as e:
-                # Non-blocking: Log error but continue with other repositories
-                sentry_sdk.capture_exception(e)
-                continue
+        # Seed the cached listing so the account page doesn't fetch it again
+        store_installation_repositories(github_installation, repositories)
+        session.commit()
+
+        # Fetch all repository trees concurrently and store them in one upsert
+        success_count = index_repositories(
+            github_installation.installation_id, repositories, session
+        )
 
         # Update prefixing strategy to ensure consistent @ prefixing across all repositories
         # This fixes the issue where the first repo gets single-repo prefixing while
@@ -113,11 +111,33 @@ def populate_initial_file_index(
         pass
 
 
+def _populate_initial_file_index_in_background(github_installation_id: Any) -> None:
+    """Index a new installation's repositories after the response was sent."""
+    db = SessionLocal()
+    try:
+        github_installation = db.get(GitHubInstallation, github_installation_id)
+        if github_installation is not None:
+            populate_initial_file_index(github_installation, db)
+            db.commit()
+    except Exception as e:
+        db.rollback()
+        sentry_sdk.capture_exception(e)
+    finally:
+        db.close()
+
+
 def handle_installation_callback(
     callback_payload: Annotated[GithubAppInstallationCallback, Query()],
     user: User,
     session: Session,
+    background_tasks: Optional[BackgroundTasks] = None,
 ) -> Response:
+    """
+    Store a new installation and index its repositories.
+
+    Indexing waits on GitHub for every repository, so it runs after the
+    response when background_tasks are given.
+    """
     user = session.merge(user)  # merge user to attach it to the current session
 
     # Verify the installation exists and is accessible by attempting to get a token
@@ -154,8 +174,13 @@ def handle_installation_callback(
         session.refresh(github_installation)
 
     # Populate initial file index for immediate autocomplete functionality
-    populate_initial_file_index(github_installation, session)
-    session.commit()  # Commit file index changes
+    if background_tasks is not None:
+        background_tasks.add_task(
+            _populate_initial_file_index_in_background, github_installation.id
+        )
+    else:
+        populate_initial_file_index(github_installation, session)
+        session.commit()  # Commit file index changes
 
     # Redirect based on onboarding status
     # If user hasn't completed onboarding, return them to the onboarding flow
@@ -360,6 +385,126 @@ def get_all_file_search_strings_for_user(user: User, db: Session):
     )
 
 
+def _get_repository_file_index_metadata(
+    user: User, db: Session, repository_full_name: Optional[str] = None
+) -> List[RepositoryFileIndex]:
+    """
+    Load the user's repository file indexes without their search strings.
+
+    The search string column is deferred and only loaded if accessed.
+    """
+    github_installation = (
+        db.query(GitHubInstallation)
+        .filter(GitHubInstallation.user_id == user.id)
+        .first()
+    )
+
+    if not github_installation:
+        return []
+
+    query = (
+        db.query(RepositoryFileIndex)
+        .options(defer(RepositoryFileIndex.compressed_file_search_string))
+        .filter(RepositoryFileIndex.github_installation_id == github_installation.id)
+    )
+    if repository_full_name is not None:
+        query = query.filter(
+            RepositoryFileIndex.repository_full_name == repository_full_name
+        )
+
+    return query.order_by(RepositoryFileIndex.repository_full_name).all()
+
+
+def _file_index_version(repo_index: RepositoryFileIndex) -> Tuple[Any, ...]:
+    """Values that change whenever the rendered search string can change."""
+    return (
+        repo_index.repository_full_name,
+        repo_index.last_indexed_commit_sha,
+        repo_index.uses_repo_prefix,
+        repo_index.updated_at,
+    )
+
+
+def get_file_search_strings_etag(
+    user: User, db: Session, repository_full_name: Optional[str] = None
+) -> Optional[str]:
+    """
+    Compute a weak ETag for the user's file search strings.
+
+    Only index metadata is read, so unchanged lists can be answered with
+    304 Not Modified without loading any search strings.
+
+    Args:
+        user: The authenticated user
+        db: Database session
+        repository_full_name: Limit to a single repository
+
+    Returns:
+        Optional[str]: The ETag, or None if there is nothing to tag
+    """
+    repository_file_indexes = _get_repository_file_index_metadata(
+        user, db, repository_full_name
+    )
+    if repository_full_name is not None and not repository_file_indexes:
+        return None
+
+    digest = hashlib.sha1(
+        repr(
+            [_file_index_version(repo_index) for repo_index in repository_file_indexes]
+        ).encode()
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def search_file_paths_for_user(
+    user: User,
+    query: str,
+    db: Session,
+    repository_full_name: Optional[str] = None,
+    limit: int = 20,
+):
+    """
+    Search the user's indexed repositories for file paths matching a query.
+
+    Each repository is searched with an in-process index that is rebuilt only
+    when the repository's indexed commit changes.
+
+    Args:
+        user: The authenticated user
+        query: The partial path typed by the user
+        db: Database session
+        repository_full_name: Limit the search to a single repository
+        limit: Maximum number of matches to return
+
+    Returns:
+        FilePathSearchResponse: The best matches across repositories
+    """
+    # Import here to avoid circular import
+    from src.github_app.views import FilePathMatch, FilePathSearchResponse
+
+    repository_file_indexes = _get_repository_file_index_metadata(
+        user, db, repository_full_name
+    )
+
+    results = []
+    for repo_index in repository_file_indexes:
+        search_index = path_search_cache.get_or_build(
+            repo_index.id,
+            _file_index_version(repo_index),
+            lambda index=repo_index: index.file_search_string,
+        )
+        results.append(
+            (repo_index.repository_full_name, search_index.search(query, limit))
+        )
+
+    matches = [
+        FilePathMatch(repository_full_name=repo_full_name, path=path)
+        for repo_full_name, path in merge_ranked_paths(results, limit)
+    ]
+
+    return FilePathSearchResponse(query=query, matches=matches, success=True)
+
+
 def get_installation_status(user: User, db: Session):
     """
     Get GitHub installation status for the user.
@@ -0,0 +1,165 @@
+"""
+Helpers for maintaining the sorted file path list behind a RepositoryFileIndex.
+
+A repository index is a sorted list of file paths rendered into a
+newline-separated, @-prefixed search string. Push webhooks list the paths each
+commit added and removed, which lets the stored list be updated without
+re-downloading the full recursive tree from GitHub. The list is stored as one
+compressed string, so applying such a change still rewrites all of it.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional
+
+import zstandard
+
+NULL_SHA = "0000000000000000000000000000000000000000"
+
+# Sorted paths share long prefixes, so even a fast level compresses them well
+FILE_SEARCH_STRING_ZSTD_LEVEL = 3
+
+# GitHub includes at most this many commits in a push payload
+GITHUB_PUSH_COMMIT_LIMIT = 2048
+
+
+def file_path_prefix(repo_name: str, use_repo_prefix: bool) -> str:
+    """Return the autocomplete prefix used for paths of ``repo_name``."""
+    return f"@{repo_name}/" if use_repo_prefix else "@"
+
+
+def parse_file_search_string(
+    file_search_string: str, repo_name: str, use_repo_prefix: bool
+) -> List[str]:
+    """
+    Recover the sorted, un-prefixed path list from a stored search string.
+
+    Example:
+        >>> parse_file_search_string("@myrepo/README.md\\n@myrepo/src/a.py", "myrepo", True)
+        ['README.md', 'src/a.py']
+    """
+    if not file_search_string:
+        return []
+
+    prefix = file_path_prefix(repo_name, use_repo_prefix)
+    return [
+        line[len(prefix) :] if line.startswith(prefix) else line.lstrip("@")
+        for line in file_search_string.split("\n")
+        if line
+    ]
+
+
+def render_file_search_string(
+    file_paths: Iterable[str], repo_name: str, use_repo_prefix: bool
+) -> str:
+    """Render sorted paths as the newline-separated, @-prefixed search string."""
+    prefix = file_path_prefix(repo_name, use_repo_prefix)
+    return "\n".join(f"{prefix}{path}" for path in file_paths)
+
+
+def reprefix_file_search_string(
+    file_search_string: str,
+    repo_name: str,
+    from_repo_prefix: bool,
+    to_repo_prefix: bool,
+) -> str:
+    """
+    Switch a stored search string between ``@path`` and ``@repo/path`` prefixes.
+
+    Only the prefixes change, so this is a single pass over the stored paths and
+    needs no file tree from GitHub.
+
+    Example:
+        >>> reprefix_file_search_string("@README.md", "myrepo", False, True)
+        '@myrepo/README.md'
+    """
+    if from_repo_prefix == to_repo_prefix:
+        return file_search_string
+
+    return render_file_search_string(
+        parse_file_search_string(file_search_string, repo_name, from_repo_prefix),
+        repo_name,
+        to_repo_prefix,
+    )
+
+
+def compress_file_search_string(file_search_string: str) -> bytes:
+    """Compress a search string for storage."""
+    return zstandard.ZstdCompressor(level=FILE_SEARCH_STRING_ZSTD_LEVEL).compress(
+        file_search_string.encode("utf-8")
+    )
+
+
+def decompress_file_search_string(compressed: bytes) -> str:
+    """Inverse of :func:`compress_file_search_string`."""
+    return zstandard.ZstdDecompressor().decompress(compressed).decode("utf-8")
+
+
+def count_file_search_string_paths(file_search_string: str) -> int:
+    """Number of paths in a newline-separated search string."""
+    return sum(1 for line in file_search_string.split("\n") if line)
+
+
+def push_requires_full_reindex(
+    payload: Dict[str, Any], last_indexed_commit_sha: Optional[str]
+) -> Optional[str]:
+    """
+    Decide whether a push payload can be applied incrementally.
+
+    Args:
+        payload: The (possibly coalesced) push webhook payload
+        last_indexed_commit_sha: The commit the stored index reflects
+
+    Returns:
+        Optional[str]: The reason a full tree fetch is needed, or None when the
+        payload's file lists describe every change since the indexed commit
+    """
+    commits = payload.get("commits")
+    before = payload.get("before")
+
+    if not last_indexed_commit_sha:
+        return "index has no base commit"
+    if payload.get("forced"):
+        return "force push"
+    if not before or before == NULL_SHA or before != last_indexed_commit_sha:
+        return "base commit does not match indexed commit"
+    if commits is None:
+        return "payload has no commit list"
+    if payload.get("commits_truncated") or len(commits) >= GITHUB_PUSH_COMMIT_LIMIT:
+        return "commit list truncated"
+    return None
+
+
+def push_changes_file_paths(commits: List[Dict[str, Any]]) -> bool:
+    """Whether any push commit added or removed a path (not just modified one)."""
+    return any(commit.get("added") or commit.get("removed") for commit in commits)
+
+
+def apply_push_commits(file_paths: List[str], commits: List[Dict[str, Any]]) -> bool:
+    """
+    Apply the added/removed paths of push commits to a sorted path list.
+
+    Commits are applied in order, so a path added and later removed within the
+    same push ends up absent. Modified paths do not change the set of files and
+    are ignored. Paths are found with binary search and the list is updated in
+    place.
+
+    Args:
+        file_paths: Sorted list of repository file paths (mutated in place)
+        commits: The ``commits`` array of a push payload, oldest first
+
+    Returns:
+        bool: True if the path list changed
+    """
+    changed = False
+    for commit in commits:
+        for path in commit.get("removed") or []:
+            index = bisect_left(file_paths, path)
+            if index < len(file_paths) and file_paths[index] == path:
+                del file_paths[index]
+                changed = True
+        for path in commit.get("added") or []:
+            index = bisect_left(file_paths, path)
+            if index == len(file_paths) or file_paths[index] != path:
+                file_paths.insert(index, path)
+                changed = True
+    return changed
@@ -1,16 +1,37 @@
 import base64
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import jwt
-import requests
 import sentry_sdk
 
 from src.config import settings
+from src.github_app.http_client import (
+    APP_SCOPE,
+    async_github_http_client,
+    github_http_client,
+)
+
+# Installation tokens live for an hour; a cached one is replaced this long
+# before it expires so that no request goes out with a token about to lapse
+INSTALLATION_TOKEN_REFRESH_MARGIN_SECONDS = 300
 
 
 class GitHubService:
-    """Service for interacting with GitHub API."""
+    """
+    Service for interacting with GitHub API.
+
+    All requests go through the shared pooled ``github_http_client``. Repository
+    metadata, repository listings, branches, commits and trees are fetched with
+    conditional requests keyed by installation, so unchanged resources come back
+    as free 304s. Installation tokens are reused until shortly before they
+    expire instead of being minted for every call.
+    """
+
+    _installation_tokens: Dict[str, Tuple[str, float]] = {}
+    _installation_tokens_lock = threading.Lock()
 
     @staticmethod
     def _create_jwt_token() -> str:
@@ -50,10 +71,11 @@ class GitHubService:
             "Accept": "application/vnd.github.v3+json",
         }
 
-        response = requests.post(
+        response = github_http_client.post(
             f"https://api.github.com/app/installations/{installation_id}/access_tokens",
             headers=headers,
             timeout=settings.internal_request_timeout,
+            rate_limit_scope=APP_SCOPE,
         )
 
         if response.status_code != 201:
@@ -96,32 +118,42 @@ class GitHubService:
             list: A list of repository information dictionaries
         """
         try:
-            # Get an installation token
-            token_data = cls.get_installation_token(installation_id)
-            token = token_data["token"]
+            return cls.list_installation_repositories(installation_id)
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            return []
 
-            # Use the token to request repositories
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/vnd.github.v3+json",
-                "X-GitHub-Api-Version": "2022-11-28",
-            }
+    @classmethod
+    def list_installation_repositories(
+        cls, installation_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Like :meth:`get_user_repositories`, but raises on failure.
 
-            response = requests.get(
-                "https://api.github.com/installation/repositories",
-                headers=headers,
-                timeout=settings.internal_request_timeout,
-            )
+        Callers that cache the listing use this to tell an installation with no
+        repositories apart from a failed request.
 
-            if response.status_code != 200:
-                raise Exception(
-                    f"Failed to get repositories: {response.status_code} {response.text}"
-                )
+        Args:
+            installation_id: The GitHub App installation ID
 
-            return response.json().get("repositories", [])
-        except Exception as e:
-            sentry_sdk.capture_exception(e)
-            return []
+        Returns:
+            list: A list of repository information dictionaries
+        """
+        headers = cls._get_auth_headers(installation_id)
+
+        response = github_http_client.get(
+            "https://api.github.com/installation/repositories",
+            headers=headers,
+            timeout=settings.internal_request_timeout,
+            etag_scope=installation_id,
+        )
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to get repositories: {response.status_code} {response.text}"
+            )
+
+        return response.json().get("repositories", [])
 
     @classmethod
     def revoke_installation_access(cls, installation_id: str) -> bool:
@@ -143,11 +175,14 @@ class GitHubService:
                 "X-GitHub-Api-Version": "2022-11-28",
             }
 
-            response = requests.delete(
+            response = github_http_client.delete(
                 f"https://api.github.com/app/installations/{installation_id}",
                 headers=headers,
                 timeout=settings.internal_request_timeout,
+                rate_limit_scope=APP_SCOPE,
             )
+            with cls._installation_tokens_lock:
+                cls._installation_tokens.pop(str(installation_id), None)
 
             return response.status_code == 204
         except Exception as e:
@@ -165,8 +200,7 @@ class GitHubService:
         Returns:
             Dict[str, str]: Headers with authentication token
         """
-        token_data = cls.get_installation_token(installation_id)
-        token = token_data["token"]
+        token = cls._get_cached_installation_token(installation_id)
 
         return {
             "Authorization": f"Bearer {token}",
@@ -174,6 +208,42 @@ class GitHubService:
             "X-GitHub-Api-Version": "2022-11-28",
         }
 
+    @classmethod
+    def _get_cached_installation_token(cls, installation_id: str) -> str:
+        """
+        Get an installation token, minting a new one only when the cached one
+        is missing or close to expiry.
+
+        Args:
+            installation_id: The GitHub App installation ID
+
+        Returns:
+            str: The installation token
+        """
+        key = str(installation_id)
+        now = time.time()
+        with cls._installation_tokens_lock:
+            cached = cls._installation_tokens.get(key)
+        if cached is not None and cached[1] - now > (
+            INSTALLATION_TOKEN_REFRESH_MARGIN_SECONDS
+        ):
+            return cached[0]
+
+        token_data = cls.get_installation_token(installation_id)
+        token = token_data["token"]
+        expires_at = token_data.get("expires_at")
+        if expires_at:
+            expires = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+            with cls._installation_tokens_lock:
+                cls._installation_tokens[key] = (token, expires.timestamp())
+        return token
+
+    @classmethod
+    def clear_installation_tokens(cls) -> None:
+        """Forget every cached installation token."""
+        with cls._installation_tokens_lock:
+            cls._installation_tokens.clear()
+
     @classmethod
     def get_repository_metadata(
         cls, installation_id: str, repo_owner: str, repo_name: str
@@ -192,10 +262,11 @@ class GitHubService:
         try:
             headers = cls._get_auth_headers(installation_id)
 
-            response = requests.get(
+            response = github_http_client.get(
                 f"https://api.github.com/repos/{repo_owner}/{repo_name}",
                 headers=headers,
                 timeout=settings.internal_request_timeout,
+                etag_scope=installation_id,
             )
 
             if response.status_code != 200:
@@ -238,8 +309,11 @@ class GitHubService:
             if ref:
                 url += f"?ref={ref}"
 
-            response = requests.get(
-                url, headers=headers, timeout=settings.internal_request_timeout
+            response = github_http_client.get(
+                url,
+                headers=headers,
+                timeout=settings.internal_request_timeout,
+                rate_limit_scope=installation_id,
             )
 
             if response.status_code != 200:
@@ -293,8 +367,11 @@ class GitHubService:
             if ref:
                 url += f"?ref={ref}"
 
-            response = requests.get(
-                url, headers=headers, timeout=settings.internal_request_timeout
+            response = github_http_client.get(
+                url,
+                headers=headers,
+                timeout=settings.internal_request_timeout,
+                rate_limit_scope=installation_id,
             )
 
             if response.status_code != 200:
@@ -327,7 +404,7 @@ class GitHubService:
             ref: The name of the commit/branch/tag (optional, default: default branch)
 
         Returns:
-            Dict[str, Any]: Repository file tree
+            Dict[str, Any]: Repository file tree, plus the resolved "commit_sha"
         """
         try:
             headers = cls._get_auth_headers(installation_id)
@@ -342,10 +419,11 @@ class GitHubService:
                 ref = repo_data.get("default_branch", "main")
 
             # Get the latest commit SHA for the specified ref
-            response = requests.get(
+            response = github_http_client.get(
                 f"https://api.github.com/repos/{repo_owner}/{repo_name}/commits/{ref}",
                 headers=headers,
                 timeout=settings.internal_request_timeout,
+                etag_scope=installation_id,
             )
             if response.status_code != 200:
                 raise Exception(
@@ -356,10 +434,11 @@ class GitHubService:
 
             # Get the tree using the commit SHA
             recursive_param = "?recursive=1" if recursive else ""
-            response = requests.get(
+            response = github_http_client.get(
                 f"https://api.github.com/repos/{repo_owner}/{repo_name}/git/trees/{commit_sha}{recursive_param}",
                 headers=headers,
                 timeout=settings.internal_request_timeout,
+                etag_scope=installation_id,
             )
 
             if response.status_code != 200:
@@ -367,7 +446,83 @@ class GitHubService:
                     f"Failed to get file tree: {response.status_code} {response.text}"
                 )
 
-            return response.json()
+            # Copy so the ETag-cached response body is never mutated
+            tree_data = dict(response.json())
+            # The tree's own "sha" is the tree SHA; keep the commit it came from
+            tree_data["commit_sha"] = commit_sha
+            return tree_data
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            return {"error": str(e)}
+
+    @classmethod
+    async def get_file_tree_async(
+        cls,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        headers: Dict[str, str],
+        ref: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of :meth:`get_file_tree` for indexing many repositories.
+
+        Takes pre-built auth headers so one installation token can be shared by
+        every repository in a batch.
+
+        Args:
+            installation_id: The GitHub App installation ID
+            repo_owner: The owner of the repository
+            repo_name: The name of the repository
+            headers: Authentication headers from :meth:`_get_auth_headers`
+            ref: The name of the commit/branch/tag (optional, default: default branch)
+
+        Returns:
+            Dict[str, Any]: Repository file tree, plus the resolved "commit_sha"
+        """
+        try:
+            base_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}"
+
+            if not ref:
+                response = await async_github_http_client.get(
+                    base_url,
+                    headers=headers,
+                    timeout=settings.internal_request_timeout,
+                    etag_scope=installation_id,
+                )
+                if response.status_code != 200:
+                    raise Exception(
+                        f"Failed to get repository metadata: {response.status_code} {response.text}"
+                    )
+                ref = response.json().get("default_branch", "main")
+
+            response = await async_github_http_client.get(
+                f"{base_url}/commits/{ref}",
+                headers=headers,
+                timeout=settings.internal_request_timeout,
+                etag_scope=installation_id,
+            )
+            if response.status_code != 200:
+                raise Exception(
+                    f"Failed to get commit: {response.status_code} {response.text}"
+                )
+
+            commit_sha = response.json()["sha"]
+
+            response = await async_github_http_client.get(
+                f"{base_url}/git/trees/{commit_sha}?recursive=1",
+                headers=headers,
+                timeout=settings.internal_request_timeout,
+                etag_scope=installation_id,
+            )
+            if response.status_code != 200:
+                raise Exception(
+                    f"Failed to get file tree: {response.status_code} {response.text}"
+                )
+
+            tree_data = dict(response.json())
+            tree_data["commit_sha"] = commit_sha
+            return tree_data
         except Exception as e:
             sentry_sdk.capture_exception(e)
             return {"error": str(e)}
@@ -390,10 +545,11 @@ class GitHubService:
         try:
             headers = cls._get_auth_headers(installation_id)
 
-            response = requests.get(
+            response = github_http_client.get(
                 f"https://api.github.com/repos/{repo_owner}/{repo_name}/branches",
                 headers=headers,
                 timeout=settings.internal_request_timeout,
+                etag_scope=installation_id,
             )
 
             if response.status_code != 200:
@@ -0,0 +1,488 @@
+"""
+Shared HTTP clients for the GitHub REST API.
+
+Every GitHub call made by GitHubService goes through a single pooled client so
+that connections (and their TLS sessions) are reused across requests. GET
+requests that opt in with an ``etag_scope`` are sent as conditional requests:
+a 304 Not Modified answer is served from the local ETag cache and does not
+count against the installation's rate limit.
+
+Rate-limit headers from every response are tracked per scope (the
+installation, or ``APP_SCOPE`` for requests made as the App itself), and
+requests are slowed down (or retried once) when the remaining budget runs low.
+The synchronous client never waits when it is called from a thread running an
+event loop: it sends without backing off and returns a rate-limited response
+instead of retrying it, so an async view does not stall every other request.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, Mapping, Optional, Tuple, TypeVar
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+ResponseT = TypeVar("ResponseT")
+
+DEFAULT_SCOPE = "default"
+# Requests authenticated with the App's JWT share the App's own budget
+APP_SCOPE = "app"
+
+
+@dataclass
+class RateLimitState:
+    """Last known GitHub rate-limit budget for one scope (installation)."""
+
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_at: Optional[float] = None
+    retry_after: Optional[float] = None
+
+
+@dataclass
+class CachedResponse(Generic[ResponseT]):
+    """A cached GET response and the validator needed to revalidate it."""
+
+    etag: str
+    response: ResponseT
+    size: int
+
+
+class ETagCache(Generic[ResponseT]):
+    """
+    Thread-safe LRU cache of GET responses keyed by scope and URL, bounded by
+    the total size of the cached bodies.
+
+    The scope is normally the GitHub installation ID; it keeps responses seen by
+    one installation from being served to another. Recursive trees of large
+    repositories run to megabytes each, so the bound is in bytes rather than
+    entries; a body larger than the whole budget is not cached.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str], CachedResponse[ResponseT]]" = (
+            OrderedDict()
+        )
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, scope: str, url: str) -> Optional[CachedResponse[ResponseT]]:
+        key = (scope, url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(
+        self, scope: str, url: str, etag: str, response: ResponseT, size: int
+    ) -> None:
+        key = (scope, url)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous.size
+            if size > self._max_bytes:
+                return
+            self._entries[key] = CachedResponse(etag=etag, response=response, size=size)
+            self._size_bytes += size
+            while self._size_bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= evicted.size
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RateLimitTracker:
+    """
+    Tracks GitHub rate-limit headers per scope and computes adaptive backoff.
+
+    The delay grows as the remaining budget shrinks: once fewer than
+    ``low_watermark`` requests remain, the time left until the window resets is
+    spread evenly over the remaining requests. Delays are capped at
+    ``max_backoff_seconds`` so that a request thread is never parked for the
+    whole reset window.
+    """
+
+    def __init__(self, low_watermark: int, max_backoff_seconds: float) -> None:
+        self.low_watermark = low_watermark
+        self.max_backoff_seconds = max_backoff_seconds
+        self._states: Dict[str, RateLimitState] = {}
+        self._lock = threading.Lock()
+
+    def update(self, scope: str, headers: Mapping[str, str]) -> None:
+        """Record the rate-limit headers of a response."""
+        state = RateLimitState(
+            limit=_int_header(headers, "X-RateLimit-Limit"),
+            remaining=_int_header(headers, "X-RateLimit-Remaining"),
+            reset_at=_float_header(headers, "X-RateLimit-Reset"),
+            retry_after=_float_header(headers, "Retry-After"),
+        )
+        with self._lock:
+            if state.remaining is None and state.retry_after is None:
+                # No budget information; a stale Retry-After must not linger
+                previous = self._states.get(scope)
+                if previous is not None:
+                    previous.retry_after = None
+                return
+            self._states[scope] = state
+
+    def state(self, scope: str) -> Optional[RateLimitState]:
+        with self._lock:
+            return self._states.get(scope)
+
+    def backoff_seconds(self, scope: str, now: Optional[float] = None) -> float:
+        """Seconds to wait before the next request for ``scope``."""
+        state = self.state(scope)
+        if state is None:
+            return 0.0
+
+        now = time.time() if now is None else now
+        if state.retry_after:
+            delay = state.retry_after
+        elif state.remaining is None or state.remaining >= self.low_watermark:
+            return 0.0
+        elif state.reset_at is None or state.reset_at <= now:
+            return 0.0
+        else:
+            delay = (state.reset_at - now) / max(state.remaining, 1)
+
+        return min(max(delay, 0.0), self.max_backoff_seconds)
+
+    def is_rate_limited(self, status_code: int, headers: Mapping[str, str]) -> bool:
+        """Whether a response was rejected by GitHub's (secondary) rate limiter."""
+        if status_code == 429:
+            return True
+        if status_code != 403:
+            return False
+        return (
+            headers.get("X-RateLimit-Remaining") == "0"
+            or headers.get("Retry-After") is not None
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _float_header(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class GitHubHttpClient:
+    """Pooled, conditional-request aware synchronous client for the GitHub API."""
+
+    def __init__(
+        self,
+        pool_maxsize: int,
+        etag_cache_max_bytes: int,
+        rate_limit_low_watermark: int,
+        rate_limit_max_backoff_seconds: float,
+    ) -> None:
+        self._pool_maxsize = pool_maxsize
+        self.etag_cache: ETagCache[requests.Response] = ETagCache(etag_cache_max_bytes)
+        self.rate_limits = RateLimitTracker(
+            rate_limit_low_watermark, rate_limit_max_backoff_seconds
+        )
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        self.request_count = 0
+        self.not_modified_count = 0
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self._pool_maxsize,
+                        pool_maxsize=self._pool_maxsize,
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        etag_scope: Optional[str] = None,
+        rate_limit_scope: Optional[str] = None,
+    ) -> requests.Response:
+        """
+        Send a GET request.
+
+        When ``etag_scope`` is given the request is made conditional on the
+        cached ETag for ``(etag_scope, url)``; a 304 answer returns the cached
+        response instead. Rate limits are tracked under ``rate_limit_scope``,
+        which defaults to ``etag_scope``.
+        """
+        scope = rate_limit_scope or etag_scope or DEFAULT_SCOPE
+        request_headers = dict(headers or {})
+        cached = self.etag_cache.get(etag_scope, url) if etag_scope else None
+        if cached is not None:
+            request_headers["If-None-Match"] = cached.etag
+
+        response = self._send("GET", url, request_headers, timeout, scope)
+
+        if cached is not None and response.status_code == 304:
+            self.not_modified_count += 1
+            return cached.response
+
+        etag = response.headers.get("ETag")
+        if etag_scope and etag and response.status_code == 200:
+            # Reading the body also lets the cached response be re-read after
+            # the underlying connection is returned to the pool.
+            size = len(response.content)
+            self.etag_cache.set(etag_scope, url, etag, response, size)
+
+        return response
+
+    def post(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        rate_limit_scope: Optional[str] = None,
+    ) -> requests.Response:
+        scope = rate_limit_scope or DEFAULT_SCOPE
+        return self._send("POST", url, dict(headers or {}), timeout, scope)
+
+    def delete(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        rate_limit_scope: Optional[str] = None,
+    ) -> requests.Response:
+        scope = rate_limit_scope or DEFAULT_SCOPE
+        return self._send("DELETE", url, dict(headers or {}), timeout, scope)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        scope: str,
+    ) -> requests.Response:
+        # Sleeping here would block the event loop and every request on it
+        can_wait = not _on_event_loop()
+
+        delay = self.rate_limits.backoff_seconds(scope)
+        if delay and can_wait:
+            logger.info(f"GitHub rate limit low for {scope}, backing off {delay:.2f}s")
+            time.sleep(delay)
+
+        response = self.session.request(method, url, headers=headers, timeout=timeout)
+        self.request_count += 1
+        self.rate_limits.update(scope, response.headers)
+
+        if self.rate_limits.is_rate_limited(response.status_code, response.headers):
+            if not can_wait:
+                logger.warning(f"GitHub rate limited {method} {url}, not retrying")
+                return response
+            # Retry once after the advertised (capped) backoff.
+            delay = self.rate_limits.backoff_seconds(scope)
+            logger.warning(
+                f"GitHub rate limited {method} {url}, retrying in {delay:.2f}s"
+            )
+            time.sleep(delay)
+            response = self.session.request(
+                method, url, headers=headers, timeout=timeout
+            )
+            self.request_count += 1
+            self.rate_limits.update(scope, response.headers)
+
+        return response
+
+    def reset(self) -> None:
+        """Drop cached responses, rate-limit state and pooled connections."""
+        self.etag_cache.clear()
+        self.rate_limits.clear()
+        self.request_count = 0
+        self.not_modified_count = 0
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+class AsyncGitHubHttpClient:
+    """``httpx.AsyncClient`` counterpart of :class:`GitHubHttpClient`."""
+
+    def __init__(
+        self,
+        pool_maxsize: int,
+        etag_cache_max_bytes: int,
+        rate_limit_low_watermark: int,
+        rate_limit_max_backoff_seconds: float,
+    ) -> None:
+        self._pool_maxsize = pool_maxsize
+        self.etag_cache: ETagCache[httpx.Response] = ETagCache(etag_cache_max_bytes)
+        self.rate_limits = RateLimitTracker(
+            rate_limit_low_watermark, rate_limit_max_backoff_seconds
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.request_count = 0
+        self.not_modified_count = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Connections are bound to the event loop they were opened on
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            self._client_loop = loop
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self._pool_maxsize,
+                    max_keepalive_connections=self._pool_maxsize,
+                ),
+            )
+        return self._client
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        etag_scope: Optional[str] = None,
+        rate_limit_scope: Optional[str] = None,
+    ) -> httpx.Response:
+        """Async version of :meth:`GitHubHttpClient.get`."""
+        scope = rate_limit_scope or etag_scope or DEFAULT_SCOPE
+        request_headers = dict(headers or {})
+        cached = self.etag_cache.get(etag_scope, url) if etag_scope else None
+        if cached is not None:
+            request_headers["If-None-Match"] = cached.etag
+
+        response = await self._send("GET", url, request_headers, timeout, scope)
+
+        if cached is not None and response.status_code == 304:
+            self.not_modified_count += 1
+            return cached.response
+
+        etag = response.headers.get("ETag")
+        if etag_scope and etag and response.status_code == 200:
+            self.etag_cache.set(etag_scope, url, etag, response, len(response.content))
+
+        return response
+
+    async def post(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        rate_limit_scope: Optional[str] = None,
+    ) -> httpx.Response:
+        scope = rate_limit_scope or DEFAULT_SCOPE
+        return await self._send("POST", url, dict(headers or {}), timeout, scope)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        scope: str,
+    ) -> httpx.Response:
+        delay = self.rate_limits.backoff_seconds(scope)
+        if delay:
+            logger.info(f"GitHub rate limit low for {scope}, backing off {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+        response = await self.client.request(
+            method, url, headers=headers, timeout=timeout
+        )
+        self.request_count += 1
+        self.rate_limits.update(scope, response.headers)
+
+        if self.rate_limits.is_rate_limited(response.status_code, response.headers):
+            delay = self.rate_limits.backoff_seconds(scope)
+            logger.warning(
+                f"GitHub rate limited {method} {url}, retrying in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+            response = await self.client.request(
+                method, url, headers=headers, timeout=timeout
+            )
+            self.request_count += 1
+            self.rate_limits.update(scope, response.headers)
+
+        return response
+
+    async def aclose(self) -> None:
+        # A client opened on another event loop can only be closed there
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+            self._client = None
+
+    def reset(self) -> None:
+        """Drop cached responses and rate-limit state."""
+        self.etag_cache.clear()
+        self.rate_limits.clear()
+        self.request_count = 0
+        self.not_modified_count = 0
+
+
+def _on_event_loop() -> bool:
+    """True when called from a thread that is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _client_kwargs() -> Dict[str, Any]:
+    return {
+        "pool_maxsize": settings.github_http_pool_maxsize,
+        "etag_cache_max_bytes": settings.github_etag_cache_max_bytes,
+        "rate_limit_low_watermark": settings.github_rate_limit_low_watermark,
+        "rate_limit_max_backoff_seconds": settings.github_rate_limit_max_backoff_seconds,
+    }
+
+
+# Process-wide shared clients
+github_http_client = GitHubHttpClient(**_client_kwargs())
+async_github_http_client = AsyncGitHubHttpClient(**_client_kwargs())
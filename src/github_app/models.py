@@ -1,13 +1,28 @@
+import enum
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
-
-from sqlalchemy import DateTime, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import text
 
 from src.db import Base
+from src.github_app.file_index import (
+    compress_file_search_string,
+    count_file_search_string_paths,
+    decompress_file_search_string,
+)
 
 if TYPE_CHECKING:
     from src.models import GitHubInstallation
@@ -25,8 +40,8 @@ class RepositoryFileIndex(PrivateBase, Base):
     """
     Cached file index for GitHub repositories to enable fast autocomplete.
 
-    Stores a searchable string of all file paths in a repository,
-    updated via GitHub webhooks when repository contents change.
+    Stores a zstd-compressed searchable string of all file paths in a
+    repository, updated via GitHub webhooks when repository contents change.
     """
 
     __tablename__ = "repository_file_index"
@@ -51,8 +66,22 @@ class RepositoryFileIndex(PrivateBase, Base):
         String, nullable=False, index=True
     )
 
-    # Newline-separated sorted list of file paths for client-side search
-    file_search_string: Mapped[str] = mapped_column(Text, nullable=False)
+    # zstd-compressed, newline-separated sorted list of file paths; read and
+    # written through the file_search_string property
+    compressed_file_search_string: Mapped[bytes] = mapped_column(
+        LargeBinary, nullable=False
+    )
+
+    # Number of paths, so counting files never needs the paths themselves
+    file_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0"), default=0
+    )
+
+    # Whether file_search_string was rendered with @RepoName/ prefixes, so the
+    # prefixing can be switched locally when the repository count changes
+    uses_repo_prefix: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, server_default=text("false"), default=False
+    )
 
     # Commit SHA for webhook synchronization
     last_indexed_commit_sha: Mapped[Optional[str]] = mapped_column(
@@ -69,5 +98,90 @@ class RepositoryFileIndex(PrivateBase, Base):
         "GitHubInstallation", back_populates="repository_file_indexes"
     )
 
+    @property
+    def file_search_string(self) -> str:
+        """
+        Newline-separated sorted list of file paths for client-side search.
+
+        Decompressed on first access and reused until the stored bytes change.
+        """
+        compressed = self.compressed_file_search_string
+        if compressed is None:
+            return ""
+
+        cached = self.__dict__.get("_decoded_file_search_string")
+        if cached is not None and cached[0] is compressed:
+            return cached[1]
+
+        decoded = decompress_file_search_string(compressed)
+        self.__dict__["_decoded_file_search_string"] = (compressed, decoded)
+        return decoded
+
+    @file_search_string.setter
+    def file_search_string(self, value: str) -> None:
+        compressed = compress_file_search_string(value)
+        self.compressed_file_search_string = compressed
+        self.file_count = count_file_search_string_paths(value)
+        self.__dict__["_decoded_file_search_string"] = (compressed, value)
+
+    def __repr__(self) -> str:
+        return f"<RepositoryFileIndex(repository='{self.repository_full_name}', files={self.file_count})>"
+
+
+class WebhookDeliveryStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    PROCESSED = "PROCESSED"
+    SUPERSEDED = "SUPERSEDED"
+    FAILED = "FAILED"
+
+
+class GitHubWebhookDelivery(PrivateBase, Base):
+    """
+    A verified GitHub webhook delivery waiting to be (or already) processed.
+
+    Deliveries are persisted and acknowledged immediately by the webhook
+    endpoint and processed asynchronously by the webhook queue worker. The
+    unique ``delivery_id`` (X-GitHub-Delivery) de-duplicates redeliveries.
+    """
+
+    __tablename__ = "github_webhook_delivery"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
+    )
+
+    # X-GitHub-Delivery GUID, used to drop duplicate deliveries
+    delivery_id: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+
+    event_type: Mapped[str] = mapped_column(String, nullable=False)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    # Set for push events so pending pushes can be coalesced per repository
+    repository_full_name: Mapped[Optional[str]] = mapped_column(
+        String, nullable=True, index=True
+    )
+
+    status: Mapped[WebhookDeliveryStatus] = mapped_column(
+        Enum(WebhookDeliveryStatus, schema="private"),
+        nullable=False,
+        default=WebhookDeliveryStatus.PENDING,
+        server_default=WebhookDeliveryStatus.PENDING.value,
+        index=True,
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    received_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=text("NOW()"), default=datetime.now
+    )
+    locked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
     def __repr__(self) -> str:
-        return f"<RepositoryFileIndex(repository='{self.repository_full_name}', files={len(self.file_search_string.split())})>"
+        return f"<GitHubWebhookDelivery(delivery_id='{self.delivery_id}', event='{self.event_type}', status='{self.status}')>"
@@ -0,0 +1,242 @@
+"""
+In-process file path autocomplete over RepositoryFileIndex rows.
+
+Each repository's sorted, @-prefixed paths are kept as one newline-joined
+blob with an ``array`` of line offsets, plus a lowercased copy of the blob
+only when some path has uppercase letters. Lookups run ``str.find`` over the
+lowercased blob (C speed, no per-path Python work) and map hits back to
+paths with binary search on the offsets, so a query over 100k+ paths answers
+in milliseconds without shipping the list to the browser.
+
+The scan is deliberate. A prefix index (every segment start, sorted by the
+rest of its line) took ~650ms to build for 100k paths against ~40ms for the
+blob, to save a few milliseconds per prefix query; a trigram index took
+close to two seconds and several MB of postings. Instead, substring matches
+are only scanned for when prefix matches cannot fill the limit.
+
+Indexes are cached per process and rebuilt when the row's
+``last_indexed_commit_sha`` (or its prefixing/name/timestamp) changes.
+"""
+
+import heapq
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Sequence, Tuple
+
+from src.config import settings
+
+# Match tiers, best first
+BASENAME_PREFIX_MATCH = 0
+SEGMENT_PREFIX_MATCH = 1
+SUBSTRING_MATCH = 2
+FUZZY_MATCH = 3
+
+# Ranked result: (tier, path length, path)
+RankedPath = Tuple[int, int, str]
+
+
+class PathSearchIndex:
+    """Memory-compact, case-insensitive search over one repository's paths."""
+
+    __slots__ = ("_paths", "_haystack", "_offsets")
+
+    def __init__(self, paths: Sequence[str]) -> None:
+        self._paths = "\n" + "\n".join(paths) + "\n"
+        haystack = self._paths.lower()
+        if len(haystack) != len(self._paths):
+            # A few characters lengthen when lowercased (e.g. "İ"); paths
+            # holding one stay as they are so both blobs share offsets
+            haystack = "\n" + "\n".join(map(_lower_in_place, paths)) + "\n"
+        # All-lowercase paths (the common case) need no second copy
+        self._haystack = self._paths if haystack == self._paths else haystack
+
+        # _offsets[i] is where path i starts in the blobs; the trailing
+        # sentinel marks the end of the last path
+        self._offsets = array("I")
+        position = 1
+        for path in paths:
+            self._offsets.append(position)
+            position += len(path) + 1
+        self._offsets.append(position)
+
+    @classmethod
+    def from_file_search_string(cls, file_search_string: str) -> "PathSearchIndex":
+        return cls([line for line in file_search_string.split("\n") if line])
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _path(self, line: int) -> str:
+        return self._paths[self._offsets[line] : self._offsets[line + 1] - 1]
+
+    def search(self, query: str, limit: int) -> List[RankedPath]:
+        """
+        Return the best ``limit`` matches for ``query``.
+
+        Matches are ranked by tier (basename prefix, path segment prefix,
+        substring, then in-order fuzzy match), then by shorter path.
+        """
+        needle = query.strip().lower()
+        if not needle or "\n" in needle or limit <= 0:
+            return []
+
+        candidate_cap = max(limit * 50, 1000)
+        tiers: Dict[int, int] = {}
+
+        for segment_start in ("/", "@"):
+            for line in self._scan(
+                segment_start + needle, len(segment_start), candidate_cap
+            ):
+                tiers.setdefault(line, SEGMENT_PREFIX_MATCH)
+        if needle.startswith("@"):
+            for line in self._scan("\n" + needle, 1, candidate_cap):
+                tiers.setdefault(line, SEGMENT_PREFIX_MATCH)
+
+        # Substring matches rank below every prefix match
+        if len(tiers) < limit:
+            for line in self._scan(needle, 0, candidate_cap - len(tiers)):
+                tiers.setdefault(line, SUBSTRING_MATCH)
+
+        if len(tiers) < limit:
+            for line in self._fuzzy_scan(needle, limit - len(tiers)):
+                tiers.setdefault(line, FUZZY_MATCH)
+
+        ranked = []
+        for line, tier in tiers.items():
+            path = self._path(line)
+            if tier == SEGMENT_PREFIX_MATCH:
+                basename = path[path.rfind("/") + 1 :].lower()
+                if basename.startswith(needle) or basename.startswith(
+                    needle.lstrip("@")
+                ):
+                    tier = BASENAME_PREFIX_MATCH
+            ranked.append((tier, len(path), path))
+
+        return heapq.nsmallest(limit, ranked)
+
+    def _scan(self, needle: str, skip: int, cap: int) -> List[int]:
+        """Return ids of paths containing ``needle`` (at most ``cap``, in order)."""
+        lines: List[int] = []
+        start = 0
+        while len(lines) < cap:
+            position = self._haystack.find(needle, start)
+            if position < 0:
+                break
+            line = bisect_right(self._offsets, position + skip) - 1
+            if line < 0 or line >= len(self):
+                break
+            lines.append(line)
+            # Continue after this path so each path is reported once
+            start = self._offsets[line + 1] - 1
+        return lines
+
+    def _fuzzy_scan(self, needle: str, cap: int) -> List[int]:
+        """Return ids of paths containing the characters of ``needle`` in order.
+
+        Each candidate path is checked with one bounded ``str.find`` per
+        character, so the scan is linear in the haystack whatever the query.
+        """
+        if len(needle) < 2:
+            return []
+
+        haystack = self._haystack
+        offsets = self._offsets
+        first, rest = needle[0], needle[1:]
+        lines: List[int] = []
+        line = 0
+        while line < len(self) and len(lines) < cap:
+            # Jump to the next path containing the first character
+            position = haystack.find(first, offsets[line])
+            if position < 0:
+                break
+            line = bisect_right(offsets, position) - 1
+            end = offsets[line + 1] - 1
+            for char in rest:
+                position = haystack.find(char, position + 1, end)
+                if position < 0:
+                    break
+            else:
+                lines.append(line)
+            line += 1
+        return lines
+
+
+def _lower_in_place(path: str) -> str:
+    lowered = path.lower()
+    return lowered if len(lowered) == len(path) else path
+
+
+class PathSearchIndexCache:
+    """Thread-safe LRU of PathSearchIndex objects keyed by file index id."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Hashable, PathSearchIndex]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self,
+        key: Hashable,
+        version: Hashable,
+        load_file_search_string: Callable[[], str],
+    ) -> PathSearchIndex:
+        """
+        Return the cached index for ``key`` if it was built for ``version``.
+
+        ``load_file_search_string`` is only called on a miss, so callers can
+        defer loading the (large) search string column until it is needed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        index = PathSearchIndex.from_file_search_string(load_file_search_string())
+
+        with self._lock:
+            self._entries[key] = (version, index)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def merge_ranked_paths(
+    results: Sequence[Tuple[str, List[RankedPath]]], limit: int
+) -> List[Tuple[str, str]]:
+    """
+    Merge per-repository results into the overall best ``limit`` matches.
+
+    Args:
+        results: (repository_full_name, ranked paths) pairs
+        limit: Maximum number of matches to return
+
+    Returns:
+        List[Tuple[str, str]]: (repository_full_name, path) pairs, best first
+    """
+    merged = heapq.nsmallest(
+        limit,
+        (
+            (rank, repository_full_name)
+            for repository_full_name, ranked in results
+            for rank in ranked
+        ),
+    )
+    return [(repository_full_name, rank[2]) for rank, repository_full_name in merged]
+
+
+path_search_cache = PathSearchIndexCache(settings.github_path_search_cache_size)
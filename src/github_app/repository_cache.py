@@ -0,0 +1,156 @@
+"""
+Cached repository listings for GitHub App installations.
+
+Listing an installation's repositories costs an installation token mint plus a
+GitHub API call, which used to happen on every account and repositories page
+render. The listing is now stored on the GitHubInstallation row:
+
+* pages render straight from the stored listing, and only call GitHub when
+  nothing has been stored yet;
+* a listing older than ``settings.github_repository_list_cache_ttl_seconds``
+  is still rendered, and refreshed in a background task after the response;
+* ``installation_repositories`` and unsuspend webhooks refresh it, so access
+  changes show up without waiting for the TTL.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set
+
+import sentry_sdk
+from fastapi import BackgroundTasks
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.db import SessionLocal
+from src.github_app.github_service import GitHubService
+from src.models import GitHubInstallation
+
+logger = logging.getLogger(__name__)
+
+# Fields of GitHub's repository objects the templates and indexer use; the
+# rest (dozens of API URLs per repository) is not worth storing
+CACHED_REPOSITORY_FIELDS = (
+    "id",
+    "name",
+    "full_name",
+    "private",
+    "description",
+    "html_url",
+    "default_branch",
+    "updated_at",
+)
+
+_refreshes_in_flight: Set[str] = set()
+_refreshes_lock = threading.Lock()
+
+
+def get_installation_repositories(
+    github_installation: GitHubInstallation,
+    db: Session,
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Return the repositories of an installation, preferring the stored listing.
+
+    Args:
+        github_installation: The GitHub installation record
+        db: Database session
+        background_tasks: Where to schedule a refresh of a stale listing; a
+            stale listing is served without refreshing when omitted
+
+    Returns:
+        List[Dict[str, Any]]: Repository dicts (see CACHED_REPOSITORY_FIELDS)
+    """
+    cached = github_installation.repositories_cache
+    if cached is None:
+        # Cold cache: nothing to render yet, so fetch it in the request
+        repositories = refresh_installation_repositories(github_installation, db)
+        return repositories if repositories is not None else []
+
+    if background_tasks is not None and is_repository_cache_stale(github_installation):
+        installation_id = github_installation.installation_id
+        with _refreshes_lock:
+            schedule = installation_id not in _refreshes_in_flight
+            _refreshes_in_flight.add(installation_id)
+        if schedule:
+            background_tasks.add_task(_refresh_in_background, installation_id)
+
+    return cached
+
+
+def is_repository_cache_stale(github_installation: GitHubInstallation) -> bool:
+    cached_at = github_installation.repositories_cached_at
+    if cached_at is None:
+        return True
+    max_age = timedelta(seconds=settings.github_repository_list_cache_ttl_seconds)
+    return datetime.now() - cached_at > max_age
+
+
+def refresh_installation_repositories(
+    github_installation: GitHubInstallation, db: Session
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetch the installation's repositories from GitHub and store them.
+
+    A failed request leaves the stored listing untouched.
+
+    Returns:
+        Optional[List[Dict[str, Any]]]: The stored listing, or None on failure
+    """
+    try:
+        repositories = GitHubService.list_installation_repositories(
+            github_installation.installation_id
+        )
+    except Exception as e:
+        logger.error(
+            f"Error listing repositories for installation {github_installation.installation_id}: {str(e)}"
+        )
+        sentry_sdk.capture_exception(e)
+        return None
+
+    store_installation_repositories(github_installation, repositories)
+    db.commit()
+    return github_installation.repositories_cache
+
+
+def store_installation_repositories(
+    github_installation: GitHubInstallation, repositories: List[Dict[str, Any]]
+) -> None:
+    """Store an already fetched listing on the installation (caller commits)."""
+    github_installation.repositories_cache = [
+        _cacheable_repository(repo) for repo in repositories
+    ]
+    github_installation.repositories_cached_at = datetime.now()
+
+
+def _cacheable_repository(repo: Dict[str, Any]) -> Dict[str, Any]:
+    cached = {field: repo[field] for field in CACHED_REPOSITORY_FIELDS if field in repo}
+    owner = repo.get("owner")
+    if isinstance(owner, dict) and "login" in owner:
+        cached["owner"] = {"login": owner["login"]}
+    return cached
+
+
+def _refresh_in_background(installation_id: str) -> None:
+    """Refresh a stale listing after the response has been sent."""
+    db = SessionLocal()
+    try:
+        github_installation = (
+            db.query(GitHubInstallation)
+            .filter(GitHubInstallation.installation_id == installation_id)
+            .first()
+        )
+        if github_installation and is_repository_cache_stale(github_installation):
+            refresh_installation_repositories(github_installation, db)
+    except Exception as e:
+        db.rollback()
+        logger.error(
+            f"Error refreshing repositories for installation {installation_id}: {str(e)}"
+        )
+        sentry_sdk.capture_exception(e)
+    finally:
+        db.close()
+        with _refreshes_lock:
+            _refreshes_in_flight.discard(installation_id)
@@ -0,0 +1,286 @@
+"""
+Concurrent file indexing for many repositories of one GitHub installation.
+
+Installing the app, unsuspending it or adding repositories can bring in dozens
+of repositories at once. Instead of fetching and storing them one at a time,
+their trees are fetched concurrently (bounded by
+``settings.github_indexing_concurrency``; the async GitHub client backs off as
+the rate limit runs low) with a single installation token, and every resulting
+index is written with one bulk upsert.
+
+Fetches run on one long-lived event loop in a daemon thread, so the shared
+async GitHub client keeps its connections across batches; it is closed once,
+by ``close_indexing_loop`` at shutdown. ``index_repositories`` blocks until
+its fetches finish and must be called off the server's event loop (from a
+background task or worker thread).
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Coroutine, Dict, List, Optional, TypeVar
+
+import sentry_sdk
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.github_app.file_index import (
+    compress_file_search_string,
+    render_file_search_string,
+)
+from src.github_app.github_service import GitHubService
+from src.github_app.http_client import async_github_http_client
+from src.github_app.models import RepositoryFileIndex
+from src.models import GitHubInstallation
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class RepositoryTree:
+    """File paths of one repository at a specific commit."""
+
+    repository_full_name: str
+    repo_name: str
+    file_paths: List[str]
+    commit_sha: Optional[str]
+
+
+def index_repositories(
+    installation_id: str, repositories: List[Dict[str, Any]], db: Session
+) -> int:
+    """
+    Create file indexes for repositories of an installation.
+
+    Repositories that already have an index are left alone. The rest are
+    fetched concurrently and stored with one bulk upsert, rendered with the
+    prefixing strategy for the installation's final repository count.
+
+    Args:
+        installation_id: The GitHub App installation ID
+        repositories: Repository dicts from GitHub (need "full_name"; an
+            optional "default_branch" saves a metadata request per repository)
+        db: Database session
+
+    Returns:
+        int: Number of the given repositories that now have a file index
+    """
+    github_installation = (
+        db.query(GitHubInstallation)
+        .filter(GitHubInstallation.installation_id == installation_id)
+        .first()
+    )
+    if not github_installation:
+        logger.error(f"No GitHub installation found for ID {installation_id}")
+        return 0
+
+    existing_names = {
+        name
+        for (name,) in db.query(RepositoryFileIndex.repository_full_name).filter(
+            RepositoryFileIndex.github_installation_id == github_installation.id
+        )
+    }
+
+    requested = {}
+    for repo in repositories:
+        repo_full_name = repo.get("full_name")
+        if repo_full_name and "/" in repo_full_name:
+            requested[repo_full_name] = repo
+        elif repo_full_name:
+            logger.error(f"Invalid repository full name format: {repo_full_name}")
+
+    to_fetch = [repo for name, repo in requested.items() if name not in existing_names]
+    already_indexed = len(requested) - len(to_fetch)
+    if not to_fetch:
+        return already_indexed
+
+    try:
+        headers = GitHubService._get_auth_headers(installation_id)
+    except Exception as e:
+        logger.error(
+            f"Error getting installation token for {installation_id}: {str(e)}"
+        )
+        sentry_sdk.capture_exception(e)
+        return already_indexed
+
+    trees = run_sync(fetch_repository_trees(installation_id, to_fetch, headers))
+    if not trees:
+        return already_indexed
+
+    use_repo_prefix = len(existing_names) + len(trees) > 1
+    _bulk_upsert_file_indexes(github_installation.id, trees, use_repo_prefix, db)
+    db.commit()
+
+    logger.info(
+        f"Indexed {len(trees)}/{len(to_fetch)} repositories for installation {installation_id}"
+    )
+    return already_indexed + len(trees)
+
+
+async def fetch_repository_trees(
+    installation_id: str,
+    repositories: List[Dict[str, Any]],
+    headers: Dict[str, str],
+    concurrency: Optional[int] = None,
+) -> List[RepositoryTree]:
+    """
+    Fetch the file trees of many repositories concurrently.
+
+    Repositories whose tree cannot be fetched are logged and left out.
+
+    Args:
+        installation_id: The GitHub App installation ID
+        repositories: Repository dicts with "full_name" and optional "default_branch"
+        headers: Authentication headers shared by every request
+        concurrency: Maximum repositories in flight (default from settings)
+
+    Returns:
+        List[RepositoryTree]: Trees that were fetched successfully, in input order
+    """
+    semaphore = asyncio.Semaphore(concurrency or settings.github_indexing_concurrency)
+
+    async def fetch(repo: Dict[str, Any]) -> Optional[RepositoryTree]:
+        repo_full_name = repo["full_name"]
+        repo_owner, repo_name = repo_full_name.split("/", 1)
+        async with semaphore:
+            file_tree_response = await GitHubService.get_file_tree_async(
+                installation_id,
+                repo_owner,
+                repo_name,
+                headers,
+                ref=repo.get("default_branch"),
+            )
+
+        if "error" in file_tree_response:
+            logger.error(
+                f"GitHub API error for {repo_full_name}: {file_tree_response.get('error')}"
+            )
+            return None
+
+        return RepositoryTree(
+            repository_full_name=repo_full_name,
+            repo_name=repo_name,
+            file_paths=GitHubService.extract_file_paths(file_tree_response),
+            commit_sha=file_tree_response.get(
+                "commit_sha", file_tree_response.get("sha")
+            ),
+        )
+
+    results = await asyncio.gather(*(fetch(repo) for repo in repositories))
+    return [tree for tree in results if tree is not None]
+
+
+def _bulk_upsert_file_indexes(
+    github_installation_id: Any,
+    trees: List[RepositoryTree],
+    use_repo_prefix: bool,
+    db: Session,
+) -> None:
+    """Insert (or refresh) the file indexes for ``trees`` in one statement."""
+    now = datetime.now()
+    rows = []
+    for tree in trees:
+        file_search_string = render_file_search_string(
+            tree.file_paths, tree.repo_name, use_repo_prefix
+        )
+        rows.append(
+            {
+                "github_installation_id": github_installation_id,
+                "repository_full_name": tree.repository_full_name,
+                "compressed_file_search_string": compress_file_search_string(
+                    file_search_string
+                ),
+                "file_count": len(tree.file_paths),
+                "uses_repo_prefix": use_repo_prefix,
+                "last_indexed_commit_sha": tree.commit_sha,
+                "updated_at": now,
+            }
+        )
+
+    statement = insert(RepositoryFileIndex).values(rows)
+    db.execute(
+        statement.on_conflict_do_update(
+            index_elements=["github_installation_id", "repository_full_name"],
+            set_={
+                column: statement.excluded[column]
+                for column in (
+                    "compressed_file_search_string",
+                    "file_count",
+                    "uses_repo_prefix",
+                    "last_indexed_commit_sha",
+                    "updated_at",
+                )
+            },
+        )
+    )
+
+
+class _IndexingLoop:
+    """An event loop running forever in a daemon thread, started on first use."""
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._run, args=(loop,), name="github-indexing", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def take(self) -> Optional[asyncio.AbstractEventLoop]:
+        with self._lock:
+            loop, self._loop = self._loop, None
+            return loop
+
+
+_indexing_loop = _IndexingLoop()
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the indexing loop and wait for its result.
+
+    Raises:
+        RuntimeError: If called on a thread running an event loop, which the
+            wait would block
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coroutine.close()
+        raise RuntimeError(
+            "run_sync blocks; call it from a background task or worker thread"
+        )
+
+    return asyncio.run_coroutine_threadsafe(coroutine, _indexing_loop.get()).result()
+
+
+async def close_indexing_loop() -> None:
+    """Close the shared async GitHub client and stop the indexing loop."""
+    loop = _indexing_loop.take()
+    if loop is None:
+        return
+    await asyncio.wrap_future(
+        asyncio.run_coroutine_threadsafe(async_github_http_client.aclose(), loop)
+    )
+    loop.call_soon_threadsafe(loop.stop)
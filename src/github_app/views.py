@@ -2,9 +2,10 @@ import hashlib
 import hmac
 import logging
 from datetime import datetime
-from typing import Annotated, Any, Dict, List
+from typing import Annotated, Any, Dict, List, Optional
 
 from fastapi import (
+    BackgroundTasks,
     Body,
     Depends,
     Header,
@@ -18,11 +19,12 @@ from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.security import APIKeyHeader
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from src.config import settings
-from src.db import get_db
+from src.db import SessionLocal, get_db
 from src.github_app import controller as github_app_controller
-from src.github_app import webhook_controller
+from src.github_app import webhook_queue
 from src.main import app
 from src.models import User
 from src.views import dependency_to_override
@@ -39,9 +41,11 @@ logger = logging.getLogger(__name__)
 @app.post("/github/webhook", response_class=Response)
 async def github_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
     payload: dict = Body(...),  # Use dict instead of Pydantic model to access raw JSON
     x_hub_signature_256: str = Security(webhook_security),
     x_github_event: Annotated[str | None, Header()] = None,
+    x_github_delivery: Annotated[str | None, Header()] = None,
     db: Session = Depends(get_db),
 ) -> Response:
     # The webhook_security dependency (auto_error=True) handles missing X-Hub-Signature-256
@@ -62,20 +66,54 @@ async def github_webhook(
     if not hmac.compare_digest(expected_signature, x_hub_signature_256):
         raise HTTPException(status_code=401, detail="Invalid signature")
 
-    logger.info(f"Received GitHub webhook: {x_github_event}")
+    # GitHub always sends a delivery id; fall back to the body digest so that
+    # byte-identical redeliveries are still de-duplicated
+    delivery_id = x_github_delivery or hashlib.sha256(raw_body).hexdigest()
+
+    logger.info(f"Received GitHub webhook: {x_github_event} ({delivery_id})")
     logger.debug(f"GitHub webhook payload: {payload}")
 
-    # Process the webhook with raw payload
-    return webhook_controller.handle_github_webhook(payload, str(x_github_event), db)
+    # Persist and acknowledge; processing happens outside the request
+    queued = webhook_queue.enqueue_webhook_delivery(
+        delivery_id, str(x_github_event), payload, db
+    )
+
+    if queued and settings.github_webhook_inline_processing:
+        background_tasks.add_task(_drain_webhook_queue)
+
+    return Response(
+        content="Webhook queued" if queued else "Duplicate delivery ignored",
+        status_code=202,
+    )
+
+
+def _drain_webhook_queue() -> None:
+    """Process queued webhooks after the response has been sent."""
+    db = SessionLocal()
+    try:
+        webhook_queue.drain_webhook_queue(db)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error draining GitHub webhook queue: {str(e)}")
+    finally:
+        db.close()
 
 
 @app.get("/repositories", response_class=HTMLResponse)
 async def repositories(
     request: Request,
+    background_tasks: BackgroundTasks,
     user=Depends(dependency_to_override),
     db: Session = Depends(get_db),
 ) -> HTMLResponse:
-    return github_app_controller.get_repositories_template(request, user, db)
+    # A cold repository listing is fetched from GitHub; keep it off the event loop
+    return await run_in_threadpool(
+        github_app_controller.get_repositories_template,
+        request,
+        user,
+        db,
+        background_tasks,
+    )
 
 
 @app.get("/github/install", response_class=RedirectResponse)
@@ -88,10 +126,13 @@ async def github_app_install(
 @app.get("/auth/github-app-callback", response_class=Response)
 async def github_app_callback(
     payload: Annotated[github_app_controller.GithubAppInstallationCallback, Query()],
+    background_tasks: BackgroundTasks,
     user=Depends(dependency_to_override),
     db: Session = Depends(get_db),
 ) -> Response:
-    return github_app_controller.handle_installation_callback(payload, user, db)
+    return github_app_controller.handle_installation_callback(
+        payload, user, db, background_tasks
+    )
 
 
 @app.get("/github/uninstall", response_class=RedirectResponse)
@@ -129,6 +170,17 @@ class AllFileSearchStringsResponse(BaseModel):
     success: bool
 
 
+class FilePathMatch(BaseModel):
+    repository_full_name: str
+    path: str  # Formatted like the search string lines (@repo/path or @path)
+
+
+class FilePathSearchResponse(BaseModel):
+    query: str
+    matches: List[FilePathMatch]
+    success: bool
+
+
 class RepositoryNamesResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -138,20 +190,45 @@ class RepositoryNamesResponse(BaseModel):
     success: bool
 
 
+def _etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    if not if_none_match or not etag:
+        return False
+    return etag in [tag.strip() for tag in if_none_match.split(",")]
+
+
+# Browsers revalidate on every use so changed indexes are picked up immediately
+FILE_SEARCH_STRING_CACHE_CONTROL = "private, no-cache"
+
+# Longer queries match nothing useful and only cost scan time
+FILE_SEARCH_QUERY_MAX_LENGTH = 256
+
+
 @app.get("/api/github/file-search-string", response_class=JSONResponse)
 async def get_file_search_string(
     repository_full_name: str = Query(
         ..., description="Repository in owner/repo format"
     ),
+    if_none_match: Annotated[str | None, Header()] = None,
     user=Depends(dependency_to_override),
     db: Session = Depends(get_db),
-) -> JSONResponse:
+) -> Response:
     """Return file search string for autocomplete"""
     try:
+        etag = github_app_controller.get_file_search_strings_etag(
+            user, db, repository_full_name
+        )
+        headers = (
+            {"ETag": etag, "Cache-Control": FILE_SEARCH_STRING_CACHE_CONTROL}
+            if etag
+            else None
+        )
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
         result = github_app_controller.get_file_search_string_for_user(
             user, repository_full_name, db
         )
-        return JSONResponse(content=result.model_dump(mode="json"))
+        return JSONResponse(content=result.model_dump(mode="json"), headers=headers)
     except HTTPException:
         # Re-raise HTTPExceptions as-is
         raise
@@ -162,13 +239,23 @@ async def get_file_search_string(
 
 @app.get("/api/github/file-search-strings", response_class=JSONResponse)
 async def get_all_file_search_strings(
+    if_none_match: Annotated[str | None, Header()] = None,
     user=Depends(dependency_to_override),
     db: Session = Depends(get_db),
-) -> JSONResponse:
+) -> Response:
     """Return all file search strings for user's repositories"""
     try:
+        etag = github_app_controller.get_file_search_strings_etag(user, db)
+        headers = (
+            {"ETag": etag, "Cache-Control": FILE_SEARCH_STRING_CACHE_CONTROL}
+            if etag
+            else None
+        )
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
         result = github_app_controller.get_all_file_search_strings_for_user(user, db)
-        return JSONResponse(content=result.model_dump(mode="json"))
+        return JSONResponse(content=result.model_dump(mode="json"), headers=headers)
     except HTTPException:
         # Re-raise HTTPExceptions as-is
         raise
@@ -177,6 +264,41 @@ async def get_all_file_search_strings(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.get("/api/github/file-search", response_class=JSONResponse)
+async def search_file_paths(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=FILE_SEARCH_QUERY_MAX_LENGTH,
+        description="Partial file path to match",
+    ),
+    repository_full_name: Optional[str] = Query(
+        None, description="Limit the search to one repository (owner/repo)"
+    ),
+    limit: int = Query(20, ge=1, le=100),
+    user=Depends(dependency_to_override),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Return the best matching file paths across the user's repositories"""
+    try:
+        # Building and scanning indexes is CPU work; keep it off the event loop
+        result = await run_in_threadpool(
+            github_app_controller.search_file_paths_for_user,
+            user,
+            q,
+            db,
+            repository_full_name=repository_full_name,
+            limit=limit,
+        )
+        return JSONResponse(content=result.model_dump(mode="json"))
+    except HTTPException:
+        # Re-raise HTTPExceptions as-is
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error in search_file_paths: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @app.get("/api/github/repository-names", response_class=JSONResponse)
 async def get_user_repository_names(
     user=Depends(dependency_to_override),
@@ -1,13 +1,27 @@
 import logging
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import sentry_sdk
 from fastapi import Response
 from sqlalchemy.orm import Session
 
+from src.github_app.file_index import (
+    NULL_SHA,
+    apply_push_commits,
+    parse_file_search_string,
+    push_changes_file_paths,
+    push_requires_full_reindex,
+    render_file_search_string,
+    reprefix_file_search_string,
+)
 from src.github_app.github_service import GitHubService
 from src.github_app.models import RepositoryFileIndex
+from src.github_app.repository_cache import (
+    refresh_installation_repositories,
+    store_installation_repositories,
+)
+from src.github_app.repository_indexer import index_repositories
 from src.models import GitHubInstallation
 
 logger = logging.getLogger(__name__)
@@ -279,16 +293,10 @@ def _handle_installation_unsuspended(installation_id: int, db: Session) -> Respo
                 status_code=200,
             )
 
-        # Recreate file indexes for all repositories
-        success_count = 0
+        store_installation_repositories(github_installation, repo_list)
 
-        for repo in repo_list:
-            repo_full_name = repo.get("full_name")
-            if repo_full_name:
-                if _create_repository_file_index(
-                    str(installation_id), repo_full_name, db, commit=False
-                ):
-                    success_count += 1
+        # Recreate file indexes for all repositories concurrently
+        success_count = index_repositories(str(installation_id), repo_list, db)
 
         # Update prefixing strategy if repositories were added successfully
         if success_count > 0:
@@ -320,18 +328,15 @@ def _handle_repositories_added(
     repo_names = [repo.get("full_name", "unknown") for repo in repositories]
     logger.info(f"Repositories added to installation {installation_id}: {repo_names}")
 
-    # Create file indexes for all newly added repositories
-    success_count = 0
-    for repo in repositories:
-        repo_full_name = repo.get("full_name")
-        if repo_full_name:
-            if _create_repository_file_index(str(installation_id), repo_full_name, db):
-                success_count += 1
+    # Create file indexes for all newly added repositories concurrently
+    success_count = index_repositories(str(installation_id), repositories, db)
 
     # Update prefixing strategy if repositories were added successfully
     if success_count > 0:
         _update_prefixing_strategy(str(installation_id), db)
 
+    _refresh_repository_listing(installation_id, db)
+
     logger.info(
         f"Successfully processed {success_count}/{len(repositories)} repository additions"
     )
@@ -362,6 +367,8 @@ def _handle_repositories_removed(
     if success_count > 0:
         _update_prefixing_strategy(str(installation_id), db)
 
+    _refresh_repository_listing(installation_id, db)
+
     logger.info(
         f"Successfully processed {success_count}/{len(repositories)} repository removals"
     )
@@ -371,6 +378,17 @@ def _handle_repositories_removed(
     )
 
 
+def _refresh_repository_listing(installation_id: int, db: Session) -> None:
+    """Re-fetch the cached repository listing after access changed."""
+    github_installation = (
+        db.query(GitHubInstallation)
+        .filter(GitHubInstallation.installation_id == str(installation_id))
+        .first()
+    )
+    if github_installation:
+        refresh_installation_repositories(github_installation, db)
+
+
 def _handle_repository_deleted(repo_full_name: str, db: Session) -> Response:
     """Handle repository deletion."""
     logger.info(f"Repository deleted: {repo_full_name}")
@@ -469,7 +487,10 @@ def _handle_repository_updated(
 
         # Update the repository file index
         repo_file_index.file_search_string = new_file_search_string
-        repo_file_index.last_indexed_commit_sha = file_tree_response.get("sha")
+        repo_file_index.uses_repo_prefix = use_repo_prefix
+        repo_file_index.last_indexed_commit_sha = file_tree_response.get(
+            "commit_sha", file_tree_response.get("sha")
+        )
 
         db.commit()
 
@@ -519,18 +540,31 @@ def handle_push_event(payload: Dict[str, Any], db: Session) -> Response:
         return Response(content="Push event missing commit SHA", status_code=400)
 
     # Handle branch deletion (commit SHA is all zeros)
-    if commit_sha == "0000000000000000000000000000000000000000":
+    if commit_sha == NULL_SHA:
         logger.info(f"Branch deletion detected for repository {repo_full_name}")
         return Response(
             content=f"Branch deletion processed: {repo_full_name}", status_code=200
         )
 
+    # The index tracks the default branch; pushes elsewhere don't change it
+    default_branch = repository.get("default_branch")
+    if default_branch and payload.get("ref") != f"refs/heads/{default_branch}":
+        logger.info(
+            f"Ignoring push to non-default branch {payload.get('ref')} of {repo_full_name}"
+        )
+        return Response(
+            content=f"Push to non-default branch ignored: {repo_full_name}",
+            status_code=200,
+        )
+
     logger.info(
         f"Processing push event for repository {repo_full_name}, commit {commit_sha[:8]}"
     )
 
     try:
-        return _update_repository_file_index(repo_full_name, commit_sha, db)
+        return _update_repository_file_index(
+            repo_full_name, commit_sha, db, payload=payload
+        )
     except Exception as e:
         logger.error(f"Error updating file index for {repo_full_name}: {str(e)}")
         sentry_sdk.capture_exception(e)
@@ -542,15 +576,24 @@ def handle_push_event(payload: Dict[str, Any], db: Session) -> Response:
 
 
 def _update_repository_file_index(
-    repo_full_name: str, commit_sha: str, db: Session
+    repo_full_name: str,
+    commit_sha: str,
+    db: Session,
+    payload: Optional[Dict[str, Any]] = None,
 ) -> Response:
     """
     Update the file index for a specific repository.
 
+    When the push payload describes every change since the indexed commit, the
+    added/removed paths are applied to the stored path list directly. A full
+    tree fetch from GitHub is only needed for truncated payloads, force-pushes
+    or when the push does not start at ``last_indexed_commit_sha``.
+
     Args:
         repo_full_name: Repository identifier in "owner/repo" format
         commit_sha: The new commit SHA after the push
         db: Database session
+        payload: The push webhook payload, if available
 
     Returns:
         Response: HTTP response
@@ -595,21 +638,6 @@ def _update_repository_file_index(
             content=f"Invalid repository name format: {repo_full_name}", status_code=200
         )
 
-    # Fetch updated file tree from GitHub
-    file_tree_response = GitHubService.get_file_tree(
-        github_installation.installation_id,
-        repo_owner,
-        repo_name,
-        recursive=True,
-    )
-
-    # Check for API errors
-    if "error" in file_tree_response:
-        logger.error(
-            f"GitHub API error for {repo_full_name}: {file_tree_response.get('error')}"
-        )
-        return Response(content=f"GitHub API error: {repo_full_name}", status_code=200)
-
     # Determine repository count for prefixing strategy
     total_repos = (
         db.query(RepositoryFileIndex)
@@ -618,13 +646,68 @@ def _update_repository_file_index(
     )
     use_repo_prefix = total_repos > 1
 
-    # Generate new file search string
-    new_file_search_string = GitHubService.generate_file_search_string(
-        file_tree_response, repo_name, use_repo_prefix
+    full_reindex_reason = (
+        push_requires_full_reindex(payload, repo_file_index.last_indexed_commit_sha)
+        if payload is not None
+        else "no push payload"
     )
 
+    if full_reindex_reason is None:
+        assert payload is not None
+        commits = payload.get("commits") or []
+        # The index is one compressed string, so a push that adds or removes
+        # paths still decompresses, patches and recompresses all of it; pushes
+        # that only modify files (the usual case) leave it untouched
+        changed = False
+        if push_changes_file_paths(commits):
+            file_paths = parse_file_search_string(
+                repo_file_index.file_search_string,
+                repo_name,
+                repo_file_index.uses_repo_prefix,
+            )
+            changed = apply_push_commits(file_paths, commits)
+            if changed:
+                repo_file_index.file_search_string = render_file_search_string(
+                    file_paths, repo_name, use_repo_prefix
+                )
+        if not changed and repo_file_index.uses_repo_prefix != use_repo_prefix:
+            repo_file_index.file_search_string = reprefix_file_search_string(
+                repo_file_index.file_search_string,
+                repo_name,
+                repo_file_index.uses_repo_prefix,
+                use_repo_prefix,
+            )
+        logger.info(
+            f"Applied {len(payload.get('commits') or [])} commits incrementally to "
+            f"file index for {repo_full_name}"
+        )
+    else:
+        logger.info(f"Full re-index of {repo_full_name}: {full_reindex_reason}")
+
+        # Fetch updated file tree from GitHub
+        file_tree_response = GitHubService.get_file_tree(
+            github_installation.installation_id,
+            repo_owner,
+            repo_name,
+            recursive=True,
+        )
+
+        # Check for API errors
+        if "error" in file_tree_response:
+            logger.error(
+                f"GitHub API error for {repo_full_name}: {file_tree_response.get('error')}"
+            )
+            return Response(
+                content=f"GitHub API error: {repo_full_name}", status_code=200
+            )
+
+        # Generate new file search string
+        repo_file_index.file_search_string = GitHubService.generate_file_search_string(
+            file_tree_response, repo_name, use_repo_prefix
+        )
+
     # Update the repository file index
-    repo_file_index.file_search_string = new_file_search_string
+    repo_file_index.uses_repo_prefix = use_repo_prefix
     repo_file_index.last_indexed_commit_sha = commit_sha
     # Explicitly update timestamp for cache invalidation
     repo_file_index.updated_at = datetime.now()
@@ -879,7 +962,10 @@ def _create_repository_file_index(
             github_installation_id=github_installation.id,
             repository_full_name=repo_full_name,
             file_search_string=file_search_string,
-            last_indexed_commit_sha=file_tree_response.get("sha"),
+            uses_repo_prefix=use_repo_prefix,
+            last_indexed_commit_sha=file_tree_response.get(
+                "commit_sha", file_tree_response.get("sha")
+            ),
         )
 
         db.add(repo_file_index)
@@ -935,7 +1021,8 @@ def _update_prefixing_strategy(installation_id: str, db: Session) -> bool:
     Update the prefixing strategy for all repositories in an installation.
 
     This should be called when the number of repositories changes to ensure
-    consistent @ prefixing (single repo vs multi-repo scenarios).
+    consistent @ prefixing (single repo vs multi-repo scenarios). The stored
+    paths are re-prefixed locally, so no file trees are fetched from GitHub.
 
     Args:
         installation_id: The GitHub App installation ID
@@ -972,34 +1059,23 @@ def _update_prefixing_strategy(installation_id: str, db: Session) -> bool:
         # Determine new prefixing strategy
         use_repo_prefix = len(repo_file_indexes) > 1
 
-        # Update each repository's file search string with correct prefixing
+        # Re-prefix each repository's stored paths that use the other strategy
         for repo_file_index in repo_file_indexes:
+            if repo_file_index.uses_repo_prefix == use_repo_prefix:
+                continue
+
             try:
-                repo_full_name = repo_file_index.repository_full_name
-                repo_owner, repo_name = repo_full_name.split("/", 1)
+                repo_name = repo_file_index.repository_full_name.split("/", 1)[1]
 
-                # Get fresh file tree to regenerate with correct prefixing
-                file_tree_response = GitHubService.get_file_tree(
-                    installation_id,
-                    repo_owner,
+                repo_file_index.file_search_string = reprefix_file_search_string(
+                    repo_file_index.file_search_string,
                     repo_name,
-                    recursive=True,
+                    repo_file_index.uses_repo_prefix,
+                    use_repo_prefix,
                 )
-
-                # Check for API errors
-                if "error" in file_tree_response:
-                    logger.error(
-                        f"GitHub API error for {repo_full_name}: {file_tree_response.get('error')}"
-                    )
-                    continue
-
-                # Generate new file search string with updated prefixing
-                new_file_search_string = GitHubService.generate_file_search_string(
-                    file_tree_response, repo_name, use_repo_prefix
-                )
-
-                # Update the file search string
-                repo_file_index.file_search_string = new_file_search_string
+                repo_file_index.uses_repo_prefix = use_repo_prefix
+                # Explicitly update timestamp for cache invalidation
+                repo_file_index.updated_at = datetime.now()
 
             except Exception as e:
                 logger.error(
@@ -0,0 +1,360 @@
+"""
+Persistent queue for GitHub webhook deliveries.
+
+The webhook endpoint only verifies, persists and acknowledges deliveries. The
+work itself happens here, outside the request: pending deliveries are claimed
+in batches and handled in the order they were received. Consecutive pushes
+to a repository are coalesced so a burst of pushes produces a single re-index
+of the newest ``after`` SHA, and every other event is dispatched to the
+existing handlers in ``webhook_controller``.
+"""
+
+import logging
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+import sentry_sdk
+from sqlalchemy import and_, or_, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.github_app.file_index import GITHUB_PUSH_COMMIT_LIMIT
+from src.github_app.models import GitHubWebhookDelivery, WebhookDeliveryStatus
+from src.github_app.webhook_controller import handle_github_webhook
+
+logger = logging.getLogger(__name__)
+
+PUSH_EVENT = "push"
+
+
+def enqueue_webhook_delivery(
+    delivery_id: str, event_type: str, payload: Dict[str, Any], db: Session
+) -> bool:
+    """
+    Persist a verified webhook delivery for asynchronous processing.
+
+    Duplicate deliveries (same X-GitHub-Delivery id) are ignored. Only pushes
+    to a repository's default branch get a repository key, so pushes to other
+    branches are never coalesced with (or supersede) the ones that are indexed.
+
+    Args:
+        delivery_id: The X-GitHub-Delivery GUID
+        event_type: The GitHub event type (from X-GitHub-Event header)
+        payload: The raw webhook payload as a dictionary
+        db: Database session
+
+    Returns:
+        bool: True if the delivery was queued, False if it was a duplicate
+    """
+    repository_full_name = None
+    if event_type == PUSH_EVENT:
+        repository_full_name = _indexed_push_repository(payload)
+
+    result = db.execute(
+        insert(GitHubWebhookDelivery)
+        .values(
+            delivery_id=delivery_id,
+            event_type=event_type,
+            payload=payload,
+            repository_full_name=repository_full_name,
+            status=WebhookDeliveryStatus.PENDING,
+            received_at=datetime.now(),
+        )
+        .on_conflict_do_nothing(index_elements=["delivery_id"])
+        .returning(GitHubWebhookDelivery.id)
+    )
+    queued = result.first() is not None
+    db.commit()
+
+    if not queued:
+        logger.info(f"Ignoring duplicate GitHub webhook delivery {delivery_id}")
+
+    return queued
+
+
+def process_pending_webhook_deliveries(
+    db: Session, batch_size: Optional[int] = None
+) -> int:
+    """
+    Claim and process one batch of pending webhook deliveries.
+
+    Args:
+        db: Database session
+        batch_size: Maximum number of deliveries to claim (default from settings)
+
+    Returns:
+        int: Number of deliveries claimed in this batch
+    """
+    deliveries = _claim_pending_deliveries(
+        db, batch_size or settings.github_webhook_batch_size
+    )
+    if not deliveries:
+        return 0
+
+    pushes_by_repository: Dict[str, List[GitHubWebhookDelivery]] = {}
+    for delivery in deliveries:
+        if delivery.event_type == PUSH_EVENT and delivery.repository_full_name:
+            pushes_by_repository.setdefault(delivery.repository_full_name, []).append(
+                delivery
+            )
+            continue
+
+        if delivery.event_type != PUSH_EVENT:
+            # Other events (installation and repository changes) can add,
+            # remove or rename the repositories pushed to, so the pushes
+            # received before them are handled first
+            _process_pending_pushes(pushes_by_repository, db)
+        _process_delivery(
+            delivery, delivery.payload, delivery.event_type, db, supersedes=[]
+        )
+
+    _process_pending_pushes(pushes_by_repository, db)
+
+    return len(deliveries)
+
+
+def drain_webhook_queue(db: Session, max_batches: int = 100) -> int:
+    """
+    Process pending deliveries until the queue is empty (or ``max_batches``).
+
+    Returns:
+        int: Total number of deliveries claimed
+    """
+    total = 0
+    for _ in range(max_batches):
+        claimed = process_pending_webhook_deliveries(db)
+        if claimed == 0:
+            break
+        total += claimed
+    return total
+
+
+def purge_old_webhook_deliveries(db: Session) -> int:
+    """
+    Delete finished deliveries past the retention window.
+
+    Rows are kept for a while after processing so GitHub redeliveries of the
+    same delivery id are still recognised as duplicates.
+
+    Returns:
+        int: Number of deleted deliveries
+    """
+    cutoff = datetime.now() - timedelta(
+        days=settings.github_webhook_delivery_retention_days
+    )
+    deleted = (
+        db.query(GitHubWebhookDelivery)
+        .filter(
+            GitHubWebhookDelivery.status.in_(
+                [WebhookDeliveryStatus.PROCESSED, WebhookDeliveryStatus.SUPERSEDED]
+            ),
+            GitHubWebhookDelivery.received_at < cutoff,
+        )
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+def _claim_pending_deliveries(
+    db: Session, batch_size: int
+) -> List[GitHubWebhookDelivery]:
+    """
+    Atomically mark the oldest pending deliveries as PROCESSING.
+
+    Deliveries left in PROCESSING by a crashed worker are reclaimed once their
+    lock is older than the configured timeout.
+    """
+    now = datetime.now()
+    stale_before = now - timedelta(seconds=settings.github_webhook_lock_timeout_seconds)
+
+    claimable = (
+        select(GitHubWebhookDelivery.id)
+        .where(
+            or_(
+                GitHubWebhookDelivery.status == WebhookDeliveryStatus.PENDING,
+                and_(
+                    GitHubWebhookDelivery.status == WebhookDeliveryStatus.PROCESSING,
+                    GitHubWebhookDelivery.locked_at < stale_before,
+                ),
+            )
+        )
+        .order_by(GitHubWebhookDelivery.received_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    ids = list(db.execute(claimable).scalars())
+    if not ids:
+        db.commit()
+        return []
+
+    deliveries = (
+        db.query(GitHubWebhookDelivery)
+        .filter(GitHubWebhookDelivery.id.in_(ids))
+        .order_by(GitHubWebhookDelivery.received_at)
+        .all()
+    )
+    for delivery in deliveries:
+        delivery.status = WebhookDeliveryStatus.PROCESSING
+        delivery.locked_at = now
+        delivery.attempts += 1
+    db.commit()
+
+    return deliveries
+
+
+def _indexed_push_repository(payload: Dict[str, Any]) -> Optional[str]:
+    """The repository a push updates the file index of, if any.
+
+    Mirrors ``handle_push_event``, which ignores pushes to branches other than
+    the default one.
+    """
+    repository = payload.get("repository") or {}
+    default_branch = repository.get("default_branch")
+    if default_branch and payload.get("ref") != f"refs/heads/{default_branch}":
+        return None
+    return repository.get("full_name")
+
+
+def _process_pending_pushes(
+    pushes_by_repository: Dict[str, List[GitHubWebhookDelivery]], db: Session
+) -> None:
+    """Process and forget the runs of pushes collected so far."""
+    for repository_full_name, pushes in pushes_by_repository.items():
+        _process_coalesced_pushes(repository_full_name, pushes, db)
+    pushes_by_repository.clear()
+
+
+def _process_coalesced_pushes(
+    repository_full_name: str, pushes: List[GitHubWebhookDelivery], db: Session
+) -> None:
+    """Index a repository once for a run of pending pushes."""
+    with _repository_push_lock(repository_full_name, db):
+        newer_processed = (
+            db.query(GitHubWebhookDelivery.id)
+            .filter(
+                GitHubWebhookDelivery.event_type == PUSH_EVENT,
+                GitHubWebhookDelivery.repository_full_name == repository_full_name,
+                GitHubWebhookDelivery.status == WebhookDeliveryStatus.PROCESSED,
+                GitHubWebhookDelivery.received_at > pushes[-1].received_at,
+            )
+            .first()
+        )
+        if newer_processed:
+            _mark_superseded(pushes, db)
+            db.commit()
+            return
+
+        latest = pushes[-1]
+        payload = coalesce_push_payloads([push.payload for push in pushes])
+        if len(pushes) > 1:
+            logger.info(
+                f"Coalesced {len(pushes)} pushes for {repository_full_name} into one "
+                f"update to {str(payload.get('after'))[:8]}"
+            )
+
+        _process_delivery(latest, payload, PUSH_EVENT, db, supersedes=pushes[:-1])
+
+
+@contextmanager
+def _repository_push_lock(repository_full_name: str, db: Session) -> Iterator[None]:
+    """
+    Serialise push processing per repository across workers.
+
+    Push handlers commit part-way through, so a transaction-scoped lock would be
+    released too early. The session-level advisory lock is taken on a dedicated
+    connection and held until the whole coalesced push has been recorded,
+    which guarantees an older push can never overwrite a newer index.
+    """
+    key = f"github_push:{repository_full_name}"
+    with db.get_bind().connect() as lock_connection:
+        lock_connection.execute(
+            text("SELECT pg_advisory_lock(hashtext(:key))"), {"key": key}
+        )
+        try:
+            yield
+        finally:
+            lock_connection.execute(
+                text("SELECT pg_advisory_unlock(hashtext(:key))"), {"key": key}
+            )
+            lock_connection.commit()
+
+
+def coalesce_push_payloads(payloads: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge consecutive push payloads for one repository into a single payload.
+
+    The result spans from the oldest push's ``before`` to the newest push's
+    ``after`` and carries every commit in order, so both full and incremental
+    re-indexing see the combined change.
+
+    Args:
+        payloads: Push payloads ordered from oldest to newest
+
+    Returns:
+        Dict[str, Any]: A push payload equivalent to applying all of them
+    """
+    if len(payloads) == 1:
+        return payloads[0]
+
+    merged = dict(payloads[-1])
+    merged["before"] = payloads[0].get("before")
+    merged["commits"] = [
+        commit for payload in payloads for commit in payload.get("commits") or []
+    ]
+    merged["forced"] = any(payload.get("forced") for payload in payloads)
+    # Each push caps its own commit list, so a gap in any of them leaves the
+    # merged list incomplete as well.
+    merged["commits_truncated"] = any(
+        payload.get("commits_truncated")
+        or len(payload.get("commits") or []) >= GITHUB_PUSH_COMMIT_LIMIT
+        for payload in payloads
+    )
+    return merged
+
+
+def _process_delivery(
+    delivery: GitHubWebhookDelivery,
+    payload: Dict[str, Any],
+    event_type: str,
+    db: Session,
+    supersedes: List[GitHubWebhookDelivery],
+) -> None:
+    try:
+        response = handle_github_webhook(payload, event_type, db)
+        failed = response.status_code >= 500
+        error = bytes(response.body).decode() if failed else None
+    except Exception as e:
+        db.rollback()
+        sentry_sdk.capture_exception(e)
+        failed = True
+        error = str(e)
+
+    now = datetime.now()
+    if failed:
+        logger.error(
+            f"GitHub webhook delivery {delivery.delivery_id} ({event_type}) failed: {error}"
+        )
+        retry = delivery.attempts < settings.github_webhook_max_attempts
+        for item in [*supersedes, delivery]:
+            item.status = (
+                WebhookDeliveryStatus.PENDING if retry else WebhookDeliveryStatus.FAILED
+            )
+            item.error = error
+            item.locked_at = None
+    else:
+        delivery.status = WebhookDeliveryStatus.PROCESSED
+        delivery.error = None
+        delivery.processed_at = now
+        _mark_superseded(supersedes, db)
+
+    db.commit()
+
+
+def _mark_superseded(deliveries: List[GitHubWebhookDelivery], db: Session) -> None:
+    now = datetime.now()
+    for delivery in deliveries:
+        delivery.status = WebhookDeliveryStatus.SUPERSEDED
+        delivery.processed_at = now
@@ -0,0 +1,534 @@
+"""
+Bulk import of a backlog (initiatives, tasks and their checklists).
+
+Creating items one by one through the controllers costs an identifier
+trigger call, an ordering position lookup and a commit per item. The import
+instead streams every record into a temporary table with ``COPY``, validates
+the records with a few set-wise queries, reserves identifiers and ordering
+positions for all of them at once, and inserts each entity type with one
+``INSERT ... SELECT``, in a single transaction.
+
+Imports are all or nothing: if any record is invalid, nothing is written and
+the result lists every invalid record with the reason.
+
+Two input formats are supported:
+
+- CSV, one record per row, with the columns ``record`` (``initiative`` or
+  ``task``), ``ref``, ``parent``, ``title``, ``description``, ``status``,
+  ``type`` and ``checklist`` (one item per line, ``[x]`` marks done items).
+  A task's ``parent`` is the ``ref`` of an initiative of the file or the
+  identifier of an existing initiative of the workspace.
+- JSON, ``{"initiatives": [{"title", ..., "tasks": [{"title", ...,
+  "checklist": ["item", {"title": "item", "is_complete": true}]}]}]}``.
+"""
+
+import csv
+import io
+import json
+import logging
+import uuid
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional
+
+import sentry_sdk
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.models import ContextType, EntityType, InitiativeStatus, Ordering, TaskStatus
+from src.services.identifier_service import reserve_identifiers
+from src.utils.lexorank import LexoRank
+
+logger = logging.getLogger(__name__)
+
+INITIATIVE = "initiative"
+TASK = "task"
+
+# Same limit as the create initiative/task endpoints
+TITLE_MAX_LENGTH = 200
+
+_ROWS = "backlog_import_rows"
+_POSITIONS = "backlog_import_positions"
+
+_COLUMNS = [
+    "seq",
+    "location",
+    "record",
+    "ref",
+    "parent",
+    "title",
+    "description",
+    "status",
+    "type",
+    "checklist",
+]
+
+_COMPLETE_MARK = "[x] "
+
+
+@dataclass
+class BacklogRecord:
+    """One initiative or task to import.
+
+    Attributes:
+        location: Where the record comes from, for error reports (e.g. "line 3")
+        record: ``initiative`` or ``task``
+        title: Title of the entity
+        ref: Reference of an initiative, used as the parent of tasks
+        parent: For a task, the ref or identifier of its initiative
+        description: Description of the entity
+        status: Status name; defaults to BACKLOG (initiatives) or TO_DO (tasks)
+        type: Type of the entity
+        checklist: Checklist item titles of a task, ``[x] `` marking done items
+    """
+
+    location: str
+    record: str
+    title: str
+    ref: Optional[str] = None
+    parent: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+    checklist: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BacklogImportError:
+    location: str
+    message: str
+
+
+@dataclass
+class BacklogImportResult:
+    """Outcome of an import; nothing was written if there are errors."""
+
+    initiatives: int = 0
+    tasks: int = 0
+    checklist_items: int = 0
+    errors: List[BacklogImportError] = field(default_factory=list)
+
+
+def parse_csv(file: IO[str]) -> Iterator[BacklogRecord]:
+    """Read backlog records from CSV (see the module docstring for columns)."""
+    reader = csv.DictReader(file)
+    for row in reader:
+        checklist = (row.get("checklist") or "").splitlines()
+        yield BacklogRecord(
+            location=f"line {reader.line_num}",
+            record=(row.get("record") or "").strip().lower(),
+            title=(row.get("title") or "").strip(),
+            ref=(row.get("ref") or "").strip() or None,
+            parent=(row.get("parent") or "").strip() or None,
+            description=row.get("description") or None,
+            status=(row.get("status") or "").strip().upper() or None,
+            type=(row.get("type") or "").strip() or None,
+            checklist=[item.strip() for item in checklist if item.strip()],
+        )
+
+
+def parse_json(data: Dict[str, Any]) -> Iterator[BacklogRecord]:
+    """Read backlog records from nested JSON (see the module docstring)."""
+    for i, initiative in enumerate(data.get("initiatives") or []):
+        location = f"initiatives[{i}]"
+        ref = f"#{i}"
+        yield BacklogRecord(
+            location=location,
+            record=INITIATIVE,
+            title=str(initiative.get("title") or "").strip(),
+            ref=ref,
+            description=initiative.get("description"),
+            status=_status(initiative.get("status")),
+            type=initiative.get("type"),
+        )
+        for j, task in enumerate(initiative.get("tasks") or []):
+            yield BacklogRecord(
+                location=f"{location}.tasks[{j}]",
+                record=TASK,
+                title=str(task.get("title") or "").strip(),
+                parent=ref,
+                description=task.get("description"),
+                status=_status(task.get("status")),
+                type=task.get("type"),
+                checklist=[
+                    _checklist_line(item) for item in task.get("checklist") or []
+                ],
+            )
+
+
+def parse_file(file: IO[bytes], filename: str) -> Iterator[BacklogRecord]:
+    """Read backlog records from a CSV or JSON file, by file extension."""
+    if filename.lower().endswith(".json"):
+        return parse_json(json.load(file))
+    return parse_csv(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+
+
+def _status(status: Any) -> Optional[str]:
+    if status is None:
+        return None
+    return str(status).strip().upper() or None
+
+
+def _checklist_line(item: Any) -> str:
+    if isinstance(item, dict):
+        title = " ".join(str(item.get("title") or "").split())
+        return f"{_COMPLETE_MARK}{title}" if item.get("is_complete") else title
+    return " ".join(str(item).split())
+
+
+def import_backlog(
+    session: Session,
+    workspace_id: uuid.UUID,
+    user_id: uuid.UUID,
+    records: Iterable[BacklogRecord],
+) -> BacklogImportResult:
+    """Import initiatives and tasks into a workspace in one transaction.
+
+    Imported items are appended, in file order, to the status lists.
+
+    Args:
+        session: Database session
+        workspace_id: UUID of the workspace to import into
+        user_id: UUID of the workspace owner
+        records: Records to import, e.g. from ``parse_file``
+
+    Returns:
+        BacklogImportResult: Counts of created entities, or the errors
+    """
+    params = {"workspace_id": workspace_id, "user_id": user_id}
+    try:
+        _stage(session, records)
+        errors = _validate(session, params)
+        if errors:
+            session.rollback()
+            return BacklogImportResult(errors=errors)
+
+        result = _insert(session, params)
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Error importing backlog into workspace {workspace_id}: {e}")
+        sentry_sdk.capture_exception(e)
+        raise
+
+    logger.info(
+        f"Imported {result.initiatives} initiatives and {result.tasks} tasks "
+        f"into workspace {workspace_id}"
+    )
+    return result
+
+
+def _copy(session: Session, table: str, columns: List[str], rows: Iterable) -> None:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def _stage(session: Session, records: Iterable[BacklogRecord]) -> None:
+    session.execute(
+        text(
+            f"""
+            CREATE TEMPORARY TABLE {_ROWS} (
+                seq integer PRIMARY KEY,
+                location text NOT NULL,
+                record text,
+                ref text,
+                parent text,
+                title text,
+                description text,
+                status text,
+                type text,
+                checklist text,
+                id uuid NOT NULL DEFAULT gen_random_uuid(),
+                initiative_id uuid,
+                kind_seq integer
+            ) ON COMMIT DROP
+            """
+        )
+    )
+    _copy(
+        session,
+        _ROWS,
+        _COLUMNS,
+        (
+            (
+                seq,
+                r.location,
+                r.record,
+                r.ref,
+                r.parent,
+                r.title,
+                r.description,
+                r.status,
+                r.type,
+                "\n".join(r.checklist),
+            )
+            for seq, r in enumerate(records)
+        ),
+    )
+    session.execute(text(f"ANALYZE {_ROWS}"))
+
+
+def _validate(session: Session, params: Dict) -> List[BacklogImportError]:
+    # Resolve the initiative of each task: an initiative of the file first,
+    # then an existing initiative of the workspace
+    session.execute(
+        text(
+            f"""
+            UPDATE {_ROWS} AS t
+            SET initiative_id = i.id
+            FROM (
+                SELECT DISTINCT ON (ref) ref, id
+                FROM {_ROWS}
+                WHERE record = '{INITIATIVE}' AND ref IS NOT NULL
+                ORDER BY ref, seq
+            ) AS i
+            WHERE t.record = '{TASK}' AND t.parent = i.ref
+            """
+        )
+    )
+    session.execute(
+        text(
+            f"""
+            UPDATE {_ROWS} AS t
+            SET initiative_id = e.id
+            FROM dev.initiative AS e
+            WHERE t.record = '{TASK}' AND t.initiative_id IS NULL
+                AND e.workspace_id = :workspace_id AND e.identifier = t.parent
+            """
+        ),
+        params,
+    )
+
+    checks = [
+        (
+            f"record NOT IN ('{INITIATIVE}', '{TASK}') OR record IS NULL",
+            f'\'record must be "{INITIATIVE}" or "{TASK}"\'',
+        ),
+        ("COALESCE(title, '') = ''", "'title is required'"),
+        (
+            f"length(title) > {TITLE_MAX_LENGTH}",
+            f"'title is longer than {TITLE_MAX_LENGTH} characters'",
+        ),
+        (
+            f"record = '{INITIATIVE}' AND status IS NOT NULL "
+            f"AND status <> ALL(:initiative_statuses)",
+            "'unknown initiative status ' || quote_literal(status)",
+        ),
+        (
+            f"record = '{TASK}' AND status IS NOT NULL "
+            f"AND status <> ALL(:task_statuses)",
+            "'unknown task status ' || quote_literal(status)",
+        ),
+        (
+            f"record = '{INITIATIVE}' AND ref IS NOT NULL AND ref_rank > 1",
+            "'duplicate ref ' || quote_literal(ref)",
+        ),
+        (
+            f"record = '{TASK}' AND initiative_id IS NULL",
+            "'unknown initiative ' || quote_literal(COALESCE(parent, ''))",
+        ),
+    ]
+    rows = session.execute(
+        text(
+            f"""
+            WITH r AS MATERIALIZED (
+                SELECT *, row_number() OVER (
+                    PARTITION BY record, ref ORDER BY seq
+                ) AS ref_rank
+                FROM {_ROWS}
+            )
+            """
+            + "\nUNION ALL\n".join(
+                f"SELECT seq, location, {message} AS message FROM r WHERE {condition}"
+                for condition, message in checks
+            )
+            + "\nORDER BY seq"
+        ),
+        {
+            "initiative_statuses": [s.value for s in InitiativeStatus],
+            "task_statuses": [s.value for s in TaskStatus],
+        },
+    )
+    return [BacklogImportError(location, message) for _, location, message in rows]
+
+
+def _next_positions(session: Session, entity_type: EntityType, count: int) -> List[str]:
+    """Positions after the end of a status list, as OrderingService.add_item."""
+    last = (
+        session.query(Ordering.position)
+        .filter(
+            Ordering.context_type == ContextType.STATUS_LIST,
+            Ordering.context_id.is_(None),
+            Ordering.entity_type == entity_type,
+        )
+        .order_by(Ordering.position.desc())
+        .limit(1)
+        .scalar()
+    )
+    positions = []
+    for _ in range(count):
+        last = LexoRank.gen_next(last) if last else LexoRank.middle()
+        positions.append(last)
+    return positions
+
+
+def _insert(session: Session, params: Dict) -> BacklogImportResult:
+    session.execute(
+        text(
+            f"""
+            UPDATE {_ROWS} AS r
+            SET kind_seq = n.kind_seq
+            FROM (
+                SELECT seq, row_number() OVER (
+                    PARTITION BY record ORDER BY seq
+                ) AS kind_seq
+                FROM {_ROWS}
+            ) AS n
+            WHERE n.seq = r.seq
+            """
+        )
+    )
+    counts = dict(
+        session.execute(
+            text(f"SELECT record, count(*) FROM {_ROWS} GROUP BY record")
+        ).all()
+    )
+    result = BacklogImportResult(
+        initiatives=counts.get(INITIATIVE, 0), tasks=counts.get(TASK, 0)
+    )
+
+    params = {
+        **params,
+        "initiative_base": reserve_identifiers(
+            session, "user_initiative_counter", params["user_id"], result.initiatives
+        ),
+        "task_base": reserve_identifiers(
+            session, "user_task_counter", params["user_id"], result.tasks
+        ),
+    }
+
+    session.execute(
+        text(
+            f"""
+            CREATE TEMPORARY TABLE {_POSITIONS} (
+                entity_type text,
+                kind_seq integer,
+                position text,
+                PRIMARY KEY (entity_type, kind_seq)
+            ) ON COMMIT DROP
+            """
+        )
+    )
+    _copy(
+        session,
+        _POSITIONS,
+        ["entity_type", "kind_seq", "position"],
+        (
+            (entity_type.value, seq, position)
+            for entity_type, count in (
+                (EntityType.INITIATIVE, result.initiatives),
+                (EntityType.TASK, result.tasks),
+            )
+            for seq, position in enumerate(
+                _next_positions(session, entity_type, count), start=1
+            )
+        ),
+    )
+
+    session.execute(
+        text(
+            f"""
+            INSERT INTO dev.initiative (
+                id, identifier, title, description, status, type,
+                user_id, workspace_id
+            )
+            SELECT
+                id,
+                dev.format_identifier('I-', :initiative_base + kind_seq, 3),
+                title,
+                COALESCE(description, ''),
+                COALESCE(status, 'BACKLOG')::dev.initiativestatus,
+                type,
+                :user_id,
+                :workspace_id
+            FROM {_ROWS}
+            WHERE record = '{INITIATIVE}'
+            ORDER BY seq
+            """
+        ),
+        params,
+    )
+    session.execute(
+        text(
+            f"""
+            INSERT INTO dev.task (
+                id, identifier, title, description, status, type,
+                initiative_id, user_id, workspace_id
+            )
+            SELECT
+                id,
+                dev.format_identifier('TM-', :task_base + kind_seq, 3),
+                title,
+                COALESCE(description, ''),
+                COALESCE(status, 'TO_DO')::dev.taskstatus,
+                type,
+                initiative_id,
+                :user_id,
+                :workspace_id
+            FROM {_ROWS}
+            WHERE record = '{TASK}'
+            ORDER BY seq
+            """
+        ),
+        params,
+    )
+    result.checklist_items = session.execute(
+        text(
+            f"""
+            INSERT INTO dev.checklist (title, is_complete, "order", task_id, user_id)
+            SELECT
+                regexp_replace(c.item, '^\\[[xX]\\]\\s*', ''),
+                c.item ~ '^\\[[xX]\\]',
+                c.n - 1,
+                r.id,
+                :user_id
+            FROM {_ROWS} AS r,
+                regexp_split_to_table(r.checklist, E'\\n')
+                    WITH ORDINALITY AS c(item, n)
+            WHERE r.record = '{TASK}' AND c.item <> ''
+            """
+        ),
+        params,
+    ).rowcount
+    session.execute(
+        text(
+            f"""
+            INSERT INTO dev.orderings (
+                user_id, workspace_id, context_type, context_id, entity_type,
+                initiative_id, task_id, position
+            )
+            SELECT
+                :user_id,
+                :workspace_id,
+                '{ContextType.STATUS_LIST.name}'::dev.contexttype,
+                NULL,
+                p.entity_type::dev.orderings_entitytype,
+                CASE WHEN r.record = '{INITIATIVE}' THEN r.id END,
+                CASE WHEN r.record = '{TASK}' THEN r.id END,
+                p.position
+            FROM {_ROWS} AS r
+            JOIN {_POSITIONS} AS p
+                ON p.kind_seq = r.kind_seq AND p.entity_type = upper(r.record)
+            """
+        ),
+        params,
+    )
+    return result
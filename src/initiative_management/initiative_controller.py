@@ -1,16 +1,29 @@
 import logging
 import uuid
-from typing import Optional
+from typing import Dict, List, Optional
 
+from sqlalchemy import and_, func, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
-
-from src.models import ContextType, Group, Initiative, InitiativeGroup, InitiativeStatus
+from sqlalchemy.orm import Session, load_only, selectinload
+
+from src.models import (
+    ContextType,
+    EntityType,
+    Group,
+    Initiative,
+    InitiativeGroup,
+    InitiativeStatus,
+    Ordering,
+    Task,
+    TaskStatus,
+)
 from src.services.ordering_service import (
     EntityNotFoundError,
     OrderingService,
     OrderingServiceError,
 )
+from src.strategic_planning.models import DomainEvent
+from src.strategic_planning.services.event_publisher import BufferedEventPublisher
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +36,23 @@ class InitiativeNotFoundError(InitiativeControllerError):
     pass
 
 
+class BoardInitiative:
+    """An initiative on the board with the counts of its tasks by status.
+
+    ``tasks`` is None unless the board was loaded with its tasks.
+    """
+
+    def __init__(
+        self,
+        initiative: Initiative,
+        task_counts: Dict[TaskStatus, int],
+        tasks: Optional[List[Task]] = None,
+    ):
+        self.initiative = initiative
+        self.task_counts = task_counts
+        self.tasks = tasks
+
+
 class InitiativeController:
     def __init__(self, db_session: Session):
         self.db = db_session
@@ -325,6 +355,116 @@ class InitiativeController:
             logger.error(f"Unexpected error moving initiative to status: {e}")
             raise InitiativeControllerError(f"Failed to move initiative to status: {e}")
 
+    def move_initiatives_to_status(
+        self,
+        initiative_ids: List[uuid.UUID],
+        user_id: uuid.UUID,
+        new_status: InitiativeStatus,
+    ) -> List[Initiative]:
+        """
+        Move many initiatives to a status at once.
+
+        Initiatives not already in ``new_status`` are updated with one UPDATE,
+        moved to the end of the status list (in the order given) with one
+        ranked batch, and get an InitiativeStatusChanged domain event each,
+        written with one INSERT on commit.
+
+        Args:
+            initiative_ids: The initiatives to move
+            user_id: The user ID to verify ownership
+            new_status: The status to move the initiatives to
+
+        Returns:
+            The initiatives, in the order of ``initiative_ids``
+
+        Raises:
+            InitiativeNotFoundError: If any initiative is not found or doesn't
+                belong to user
+        """
+        initiative_ids = list(dict.fromkeys(initiative_ids))
+        try:
+            current = self.db.execute(
+                select(Initiative.id, Initiative.status, Initiative.workspace_id)
+                .where(Initiative.id.in_(initiative_ids), Initiative.user_id == user_id)
+                .with_for_update()
+            ).all()
+            missing = set(initiative_ids) - {row.id for row in current}
+            if missing:
+                raise InitiativeNotFoundError(
+                    f"Initiatives {sorted(str(id) for id in missing)} not found for user {user_id}"
+                )
+
+            moved = {row.id: row for row in current if row.status != new_status}
+            moved_ids = [id for id in initiative_ids if id in moved]
+            if moved_ids:
+                self.db.execute(
+                    update(Initiative)
+                    .where(Initiative.id.in_(moved_ids))
+                    .values(status=new_status)
+                    .execution_options(synchronize_session=False)
+                )
+                self.ordering_service.append_items(
+                    ContextType.STATUS_LIST, None, EntityType.INITIATIVE, moved_ids
+                )
+
+                publisher = BufferedEventPublisher(self.db)
+                for initiative_id in moved_ids:
+                    row = moved[initiative_id]
+                    publisher.publish(
+                        DomainEvent(
+                            user_id=user_id,
+                            event_type="InitiativeStatusChanged",
+                            aggregate_id=initiative_id,
+                            payload={
+                                "workspace_id": str(row.workspace_id),
+                                "from_status": row.status.value,
+                                "to_status": new_status.value,
+                            },
+                        ),
+                        workspace_id=str(row.workspace_id),
+                    )
+
+                self.db.commit()
+
+            initiatives = {
+                initiative.id: initiative
+                for initiative in self.db.query(Initiative)
+                .options(
+                    selectinload(Initiative.orderings),
+                    selectinload(Initiative.tasks).selectinload(Task.checklist),
+                    selectinload(Initiative.tasks).selectinload(Task.orderings),
+                )
+                .filter(Initiative.id.in_(initiative_ids))
+                .all()
+            }
+
+            logger.info(
+                f"Moved {len(moved_ids)} of {len(initiative_ids)} initiatives to {new_status} for user {user_id}"
+            )
+            return [initiatives[id] for id in initiative_ids]
+
+        except InitiativeNotFoundError as e:
+            self.db.rollback()
+            raise e
+        except EntityNotFoundError as e:
+            self.db.rollback()
+            logger.error(f"Initiative ordering not found: {e}")
+            raise InitiativeControllerError(
+                f"Failed to move initiatives to status: {e}"
+            )
+        except OrderingServiceError as e:
+            self.db.rollback()
+            logger.error(f"Failed to move initiatives to status: {e}")
+            raise InitiativeControllerError(
+                f"Failed to move initiatives to status: {e}"
+            )
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Unexpected error moving initiatives to status: {e}")
+            raise InitiativeControllerError(
+                f"Failed to move initiatives to status: {e}"
+            )
+
     def add_initiative_to_group(
         self,
         initiative_id: uuid.UUID,
@@ -664,3 +804,115 @@ class InitiativeController:
         except Exception as e:
             logger.error(f"Unexpected error getting initiative details: {e}")
             raise InitiativeControllerError(f"Failed to get initiative details: {e}")
+
+    def get_board(
+        self,
+        user_id: uuid.UUID,
+        workspace_id: uuid.UUID,
+        include_tasks: bool = False,
+    ) -> Dict[InitiativeStatus, List[BoardInitiative]]:
+        """
+        Get the workspace's initiatives grouped by status, in board order.
+
+        The board is built from one query for the initiatives in ordering
+        order, one aggregate query for the task counts and, when requested,
+        one query for the tasks. No relationships are lazy loaded.
+
+        Args:
+            user_id: The user ID to filter by
+            workspace_id: The workspace ID to filter by
+            include_tasks: Also load each initiative's tasks, in board order
+
+        Returns:
+            Every initiative status, in board order, mapped to its initiatives
+        """
+        try:
+            initiatives = self.db.scalars(
+                select(Initiative)
+                .options(
+                    load_only(
+                        Initiative.id,
+                        Initiative.identifier,
+                        Initiative.title,
+                        Initiative.status,
+                        Initiative.type,
+                        Initiative.updated_at,
+                    )
+                )
+                .outerjoin(
+                    Ordering,
+                    and_(
+                        Ordering.initiative_id == Initiative.id,
+                        Ordering.context_type == ContextType.STATUS_LIST,
+                        Ordering.entity_type == EntityType.INITIATIVE,
+                    ),
+                )
+                .where(
+                    Initiative.user_id == user_id,
+                    Initiative.workspace_id == workspace_id,
+                )
+                .order_by(Ordering.position.nulls_last(), Initiative.identifier)
+            ).all()
+
+            task_counts: Dict[uuid.UUID, Dict[TaskStatus, int]] = {}
+            for initiative_id, task_status, count in self.db.execute(
+                select(Task.initiative_id, Task.status, func.count())
+                .where(Task.user_id == user_id, Task.workspace_id == workspace_id)
+                .group_by(Task.initiative_id, Task.status)
+            ):
+                task_counts.setdefault(initiative_id, {})[task_status] = count
+
+            tasks: Dict[uuid.UUID, List[Task]] = {}
+            if include_tasks:
+                for task in self._get_board_tasks(user_id, workspace_id):
+                    tasks.setdefault(task.initiative_id, []).append(task)
+
+            board: Dict[InitiativeStatus, List[BoardInitiative]] = {
+                initiative_status: [] for initiative_status in InitiativeStatus
+            }
+            for initiative in initiatives:
+                board[initiative.status].append(
+                    BoardInitiative(
+                        initiative,
+                        task_counts.get(initiative.id, {}),
+                        tasks.get(initiative.id, []) if include_tasks else None,
+                    )
+                )
+
+            logger.info(
+                f"Retrieved board of {len(initiatives)} initiatives for user {user_id}"
+            )
+            return board
+
+        except Exception as e:
+            logger.error(f"Unexpected error getting initiative board: {e}")
+            raise InitiativeControllerError(f"Failed to get initiative board: {e}")
+
+    def _get_board_tasks(
+        self, user_id: uuid.UUID, workspace_id: uuid.UUID
+    ) -> List[Task]:
+        return list(
+            self.db.scalars(
+                select(Task)
+                .options(
+                    load_only(
+                        Task.id,
+                        Task.identifier,
+                        Task.title,
+                        Task.status,
+                        Task.type,
+                        Task.initiative_id,
+                    )
+                )
+                .outerjoin(
+                    Ordering,
+                    and_(
+                        Ordering.task_id == Task.id,
+                        Ordering.context_type == ContextType.STATUS_LIST,
+                        Ordering.entity_type == EntityType.TASK,
+                    ),
+                )
+                .where(Task.user_id == user_id, Task.workspace_id == workspace_id)
+                .order_by(Ordering.position.nulls_last(), Task.identifier)
+            )
+        )
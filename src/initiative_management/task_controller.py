@@ -1,9 +1,22 @@
 import logging
 import uuid
-from typing import List, Optional
-
+from typing import List, Optional, Tuple
+
+from sqlalchemy import (
+    Boolean,
+    Integer,
+    Row,
+    String,
+    column,
+    delete,
+    insert,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from src.models import ChecklistItem, ContextType, EntityType, Task, TaskStatus
 from src.services.ordering_service import (
@@ -11,6 +24,8 @@ from src.services.ordering_service import (
     OrderingService,
     OrderingServiceError,
 )
+from src.strategic_planning.models import DomainEvent
+from src.strategic_planning.services.event_publisher import BufferedEventPublisher
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +39,22 @@ class TaskNotFoundError(TaskControllerError):
 
 
 class ChecklistItemData:
-    """Simple data class for checklist items."""
+    """Simple data class for checklist items.
 
-    def __init__(self, title: str, is_complete: bool = False, order: int = 0):
+    ``id`` identifies an existing item when the checklist is updated.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        is_complete: bool = False,
+        order: int = 0,
+        id: Optional[uuid.UUID] = None,
+    ):
         self.title = title
         self.is_complete = is_complete
         self.order = order
+        self.id = id
 
 
 class TaskController:
@@ -234,6 +259,105 @@ class TaskController:
             logger.error(f"Unexpected error moving task to status: {e}")
             raise TaskControllerError(f"Failed to move task to status: {e}")
 
+    def move_tasks_to_status(
+        self,
+        task_ids: List[uuid.UUID],
+        user_id: uuid.UUID,
+        new_status: TaskStatus,
+    ) -> List[Task]:
+        """
+        Move many tasks to a status at once.
+
+        Tasks not already in ``new_status`` are updated with one UPDATE, moved
+        to the end of the status list (in the order given) with one ranked
+        batch, and get a TaskStatusChanged domain event each, written with
+        one INSERT on commit.
+
+        Args:
+            task_ids: The tasks to move
+            user_id: The user ID to verify ownership
+            new_status: The status to move the tasks to
+
+        Returns:
+            The tasks, in the order of ``task_ids``
+
+        Raises:
+            TaskNotFoundError: If any task is not found or doesn't belong to user
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        try:
+            current = self.db.execute(
+                select(Task.id, Task.status, Task.workspace_id)
+                .where(Task.id.in_(task_ids), Task.user_id == user_id)
+                .with_for_update()
+            ).all()
+            missing = set(task_ids) - {row.id for row in current}
+            if missing:
+                raise TaskNotFoundError(
+                    f"Tasks {sorted(str(id) for id in missing)} not found for user {user_id}"
+                )
+
+            moved = {row.id: row for row in current if row.status != new_status}
+            moved_ids = [task_id for task_id in task_ids if task_id in moved]
+            if moved_ids:
+                self.db.execute(
+                    update(Task)
+                    .where(Task.id.in_(moved_ids))
+                    .values(status=new_status)
+                    .execution_options(synchronize_session=False)
+                )
+                self.ordering_service.append_items(
+                    ContextType.STATUS_LIST, None, EntityType.TASK, moved_ids
+                )
+
+                publisher = BufferedEventPublisher(self.db)
+                for task_id in moved_ids:
+                    row = moved[task_id]
+                    publisher.publish(
+                        DomainEvent(
+                            user_id=user_id,
+                            event_type="TaskStatusChanged",
+                            aggregate_id=task_id,
+                            payload={
+                                "workspace_id": str(row.workspace_id),
+                                "from_status": row.status.value,
+                                "to_status": new_status.value,
+                            },
+                        ),
+                        workspace_id=str(row.workspace_id),
+                    )
+
+                self.db.commit()
+
+            tasks = {
+                task.id: task
+                for task in self.db.query(Task)
+                .options(selectinload(Task.checklist), selectinload(Task.orderings))
+                .filter(Task.id.in_(task_ids))
+                .all()
+            }
+
+            logger.info(
+                f"Moved {len(moved_ids)} of {len(task_ids)} tasks to {new_status} for user {user_id}"
+            )
+            return [tasks[task_id] for task_id in task_ids]
+
+        except TaskNotFoundError as e:
+            self.db.rollback()
+            raise e
+        except EntityNotFoundError as e:
+            self.db.rollback()
+            logger.error(f"Task ordering not found: {e}")
+            raise TaskControllerError(f"Failed to move tasks to status: {e}")
+        except OrderingServiceError as e:
+            self.db.rollback()
+            logger.error(f"Failed to move tasks to status: {e}")
+            raise TaskControllerError(f"Failed to move tasks to status: {e}")
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Unexpected error moving tasks to status: {e}")
+            raise TaskControllerError(f"Failed to move tasks to status: {e}")
+
     def get_initiative_tasks(
         self, user_id: uuid.UUID, initiative_id: uuid.UUID
     ) -> list[Task]:
@@ -398,6 +522,12 @@ class TaskController:
         """
         Replace the entire checklist for a task.
 
+        Only the difference is written: incoming items are matched to the
+        existing ones by id (or, for items without an id, by title), then
+        changed items are updated in one statement, new ones inserted in one
+        and missing ones deleted in one. Nothing is written when the
+        checklist is unchanged.
+
         Args:
             user_id: The user ID to verify ownership
             task_id: The task ID to update checklist for
@@ -422,27 +552,67 @@ class TaskController:
             if not task:
                 raise TaskNotFoundError(f"Task {task_id} not found for user {user_id}")
 
-            # Delete existing checklist items
-            self.db.query(ChecklistItem).filter(
-                ChecklistItem.task_id == task_id
-            ).delete()
-
-            # Add new checklist items
-            for item_data in items:
-                checklist_item = ChecklistItem(
-                    title=item_data.title,
-                    is_complete=item_data.is_complete,
-                    order=item_data.order,
-                    user_id=user_id,
-                    task_id=task_id,
+            existing = self.db.execute(
+                select(
+                    ChecklistItem.id,
+                    ChecklistItem.title,
+                    ChecklistItem.is_complete,
+                    ChecklistItem.order,
+                )
+                .where(ChecklistItem.task_id == task_id)
+                .order_by(ChecklistItem.order)
+            ).all()
+            changed, added, removed = _diff_checklist(existing, items)
+
+            if not (changed or added or removed):
+                return task
+
+            if changed:
+                changes = (
+                    values(
+                        column("id", UUID(as_uuid=True)),
+                        column("title", String),
+                        column("is_complete", Boolean),
+                        column("order", Integer),
+                        name="changes",
+                    )
+                ).data(changed)
+                self.db.execute(
+                    update(ChecklistItem.__table__)
+                    .where(ChecklistItem.__table__.c.id == changes.c.id)
+                    .values(
+                        title=changes.c.title,
+                        is_complete=changes.c.is_complete,
+                        order=changes.c.order,
+                    )
+                )
+            if added:
+                self.db.execute(
+                    insert(ChecklistItem),
+                    [
+                        {
+                            "title": item.title,
+                            "is_complete": item.is_complete,
+                            "order": item.order,
+                            "user_id": user_id,
+                            "task_id": task_id,
+                        }
+                        for item in added
+                    ],
+                )
+            if removed:
+                self.db.execute(
+                    delete(ChecklistItem.__table__).where(
+                        ChecklistItem.__table__.c.id.in_(removed)
+                    )
                 )
-                self.db.add(checklist_item)
 
             self.db.commit()
             self.db.refresh(task)
 
             logger.info(
-                f"Updated checklist for task {task_id} with {len(items)} items for user {user_id}"
+                f"Updated checklist for task {task_id} with {len(items)} items for user {user_id} "
+                f"({len(changed)} changed, {len(added)} added, {len(removed)} removed)"
             )
             return task
 
@@ -520,3 +690,44 @@ class TaskController:
             self.db.rollback()
             logger.error(f"Unexpected error updating checklist item: {e}")
             raise TaskControllerError(f"Failed to update checklist item: {e}")
+
+
+def _diff_checklist(
+    existing: List[Row], items: List[ChecklistItemData]
+) -> Tuple[List[tuple], List[ChecklistItemData], List[uuid.UUID]]:
+    """Match incoming checklist items to the stored ones.
+
+    Items are matched by id first; items without a known id then take an
+    unmatched stored item with the same title, so clients that only send
+    titles still update in place.
+
+    Returns:
+        (changed rows as (id, title, is_complete, order), items to insert,
+        ids of stored items to delete)
+    """
+    stored = {row.id: row for row in existing}
+    matches: List[Tuple[ChecklistItemData, Row]] = []
+    unmatched: List[ChecklistItemData] = []
+    for item in items:
+        row = stored.pop(item.id, None) if item.id is not None else None
+        if row is not None:
+            matches.append((item, row))
+        else:
+            unmatched.append(item)
+
+    added: List[ChecklistItemData] = []
+    for item in unmatched:
+        row = next((r for r in stored.values() if r.title == item.title), None)
+        if row is not None:
+            del stored[row.id]
+            matches.append((item, row))
+        else:
+            added.append(item)
+
+    changed = [
+        (row.id, item.title, item.is_complete, item.order)
+        for item, row in matches
+        if (row.title, row.is_complete, row.order)
+        != (item.title, item.is_complete, item.order)
+    ]
+    return changed, added, list(stored)
@@ -5,20 +5,28 @@ import logging
 import uuid
 from typing import Any, Dict, List, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Form, HTTPException, UploadFile, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.orm import Session
 
 from src.db import get_db
-from src.initiative_management import product_strategy_controller
+from src.initiative_management import backlog_import, product_strategy_controller
 from src.initiative_management.initiative_controller import (
     InitiativeController,
     InitiativeControllerError,
     InitiativeNotFoundError,
 )
 from src.main import app
-from src.models import ContextType, EntityType, InitiativeStatus, User
+from src.models import (
+    ContextType,
+    EntityType,
+    InitiativeStatus,
+    TaskStatus,
+    User,
+    Workspace,
+)
+from src.services import dependency_graph_service
 from src.strategic_planning.exceptions import DomainException
 from src.views import dependency_to_override
 from src.views.task_views import TaskResponse
@@ -58,6 +66,13 @@ class InitiativeStatusMoveRequest(BaseModel):
     )
 
 
+class InitiativeBulkStatusMoveRequest(BaseModel):
+    initiative_ids: List[uuid.UUID] = Field(
+        min_length=1, max_length=1000, description="IDs of initiatives to move"
+    )
+    new_status: InitiativeStatus = Field(description="New status for the initiatives")
+
+
 class InitiativeGroupRequest(BaseModel):
     group_id: uuid.UUID = Field(description="Group ID to add initiative to")
     after_id: Optional[uuid.UUID] = Field(
@@ -134,6 +149,176 @@ async def create_initiative(
         raise _handle_controller_error(e)
 
 
+class BacklogImportErrorResponse(BaseModel):
+    location: str
+    message: str
+
+
+class BacklogImportResponse(BaseModel):
+    initiatives: int
+    tasks: int
+    checklist_items: int
+    errors: List[BacklogImportErrorResponse]
+
+
+def _get_user_workspace(db: Session, workspace_id: uuid.UUID, user: User) -> Workspace:
+    workspace = (
+        db.query(Workspace)
+        .filter(
+            Workspace.id == workspace_id,
+            Workspace.user_id == user.id,
+            Workspace.deleting_at.is_(None),
+        )
+        .first()
+    )
+    if workspace is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found"
+        )
+    return workspace
+
+
+@app.post("/api/initiatives/import", response_model=BacklogImportResponse)
+async def import_backlog(
+    file: UploadFile,
+    workspace_id: uuid.UUID = Form(),
+    user: User = Depends(dependency_to_override),
+    db: Session = Depends(get_db),
+) -> BacklogImportResponse:
+    """Import initiatives and tasks from a CSV or JSON file.
+
+    Nothing is imported if any record is invalid; the response then lists
+    every invalid record (422).
+    """
+    workspace = _get_user_workspace(db, workspace_id, user)
+
+    try:
+        records = backlog_import.parse_file(file.file, file.filename or "")
+        result = backlog_import.import_backlog(db, workspace.id, user.id, records)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    response = BacklogImportResponse.model_validate(result, from_attributes=True)
+    if result.errors:
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content=response.model_dump(),
+        )
+    return response
+
+
+class UnblockedInitiativeResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    identifier: str
+    title: str
+    status: InitiativeStatus
+
+
+@app.get("/api/workspaces/{workspace_id}/initiatives/dependencies")
+async def get_initiative_dependencies(
+    workspace_id: uuid.UUID,
+    user: User = Depends(dependency_to_override),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """Blocking chains, cycles and critical path of the workspace's initiatives."""
+    workspace = _get_user_workspace(db, workspace_id, user)
+    return dependency_graph_service.get_dependency_graph(db, workspace.id).to_dict()
+
+
+@app.get(
+    "/api/workspaces/{workspace_id}/initiatives/unblocked",
+    response_model=List[UnblockedInitiativeResponse],
+)
+async def get_unblocked_initiatives(
+    workspace_id: uuid.UUID,
+    user: User = Depends(dependency_to_override),
+    db: Session = Depends(get_db),
+) -> List[UnblockedInitiativeResponse]:
+    """Open initiatives that nothing unresolved is blocking."""
+    workspace = _get_user_workspace(db, workspace_id, user)
+    initiatives = dependency_graph_service.get_unblocked_initiatives(db, workspace.id)
+    return [UnblockedInitiativeResponse.model_validate(i) for i in initiatives]
+
+
+class BoardTaskResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    identifier: str
+    title: str
+    status: TaskStatus
+    type: Optional[str]
+
+
+class BoardInitiativeResponse(BaseModel):
+    id: uuid.UUID
+    identifier: str
+    title: str
+    status: InitiativeStatus
+    type: Optional[str]
+    updated_at: datetime.datetime
+    task_counts: Dict[TaskStatus, int]
+    tasks: Optional[List[BoardTaskResponse]] = None
+
+
+class BoardColumnResponse(BaseModel):
+    status: InitiativeStatus
+    initiatives: List[BoardInitiativeResponse]
+
+
+class BoardResponse(BaseModel):
+    columns: List[BoardColumnResponse]
+
+
+@app.get(
+    "/api/workspaces/{workspace_id}/initiatives/board", response_model=BoardResponse
+)
+async def get_initiative_board(
+    workspace_id: uuid.UUID,
+    include_tasks: bool = False,
+    user: User = Depends(dependency_to_override),
+    db: Session = Depends(get_db),
+) -> BoardResponse:
+    """Initiatives grouped by status in board order, with task counts.
+
+    Tasks are only listed with ``include_tasks``.
+    """
+    workspace = _get_user_workspace(db, workspace_id, user)
+
+    try:
+        board = InitiativeController(db).get_board(user.id, workspace.id, include_tasks)
+    except Exception as e:
+        raise _handle_controller_error(e)
+
+    return BoardResponse(
+        columns=[
+            BoardColumnResponse(
+                status=column_status,
+                initiatives=[
+                    BoardInitiativeResponse(
+                        id=item.initiative.id,
+                        identifier=item.initiative.identifier,
+                        title=item.initiative.title,
+                        status=item.initiative.status,
+                        type=item.initiative.type,
+                        updated_at=item.initiative.updated_at,
+                        task_counts=item.task_counts,
+                        tasks=(
+                            [BoardTaskResponse.model_validate(t) for t in item.tasks]
+                            if item.tasks is not None
+                            else None
+                        ),
+                    )
+                    for item in items
+                ],
+            )
+            for column_status, items in board.items()
+        ]
+    )
+
+
 @app.delete("/api/initiatives/{initiative_id}")
 async def delete_initiative(
     initiative_id: uuid.UUID,
@@ -200,6 +385,28 @@ async def move_initiative_to_status(
         raise _handle_controller_error(e)
 
 
+@app.put("/api/initiatives/status", response_model=List[InitiativeResponse])
+async def move_initiatives_to_status(
+    request: InitiativeBulkStatusMoveRequest,
+    user: User = Depends(dependency_to_override),
+    db: Session = Depends(get_db),
+) -> List[InitiativeResponse]:
+    try:
+        controller = InitiativeController(db)
+        initiatives = controller.move_initiatives_to_status(
+            initiative_ids=request.initiative_ids,
+            user_id=user.id,
+            new_status=request.new_status,
+        )
+
+        return [
+            InitiativeResponse.model_validate(initiative) for initiative in initiatives
+        ]
+
+    except Exception as e:
+        raise _handle_controller_error(e)
+
+
 @app.put("/api/initiatives/{initiative_id}/groups", response_model=InitiativeResponse)
 async def add_initiative_to_group(
     initiative_id: uuid.UUID,
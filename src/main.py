@@ -15,8 +15,10 @@ from fastapi_csrf_protect import CsrfProtect
 from fastapi_csrf_protect.exceptions import CsrfProtectError
 from pydantic_settings import BaseSettings
 
+from src.change_feed import change_feed
 from src.config import settings
 from src.db import get_async_db
+from src.github_app.repository_indexer import close_indexing_loop
 
 # from alembic import command
 # from alembic.config import Config
@@ -61,7 +63,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     yield
     # Clean up resources
-    pass
+    await change_feed.close()
+    await close_indexing_loop()
 
 
 # Combine both lifespans
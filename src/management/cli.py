@@ -62,7 +62,10 @@ def parse_args() -> Tuple[str, Dict[str, Any]]:
     Returns:
         Tuple[str, Dict[str, Any]]: Command name and arguments dictionary
     """
-    parser = argparse.ArgumentParser(description="TaskManagement management commands")
+    # --help is added once the command's own options are known
+    parser = argparse.ArgumentParser(
+        description="TaskManagement management commands", add_help=False
+    )
     parser.add_argument("command", nargs="?", help="Command to run")
     parser.add_argument("--list", action="store_true", help="List available commands")
 
@@ -80,6 +83,19 @@ def parse_args() -> Tuple[str, Dict[str, Any]]:
 
     args, unknown = parser.parse_known_args()
 
+    # Commands may declare their own options with add_arguments(parser)
+    commands = discover_commands()
+    if args.command in commands:
+        try:
+            module = importlib.import_module(commands[args.command])
+        except ImportError:
+            module = None
+        if hasattr(module, "add_arguments"):
+            module.add_arguments(parser)
+
+    parser.add_argument("-h", "--help", action="help", help="Show this help message")
+    args, unknown = parser.parse_known_args()
+
     # Convert args to dictionary
     args_dict = vars(args).copy()
     command = args_dict.pop("command")
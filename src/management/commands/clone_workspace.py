@@ -0,0 +1,63 @@
+"""
+Management command to copy a workspace to a user, e.g. to seed a demo account.
+"""
+
+import argparse
+import logging
+import uuid
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def get_help() -> str:
+    """Return help text for this command."""
+    return "Copy a workspace, with its strategy, narrative and backlog, to a user"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of this command."""
+    parser.add_argument("--source", required=True, help="ID of the workspace to copy")
+    parser.add_argument("--user", required=True, help="ID of the user owning the copy")
+    parser.add_argument("--name", help="Name of the copy (default: the source name)")
+
+
+def execute(args: Dict[str, Any]) -> int:
+    """
+    Copy a workspace to a user.
+
+    Args:
+        args: Command-line arguments; requires ``source`` and ``user``,
+            supports ``name``
+
+    Returns:
+        0 on success, 1 on error
+    """
+    from src.db import SessionLocal
+    from src.models import Workspace
+    from src.services.workspace_clone_service import clone_workspace
+
+    db = SessionLocal()
+    try:
+        source_id = uuid.UUID(args["source"])
+        source = db.query(Workspace).filter(Workspace.id == source_id).first()
+        if source is None:
+            logger.error(f"Workspace {source_id} not found")
+            return 1
+
+        workspace = clone_workspace(
+            db,
+            source_workspace_id=source_id,
+            user_id=uuid.UUID(args["user"]),
+            name=args.get("name") or source.name,
+            description=source.description,
+            icon=source.icon,
+        )
+        logger.info(f"Created workspace {workspace.id}")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Error cloning workspace: {e}")
+        return 1
+    finally:
+        db.close()
@@ -0,0 +1,54 @@
+"""
+Management command to export a workspace to a file, e.g. to back it up.
+"""
+
+import argparse
+import logging
+import uuid
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def get_help() -> str:
+    """Return help text for this command."""
+    return "Export a workspace as NDJSON (zstd-compressed if the file ends in .zst)"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of this command."""
+    parser.add_argument(
+        "--workspace", required=True, help="ID of the workspace to export"
+    )
+    parser.add_argument("--output", required=True, help="Path of the export file")
+
+
+def execute(args: Dict[str, Any]) -> int:
+    """
+    Export a workspace to a file.
+
+    Args:
+        args: Command-line arguments; requires ``workspace`` and ``output``
+
+    Returns:
+        0 on success, 1 on error
+    """
+    from src.db import SessionLocal
+    from src.services.workspace_export_service import compress, export_workspace
+
+    db = SessionLocal()
+    try:
+        chunks = export_workspace(db, uuid.UUID(args["workspace"]))
+        if args["output"].endswith(".zst"):
+            chunks = compress(chunks)
+        with open(args["output"], "wb") as output:
+            for chunk in chunks:
+                output.write(chunk)
+        logger.info(f"Exported workspace {args['workspace']} to {args['output']}")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Error exporting workspace: {e}")
+        return 1
+    finally:
+        db.close()
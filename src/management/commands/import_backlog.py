@@ -0,0 +1,72 @@
+"""
+Management command to bulk import a backlog file into a workspace.
+"""
+
+import argparse
+import logging
+import os
+import uuid
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def get_help() -> str:
+    """Return help text for this command."""
+    return "Bulk import initiatives and tasks from a CSV or JSON file"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of this command."""
+    parser.add_argument(
+        "--workspace", required=True, help="ID of the workspace to import into"
+    )
+    parser.add_argument("--file", required=True, help="Path of the CSV or JSON file")
+
+
+def execute(args: Dict[str, Any]) -> int:
+    """
+    Import a backlog file into a workspace, as its owner.
+
+    Args:
+        args: Command-line arguments; requires ``workspace`` and ``file``
+
+    Returns:
+        0 on success, 1 on error or if any record is invalid
+    """
+    from src.db import SessionLocal
+    from src.initiative_management.backlog_import import import_backlog, parse_file
+    from src.models import Workspace
+
+    db = SessionLocal()
+    try:
+        workspace_id = uuid.UUID(args["workspace"])
+        workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+        if workspace is None:
+            logger.error(f"Workspace {workspace_id} not found")
+            return 1
+
+        with open(args["file"], "rb") as file:
+            result = import_backlog(
+                db,
+                workspace.id,
+                workspace.user_id,
+                parse_file(file, os.path.basename(args["file"])),
+            )
+        for error in result.errors:
+            logger.error(f"{error.location}: {error.message}")
+        if result.errors:
+            logger.error("Nothing was imported")
+            return 1
+
+        logger.info(
+            f"Imported {result.initiatives} initiatives, {result.tasks} tasks "
+            f"and {result.checklist_items} checklist items"
+        )
+        return 0
+
+    except Exception as e:
+        logger.error(f"Error importing backlog: {e}")
+        return 1
+    finally:
+        db.close()
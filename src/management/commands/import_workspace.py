@@ -0,0 +1,52 @@
+"""
+Management command to restore a workspace from an export file.
+"""
+
+import argparse
+import logging
+import uuid
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def get_help() -> str:
+    """Return help text for this command."""
+    return "Restore a workspace from an export file (NDJSON, optionally zstd)"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of this command."""
+    parser.add_argument("--input", required=True, help="Path of the export file")
+    parser.add_argument(
+        "--user",
+        help="ID of the user owning the workspace (default: the exported owner)",
+    )
+
+
+def execute(args: Dict[str, Any]) -> int:
+    """
+    Restore a workspace from an export file.
+
+    Args:
+        args: Command-line arguments; requires ``input``, supports ``user``
+
+    Returns:
+        0 on success, 1 on error
+    """
+    from src.db import SessionLocal
+    from src.services.workspace_export_service import import_workspace, read_lines
+
+    db = SessionLocal()
+    try:
+        user_id = uuid.UUID(args["user"]) if args.get("user") else None
+        with open(args["input"], "rb") as file:
+            workspace = import_workspace(db, read_lines(file), user_id=user_id)
+        logger.info(f"Restored workspace {workspace.id}")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Error importing workspace: {e}")
+        return 1
+    finally:
+        db.close()
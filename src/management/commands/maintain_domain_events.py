@@ -0,0 +1,92 @@
+"""
+Management command to maintain the monthly partitions of the domain event store.
+"""
+
+import argparse
+import logging
+from typing import Any, Dict
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_help() -> str:
+    """Return help text for this command."""
+    return "Create upcoming domain event partitions and drop or archive expired months"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of this command."""
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        help=(
+            "Months of events kept besides the current one; 0 keeps all "
+            f"(default: {settings.domain_event_retention_months})"
+        ),
+    )
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        help=(
+            "Months of partitions created ahead "
+            f"(default: {settings.domain_event_partitions_ahead})"
+        ),
+    )
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument(
+        "--archive",
+        dest="archive",
+        action="store_true",
+        default=None,
+        help="Move expired months to the private schema instead of dropping them",
+    )
+    archive.add_argument(
+        "--drop",
+        dest="archive",
+        action="store_false",
+        help="Drop expired months",
+    )
+
+
+def execute(args: Dict[str, Any]) -> int:
+    """
+    Create upcoming partitions and apply the retention window.
+
+    Args:
+        args: Command-line arguments; supports ``retention_months``,
+            ``months_ahead`` and ``archive`` (settings are used when unset)
+
+    Returns:
+        0 on success, 1 on error
+    """
+    from src.db import SessionLocal
+    from src.strategic_planning.services.event_store import (
+        apply_event_retention,
+        ensure_event_partitions,
+    )
+
+    retention_months = args.get("retention_months")
+    if retention_months is None:
+        retention_months = settings.domain_event_retention_months
+    archive = args.get("archive")
+    if archive is None:
+        archive = settings.domain_event_archive_expired
+
+    db = SessionLocal()
+    try:
+        created = ensure_event_partitions(db, months_ahead=args.get("months_ahead"))
+        logger.info(f"Created {len(created)} domain event partitions")
+
+        if retention_months > 0:
+            removed = apply_event_retention(db, retention_months, archive=archive)
+            action = "Archived" if archive else "Dropped"
+            logger.info(f"{action} {len(removed)} expired domain event partitions")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Error maintaining domain event partitions: {e}")
+        return 1
+    finally:
+        db.close()
@@ -0,0 +1,66 @@
+"""
+Management command to process queued GitHub webhook deliveries.
+"""
+
+import logging
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 5
+
+
+def get_help() -> str:
+    """Return help text for this command."""
+    return "Process queued GitHub webhook deliveries (coalescing pushes per repository)"
+
+
+def execute(args: Dict[str, Any]) -> int:
+    """
+    Process queued GitHub webhook deliveries.
+
+    Args:
+        args: Command-line arguments; supports ``interval`` (seconds between
+            polls) and ``single_run`` (drain the queue once and exit)
+
+    Returns:
+        0 on success, 1 on error
+    """
+    from src.db import SessionLocal
+    from src.github_app.webhook_queue import (
+        drain_webhook_queue,
+        purge_old_webhook_deliveries,
+    )
+
+    interval = args.get("interval") or DEFAULT_INTERVAL_SECONDS
+    single_run = bool(args.get("single_run"))
+
+    logger.info("Starting GitHub webhook queue worker...")
+
+    try:
+        while True:
+            db = SessionLocal()
+            try:
+                processed = drain_webhook_queue(db)
+                purged = purge_old_webhook_deliveries(db)
+            finally:
+                db.close()
+
+            if processed or purged:
+                logger.info(
+                    f"GitHub webhook queue: processed {processed} deliveries, "
+                    f"purged {purged} old deliveries"
+                )
+
+            if single_run:
+                return 0
+
+            time.sleep(interval)
+
+    except KeyboardInterrupt:
+        logger.info("GitHub webhook queue worker stopped by user")
+        return 0
+    except Exception as e:
+        logger.error(f"Error processing GitHub webhook queue: {e}")
+        return 1
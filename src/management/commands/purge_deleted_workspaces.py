@@ -0,0 +1,60 @@
+"""
+Management command to purge workspaces and accounts marked for deletion.
+
+Deleted workspaces and accounts are normally purged right after the request;
+this picks up any whose purge was interrupted, e.g. by a restart.
+"""
+
+import argparse
+import logging
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def get_help() -> str:
+    """Return help text for this command."""
+    return "Purge the workspaces and accounts marked for deletion"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of this command."""
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Rows deleted per statement (default: 1000)",
+    )
+
+
+def execute(args: Dict[str, Any]) -> int:
+    """
+    Purge every workspace and account marked for deletion.
+
+    Args:
+        args: Command-line arguments; supports ``chunk_size``
+
+    Returns:
+        0 on success, 1 on error
+    """
+    from src.db import SessionLocal
+    from src.services.workspace_deletion_service import (
+        CHUNK_SIZE,
+        purge_deleted_users,
+        purge_deleted_workspaces,
+    )
+
+    db = SessionLocal()
+    try:
+        chunk_size = args.get("chunk_size") or CHUNK_SIZE
+        # Accounts first: purging one also purges its workspaces
+        users = purge_deleted_users(db, chunk_size)
+        workspaces = purge_deleted_workspaces(db, chunk_size)
+        logger.info(f"Purged {users} accounts and {workspaces} workspaces")
+        return 0
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error purging workspaces: {e}")
+        return 1
+    finally:
+        db.close()
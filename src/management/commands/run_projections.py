@@ -0,0 +1,116 @@
+"""
+Management command to keep domain event projections up to date.
+"""
+
+import argparse
+import logging
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 5
+
+
+def get_help() -> str:
+    """Return help text for this command."""
+    return "Apply new domain events to the per-workspace projections (or replay/rebuild them)"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of this command."""
+    parser.add_argument(
+        "--projection",
+        action="append",
+        help="Only run this projection (may be repeated; default: all)",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--replay",
+        action="store_true",
+        help="Re-apply the whole event history from the first event, then exit",
+    )
+    mode.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Drop the read models and rebuild them from zero, then exit",
+    )
+
+
+def execute(args: Dict[str, Any]) -> int:
+    """
+    Apply new domain events to the projections.
+
+    Args:
+        args: Command-line arguments; supports ``interval`` (seconds between
+            polls), ``single_run`` (apply pending events once and exit),
+            ``projection`` (names to run), ``replay`` and ``rebuild``
+
+    Returns:
+        0 on success, 1 on error
+    """
+    from src.db import SessionLocal
+    from src.strategic_planning.services.projections import (
+        get_projection,
+        get_projections,
+        rebuild_projection,
+        refresh_expired_read_models,
+        replay_projection,
+        run_projection,
+    )
+
+    interval = args.get("interval") or DEFAULT_INTERVAL_SECONDS
+    single_run = bool(args.get("single_run"))
+
+    try:
+        names = args.get("projection")
+        projections = (
+            [get_projection(name) for name in names] if names else get_projections()
+        )
+    except KeyError as e:
+        logger.error(f"Unknown projection: {e}")
+        return 1
+
+    logger.info(
+        f"Starting projection runner for {', '.join(p.name for p in projections)}..."
+    )
+
+    try:
+        if args.get("rebuild") or args.get("replay"):
+            db = SessionLocal()
+            try:
+                for projection in projections:
+                    if args.get("rebuild"):
+                        rebuilt = rebuild_projection(db, projection)
+                        logger.info(
+                            f"Rebuilt {projection.name} for {rebuilt} workspaces"
+                        )
+                    else:
+                        replayed = replay_projection(db, projection)
+                        logger.info(
+                            f"Replayed {replayed} events into {projection.name}"
+                        )
+            finally:
+                db.close()
+            return 0
+
+        while True:
+            db = SessionLocal()
+            try:
+                for projection in projections:
+                    run_projection(db, projection)
+                    refresh_expired_read_models(db, projection)
+            finally:
+                db.close()
+
+            if single_run:
+                return 0
+
+            time.sleep(interval)
+
+    except KeyboardInterrupt:
+        logger.info("Projection runner stopped by user")
+        return 0
+    except Exception as e:
+        logger.error(f"Error running projections: {e}")
+        return 1
@@ -83,7 +83,9 @@ def get_user_workspace(
     """
     try:
         workspace = (
-            session.query(Workspace).filter(Workspace.user_id == user_id).first()
+            session.query(Workspace)
+            .filter(Workspace.user_id == user_id, Workspace.deleting_at.is_(None))
+            .first()
         )
         if not workspace:
             return None, "No workspace found. Please create a workspace first."
@@ -37,7 +37,9 @@ async def health_check() -> Dict[str, Any]:
         workspace_id = uuid.UUID(workspace_id_str) if workspace_id_str else None
 
         workspace = (
-            session.query(Workspace).filter(Workspace.id == workspace_id).first()
+            session.query(Workspace)
+            .filter(Workspace.id == workspace_id, Workspace.deleting_at.is_(None))
+            .first()
             if workspace_id
             else None
         )
@@ -54,6 +54,7 @@ __all__ = [
     "submit_strategic_initiative",
     "query_strategic_initiatives",
     "delete_strategic_initiative",
+    "query_initiative_dependencies",
     # Utility Tools
     "connect_outcome_to_pillars",
 ]
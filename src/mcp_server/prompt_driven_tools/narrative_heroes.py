@@ -24,6 +24,7 @@ from src.mcp_server.prompt_driven_tools.utils import (
 from src.narrative.aggregates.hero import Hero
 from src.narrative.exceptions import DomainException
 from src.narrative.services.hero_service import HeroService
+from src.strategic_planning.models import DomainEvent
 from src.strategic_planning.services.event_publisher import EventPublisher
 
 logging.basicConfig(level=logging.INFO)
@@ -438,7 +439,7 @@ async def delete_hero(hero_identifier: str) -> Dict[str, Any]:
     """
     session = SessionLocal()
     try:
-        _, workspace_id = get_auth_context(session, requires_workspace=True)
+        user_id, workspace_id = get_auth_context(session, requires_workspace=True)
         logger.info(f"Deleting hero {hero_identifier} for workspace {workspace_id}")
 
         publisher = EventPublisher(session)
@@ -450,6 +451,14 @@ async def delete_hero(hero_identifier: str) -> Dict[str, Any]:
         hero_name = hero.name
         hero_id = str(hero.id)
 
+        event = DomainEvent(
+            user_id=uuid.UUID(user_id),
+            event_type="HeroDeleted",
+            aggregate_id=hero.id,
+            payload={"workspace_id": str(workspace_id), "name": hero_name},
+        )
+        publisher.publish(event, workspace_id=str(workspace_id))
+
         session.delete(hero)
         session.commit()
 
@@ -24,6 +24,7 @@ from src.mcp_server.prompt_driven_tools.utils import (
 from src.narrative.aggregates.villain import Villain, VillainType
 from src.narrative.exceptions import DomainException
 from src.narrative.services.villain_service import VillainService
+from src.strategic_planning.models import DomainEvent
 from src.strategic_planning.services.event_publisher import EventPublisher
 
 logging.basicConfig(level=logging.INFO)
@@ -444,7 +445,7 @@ async def delete_villain(villain_identifier: str) -> Dict[str, Any]:
     """
     session = SessionLocal()
     try:
-        _, workspace_id = get_auth_context(session, requires_workspace=True)
+        user_id, workspace_id = get_auth_context(session, requires_workspace=True)
         logger.info(
             f"Deleting villain {villain_identifier} for workspace {workspace_id}"
         )
@@ -458,6 +459,14 @@ async def delete_villain(villain_identifier: str) -> Dict[str, Any]:
         villain_name = villain.name
         villain_id = str(villain.id)
 
+        event = DomainEvent(
+            user_id=uuid.UUID(user_id),
+            event_type="VillainDeleted",
+            aggregate_id=villain.id,
+            payload={"workspace_id": str(workspace_id), "name": villain_name},
+        )
+        publisher.publish(event, workspace_id=str(workspace_id))
+
         session.delete(villain)
         session.commit()
 
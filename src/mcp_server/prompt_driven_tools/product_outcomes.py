@@ -15,6 +15,7 @@ from src.mcp_server.auth_utils import MCPContextError, get_auth_context
 from src.mcp_server.main import mcp
 from src.mcp_server.prompt_driven_tools.utils import (
     FrameworkBuilder,
+    WorkspaceStrategyGraph,
     build_error_response,
     build_success_response,
     get_workspace_id_from_request,
@@ -506,17 +507,15 @@ async def query_product_outcomes(
     try:
         workspace_uuid = get_workspace_id_from_request()
 
+        graph = WorkspaceStrategyGraph.load(session, workspace_uuid)
+
         # SINGLE OUTCOME MODE: identifier provided
         if identifier:
             logger.info(
                 f"Getting product outcome '{identifier}' in workspace {workspace_uuid}"
             )
 
-            outcome = (
-                session.query(ProductOutcome)
-                .filter_by(identifier=identifier, workspace_id=workspace_uuid)
-                .first()
-            )
+            outcome = graph.outcomes_by_identifier.get(identifier)
 
             if not outcome:
                 return build_error_response(
@@ -534,7 +533,7 @@ async def query_product_outcomes(
                     {
                         "identifier": theme.identifier,
                         "name": theme.name,
-                        "is_prioritized": theme.display_order is not None,
+                        "is_prioritized": graph.is_prioritized(theme),
                     }
                 )
             outcome_data["linked_themes"] = linked_themes
@@ -548,13 +547,11 @@ async def query_product_outcomes(
         # LIST MODE: return all outcomes
         logger.info(f"Getting all product outcomes for workspace {workspace_uuid}")
 
-        outcomes = strategic_controller.get_product_outcomes(workspace_uuid, session)
-
         return build_success_response(
             entity_type="outcome",
-            message=f"Found {len(outcomes)} product outcome(s)",
+            message=f"Found {len(graph.outcomes)} product outcome(s)",
             data={
-                "outcomes": [serialize_outcome(outcome) for outcome in outcomes],
+                "outcomes": [serialize_outcome(outcome) for outcome in graph.outcomes],
             },
         )
 
@@ -16,6 +16,7 @@ from src.mcp_server.auth_utils import MCPContextError, get_auth_context
 from src.mcp_server.main import mcp
 from src.mcp_server.prompt_driven_tools.utils import (
     FrameworkBuilder,
+    WorkspaceStrategyGraph,
     build_error_response,
     build_success_response,
     calculate_alignment_score,
@@ -793,17 +794,15 @@ async def query_roadmap_themes(
     try:
         workspace_uuid = get_workspace_id_from_request()
 
+        graph = WorkspaceStrategyGraph.load(session, workspace_uuid)
+
         # SINGLE THEME MODE: identifier provided
         if identifier:
             logger.info(
                 f"Getting roadmap theme '{identifier}' in workspace {workspace_uuid}"
             )
 
-            theme = (
-                session.query(roadmap_controller.RoadmapTheme)
-                .filter_by(identifier=identifier, workspace_id=workspace_uuid)
-                .first()
-            )
+            theme = graph.themes_by_identifier.get(identifier)
 
             if not theme:
                 return build_error_response(
@@ -828,17 +827,8 @@ async def query_roadmap_themes(
             else:
                 theme_data["primary_villain_name"] = None
 
-            prioritized_themes = roadmap_controller.get_prioritized_themes(
-                workspace_uuid, session
-            )
-            is_prioritized = any(t.id == theme.id for t in prioritized_themes)
-            theme_data["is_prioritized"] = is_prioritized
-
-            all_outcomes = strategic_controller.get_product_outcomes(
-                workspace_uuid, session
-            )
-            alignment_score = calculate_alignment_score(theme, len(all_outcomes))
-            theme_data["alignment_score"] = round(alignment_score, 2)
+            theme_data["is_prioritized"] = graph.is_prioritized(theme)
+            theme_data["alignment_score"] = round(graph.alignment_score(theme), 2)
 
             return build_success_response(
                 entity_type="theme",
@@ -853,10 +843,10 @@ async def query_roadmap_themes(
         )
 
         if prioritized_only:
-            themes = roadmap_controller.get_prioritized_themes(workspace_uuid, session)
+            themes = graph.prioritized_themes
             message = f"Found {len(themes)} prioritized roadmap theme(s)"
         else:
-            themes = roadmap_controller.get_roadmap_themes(workspace_uuid, session)
+            themes = graph.themes
             message = f"Found {len(themes)} roadmap theme(s)"
 
         return build_success_response(
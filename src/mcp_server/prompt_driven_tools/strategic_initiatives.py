@@ -25,6 +25,7 @@ from src.mcp_server.auth_utils import MCPContextError, get_auth_context
 from src.mcp_server.main import mcp
 from src.mcp_server.prompt_driven_tools.utils import (
     FrameworkBuilder,
+    WorkspaceStrategyGraph,
     build_error_response,
     build_success_response,
     get_workspace_id_from_request,
@@ -42,6 +43,7 @@ from src.narrative.aggregates.conflict import Conflict, ConflictStatus
 from src.narrative.services.hero_service import HeroService
 from src.narrative.services.villain_service import VillainService
 from src.roadmap_intelligence.aggregates.roadmap_theme import RoadmapTheme
+from src.services import dependency_graph_service
 from src.strategic_planning import controller as strategic_controller
 from src.strategic_planning.aggregates.strategic_pillar import StrategicPillar
 from src.strategic_planning.exceptions import DomainException
@@ -840,16 +842,12 @@ async def _query_strategic_initiatives_impl(
                 .all()
             )
         else:
-            # Get all - query via StrategicInitiative for full context
-            strategic_initiatives = (
-                session.query(StrategicInitiative)
-                .options(*_get_strategic_initiative_eager_load_options())
-                .filter_by(workspace_id=workspace_uuid)
-                .all()
-            )
+            # Get all - the strategy graph gives the full context of every
+            # initiative without a query per initiative
+            graph = WorkspaceStrategyGraph.load(session, workspace_uuid)
 
             initiatives_data = []
-            for si in strategic_initiatives:
+            for si in graph.strategic_initiatives:
                 initiative_data = {
                     "id": str(si.id),
                     "initiative": {
@@ -951,6 +949,114 @@ async def query_strategic_initiatives(
     )
 
 
+@mcp.tool()
+async def query_initiative_dependencies(
+    identifier: Optional[str] = None,
+    unblocked_only: bool = False,
+) -> Dict[str, Any]:
+    """Query how initiatives block each other.
+
+    Query modes:
+    - No params: Returns the workspace dependency graph (blocking chains,
+      topological order, cycles and critical path)
+    - identifier: Returns the initiatives blocking and blocked by one initiative
+    - unblocked_only: Returns open initiatives nothing unresolved is blocking,
+      i.e. what can start now
+
+    Args:
+        identifier: Initiative identifier (e.g., "I-1001")
+        unblocked_only: Only list initiatives that can start now
+    """
+    session = SessionLocal()
+    try:
+        _, workspace_id_str = get_auth_context(session, requires_workspace=True)
+        if workspace_id_str is None:
+            raise MCPContextError(
+                "Workspace not found.",
+                error_type="workspace_error",
+            )
+
+        workspace_uuid = uuid.UUID(workspace_id_str)
+
+        if unblocked_only:
+            initiatives = dependency_graph_service.get_unblocked_initiatives(
+                session, workspace_uuid
+            )
+            return build_success_response(
+                entity_type="strategic_initiative",
+                message=f"Found {len(initiatives)} unblocked initiative(s)",
+                data={
+                    "initiatives": [
+                        {
+                            "id": str(initiative.id),
+                            "identifier": initiative.identifier,
+                            "title": initiative.title,
+                            "status": initiative.status.value,
+                        }
+                        for initiative in initiatives
+                    ]
+                },
+            )
+
+        graph = dependency_graph_service.get_dependency_graph(session, workspace_uuid)
+
+        if identifier:
+            node = next(
+                (n for n in graph.nodes.values() if n.identifier == identifier),
+                None,
+            )
+            if node is None:
+                return build_error_response(
+                    "strategic_initiative", f"Initiative not found: {identifier}"
+                )
+
+            def summarize(dependency):
+                return {
+                    "identifier": dependency.identifier,
+                    "title": dependency.title,
+                    "status": dependency.status.value,
+                }
+
+            return build_success_response(
+                entity_type="strategic_initiative",
+                message=f"Found dependencies of {node.identifier}",
+                data={
+                    "identifier": node.identifier,
+                    "title": node.title,
+                    "status": node.status.value,
+                    "in_cycle": node.in_cycle,
+                    "blocked_by": [
+                        summarize(graph.nodes[blocker_id])
+                        for blocker_id in node.blockers
+                    ],
+                    "open_blockers": [
+                        summarize(blocker) for blocker in graph.open_blockers(node.id)
+                    ],
+                    "blocking": [
+                        summarize(blocked) for blocked in graph.blocking(node.id)
+                    ],
+                },
+            )
+
+        return build_success_response(
+            entity_type="strategic_initiative",
+            message=(
+                f"Found {len(graph.nodes)} initiative(s), "
+                f"{len(graph.cycles)} dependency cycle(s)"
+            ),
+            data=graph.to_dict(),
+        )
+
+    except MCPContextError as e:
+        logger.warning(f"Context error: {e}")
+        return build_error_response("strategic_initiative", str(e))
+    except Exception as e:
+        logger.exception(f"Error querying initiative dependencies: {e}")
+        return build_error_response("strategic_initiative", f"Server error: {str(e)}")
+    finally:
+        session.close()
+
+
 def _ensure_strategic_context(
     session: Session,
     initiative: Initiative,
@@ -13,6 +13,7 @@ from src.mcp_server.auth_utils import MCPContextError, get_auth_context
 from src.mcp_server.main import mcp
 from src.mcp_server.prompt_driven_tools.utils import (
     FrameworkBuilder,
+    WorkspaceStrategyGraph,
     build_error_response,
     build_success_response,
     get_workspace_id_from_request,
@@ -326,17 +327,15 @@ async def query_strategic_pillars(
     try:
         workspace_uuid = get_workspace_id_from_request()
 
+        graph = WorkspaceStrategyGraph.load(session, workspace_uuid)
+
         # SINGLE PILLAR MODE: identifier provided
         if identifier:
             logger.info(
                 f"Getting strategic pillar '{identifier}' in workspace {workspace_uuid}"
             )
 
-            pillar = (
-                session.query(StrategicPillar)
-                .filter_by(identifier=identifier, workspace_id=workspace_uuid)
-                .first()
-            )
+            pillar = graph.pillars_by_identifier.get(identifier)
 
             if not pillar:
                 return build_error_response(
@@ -359,13 +358,11 @@ async def query_strategic_pillars(
         # LIST MODE: return all pillars
         logger.info(f"Getting all strategic pillars for workspace {workspace_uuid}")
 
-        pillars = strategic_controller.get_strategic_pillars(workspace_uuid, session)
-
         return build_success_response(
             entity_type="pillar",
-            message=f"Found {len(pillars)} strategic pillar(s)",
+            message=f"Found {len(graph.pillars)} strategic pillar(s)",
             data={
-                "pillars": [serialize_pillar(pillar) for pillar in pillars],
+                "pillars": [serialize_pillar(pillar) for pillar in graph.pillars],
             },
         )
 
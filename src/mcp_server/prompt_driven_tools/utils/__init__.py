@@ -30,6 +30,9 @@ from src.mcp_server.prompt_driven_tools.utils.serializers import (
     serialize_villain,
     serialize_vision,
 )
+from src.mcp_server.prompt_driven_tools.utils.strategy_graph import (
+    WorkspaceStrategyGraph,
+)
 from src.mcp_server.prompt_driven_tools.utils.validation_runner import (
     validate_hero_constraints,
     validate_outcome_constraints,
@@ -76,4 +79,5 @@ __all__ = [
     "serialize_villain",
     "serialize_conflict",
     "serialize_turning_point",
+    "WorkspaceStrategyGraph",
 ]
@@ -0,0 +1,346 @@
+"""In-memory view of a workspace's strategy for read tools.
+
+Serializing strategy entities walks their relationships (pillar → outcomes,
+theme → outcomes/heroes/villains, initiative → pillar/theme/conflicts...),
+and every walk is a lazy load, so the cost of a read tool grew with the size
+of the workspace. ``WorkspaceStrategyGraph.load`` fetches the whole strategy
+of a workspace in a fixed number of queries and wires every relationship the
+serializers follow from the fetched rows, so reading a workspace costs the
+same handful of queries however many entities and links it has.
+"""
+
+import uuid
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.initiative_management.aggregates.strategic_initiative import (
+    StrategicInitiative,
+)
+from src.mcp_server.prompt_driven_tools.utils.alignment_scorer import (
+    calculate_alignment_score,
+)
+from src.narrative.aggregates.conflict import Conflict
+from src.narrative.aggregates.hero import Hero
+from src.narrative.aggregates.villain import Villain
+from src.roadmap_intelligence.aggregates.prioritized_roadmap import PrioritizedRoadmap
+from src.roadmap_intelligence.aggregates.roadmap_theme import RoadmapTheme
+from src.strategic_planning.aggregates.product_outcome import ProductOutcome
+from src.strategic_planning.aggregates.product_vision import ProductVision
+from src.strategic_planning.aggregates.strategic_pillar import StrategicPillar
+
+T = TypeVar("T")
+
+# Link tables of the strategy, as (left column, table of the left entity,
+# right column); links are scoped to the workspace through the left entity
+_LINK_TABLES = {
+    "outcome_pillar_links": ("outcome_id", "product_outcomes", "pillar_id"),
+    "theme_outcome_links": ("theme_id", "roadmap_themes", "outcome_id"),
+    "roadmap_theme_heroes": ("roadmap_theme_id", "roadmap_themes", "hero_id"),
+    "roadmap_theme_villains": ("roadmap_theme_id", "roadmap_themes", "villain_id"),
+    "strategic_initiative_heroes": (
+        "strategic_initiative_id",
+        "strategic_initiatives",
+        "hero_id",
+    ),
+    "strategic_initiative_villains": (
+        "strategic_initiative_id",
+        "strategic_initiatives",
+        "villain_id",
+    ),
+    "strategic_initiative_conflicts": (
+        "strategic_initiative_id",
+        "strategic_initiatives",
+        "conflict_id",
+    ),
+}
+
+_LINKS_QUERY = "\nUNION ALL\n".join(
+    f"SELECT '{table}' AS kind, l.{left} AS left_id, l.{right} AS right_id "
+    f"FROM dev.{table} AS l JOIN dev.{entities} AS e ON e.id = l.{left} "
+    f"WHERE e.workspace_id = :workspace_id"
+    for table, (left, entities, right) in _LINK_TABLES.items()
+)
+
+
+class WorkspaceStrategyGraph:
+    """The strategy of one workspace, loaded up front and indexed in memory.
+
+    Entity lists keep the order of the corresponding controller queries
+    (pillars and outcomes by display order, the others by creation), and
+    every collection wired on the entities follows the same order. Once
+    loaded, serializing any entity of the graph issues no query.
+
+    Attributes:
+        workspace_id: UUID of the workspace
+        vision: The workspace vision, None if not defined yet
+        pillars, outcomes, themes, heroes, villains, conflicts,
+            strategic_initiatives: Every entity of that type in the workspace
+        prioritized_theme_ids: Theme UUIDs in priority order
+    """
+
+    def __init__(
+        self,
+        workspace_id: uuid.UUID,
+        vision: Optional[ProductVision],
+        pillars: List[StrategicPillar],
+        outcomes: List[ProductOutcome],
+        themes: List[RoadmapTheme],
+        heroes: List[Hero],
+        villains: List[Villain],
+        conflicts: List[Conflict],
+        strategic_initiatives: List[StrategicInitiative],
+        prioritized_theme_ids: List[uuid.UUID],
+    ) -> None:
+        self.workspace_id = workspace_id
+        self.vision = vision
+        self.pillars = pillars
+        self.outcomes = outcomes
+        self.themes = themes
+        self.heroes = heroes
+        self.villains = villains
+        self.conflicts = conflicts
+        self.strategic_initiatives = strategic_initiatives
+        self.prioritized_theme_ids = prioritized_theme_ids
+
+        self.pillars_by_identifier = _by_identifier(pillars)
+        self.outcomes_by_identifier = _by_identifier(outcomes)
+        self.themes_by_identifier = _by_identifier(themes)
+        self.heroes_by_identifier = _by_identifier(heroes)
+        self.villains_by_identifier = _by_identifier(villains)
+        self.conflicts_by_identifier = _by_identifier(conflicts)
+
+        self._themes_by_id = {theme.id: theme for theme in themes}
+        self._prioritized_ids: Set[uuid.UUID] = set(prioritized_theme_ids)
+
+    @classmethod
+    def load(
+        cls, session: Session, workspace_id: uuid.UUID
+    ) -> "WorkspaceStrategyGraph":
+        """Load the strategy of a workspace in a fixed number of queries.
+
+        Args:
+            session: Database session
+            workspace_id: UUID of the workspace
+
+        Returns:
+            WorkspaceStrategyGraph: The loaded graph
+        """
+        vision = (
+            session.query(ProductVision).filter_by(workspace_id=workspace_id).first()
+        )
+        roadmap = (
+            session.query(PrioritizedRoadmap)
+            .filter_by(workspace_id=workspace_id)
+            .first()
+        )
+        pillars = (
+            session.query(StrategicPillar)
+            .filter_by(workspace_id=workspace_id)
+            .order_by(StrategicPillar.display_order)
+            .all()
+        )
+        outcomes = (
+            session.query(ProductOutcome)
+            .filter_by(workspace_id=workspace_id)
+            .order_by(ProductOutcome.display_order)
+            .all()
+        )
+        themes = (
+            session.query(RoadmapTheme)
+            .filter_by(workspace_id=workspace_id)
+            .order_by(RoadmapTheme.created_at)
+            .all()
+        )
+        heroes = (
+            session.query(Hero)
+            .filter_by(workspace_id=workspace_id)
+            .order_by(Hero.created_at)
+            .all()
+        )
+        villains = (
+            session.query(Villain)
+            .filter_by(workspace_id=workspace_id)
+            .order_by(Villain.created_at)
+            .all()
+        )
+        conflicts = (
+            session.query(Conflict)
+            .options(joinedload(Conflict.resolved_by_initiative))
+            .filter_by(workspace_id=workspace_id)
+            .order_by(Conflict.created_at.desc())
+            .all()
+        )
+        strategic_initiatives = (
+            session.query(StrategicInitiative)
+            .options(joinedload(StrategicInitiative.initiative))
+            .filter_by(workspace_id=workspace_id)
+            .order_by(StrategicInitiative.created_at)
+            .all()
+        )
+
+        links: Dict[str, List[Tuple[uuid.UUID, uuid.UUID]]] = defaultdict(list)
+        for kind, left_id, right_id in session.execute(
+            text(_LINKS_QUERY), {"workspace_id": workspace_id}
+        ):
+            links[kind].append((left_id, right_id))
+
+        _wire(
+            pillars,
+            outcomes,
+            themes,
+            heroes,
+            villains,
+            conflicts,
+            strategic_initiatives,
+            links,
+        )
+
+        return cls(
+            workspace_id=workspace_id,
+            vision=vision,
+            pillars=pillars,
+            outcomes=outcomes,
+            themes=themes,
+            heroes=heroes,
+            villains=villains,
+            conflicts=conflicts,
+            strategic_initiatives=strategic_initiatives,
+            prioritized_theme_ids=roadmap.get_prioritized_themes() if roadmap else [],
+        )
+
+    @property
+    def prioritized_themes(self) -> List[RoadmapTheme]:
+        """Themes on the prioritized roadmap, in priority order."""
+        return [
+            self._themes_by_id[theme_id]
+            for theme_id in self.prioritized_theme_ids
+            if theme_id in self._themes_by_id
+        ]
+
+    def is_prioritized(self, theme: RoadmapTheme) -> bool:
+        return theme.id in self._prioritized_ids
+
+    def alignment_score(self, theme: RoadmapTheme) -> float:
+        """Alignment score of a theme against the outcomes of the workspace."""
+        return calculate_alignment_score(theme, len(self.outcomes))
+
+
+def _by_identifier(entities: Iterable[T]) -> Dict[str, T]:
+    return {entity.identifier: entity for entity in entities}
+
+
+def _wire(
+    pillars: List[StrategicPillar],
+    outcomes: List[ProductOutcome],
+    themes: List[RoadmapTheme],
+    heroes: List[Hero],
+    villains: List[Villain],
+    conflicts: List[Conflict],
+    strategic_initiatives: List[StrategicInitiative],
+    links: Dict[str, List[Tuple[uuid.UUID, uuid.UUID]]],
+) -> None:
+    """Set every strategy relationship from the loaded rows, as if loaded."""
+    pillars_by_id = {pillar.id: pillar for pillar in pillars}
+    outcomes_by_id = {outcome.id: outcome for outcome in outcomes}
+    themes_by_id = {theme.id: theme for theme in themes}
+    heroes_by_id = {hero.id: hero for hero in heroes}
+    villains_by_id = {villain.id: villain for villain in villains}
+    conflicts_by_id = {conflict.id: conflict for conflict in conflicts}
+    initiatives_by_id = {si.id: si for si in strategic_initiatives}
+
+    def many_to_many(
+        kind: str,
+        lefts: Dict[uuid.UUID, object],
+        rights: Dict[uuid.UUID, object],
+        left_key: str,
+        right_key: str,
+    ) -> None:
+        left_targets = defaultdict(set)
+        right_targets = defaultdict(set)
+        for left_id, right_id in links[kind]:
+            if left_id in lefts and right_id in rights:
+                left_targets[left_id].add(right_id)
+                right_targets[right_id].add(left_id)
+        # Linked entities keep the load order, looked up by position so each
+        # side costs its number of links rather than |lefts| x |rights|
+        left_positions = {left_id: n for n, left_id in enumerate(lefts)}
+        right_positions = {right_id: n for n, right_id in enumerate(rights)}
+        for left_id, left in lefts.items():
+            linked = sorted(left_targets[left_id], key=right_positions.__getitem__)
+            set_committed_value(left, left_key, [rights[i] for i in linked])
+        for right_id, right in rights.items():
+            linked = sorted(right_targets[right_id], key=left_positions.__getitem__)
+            set_committed_value(right, right_key, [lefts[i] for i in linked])
+
+    many_to_many(
+        "outcome_pillar_links", outcomes_by_id, pillars_by_id, "pillars", "outcomes"
+    )
+    many_to_many(
+        "theme_outcome_links", themes_by_id, outcomes_by_id, "outcomes", "themes"
+    )
+    many_to_many(
+        "roadmap_theme_heroes", themes_by_id, heroes_by_id, "heroes", "roadmap_themes"
+    )
+    many_to_many(
+        "roadmap_theme_villains",
+        themes_by_id,
+        villains_by_id,
+        "villains",
+        "roadmap_themes",
+    )
+    many_to_many(
+        "strategic_initiative_heroes",
+        initiatives_by_id,
+        heroes_by_id,
+        "heroes",
+        "strategic_initiatives",
+    )
+    many_to_many(
+        "strategic_initiative_villains",
+        initiatives_by_id,
+        villains_by_id,
+        "villains",
+        "strategic_initiatives",
+    )
+    many_to_many(
+        "strategic_initiative_conflicts",
+        initiatives_by_id,
+        conflicts_by_id,
+        "conflicts",
+        "strategic_initiatives",
+    )
+
+    hero_conflicts = defaultdict(list)
+    villain_conflicts = defaultdict(list)
+    for conflict in conflicts:
+        set_committed_value(conflict, "hero", heroes_by_id.get(conflict.hero_id))
+        set_committed_value(
+            conflict, "villain", villains_by_id.get(conflict.villain_id)
+        )
+        set_committed_value(
+            conflict, "story_arc", themes_by_id.get(conflict.story_arc_id)
+        )
+        hero_conflicts[conflict.hero_id].append(conflict)
+        villain_conflicts[conflict.villain_id].append(conflict)
+    for hero in heroes:
+        set_committed_value(hero, "conflicts", hero_conflicts[hero.id])
+    for villain in villains:
+        set_committed_value(villain, "conflicts", villain_conflicts[villain.id])
+
+    pillar_initiatives = defaultdict(list)
+    theme_initiatives = defaultdict(list)
+    for si in strategic_initiatives:
+        set_committed_value(si, "strategic_pillar", pillars_by_id.get(si.pillar_id))
+        set_committed_value(si, "roadmap_theme", themes_by_id.get(si.theme_id))
+        pillar_initiatives[si.pillar_id].append(si)
+        theme_initiatives[si.theme_id].append(si)
+    for pillar in pillars:
+        set_committed_value(
+            pillar, "strategic_initiatives", pillar_initiatives[pillar.id]
+        )
+    for theme in themes:
+        set_committed_value(theme, "strategic_initiatives", theme_initiatives[theme.id])
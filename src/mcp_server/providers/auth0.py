@@ -77,7 +77,9 @@ class Auth0MCPAuthProvider(MCPAuthProvider):
 
             # Get User's workspace
             workspace = (
-                session.query(Workspace).filter(Workspace.user_id == user_id).first()
+                session.query(Workspace)
+                .filter(Workspace.user_id == user_id, Workspace.deleting_at.is_(None))
+                .first()
             )
             if not workspace:
                 logger.debug(f"Auth0 context resolved: user={user_id}, workspace=None")
@@ -58,7 +58,9 @@ class DevMCPAuthProvider(MCPAuthProvider):
 
             # Find the user's first workspace
             workspace = (
-                session.query(Workspace).filter(Workspace.user_id == user.id).first()
+                session.query(Workspace)
+                .filter(Workspace.user_id == user.id, Workspace.deleting_at.is_(None))
+                .first()
             )
 
             if not workspace:
@@ -5,14 +5,19 @@ summary of the OpenBacklog strategic foundation rendered as markdown.
 
 The tool fetches all strategic entities (vision, pillars, outcomes,
 themes, heroes, villains) and renders them using a Jinja2 template,
-providing complete strategic context in a single request.
+providing complete strategic context in a single request. The collected
+entities are kept up to date as the workspace's strategic context
+projection, so a request usually reads one precomputed row.
 """
 
 import logging
+import uuid
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
 from jinja2 import Environment, FileSystemLoader
+from sqlalchemy.orm import Session
 
 from src.db import SessionLocal
 from src.mcp_server.main import mcp
@@ -23,6 +28,7 @@ from src.mcp_server.prompt_driven_tools.utils import (
     serialize_pillar,
     serialize_theme,
     serialize_villain,
+    serialize_vision,
 )
 from src.narrative.aggregates.villain import Villain
 from src.narrative.services.hero_service import HeroService
@@ -34,6 +40,10 @@ from src.roadmap_intelligence.services.prioritization_service import (
 from src.strategic_planning import ProductOutcome, RoadmapTheme
 from src.strategic_planning import controller as strategic_controller
 from src.strategic_planning.services.event_publisher import EventPublisher
+from src.strategic_planning.services.projections import (
+    STRATEGIC_CONTEXT_PROJECTION,
+    get_workspace_projection,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -90,6 +100,66 @@ def _adapt_villain_for_template(villain: Villain) -> Dict[str, Any]:
     return data
 
 
+def build_strategic_context(
+    workspace_id: uuid.UUID, session: Session
+) -> Dict[str, Any]:
+    """Collect the template context of the strategic context summary.
+
+    The result is JSON-serializable, so it can be stored as the workspace's
+    strategic context projection.
+
+    Args:
+        workspace_id: UUID of the workspace
+        session: Database session
+
+    Returns:
+        Dict with vision (or None), pillars, outcomes, themes, heroes and villains
+    """
+    vision = strategic_controller.get_workspace_vision(workspace_id, session)
+    pillars = strategic_controller.get_strategic_pillars(workspace_id, session)
+    outcomes = strategic_controller.get_product_outcomes(workspace_id, session)
+    themes = roadmap_controller.get_roadmap_themes(workspace_id, session)
+
+    publisher = EventPublisher(session)
+    hero_service = HeroService(session, publisher)
+    villain_service = VillainService(session, publisher)
+
+    heroes = hero_service.get_heroes_for_workspace(workspace_id)
+    villains = villain_service.get_villains_for_workspace(workspace_id)
+
+    prioritization_service = PrioritizationService(session, publisher)
+    prioritized_roadmap = prioritization_service.get_prioritized_roadmap(workspace_id)
+    prioritized_theme_ids = (
+        [str(tid) for tid in prioritized_roadmap.get_prioritized_themes()]
+        if prioritized_roadmap
+        else []
+    )
+
+    return {
+        "vision": serialize_vision(vision) if vision else None,
+        "pillars": [serialize_pillar(p, include_connections=False) for p in pillars],
+        "outcomes": [_adapt_outcome_for_template(o) for o in outcomes],
+        "themes": [_adapt_theme_for_template(t, prioritized_theme_ids) for t in themes],
+        "heroes": [serialize_hero(h, include_connections=False) for h in heroes],
+        "villains": [_adapt_villain_for_template(v) for v in villains],
+    }
+
+
+def render_strategic_context(context: Dict[str, Any]) -> str:
+    """Render a context from build_strategic_context as markdown."""
+    vision = context["vision"]
+    if vision and vision.get("created_at"):
+        vision = {**vision, "created_at": datetime.fromisoformat(vision["created_at"])}
+
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        autoescape=False,
+    )
+    template = env.get_template("prompts/strategic_context_summary.jinja")
+
+    return template.render(**{**context, "vision": vision})
+
+
 async def _get_strategic_context_summary_impl() -> str:
     """Implementation of get_strategic_context_summary - separated from decorator for reuse."""
     session = SessionLocal()
@@ -97,56 +167,13 @@ async def _get_strategic_context_summary_impl() -> str:
         workspace_uuid = get_workspace_id_from_request()
         logger.info(f"Getting strategic context summary for workspace {workspace_uuid}")
 
-        vision = strategic_controller.get_workspace_vision(workspace_uuid, session)
-        pillars = strategic_controller.get_strategic_pillars(workspace_uuid, session)
-        outcomes = strategic_controller.get_product_outcomes(workspace_uuid, session)
-        themes = roadmap_controller.get_roadmap_themes(workspace_uuid, session)
-
-        publisher = EventPublisher(session)
-        hero_service = HeroService(session, publisher)
-        villain_service = VillainService(session, publisher)
-
-        heroes = hero_service.get_heroes_for_workspace(workspace_uuid)
-        villains = villain_service.get_villains_for_workspace(workspace_uuid)
-
-        prioritization_service = PrioritizationService(session, publisher)
-        prioritized_roadmap = prioritization_service.get_prioritized_roadmap(
-            workspace_uuid
-        )
-        prioritized_theme_ids = (
-            [str(tid) for tid in prioritized_roadmap.get_prioritized_themes()]
-            if prioritized_roadmap
-            else []
-        )
-
-        serialized_pillars = [
-            serialize_pillar(p, include_connections=False) for p in pillars
-        ]
-        serialized_outcomes = [_adapt_outcome_for_template(o) for o in outcomes]
-        serialized_themes = [
-            _adapt_theme_for_template(t, prioritized_theme_ids) for t in themes
-        ]
-        serialized_heroes = [
-            serialize_hero(h, include_connections=False) for h in heroes
-        ]
-        serialized_villains = [_adapt_villain_for_template(v) for v in villains]
-
-        env = Environment(
-            loader=FileSystemLoader(TEMPLATES_DIR),
-            autoescape=False,
-        )
-        template = env.get_template("prompts/strategic_context_summary.jinja")
-
-        rendered = template.render(
-            vision=vision,
-            pillars=serialized_pillars,
-            outcomes=serialized_outcomes,
-            themes=serialized_themes,
-            heroes=serialized_heroes,
-            villains=serialized_villains,
+        context = get_workspace_projection(
+            session, STRATEGIC_CONTEXT_PROJECTION, workspace_uuid
         )
+        if context is None:
+            context = build_strategic_context(workspace_uuid, session)
 
-        return rendered
+        return render_strategic_context(context)
 
     except ValueError as e:
         logger.error(f"Validation error: {e}")
@@ -26,10 +26,14 @@ logger = logging.getLogger(__name__)
 
 
 class TaskChecklistItem(BaseModel):
-    """Pydantic model for checklist items when creating a task."""
+    """Pydantic model for checklist items when creating or updating a task.
+
+    ``id`` (as returned by get_task) keeps an existing item when updating.
+    """
 
     title: str
     is_complete: bool = False
+    id: Optional[str] = None
 
 
 def _generate_task_context(
@@ -478,7 +482,10 @@ async def _submit_task_impl(
             if checklist is not None:
                 items_data = [
                     ChecklistItemData(
-                        title=item.title, is_complete=item.is_complete, order=idx
+                        title=item.title,
+                        is_complete=item.is_complete,
+                        order=idx,
+                        id=uuid.UUID(item.id) if item.id else None,
                     )
                     for idx, item in enumerate(checklist)
                 ]
@@ -636,7 +643,8 @@ async def submit_task(
         description: Task description (optional)
         status: Task status (TO_DO, IN_PROGRESS, BLOCKED, DONE, ARCHIVED) (optional)
         task_type: Task type (CODING, TESTING, DOCUMENTATION, DESIGN) (optional)
-        checklist: List of checklist items (replaces entire checklist if provided) (optional)
+        checklist: List of checklist items (replaces entire checklist if provided;
+            include item ids from get_task to keep existing items) (optional)
 
     Returns:
         Success response with created or updated task
@@ -650,3 +658,152 @@ async def submit_task(
         task_type,
         checklist,
     )
+
+
+async def _move_tasks_to_status_impl(
+    status: str,
+    task_identifiers: Optional[List[str]] = None,
+    initiative_identifier: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Implementation of move_tasks_to_status - separated from decorator for reuse."""
+    logger.info(
+        f"Moving tasks to {status}: identifiers={task_identifiers}, initiative={initiative_identifier}"
+    )
+    session: Session = SessionLocal()
+    try:
+        user_id_str, workspace_id_str = get_auth_context(
+            session, requires_workspace=True
+        )
+        if workspace_id_str is None:
+            raise MCPContextError(
+                "Workspace not found.",
+                error_type="workspace_error",
+            )
+        user_id = uuid.UUID(user_id_str)
+        workspace_id = uuid.UUID(workspace_id_str)
+
+        try:
+            task_status = TaskStatus(status)
+        except ValueError:
+            valid_statuses = [s.value for s in TaskStatus]
+            return {
+                "status": "error",
+                "type": "task",
+                "error_message": f"Invalid status '{status}'. Valid: {valid_statuses}",
+                "error_type": "validation_error",
+            }
+
+        if not task_identifiers and not initiative_identifier:
+            return {
+                "status": "error",
+                "type": "task",
+                "error_message": "Provide task_identifiers or initiative_identifier",
+                "error_type": "validation_error",
+            }
+
+        # Resolve all identifiers with one query
+        query = session.query(Task.id, Task.identifier).filter(
+            Task.workspace_id == workspace_id, Task.user_id == user_id
+        )
+        if initiative_identifier:
+            initiative_id = resolve_initiative_identifier(
+                initiative_identifier, workspace_id, session
+            )
+            query = query.filter(Task.initiative_id == initiative_id)
+        if task_identifiers:
+            query = query.filter(Task.identifier.in_(task_identifiers))
+        task_ids_by_identifier = {
+            identifier: task_id for task_id, identifier in query.all()
+        }
+
+        missing = [
+            identifier
+            for identifier in task_identifiers or []
+            if identifier not in task_ids_by_identifier
+        ]
+        if missing:
+            return {
+                "status": "error",
+                "type": "task",
+                "error_message": f"Tasks not found: {', '.join(missing)}",
+                "error_type": "not_found",
+            }
+
+        task_ids = [
+            task_ids_by_identifier[identifier]
+            for identifier in task_identifiers or task_ids_by_identifier
+        ]
+        tasks = (
+            TaskController(session).move_tasks_to_status(
+                task_ids=task_ids, user_id=user_id, new_status=task_status
+            )
+            if task_ids
+            else []
+        )
+
+        return {
+            "status": "success",
+            "type": "task",
+            "message": f"Moved {len(tasks)} task(s) to {task_status.value}",
+            "data": {"tasks": [_task_to_dict(task) for task in tasks]},
+        }
+
+    except MCPContextError as e:
+        logger.warning(f"Authorization error in move_tasks_to_status: {str(e)}")
+        return {
+            "status": "error",
+            "type": "task",
+            "error_message": str(e),
+            "error_type": e.error_type,
+        }
+    except DomainException as e:
+        logger.warning(f"Domain error in move_tasks_to_status: {str(e)}")
+        return {
+            "status": "error",
+            "type": "task",
+            "error_message": str(e),
+            "error_type": "not_found",
+        }
+    except TaskControllerError as e:
+        logger.exception(f"Controller error in move_tasks_to_status: {str(e)}")
+        return {
+            "status": "error",
+            "type": "task",
+            "error_message": str(e),
+            "error_type": "controller_error",
+        }
+    except Exception as e:
+        logger.exception(f"Error in move_tasks_to_status MCP tool: {str(e)}")
+        return {
+            "status": "error",
+            "type": "task",
+            "error_message": f"Server error: {str(e)}",
+            "error_type": "server_error",
+        }
+    finally:
+        session.close()
+
+
+@mcp.tool()
+async def move_tasks_to_status(
+    status: str,
+    task_identifiers: Optional[List[str]] = None,
+    initiative_identifier: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Move many tasks to a status in one operation.
+
+    Use this instead of one submit_task call per task, e.g. to mark a set of
+    tasks DONE or to archive the tasks of a finished initiative.
+
+    Args:
+        status: Target status (TO_DO, IN_PROGRESS, BLOCKED, DONE, ARCHIVED)
+        task_identifiers: Task identifiers (e.g., ["TM-001", "TM-002"]) (optional)
+        initiative_identifier: Move the tasks of this initiative; combined with
+            task_identifiers, those tasks must belong to it (optional)
+
+    Returns:
+        Success response with the moved tasks
+    """
+    return await _move_tasks_to_status_impl(
+        status, task_identifiers, initiative_identifier
+    )
@@ -34,7 +34,9 @@ async def create_workspace(name: str, description: str = "") -> Dict[str, Any]:
         user = session.query(User).filter(User.id == user_id).first()
 
         existing_workspace = (
-            session.query(Workspace).filter(Workspace.user_id == user_id).first()
+            session.query(Workspace)
+            .filter(Workspace.user_id == user_id, Workspace.deleting_at.is_(None))
+            .first()
         )
         if existing_workspace:
             return {
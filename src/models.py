@@ -30,9 +30,10 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.mutable import MutableDict
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from src.db import Base
+from src.services.identifier_service import assign_identifiers_in_bulk
 
 # Forward declaration for type hints
 if TYPE_CHECKING:
@@ -152,6 +153,8 @@ class User(PrivateBase, Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Set when the account is deleted; it is purged in the background
+    deleting_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Custom fields
     name: Mapped[str] = mapped_column(String, nullable=True)
@@ -173,6 +176,7 @@ class User(PrivateBase, Base):
     workspaces: Mapped[List["Workspace"]] = relationship(
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     account_details: Mapped["UserAccountDetails"] = relationship(
         back_populates="user",
@@ -331,68 +335,80 @@ class Workspace(PublicBase, Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.now, server_default=text("now()")
     )
+    # Set when the workspace is deleted; its rows are purged in the background
+    deleting_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
     tasks: Mapped[List["Task"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True
     )
     initiatives: Mapped[List["Initiative"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True
     )
     field_definitions: Mapped[List["FieldDefinition"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True
     )
     vision: Mapped["ProductVision"] = relationship(
         "ProductVision",
         back_populates="workspace",
         uselist=False,
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     strategic_pillars: Mapped[List["StrategicPillar"]] = relationship(
         "StrategicPillar",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     product_outcomes: Mapped[List["ProductOutcome"]] = relationship(
         "ProductOutcome",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     roadmap_themes: Mapped[List["RoadmapTheme"]] = relationship(
         "RoadmapTheme",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     prioritized_roadmap: Mapped["PrioritizedRoadmap"] = relationship(
         "PrioritizedRoadmap",
         back_populates="workspace",
         uselist=False,
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     strategic_initiatives: Mapped[List["StrategicInitiative"]] = relationship(
         "StrategicInitiative",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     heroes: Mapped[List["Hero"]] = relationship(
         "Hero",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     villains: Mapped[List["Villain"]] = relationship(
         "Villain",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     conflicts: Mapped[List["Conflict"]] = relationship(
         "Conflict",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     turning_points: Mapped[List["TurningPoint"]] = relationship(
         "TurningPoint",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def dict(self) -> Dict[str, Union[str, datetime]]:
@@ -452,6 +468,10 @@ def create_workspace_dependencies(mapper, connection, target):
     )
 
 
+# Rows of one owner inserted by the same flush share one counter update
+event.listen(Session, "before_flush", assign_identifiers_in_bulk)
+
+
 class DoableBase:
     __abstract__ = True
 
@@ -501,7 +521,7 @@ class Task(DoableBase, PublicBase, Base):
 
     type: Mapped[str] = mapped_column(String, nullable=True)
     initiative_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        ForeignKey("dev.initiative.id"), nullable=False
+        ForeignKey("dev.initiative.id"), nullable=False, index=True
     )
     initiative: Mapped[Optional["Initiative"]] = relationship(back_populates="tasks")
     workspace: Mapped["Workspace"] = relationship(back_populates="tasks")
@@ -707,7 +727,7 @@ class ChecklistItem(PublicBase, Base):
     order: Mapped[Integer] = mapped_column(Integer, default=0, server_default=text("0"))
 
     task_id: Mapped[Optional[UUID_ID]] = mapped_column(
-        ForeignKey("dev.task.id"), nullable=False
+        ForeignKey("dev.task.id"), nullable=False, index=True
     )
 
     def __eq__(self, value: object) -> bool:
@@ -750,6 +770,15 @@ class GitHubInstallation(PrivateBase, Base):
     )
     workspace: Mapped[Optional["Workspace"]] = relationship("Workspace")
 
+    # Repository listing shown on the account and repositories pages, kept
+    # fresh by installation webhooks (see src.github_app.repository_cache)
+    repositories_cache: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(
+        JSONB, nullable=True
+    )
+    repositories_cached_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )
+
     # Relationship to repository file indexes
     repository_file_indexes: Mapped[List["RepositoryFileIndex"]] = relationship(
         "RepositoryFileIndex",
@@ -817,14 +846,14 @@ class FieldDefinition(PublicBase, Base):
     user: Mapped[Optional["User"]] = relationship("User")
 
     initiative_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        ForeignKey("dev.initiative.id"), nullable=True
+        ForeignKey("dev.initiative.id"), nullable=True, index=True
     )
     initiative: Mapped[Optional["Initiative"]] = relationship(
         back_populates="field_definitions"
     )
 
     task_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        ForeignKey("dev.task.id"), nullable=True
+        ForeignKey("dev.task.id"), nullable=True, index=True
     )
     task: Mapped[Optional["Task"]] = relationship(back_populates="field_definitions")
 
@@ -899,7 +928,7 @@ class Group(PublicBase, Base):
         MutableDict.as_mutable(JSONB()), nullable=True
     )
     parent_group_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        ForeignKey("dev.group.id", ondelete="cascade"), nullable=True
+        ForeignKey("dev.group.id", ondelete="cascade"), nullable=True, index=True
     )
 
     # Relationships
@@ -929,7 +958,7 @@ class InitiativeGroup(PublicBase, Base):
         ForeignKey("dev.initiative.id", ondelete="cascade"), nullable=False
     )
     group_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("dev.group.id", ondelete="cascade"), nullable=False
+        ForeignKey("dev.group.id", ondelete="cascade"), nullable=False, index=True
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -1016,7 +1045,10 @@ class Ordering(Base):
 
 # Import related models to ensure they're in the SQLAlchemy registry
 # This must be done after the main models are defined to avoid circular imports
-from src.github_app.models import RepositoryFileIndex  # noqa: E402
+from src.github_app.models import (  # noqa: E402
+    GitHubWebhookDelivery,
+    RepositoryFileIndex,
+)
 
 # Import junction table models to ensure they're registered with SQLAlchemy
 from src.initiative_management.models import (
@@ -44,7 +44,7 @@ class TurningPoint(Base):
         identifier: Human-readable identifier (e.g., "TP-2003")
         user_id: Foreign key to user (for RLS)
         workspace_id: Foreign key to workspace
-        domain_event_id: Foreign key to domain event (one-to-one, unique)
+        domain_event_id: ID of the source domain event (unique; None once expired)
         narrative_description: Human-readable "what happened" summary
         significance: Significance level (enum)
         conflict_id: Optional foreign key to conflict
@@ -97,10 +97,11 @@ class TurningPoint(Base):
         nullable=False,
     )
 
-    domain_event_id: Mapped[uuid.UUID] = mapped_column(
+    # No foreign key: domain_events is partitioned, so its id alone is not
+    # unique-indexed; cleared when the event's month is dropped by retention
+    domain_event_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("dev.domain_events.id", ondelete="CASCADE"),
-        nullable=False,
+        nullable=True,
         unique=True,
     )
 
@@ -138,8 +139,10 @@ class TurningPoint(Base):
         back_populates="turning_points",
     )
 
-    domain_event: Mapped["DomainEvent"] = relationship(
+    domain_event: Mapped["DomainEvent | None"] = relationship(
         "DomainEvent",
+        primaryjoin="foreign(TurningPoint.domain_event_id) == DomainEvent.id",
+        viewonly=True,
     )
 
     conflict: Mapped["Conflict | None"] = relationship(
@@ -1,20 +1,101 @@
 """Narrator service for narrative domain.
 
 This service generates narrative recaps and "Previously on..." summaries.
+
+Recaps are cached per workspace and dropped when a domain event for that
+workspace commits, so repeated recaps between narrative changes cost no
+queries at all. Only events committed by this process invalidate them, so
+recaps also expire after ``settings.previously_on_cache_ttl_seconds`` to
+bound staleness from other workers.
 """
 
+import copy
+import threading
+import time
 import uuid
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import exists, func, select
 from sqlalchemy.orm import Session
 
+from src.config import settings
 from src.narrative.aggregates.conflict import Conflict, ConflictStatus
 from src.narrative.aggregates.hero import Hero
 from src.narrative.aggregates.turning_point import TurningPoint
 from src.narrative.aggregates.villain import Villain
+from src.narrative.models import TurningPointInitiative, TurningPointStoryArc
 from src.narrative.services.conflict_service import ConflictService
 from src.narrative.services.hero_service import HeroService
-from src.strategic_planning.services.event_publisher import EventPublisher
+from src.strategic_planning.services.event_publisher import (
+    EventPublisher,
+    has_uncommitted_events,
+    on_events_committed,
+)
+
+
+class PreviouslyOnCache:
+    """Thread-safe LRU of recaps keyed by workspace id.
+
+    Entries expire after ``ttl_seconds``. Each workspace has a generation
+    counter that invalidation bumps. A recap is only stored if no
+    invalidation happened while it was being built, so an event committing
+    mid-build cannot leave a stale recap behind.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def get(self, workspace_id: str) -> Tuple[Optional[Dict], Tuple[int, int]]:
+        """Return the cached recap (or None) and the generation to store with."""
+        with self._lock:
+            generation = (self._epoch, self._generations.get(workspace_id, 0))
+            entry = self._entries.get(workspace_id)
+            if entry is None:
+                return None, generation
+            stored_at, recap = entry
+            if time.monotonic() - stored_at > self._ttl_seconds:
+                del self._entries[workspace_id]
+                return None, generation
+            self._entries.move_to_end(workspace_id)
+            return recap, generation
+
+    def put(self, workspace_id: str, generation: Tuple[int, int], recap: Dict) -> None:
+        with self._lock:
+            current = (self._epoch, self._generations.get(workspace_id, 0))
+            if current != generation:
+                return
+            self._entries[workspace_id] = (time.monotonic(), recap)
+            self._entries.move_to_end(workspace_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, workspace_id: Optional[str]) -> None:
+        """Drop one workspace's recap, or every recap when it is None."""
+        with self._lock:
+            if workspace_id is None:
+                self._epoch += 1
+                self._entries.clear()
+                return
+            self._generations[workspace_id] = self._generations.get(workspace_id, 0) + 1
+            self._entries.pop(workspace_id, None)
+
+    def clear(self) -> None:
+        self.invalidate(None)
+
+
+previously_on_cache = PreviouslyOnCache(
+    ttl_seconds=settings.previously_on_cache_ttl_seconds
+)
+
+# Any committed domain event may change the recap (turning points and story
+# arcs are derived from non-narrative events too), so all of them invalidate
+on_events_committed(previously_on_cache.invalidate)
 
 
 class NarratorService:
@@ -33,8 +114,6 @@ class NarratorService:
         Args:
             session: SQLAlchemy database session
         """
-        from src.strategic_planning.services.event_publisher import EventPublisher
-
         self.session = session
         publisher = EventPublisher(session)
         self.hero_service = HeroService(session, publisher)
@@ -76,6 +155,13 @@ class NarratorService:
         This is the key service method that enables narrative-aware development.
         It generates a story-style summary of recent progress.
 
+        The recap is served from a per-workspace cache until the next domain
+        event for the workspace commits, or until the entry expires.
+
+        A cache miss costs a constant five queries (heroes, villains, open
+        conflicts, turning points, story arcs), however many conflicts or arcs
+        exist.
+
         Args:
             workspace_id: UUID of the workspace
 
@@ -92,55 +178,109 @@ class NarratorService:
             >>> recap = service.generate_previously_on(workspace.id)
             >>> print(recap["recap_text"])
         """
-        from sqlalchemy.orm import selectinload
+        cache_key = str(workspace_id)
+        # Events published in this session but not committed yet are not
+        # visible to other sessions, so neither read nor fill the cache
+        use_cache = not has_uncommitted_events(self.session, cache_key)
 
-        from src.roadmap_intelligence.aggregates.roadmap_theme import RoadmapTheme
+        if use_cache:
+            cached, generation = previously_on_cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
 
-        primary_hero = self.hero_service.get_primary_hero(workspace_id)
-        open_conflicts = self.conflict_service.get_open_conflicts(workspace_id)
+        recap = self._build_previously_on(workspace_id)
 
-        recent_turning_points = (
-            self.session.query(TurningPoint)
-            .filter_by(workspace_id=workspace_id)
-            .options(
-                selectinload(TurningPoint.conflict),
-                selectinload(TurningPoint.story_arcs),
-                selectinload(TurningPoint.initiatives),
-            )
-            .order_by(TurningPoint.created_at.desc())
-            .limit(5)
-            .all()
-        )
+        if use_cache:
+            previously_on_cache.put(cache_key, generation, copy.deepcopy(recap))
+        return recap
 
+    def _build_previously_on(self, workspace_id: uuid.UUID) -> Dict:
+        from src.roadmap_intelligence.aggregates.roadmap_theme import RoadmapTheme
         from src.roadmap_intelligence.models import (
             RoadmapThemeHero,
             RoadmapThemeVillain,
         )
 
-        active_arcs = (
-            self.session.query(RoadmapTheme)
+        # Heroes and villains are loaded once; conflicts and arcs refer to
+        # them by id instead of lazy-loading each one
+        heroes = (
+            self.session.query(Hero)
             .filter_by(workspace_id=workspace_id)
-            .options(
-                selectinload(RoadmapTheme.heroes),
-                selectinload(RoadmapTheme.villains),
-            )
-            .outerjoin(
-                RoadmapThemeHero, RoadmapTheme.id == RoadmapThemeHero.roadmap_theme_id
-            )
-            .outerjoin(
-                RoadmapThemeVillain,
-                RoadmapTheme.id == RoadmapThemeVillain.roadmap_theme_id,
-            )
-            .group_by(RoadmapTheme.id)
-            .having(
-                (RoadmapThemeHero.roadmap_theme_id.isnot(None))
-                | (RoadmapThemeVillain.roadmap_theme_id.isnot(None))
-            )
-            .order_by(RoadmapTheme.created_at.desc())
+            .order_by(Hero.created_at)
+            .all()
+        )
+        villains = (
+            self.session.query(Villain)
+            .filter_by(workspace_id=workspace_id)
+            .order_by(Villain.created_at)
+            .all()
+        )
+        heroes_by_id = {hero.id: hero for hero in heroes}
+        villains_by_id = {villain.id: villain for villain in villains}
+        primary_hero = next((hero for hero in heroes if hero.is_primary), None)
+
+        open_conflicts = (
+            self.session.query(Conflict)
+            .filter_by(workspace_id=workspace_id, status=ConflictStatus.OPEN.value)
+            .order_by(Conflict.created_at.desc())
+            .all()
+        )
+
+        story_arc_ids = (
+            select(func.array_agg(TurningPointStoryArc.story_arc_id))
+            .where(TurningPointStoryArc.turning_point_id == TurningPoint.id)
+            .scalar_subquery()
+        )
+        initiative_ids = (
+            select(func.array_agg(TurningPointInitiative.initiative_id))
+            .where(TurningPointInitiative.turning_point_id == TurningPoint.id)
+            .scalar_subquery()
+        )
+        recent_turning_points = (
+            self.session.query(TurningPoint, story_arc_ids, initiative_ids)
+            .filter(TurningPoint.workspace_id == workspace_id)
+            .order_by(TurningPoint.created_at.desc())
             .limit(5)
             .all()
         )
 
+        arc_hero_ids = (
+            select(
+                func.array_agg(
+                    RoadmapThemeHero.hero_id,
+                    order_by=RoadmapThemeHero.created_at,
+                )
+            )
+            .where(RoadmapThemeHero.roadmap_theme_id == RoadmapTheme.id)
+            .scalar_subquery()
+        )
+        arc_villain_ids = (
+            select(
+                func.array_agg(
+                    RoadmapThemeVillain.villain_id,
+                    order_by=RoadmapThemeVillain.created_at,
+                )
+            )
+            .where(RoadmapThemeVillain.roadmap_theme_id == RoadmapTheme.id)
+            .scalar_subquery()
+        )
+        active_arcs = [
+            (arc, arc_heroes or [], arc_villains or [])
+            for arc, arc_heroes, arc_villains in (
+                self.session.query(RoadmapTheme, arc_hero_ids, arc_villain_ids)
+                .filter(
+                    RoadmapTheme.workspace_id == workspace_id,
+                    exists().where(RoadmapThemeHero.roadmap_theme_id == RoadmapTheme.id)
+                    | exists().where(
+                        RoadmapThemeVillain.roadmap_theme_id == RoadmapTheme.id
+                    ),
+                )
+                .order_by(RoadmapTheme.created_at.desc())
+                .limit(5)
+                .all()
+            )
+        ]
+
         recap_parts = []
         recap_parts.append("Previously on Your Project...\n")
 
@@ -153,13 +293,13 @@ class NarratorService:
 
         if active_arcs:
             recap_parts.append(f"\nActive Story Arcs: {len(active_arcs)}")
-            for arc in active_arcs:
+            for arc, arc_heroes, arc_villains in active_arcs:
                 arc_info = f"  • {arc.name}"
-                if arc.heroes:
-                    hero_names = [h.name for h in arc.heroes]
+                hero_names = _names(arc_heroes, heroes_by_id)
+                if hero_names:
                     arc_info += f" (helps {', '.join(hero_names)})"
-                if arc.villains:
-                    villain_names = [v.name for v in arc.villains]
+                villain_names = _names(arc_villains, villains_by_id)
+                if villain_names:
                     arc_info += f" (fights {', '.join(villain_names)})"
                 recap_parts.append(arc_info)
         else:
@@ -167,7 +307,7 @@ class NarratorService:
 
         if recent_turning_points:
             recap_parts.append(f"\nRecent Turning Points: {len(recent_turning_points)}")
-            for tp in recent_turning_points[:3]:
+            for tp, _, _ in recent_turning_points[:3]:
                 recap_parts.append(f"  • {tp.narrative_description[:150]}...")
         else:
             recap_parts.append("\nNo turning points yet.")
@@ -175,7 +315,6 @@ class NarratorService:
         if open_conflicts:
             recap_parts.append(f"\nOpen Conflicts: {len(open_conflicts)}")
             for conflict in open_conflicts[:3]:
-                hero = self.session.query(Hero).filter_by(id=conflict.hero_id).first()
                 recap_parts.append(
                     f"  • {conflict.description[:100]}..."
                     if conflict.description
@@ -203,10 +342,10 @@ class NarratorService:
                 {
                     "id": str(arc.id),
                     "name": arc.name,
-                    "hero_ids": [str(h.id) for h in arc.heroes],
-                    "villain_ids": [str(v.id) for v in arc.villains],
+                    "hero_ids": [str(hero_id) for hero_id in arc_heroes],
+                    "villain_ids": [str(villain_id) for villain_id in arc_villains],
                 }
-                for arc in active_arcs
+                for arc, arc_heroes, arc_villains in active_arcs
             ],
             "recent_turning_points": [
                 {
@@ -215,11 +354,13 @@ class NarratorService:
                     "narrative_description": tp.narrative_description,
                     "significance": tp.significance,
                     "conflict_id": str(tp.conflict_id) if tp.conflict_id else None,
-                    "story_arc_ids": [str(arc.id) for arc in tp.story_arcs],
-                    "initiative_ids": [str(init.id) for init in tp.initiatives],
+                    "story_arc_ids": [str(arc_id) for arc_id in tp_arc_ids or []],
+                    "initiative_ids": [
+                        str(initiative_id) for initiative_id in tp_initiative_ids or []
+                    ],
                     "created_at": tp.created_at.isoformat(),
                 }
-                for tp in recent_turning_points
+                for tp, tp_arc_ids, tp_initiative_ids in recent_turning_points
             ],
             "open_conflicts": [
                 {
@@ -234,3 +375,7 @@ class NarratorService:
             ],
             "suggested_next_tasks": [],
         }
+
+
+def _names(ids: List[uuid.UUID], entities_by_id: Dict[uuid.UUID, Any]) -> List[str]:
+    return [entities_by_id[id_].name for id_ in ids if id_ in entities_by_id]
@@ -1,13 +1,17 @@
 """Controller for Roadmap Intelligence context."""
 
 import uuid
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session, selectinload
 
 from src.roadmap_intelligence.aggregates.roadmap_theme import RoadmapTheme
 from src.strategic_planning.models import DomainEvent
 from src.strategic_planning.services.event_publisher import EventPublisher
+from src.strategic_planning.services.projections import (
+    ROADMAP_SUMMARY_PROJECTION,
+    get_workspace_projection,
+)
 
 
 def get_roadmap_themes(workspace_id: uuid.UUID, session: Session) -> List[RoadmapTheme]:
@@ -369,3 +373,59 @@ def get_unprioritized_themes(
     publisher = EventPublisher(session)
     service = PrioritizationService(session, publisher)
     return service.get_unprioritized_themes(workspace_id)
+
+
+def build_roadmap_summary(workspace_id: uuid.UUID, session: Session) -> Dict[str, Any]:
+    """Compute the roadmap summary of a workspace from the theme tables.
+
+    Args:
+        workspace_id: UUID of the workspace
+        session: Database session
+
+    Returns:
+        JSON-serializable dict with prioritized themes (in priority order)
+        and unprioritized themes
+    """
+    return {
+        "prioritized_themes": [
+            _summarize_theme(theme)
+            for theme in get_prioritized_themes(workspace_id, session)
+        ],
+        "unprioritized_themes": [
+            _summarize_theme(theme)
+            for theme in get_unprioritized_themes(workspace_id, session)
+        ],
+    }
+
+
+def get_roadmap_summary(workspace_id: uuid.UUID, session: Session) -> Dict[str, Any]:
+    """Get the roadmap summary, from its projection when that is up to date.
+
+    Args:
+        workspace_id: UUID of the workspace
+        session: Database session
+
+    Returns:
+        Dict as returned by build_roadmap_summary
+    """
+    summary = get_workspace_projection(
+        session, ROADMAP_SUMMARY_PROJECTION, workspace_id
+    )
+    if summary is None:
+        summary = build_roadmap_summary(workspace_id, session)
+    return summary
+
+
+def _summarize_theme(theme: RoadmapTheme) -> Dict[str, Any]:
+    return {
+        "id": str(theme.id),
+        "identifier": theme.identifier,
+        "workspace_id": str(theme.workspace_id),
+        "name": theme.name,
+        "description": theme.description,
+        "outcome_ids": [str(outcome.id) for outcome in theme.outcomes],
+        "hero_ids": [str(hero.id) for hero in theme.heroes],
+        "villain_ids": [str(villain.id) for villain in theme.villains],
+        "created_at": theme.created_at.isoformat(),
+        "updated_at": theme.updated_at.isoformat(),
+    }
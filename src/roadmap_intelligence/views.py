@@ -388,6 +388,37 @@ async def get_unprioritized_themes(
         )
 
 
+class RoadmapSummaryResponse(BaseModel):
+    """Response model for a workspace's roadmap summary."""
+
+    prioritized_themes: List[ThemeResponse]
+    unprioritized_themes: List[ThemeResponse]
+
+
+@app.get(
+    "/api/workspaces/{workspace_id}/roadmap/summary",
+    response_model=RoadmapSummaryResponse,
+    tags=["product-strategy"],
+)
+async def get_roadmap_summary(
+    workspace_id: uuid.UUID,
+    user: User = Depends(dependency_to_override),
+    session: Session = Depends(get_db),
+) -> RoadmapSummaryResponse:
+    """Get prioritized and unprioritized themes in one request.
+
+    Served from the workspace's roadmap summary projection when it is up to
+    date.
+    """
+    try:
+        return RoadmapSummaryResponse(
+            **controller.get_roadmap_summary(workspace_id, session)
+        )
+    except Exception as e:
+        logger.error(f"Error getting roadmap summary: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get roadmap summary")
+
+
 class ThemePrioritizeRequest(BaseModel):
     """Request model for prioritizing a theme."""
 
@@ -0,0 +1,344 @@
+"""
+Dependency graph of a workspace's initiatives over ``blocked_by``.
+
+Each initiative has at most one direct blocker (``Initiative.blocked_by_id``),
+so the graph is a forest of blocking chains, possibly with cycles.
+``load_dependency_graph`` reads every initiative of a workspace together with
+its transitive blockers in one recursive CTE. The topological order, cycles
+and critical path are then computed in memory.
+
+Graphs are cached per workspace. A cached graph is dropped when a session
+commits changes to one of the workspace's initiatives, or domain events for
+the workspace. It also expires after
+``settings.dependency_graph_cache_ttl_seconds``, which bounds staleness from
+writes this process does not see (other workers, PostgREST).
+
+``get_unblocked_initiatives`` answers "what can start now" with a single
+indexed query and does not need the graph.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event, or_, select, text
+from sqlalchemy.orm import Session, aliased
+
+from src.config import settings
+from src.models import Initiative, InitiativeStatus
+from src.strategic_planning.services.event_publisher import on_events_committed
+
+# Initiatives in these statuses no longer block anything
+RESOLVED_STATUSES = (InitiativeStatus.DONE, InitiativeStatus.ARCHIVED)
+
+_CHANGED_WORKSPACES_KEY = "dependency_graph_changed_workspaces"
+
+# Every initiative of the workspace, with its blockers nearest first. The
+# recursion follows blocked_by_id and stops once a chain revisits an
+# initiative, so cycles terminate (the revisited id is still returned).
+_GRAPH_QUERY = text(
+    """
+    WITH RECURSIVE nodes AS (
+        SELECT id, identifier, title, status, blocked_by_id
+        FROM dev.initiative
+        WHERE workspace_id = :workspace_id
+    ),
+    chains AS (
+        SELECT id AS initiative_id, blocked_by_id AS blocker_id, 1 AS depth,
+               ARRAY[id] AS path
+        FROM nodes
+        WHERE blocked_by_id IS NOT NULL
+        UNION ALL
+        SELECT c.initiative_id, n.blocked_by_id, c.depth + 1,
+               c.path || c.blocker_id
+        FROM chains c
+        JOIN nodes n ON n.id = c.blocker_id
+        WHERE n.blocked_by_id IS NOT NULL AND NOT c.blocker_id = ANY(c.path)
+    )
+    SELECT n.id, n.identifier, n.title, n.status, n.blocked_by_id,
+           COALESCE(
+               array_agg(c.blocker_id ORDER BY c.depth)
+                   FILTER (WHERE c.blocker_id IS NOT NULL),
+               '{}'
+           ) AS blockers
+    FROM nodes n
+    LEFT JOIN chains c ON c.initiative_id = n.id
+    GROUP BY n.id, n.identifier, n.title, n.status, n.blocked_by_id
+    ORDER BY n.identifier
+    """
+)
+
+
+@dataclass(frozen=True)
+class DependencyNode:
+    id: uuid.UUID
+    identifier: str
+    title: str
+    status: InitiativeStatus
+    blocked_by_id: Optional[uuid.UUID]
+    # Transitive blockers in the workspace, nearest first
+    blockers: Tuple[uuid.UUID, ...]
+    in_cycle: bool
+
+    @property
+    def is_resolved(self) -> bool:
+        return self.status in RESOLVED_STATUSES
+
+
+@dataclass
+class DependencyGraph:
+    """A workspace's initiatives and what blocks them."""
+
+    workspace_id: uuid.UUID
+    nodes: Dict[uuid.UUID, DependencyNode]
+    # Blockers before the initiatives they block; initiatives in or behind
+    # a cycle have no place in it and are left out
+    topological_order: List[uuid.UUID] = field(default_factory=list)
+    cycles: List[List[uuid.UUID]] = field(default_factory=list)
+    # Longest chain of unresolved initiatives, first blocker first
+    critical_path: List[uuid.UUID] = field(default_factory=list)
+
+    def open_blockers(self, initiative_id: uuid.UUID) -> List[DependencyNode]:
+        """Unresolved transitive blockers of an initiative, nearest first."""
+        return [
+            self.nodes[blocker_id]
+            for blocker_id in self.nodes[initiative_id].blockers
+            if not self.nodes[blocker_id].is_resolved
+        ]
+
+    def blocking(self, initiative_id: uuid.UUID) -> List[DependencyNode]:
+        """Initiatives that an initiative blocks, directly or transitively."""
+        return [
+            node
+            for node in self.nodes.values()
+            if initiative_id in node.blockers and node.id != initiative_id
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workspace_id": str(self.workspace_id),
+            "initiatives": [
+                {
+                    "id": str(node.id),
+                    "identifier": node.identifier,
+                    "title": node.title,
+                    "status": node.status.value,
+                    "blocked_by_id": (
+                        str(node.blocked_by_id) if node.blocked_by_id else None
+                    ),
+                    "blockers": [str(blocker_id) for blocker_id in node.blockers],
+                    "open_blockers": [
+                        str(blocker.id) for blocker in self.open_blockers(node.id)
+                    ],
+                    "in_cycle": node.in_cycle,
+                }
+                for node in self.nodes.values()
+            ],
+            "topological_order": [str(id) for id in self.topological_order],
+            "cycles": [[str(id) for id in cycle] for cycle in self.cycles],
+            "critical_path": [str(id) for id in self.critical_path],
+        }
+
+
+class DependencyGraphCache:
+    """Thread-safe LRU of dependency graphs keyed by workspace id.
+
+    Entries expire after ``ttl_seconds``. As in the previously-on cache, each
+    workspace has a generation counter that invalidation bumps, and a graph
+    is only stored if no invalidation happened while it was being loaded.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, DependencyGraph]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self, workspace_id: str
+    ) -> Tuple[Optional[DependencyGraph], Tuple[int, int]]:
+        """Return the cached graph (or None) and the generation to store with."""
+        with self._lock:
+            generation = (self._epoch, self._generations.get(workspace_id, 0))
+            entry = self._entries.get(workspace_id)
+            if entry is None:
+                return None, generation
+            stored_at, graph = entry
+            if time.monotonic() - stored_at > self._ttl_seconds:
+                del self._entries[workspace_id]
+                return None, generation
+            self._entries.move_to_end(workspace_id)
+            return graph, generation
+
+    def put(
+        self, workspace_id: str, generation: Tuple[int, int], graph: DependencyGraph
+    ) -> None:
+        with self._lock:
+            current = (self._epoch, self._generations.get(workspace_id, 0))
+            if current != generation:
+                return
+            self._entries[workspace_id] = (time.monotonic(), graph)
+            self._entries.move_to_end(workspace_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, workspace_id: Optional[str]) -> None:
+        """Drop one workspace's graph, or every graph when it is None."""
+        with self._lock:
+            if workspace_id is None:
+                self._epoch += 1
+                self._entries.clear()
+                return
+            self._generations[workspace_id] = self._generations.get(workspace_id, 0) + 1
+            self._entries.pop(workspace_id, None)
+
+    def clear(self) -> None:
+        self.invalidate(None)
+
+
+dependency_graph_cache = DependencyGraphCache(
+    ttl_seconds=settings.dependency_graph_cache_ttl_seconds
+)
+
+# Bulk status changes are Core updates that the flush hooks below do not see;
+# they publish domain events instead
+on_events_committed(dependency_graph_cache.invalidate)
+
+
+def get_dependency_graph(session: Session, workspace_id: uuid.UUID) -> DependencyGraph:
+    """Return the workspace's dependency graph, from the cache when possible."""
+    key = str(workspace_id)
+    graph, generation = dependency_graph_cache.get(key)
+    if graph is None:
+        graph = load_dependency_graph(session, workspace_id)
+        dependency_graph_cache.put(key, generation, graph)
+    return graph
+
+
+def load_dependency_graph(session: Session, workspace_id: uuid.UUID) -> DependencyGraph:
+    """Load the workspace's dependency graph with one query."""
+    rows = session.execute(_GRAPH_QUERY, {"workspace_id": workspace_id}).all()
+    known = {row.id for row in rows}
+
+    nodes: Dict[uuid.UUID, DependencyNode] = {}
+    for row in rows:
+        # Blockers outside the workspace are not part of its graph
+        blockers = [
+            blocker_id
+            for blocker_id in dict.fromkeys(row.blockers)
+            if blocker_id in known and blocker_id != row.id
+        ]
+        nodes[row.id] = DependencyNode(
+            id=row.id,
+            identifier=row.identifier,
+            title=row.title,
+            status=InitiativeStatus(row.status),
+            blocked_by_id=row.blocked_by_id if row.blocked_by_id in known else None,
+            blockers=tuple(blockers),
+            in_cycle=row.id in row.blockers,
+        )
+
+    graph = DependencyGraph(workspace_id=workspace_id, nodes=nodes)
+    graph.cycles = _find_cycles(nodes)
+    graph.topological_order = _topological_order(nodes)
+    graph.critical_path = _critical_path(nodes, graph.topological_order)
+    return graph
+
+
+def get_unblocked_initiatives(
+    session: Session, workspace_id: uuid.UUID
+) -> List[Initiative]:
+    """Unresolved initiatives with no unresolved direct blocker.
+
+    One query over the workspace_id index, joining blockers by primary key.
+    """
+    blocker = aliased(Initiative)
+    return list(
+        session.scalars(
+            select(Initiative)
+            .outerjoin(blocker, Initiative.blocked_by_id == blocker.id)
+            .where(
+                Initiative.workspace_id == workspace_id,
+                Initiative.status.not_in(RESOLVED_STATUSES),
+                or_(blocker.id.is_(None), blocker.status.in_(RESOLVED_STATUSES)),
+            )
+            .order_by(Initiative.identifier)
+        )
+    )
+
+
+def _find_cycles(nodes: Dict[uuid.UUID, DependencyNode]) -> List[List[uuid.UUID]]:
+    cycles: List[List[uuid.UUID]] = []
+    seen: Set[uuid.UUID] = set()
+    for node in nodes.values():
+        if not node.in_cycle or node.id in seen:
+            continue
+        cycle = [node.id]
+        current = nodes[node.id].blocked_by_id
+        while current is not None and current != node.id:
+            cycle.append(current)
+            current = nodes[current].blocked_by_id
+        seen.update(cycle)
+        cycles.append(cycle)
+    return cycles
+
+
+def _topological_order(nodes: Dict[uuid.UUID, DependencyNode]) -> List[uuid.UUID]:
+    blocked: Dict[uuid.UUID, List[uuid.UUID]] = defaultdict(list)
+    for node in nodes.values():
+        if node.blocked_by_id is not None:
+            blocked[node.blocked_by_id].append(node.id)
+
+    # Nodes are in identifier order, which keeps the result stable
+    order = [node.id for node in nodes.values() if node.blocked_by_id is None]
+    for initiative_id in order:
+        order.extend(blocked[initiative_id])
+    return order
+
+
+def _critical_path(
+    nodes: Dict[uuid.UUID, DependencyNode], order: List[uuid.UUID]
+) -> List[uuid.UUID]:
+    # Length of the unresolved chain ending at each unresolved initiative
+    lengths: Dict[uuid.UUID, int] = {}
+    for initiative_id in order:
+        node = nodes[initiative_id]
+        if node.is_resolved:
+            continue
+        lengths[initiative_id] = 1 + lengths.get(node.blocked_by_id, 0)
+    if not lengths:
+        return []
+
+    path = [max(lengths, key=lengths.__getitem__)]
+    while nodes[path[-1]].blocked_by_id in lengths:
+        path.append(nodes[path[-1]].blocked_by_id)
+    return list(reversed(path))
+
+
+@event.listens_for(Session, "after_flush")
+def _track_initiative_changes(session: Session, flush_context: Any) -> None:
+    changed = {
+        str(instance.workspace_id)
+        for instance in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(instance, Initiative) and instance.workspace_id is not None
+    }
+    if changed:
+        session.info.setdefault(_CHANGED_WORKSPACES_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_workspaces(session: Session) -> None:
+    for workspace_id in session.info.pop(_CHANGED_WORKSPACES_KEY, None) or ():
+        dependency_graph_cache.invalidate(workspace_id)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_changed_workspaces(session: Session, transaction: Any) -> None:
+    # Flushes and savepoints end inner transactions first
+    if transaction.parent is None:
+        session.info.pop(_CHANGED_WORKSPACES_KEY, None)
@@ -0,0 +1,115 @@
+"""
+Block allocation of human-readable identifiers ("TM-042").
+
+Identifiers are numbered from per-user counters (per-workspace for turning
+points). The ``dev.set_*_identifier`` triggers take one number at a time,
+which locks the owner's counter row once per inserted row, so concurrent
+bulk inserts for one user serialize on it. ``reserve_identifiers`` takes a
+whole block in a single counter update through ``dev.reserve_identifiers``;
+rows inserted with an identifier already set skip the trigger.
+
+``assign_identifiers_in_bulk`` does this for ORM flushes: when a flush
+inserts several rows of one table for one owner without identifiers, they
+get a reserved block instead of one counter update each.
+"""
+
+import uuid
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+class IdentifierFormat(NamedTuple):
+    prefix: str
+    counter: str
+    owner_column: str = "user_id"
+    width: int = 3
+
+
+# Tables with human-readable identifiers, as (identifier prefix, counter table);
+# the counters are per user
+IDENTIFIED_TABLES = {
+    "initiative": ("I-", "user_initiative_counter"),
+    "task": ("TM-", "user_task_counter"),
+    "strategic_pillars": ("P-", "user_pillar_counter"),
+    "product_outcomes": ("O-", "user_outcome_counter"),
+    "roadmap_themes": ("T-", "user_theme_counter"),
+    "heroes": ("H-", "user_hero_counter"),
+    "villains": ("V-", "user_villain_counter"),
+    "conflicts": ("C-", "user_conflict_counter"),
+}
+
+IDENTIFIER_FORMATS: Dict[str, IdentifierFormat] = {
+    **{
+        table: IdentifierFormat(prefix, counter)
+        for table, (prefix, counter) in IDENTIFIED_TABLES.items()
+    },
+    "turning_points": IdentifierFormat(
+        "TP-", "workspace_turning_point_counter", "workspace_id", 4
+    ),
+}
+
+
+def reserve_identifiers(
+    session: Session, counter: str, owner_id: uuid.UUID, count: int
+) -> int:
+    """Reserve ``count`` identifier numbers in one counter update.
+
+    Args:
+        session: Database session; the counter row stays locked until it ends
+        counter: Counter table, e.g. ``user_task_counter``
+        owner_id: User (or workspace, for workspace counters) owning the counter
+        count: Number of identifiers to reserve
+
+    Returns:
+        int: The last number in use before the block; the block is the
+            ``count`` numbers that follow it
+    """
+    return session.execute(
+        text("SELECT dev.reserve_identifiers(:counter, :owner_id, :count)"),
+        {"counter": counter, "owner_id": owner_id, "count": count},
+    ).scalar_one()
+
+
+def format_identifier(prefix: str, value: int, width: int = 3) -> str:
+    """Python twin of ``dev.format_identifier``, e.g. ("TM-", 7) -> "TM-007"."""
+    return f"{prefix}{value:0{width}d}"
+
+
+def allocate_identifiers(
+    session: Session, table: str, owner_id: uuid.UUID, count: int
+) -> List[str]:
+    """Reserve and format ``count`` identifiers for rows of a table."""
+    identifier_format = IDENTIFIER_FORMATS[table]
+    base = reserve_identifiers(session, identifier_format.counter, owner_id, count)
+    return [
+        format_identifier(identifier_format.prefix, base + n, identifier_format.width)
+        for n in range(1, count + 1)
+    ]
+
+
+def assign_identifiers_in_bulk(session: Session, flush_context, instances) -> None:
+    """Give rows inserted together by a flush one reserved block per owner.
+
+    Registered as a ``before_flush`` listener on every session. Single rows
+    are left to the triggers, which cost the same for one row.
+    """
+    pending: Dict[Tuple[str, uuid.UUID], List] = defaultdict(list)
+    for instance in session.new:
+        table = getattr(instance, "__tablename__", None)
+        identifier_format = IDENTIFIER_FORMATS.get(table)
+        if identifier_format is None or getattr(instance, "identifier", None):
+            continue
+        owner_id = getattr(instance, identifier_format.owner_column, None)
+        if owner_id is not None:
+            pending[(table, owner_id)].append(instance)
+
+    for (table, owner_id), rows in pending.items():
+        if len(rows) < 2:
+            continue
+        for row, identifier in zip(
+            rows, allocate_identifiers(session, table, owner_id, len(rows))
+        ):
+            row.identifier = identifier
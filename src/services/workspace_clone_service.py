@@ -0,0 +1,396 @@
+"""
+Server-side cloning of workspaces.
+
+A workspace is copied with one ``INSERT ... SELECT`` per table, in a single
+transaction, instead of replaying the API calls that created it. New UUIDs
+are drawn in bulk into a temporary old → new id map that every statement
+joins to remap its references, and identifiers are reserved in one counter
+update per entity type instead of one trigger call per row.
+
+Domain events and turning points are not copied: they are the history of
+the source workspace, and the clone starts its own.
+"""
+
+import logging
+import uuid
+from typing import Dict, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.models import Workspace
+from src.services.identifier_service import IDENTIFIED_TABLES, reserve_identifiers
+
+logger = logging.getLogger(__name__)
+
+ID_MAP = "workspace_clone_ids"
+
+# Tables whose rows are referenced by other rows, so need an id map entry
+MAPPED_TABLES = [*IDENTIFIED_TABLES, "group", "strategic_initiatives"]
+
+# Link tables, as (left column, left table, right column)
+LINK_TABLES = {
+    "initiative_group": ("initiative_id", "initiative", "group_id"),
+    "outcome_pillar_links": ("outcome_id", "product_outcomes", "pillar_id"),
+    "theme_outcome_links": ("theme_id", "roadmap_themes", "outcome_id"),
+    "roadmap_theme_heroes": ("roadmap_theme_id", "roadmap_themes", "hero_id"),
+    "roadmap_theme_villains": ("roadmap_theme_id", "roadmap_themes", "villain_id"),
+    "strategic_initiative_heroes": (
+        "strategic_initiative_id",
+        "strategic_initiatives",
+        "hero_id",
+    ),
+    "strategic_initiative_villains": (
+        "strategic_initiative_id",
+        "strategic_initiatives",
+        "villain_id",
+    ),
+    "strategic_initiative_conflicts": (
+        "strategic_initiative_id",
+        "strategic_initiatives",
+        "conflict_id",
+    ),
+}
+
+
+def clone_workspace(
+    session: Session,
+    source_workspace_id: uuid.UUID,
+    user_id: uuid.UUID,
+    name: str,
+    description: Optional[str] = None,
+    icon: Optional[str] = None,
+) -> Workspace:
+    """Create a workspace for a user as a copy of an existing workspace.
+
+    Copies initiatives, tasks, checklists, groups, orderings, field
+    definitions, context documents, the vision, the strategy (pillars,
+    outcomes, themes and the prioritized roadmap), the narrative (heroes,
+    villains, conflicts, strategic initiatives) and every link between them.
+    The copy gets new identifiers from the user's counters, in the order of
+    the source identifiers.
+
+    Args:
+        session: Database session
+        source_workspace_id: UUID of the workspace to copy
+        user_id: UUID of the user owning the new workspace
+        name: Name of the new workspace
+        description: Description of the new workspace
+        icon: Icon of the new workspace
+
+    Returns:
+        Workspace: The new workspace
+
+    Raises:
+        ValueError: If the source workspace does not exist
+    """
+    source = (
+        session.query(Workspace)
+        .filter(Workspace.id == source_workspace_id, Workspace.deleting_at.is_(None))
+        .first()
+    )
+    if source is None:
+        raise ValueError(f"Workspace with id {source_workspace_id} not found")
+
+    try:
+        workspace = Workspace(
+            name=name, description=description, icon=icon, user_id=user_id
+        )
+        session.add(workspace)
+        session.flush()  # Creates the empty vision and prioritized roadmap
+
+        params = {
+            "source_id": source.id,
+            "target_id": workspace.id,
+            "user_id": user_id,
+        }
+        _map_ids(session, params)
+        for table, (prefix, counter) in IDENTIFIED_TABLES.items():
+            params[f"{table}_base"] = _reserve_identifiers(
+                session, table, counter, user_id
+            )
+        _copy_rows(session, params)
+
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+    session.refresh(workspace)
+    logger.info(f"Cloned workspace {source.id} into {workspace.id} for user {user_id}")
+    return workspace
+
+
+def _map_ids(session: Session, params: Dict) -> None:
+    session.execute(
+        text(
+            f"""
+            CREATE TEMPORARY TABLE {ID_MAP} (
+                old_id uuid PRIMARY KEY,
+                new_id uuid NOT NULL,
+                seq integer NOT NULL
+            ) ON COMMIT DROP
+            """
+        )
+    )
+    for table in MAPPED_TABLES:
+        # seq numbers the rows of a table in the order of their identifiers,
+        # so "I-002" stays before "I-010" in the copy
+        order = (
+            "NULLIF(regexp_replace(identifier, '\\D', '', 'g'), '')::bigint "
+            "NULLS LAST, created_at, id"
+            if table in IDENTIFIED_TABLES
+            else "id"
+        )
+        session.execute(
+            text(
+                f"""
+                INSERT INTO {ID_MAP} (old_id, new_id, seq)
+                SELECT id, gen_random_uuid(), row_number() OVER (ORDER BY {order})
+                FROM dev."{table}"
+                WHERE workspace_id = :source_id
+                """
+            ),
+            params,
+        )
+    session.execute(text(f"ANALYZE {ID_MAP}"))
+
+
+def _reserve_identifiers(
+    session: Session, table: str, counter: str, user_id: uuid.UUID
+) -> int:
+    """Reserve one identifier number per mapped row of a table.
+
+    Returns:
+        int: The counter value before the reservation; the rows get the
+            numbers that follow it
+    """
+    count = session.execute(
+        text(
+            f"""
+            SELECT count(*)
+            FROM {ID_MAP} AS m
+            JOIN dev."{table}" AS s ON s.id = m.old_id
+            """
+        )
+    ).scalar_one()
+    return reserve_identifiers(session, counter, user_id, count)
+
+
+def _copy_rows(session: Session, params: Dict) -> None:
+    def identifier(table: str) -> str:
+        prefix = IDENTIFIED_TABLES[table][0]
+        return f"dev.format_identifier('{prefix}', :{table}_base + m.seq, 3)"
+
+    def mapped(column: str) -> str:
+        return f"(SELECT new_id FROM {ID_MAP} WHERE old_id = s.{column})"
+
+    def copy(
+        table: str,
+        copied: Sequence[str],
+        computed: Dict[str, str],
+        source: Optional[str] = None,
+    ) -> None:
+        if source is None:
+            source = (
+                f'dev."{table}" AS s JOIN {ID_MAP} AS m ON m.old_id = s.id '
+                f"WHERE s.workspace_id = :source_id"
+            )
+        columns = [*copied, *computed]
+        values = [f's."{column}"' for column in copied] + list(computed.values())
+        session.execute(
+            text(
+                f"""
+                INSERT INTO dev."{table}" ({", ".join(f'"{c}"' for c in columns)})
+                SELECT {", ".join(values)}
+                FROM {source}
+                """
+            ),
+            params,
+        )
+
+    owned = {"workspace_id": ":target_id", "user_id": ":user_id"}
+
+    session.execute(
+        text(
+            """
+            UPDATE dev.workspace_vision AS v
+            SET vision_text = s.vision_text
+            FROM dev.workspace_vision AS s
+            WHERE s.workspace_id = :source_id AND v.workspace_id = :target_id
+            """
+        ),
+        params,
+    )
+
+    copy(
+        "initiative",
+        [
+            "title",
+            "description",
+            "type",
+            "progress",
+            "status",
+            "properties",
+            "created_at",
+            "updated_at",
+        ],
+        {
+            "id": "m.new_id",
+            "identifier": identifier("initiative"),
+            "blocked_by_id": mapped("blocked_by_id"),
+            **owned,
+        },
+    )
+    copy(
+        "task",
+        [
+            "title",
+            "description",
+            "type",
+            "status",
+            "properties",
+            "created_at",
+            "updated_at",
+        ],
+        {
+            "id": "m.new_id",
+            "identifier": identifier("task"),
+            "initiative_id": mapped("initiative_id"),
+            **owned,
+        },
+    )
+    copy(
+        "checklist",
+        ["title", "is_complete", "order"],
+        {"task_id": "m.new_id", "user_id": ":user_id"},
+        source=(
+            f"dev.checklist AS s JOIN {ID_MAP} AS m ON m.old_id = s.task_id "
+            f"JOIN dev.task AS t ON t.id = s.task_id "
+            f"WHERE t.workspace_id = :source_id"
+        ),
+    )
+    copy(
+        "group",
+        ["name", "description", "group_type", "group_metadata", "query_criteria"],
+        {
+            "id": "m.new_id",
+            "parent_group_id": mapped("parent_group_id"),
+            **owned,
+        },
+    )
+    copy(
+        "orderings",
+        ["context_type", "entity_type", "position"],
+        {
+            "context_id": mapped("context_id"),
+            "initiative_id": mapped("initiative_id"),
+            "task_id": mapped("task_id"),
+            **owned,
+        },
+        source="dev.orderings AS s WHERE s.workspace_id = :source_id",
+    )
+    copy(
+        "field_definition",
+        [
+            "entity_type",
+            "key",
+            "name",
+            "field_type",
+            "is_core",
+            "column_name",
+            "config",
+            "created_at",
+            "updated_at",
+        ],
+        {
+            "initiative_id": mapped("initiative_id"),
+            "task_id": mapped("task_id"),
+            **owned,
+        },
+        source="dev.field_definition AS s WHERE s.workspace_id = :source_id",
+    )
+    copy(
+        "context_document",
+        ["title", "content", "created_at", "updated_at"],
+        owned,
+        source="dev.context_document AS s WHERE s.workspace_id = :source_id",
+    )
+
+    timestamps = ["created_at", "updated_at"]
+    for table, copied in (
+        ("strategic_pillars", ["name", "description", "display_order"]),
+        ("product_outcomes", ["name", "description", "display_order"]),
+        ("roadmap_themes", ["name", "description", "time_horizon_months"]),
+        ("heroes", ["name", "description", "is_primary"]),
+        (
+            "villains",
+            ["name", "villain_type", "description", "severity", "is_defeated"],
+        ),
+    ):
+        copy(
+            table,
+            copied + timestamps,
+            {"id": "m.new_id", "identifier": identifier(table), **owned},
+        )
+    copy(
+        "conflicts",
+        ["description", "status", "resolved_at", *timestamps],
+        {
+            "id": "m.new_id",
+            "identifier": identifier("conflicts"),
+            "hero_id": mapped("hero_id"),
+            "villain_id": mapped("villain_id"),
+            "story_arc_id": mapped("story_arc_id"),
+            "resolved_by_initiative_id": mapped("resolved_by_initiative_id"),
+            **owned,
+        },
+    )
+    copy(
+        "strategic_initiatives",
+        ["description", "narrative_intent", *timestamps],
+        {
+            "id": "m.new_id",
+            "initiative_id": mapped("initiative_id"),
+            "pillar_id": mapped("pillar_id"),
+            "theme_id": mapped("theme_id"),
+            **owned,
+        },
+    )
+
+    for table, (left, left_table, right) in LINK_TABLES.items():
+        copied = [] if table == "initiative_group" else ["created_at"]
+        copy(
+            table,
+            copied,
+            {left: "m.new_id", right: "r.new_id", "user_id": ":user_id"},
+            source=(
+                f'dev."{table}" AS s '
+                f"JOIN {ID_MAP} AS m ON m.old_id = s.{left} "
+                f"JOIN {ID_MAP} AS r ON r.old_id = s.{right} "
+                f'JOIN dev."{left_table}" AS e ON e.id = s.{left} '
+                f"WHERE e.workspace_id = :source_id"
+            ),
+        )
+
+    # The prioritized roadmap stores theme ids in a JSON array
+    session.execute(
+        text(
+            f"""
+            UPDATE dev.prioritized_roadmaps AS r
+            SET prioritized_theme_ids = COALESCE(
+                (
+                    SELECT jsonb_agg(m.new_id ORDER BY t.position)
+                    FROM dev.prioritized_roadmaps AS s,
+                        jsonb_array_elements_text(s.prioritized_theme_ids)
+                            WITH ORDINALITY AS t(theme_id, position)
+                    JOIN {ID_MAP} AS m ON m.old_id = t.theme_id::uuid
+                    WHERE s.workspace_id = :source_id
+                ),
+                '[]'::jsonb
+            )
+            WHERE r.workspace_id = :target_id
+            """
+        ),
+        params,
+    )
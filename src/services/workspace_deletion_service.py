@@ -0,0 +1,211 @@
+"""
+Deletion of workspaces and accounts in the background.
+
+Deleting a workspace used to be a single ORM delete, which loaded every row
+of the workspace to cascade through its relationships and held the locks of
+the whole delete until it committed. Now a deletion only marks the workspace
+(``deleting_at``), which hides it from reads (the RLS policies hide it and its
+rows from PostgREST too) and frees the user's workspace slot, and its rows are
+purged afterwards, table by table, in chunks of ``CHUNK_SIZE`` rows that each
+commit on their own. Rows of tables without a ``workspace_id`` (checklists,
+link tables) go with their parent through ``ON DELETE CASCADE``.
+
+Deleting an account deactivates it and marks it and its workspaces the same
+way. Workspaces and accounts whose purge was interrupted are picked up again
+by the ``purge_deleted_workspaces`` management command.
+"""
+
+import logging
+import uuid
+from datetime import datetime
+from typing import List
+
+import sentry_sdk
+from sqlalchemy import Table, delete, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from src.db import Base, SessionLocal
+from src.models import User, Workspace
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1000
+
+# Workspace-scoped tables that outlive the workspace: the event log is
+# append-only and trimmed by retention (see maintain_domain_events)
+_KEPT_TABLES = {"domain_events"}
+
+
+def _purged_tables() -> List[Table]:
+    """Tables with a workspace_id column, children before parents."""
+    return [
+        table
+        for table in reversed(Base.metadata.sorted_tables)
+        if "workspace_id" in table.c and table.name not in _KEPT_TABLES
+    ]
+
+
+def _restricting_self_references(table: Table) -> List[str]:
+    """Self references that would block deleting the row they point to."""
+    return [
+        column.name
+        for column in table.c
+        for fk in column.foreign_keys
+        if fk.column.table is table and fk.ondelete is None
+    ]
+
+
+def mark_workspace_for_deletion(session: Session, workspace: Workspace) -> None:
+    """Hide a workspace from reads until it is purged."""
+    workspace.deleting_at = datetime.now()
+    session.commit()
+    logger.info(f"Marked workspace {workspace.id} for deletion")
+
+
+def mark_user_for_deletion(session: Session, user: User) -> None:
+    """Deactivate an account and mark it and its workspaces for deletion."""
+    user.is_active = False
+    user.deleting_at = datetime.now()
+    session.execute(
+        update(Workspace)
+        .where(Workspace.user_id == user.id, Workspace.deleting_at.is_(None))
+        .values(deleting_at=datetime.now())
+    )
+    session.commit()
+    logger.info(f"Marked user {user.id} for deletion")
+
+
+def _delete_in_chunks(session: Session, statement, chunk_size: int) -> int:
+    """Run a chunked statement, committing each chunk, until it is exhausted."""
+    total = 0
+    while True:
+        count = session.execute(statement).rowcount
+        session.commit()
+        total += count
+        if count < chunk_size:
+            return total
+
+
+def purge_workspace(
+    session: Session, workspace_id: uuid.UUID, chunk_size: int = CHUNK_SIZE
+) -> int:
+    """Delete a workspace and its rows in chunks.
+
+    Args:
+        session: Database session; committed after every chunk
+        workspace_id: UUID of the workspace to purge
+        chunk_size: Maximum number of rows deleted per statement
+
+    Returns:
+        int: Number of rows deleted directly (not counting cascades)
+    """
+    total = 0
+    for table in _purged_tables():
+        for column in _restricting_self_references(table):
+            rows = (
+                select(table.c.id)
+                .where(
+                    table.c.workspace_id == workspace_id,
+                    table.c[column].isnot(None),
+                )
+                .limit(chunk_size)
+            )
+            _delete_in_chunks(
+                session,
+                update(table).where(table.c.id.in_(rows)).values({column: None}),
+                chunk_size,
+            )
+
+        key = tuple_(*table.primary_key.columns)
+        rows = (
+            select(*table.primary_key.columns)
+            .where(table.c.workspace_id == workspace_id)
+            .limit(chunk_size)
+        )
+        total += _delete_in_chunks(
+            session, delete(table).where(key.in_(rows)), chunk_size
+        )
+
+    # Emptied, so the ORM (with passive_deletes) has nothing left to load
+    workspace = session.get(Workspace, workspace_id)
+    if workspace is not None:
+        session.delete(workspace)
+        session.commit()
+        total += 1
+
+    logger.info(f"Purged workspace {workspace_id} ({total} rows)")
+    return total
+
+
+def purge_user(
+    session: Session, user_id: uuid.UUID, chunk_size: int = CHUNK_SIZE
+) -> None:
+    """Purge the workspaces of an account, then delete the account."""
+    workspace_ids = session.scalars(
+        select(Workspace.id).where(Workspace.user_id == user_id)
+    ).all()
+    for workspace_id in workspace_ids:
+        purge_workspace(session, workspace_id, chunk_size)
+
+    # What is left (account details, OAuth accounts) is small
+    user = session.get(User, user_id)
+    if user is not None:
+        session.delete(user)
+        session.commit()
+    logger.info(f"Deleted user {user_id}")
+
+
+def purge_deleted_workspaces(session: Session, chunk_size: int = CHUNK_SIZE) -> int:
+    """Purge every workspace marked for deletion.
+
+    Returns:
+        int: Number of workspaces purged
+    """
+    workspace_ids = session.scalars(
+        select(Workspace.id)
+        .where(Workspace.deleting_at.isnot(None))
+        .order_by(Workspace.deleting_at)
+    ).all()
+    for workspace_id in workspace_ids:
+        purge_workspace(session, workspace_id, chunk_size)
+    return len(workspace_ids)
+
+
+def purge_deleted_users(session: Session, chunk_size: int = CHUNK_SIZE) -> int:
+    """Delete every account marked for deletion.
+
+    Returns:
+        int: Number of accounts deleted
+    """
+    user_ids = session.scalars(
+        select(User.id).where(User.deleting_at.isnot(None)).order_by(User.deleting_at)
+    ).all()
+    for user_id in user_ids:
+        purge_user(session, user_id, chunk_size)
+    return len(user_ids)
+
+
+def purge_workspace_in_background(workspace_id: uuid.UUID) -> None:
+    """Purge a workspace after the response has been sent."""
+    db = SessionLocal()
+    try:
+        purge_workspace(db, workspace_id)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error purging workspace {workspace_id}: {str(e)}")
+        sentry_sdk.capture_exception(e)
+    finally:
+        db.close()
+
+
+def purge_user_in_background(user_id: uuid.UUID) -> None:
+    """Delete an account after the response has been sent."""
+    db = SessionLocal()
+    try:
+        purge_user(db, user_id)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error deleting user {user_id}: {str(e)}")
+        sentry_sdk.capture_exception(e)
+    finally:
+        db.close()
@@ -0,0 +1,346 @@
+"""
+Streaming export and import of a single workspace.
+
+An export is NDJSON: a header line, then one ``{"table", "row"}`` line per
+row, tables in foreign key order so an import can insert rows as they come.
+Rows are read through server-side cursors (``yield_per``) and written out
+one cursor partition at a time, and an import inserts them in batches of the
+same size, so memory stays flat however large the workspace is. Exports can
+be zstd-compressed; imports detect compression from the zstd magic number.
+
+Exported: the workspace row and everything in it (backlog, orderings,
+strategy, narrative, turning points, context documents). Not exported:
+domain events, read models (rebuilt from events) and GitHub installations.
+An import restores rows with their ids and identifiers, so it is meant for
+restoring a workspace that no longer exists in the target database. Every
+row is put in the export's workspace, and rows may only reference rows of
+the same export, so an edited file cannot write into or link to other
+workspaces. The import keeps the ids of referenced rows in memory to check
+this.
+"""
+
+import io
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import orjson
+import zstandard
+from sqlalchemy import Enum as SqlEnum
+from sqlalchemy import String, Table, select, text, type_coerce, update
+from sqlalchemy.exc import CompileError, DataError, IntegrityError
+from sqlalchemy.orm import Session
+
+from src.db import Base
+from src.models import Workspace
+from src.services.identifier_service import IDENTIFIED_TABLES
+
+logger = logging.getLogger(__name__)
+
+FORMAT = "openbacklog.workspace"
+FORMAT_VERSION = 1
+
+BATCH_SIZE = 1000
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Tables without a workspace_id column, scoped through the row they belong
+# to, as (column, parent table)
+_CHILD_TABLES = {
+    "checklist": ("task_id", "task"),
+    "initiative_group": ("initiative_id", "initiative"),
+    "outcome_pillar_links": ("outcome_id", "product_outcomes"),
+    "theme_outcome_links": ("theme_id", "roadmap_themes"),
+    "roadmap_theme_heroes": ("roadmap_theme_id", "roadmap_themes"),
+    "roadmap_theme_villains": ("roadmap_theme_id", "roadmap_themes"),
+    "strategic_initiative_heroes": ("strategic_initiative_id", "strategic_initiatives"),
+    "strategic_initiative_villains": (
+        "strategic_initiative_id",
+        "strategic_initiatives",
+    ),
+    "strategic_initiative_conflicts": (
+        "strategic_initiative_id",
+        "strategic_initiatives",
+    ),
+    "turning_point_initiatives": ("turning_point_id", "turning_points"),
+    "turning_point_story_arcs": ("turning_point_id", "turning_points"),
+}
+
+_EXCLUDED_TABLES = {
+    "domain_events",
+    "workspace_projections",
+    "github_installation",
+    "repository_file_index",
+}
+
+
+def _exported_tables() -> List[Table]:
+    """Workspace tables, parents before children."""
+    return [
+        table
+        for table in Base.metadata.sorted_tables
+        if table.name not in _EXCLUDED_TABLES
+        and (
+            table.name == Workspace.__tablename__
+            or "workspace_id" in table.c
+            or table.name in _CHILD_TABLES
+        )
+    ]
+
+
+def _tables_by_name() -> Dict[str, Table]:
+    return {table.name: table for table in _exported_tables()}
+
+
+def _export_query(table: Table, workspace_id: uuid.UUID):
+    # Enum columns are read as stored, so an import can write them back as is
+    columns = [
+        (
+            type_coerce(column, String).label(column.name)
+            if isinstance(column.type, SqlEnum)
+            else column
+        )
+        for column in table.c
+    ]
+    query = select(*columns)
+    if table.name == Workspace.__tablename__:
+        return query.where(table.c.id == workspace_id)
+    if "workspace_id" in table.c:
+        return query.where(table.c.workspace_id == workspace_id)
+
+    column, parent_name = _CHILD_TABLES[table.name]
+    parent = _tables_by_name()[parent_name]
+    return query.join(parent, parent.c.id == table.c[column]).where(
+        parent.c.workspace_id == workspace_id
+    )
+
+
+def _self_references(table: Table) -> List[str]:
+    """Columns referencing the same table (e.g. initiative.blocked_by_id)."""
+    return [
+        column.name
+        for column in table.c
+        if any(fk.column.table is table for fk in column.foreign_keys)
+    ]
+
+
+def _references(table: Table, tables: Dict[str, Table]) -> List[Tuple[str, str]]:
+    """Columns referencing other exported rows, as (column, referenced table).
+
+    The workspace itself is left out; ``workspace_id`` is set on import.
+    """
+    return [
+        (column.name, fk.column.table.name)
+        for column in table.c
+        for fk in column.foreign_keys
+        if fk.column.name == "id"
+        and fk.column.table.name in tables
+        and fk.column.table.name != Workspace.__tablename__
+    ]
+
+
+def export_workspace(session: Session, workspace_id: uuid.UUID) -> Iterator[bytes]:
+    """Stream a workspace as NDJSON.
+
+    Args:
+        session: Database session, kept open while the iterator is consumed
+        workspace_id: UUID of the workspace to export
+
+    Yields:
+        bytes: Chunks of newline-terminated JSON lines
+
+    Raises:
+        ValueError: If the workspace does not exist (raised on first iteration)
+    """
+    if session.get(Workspace, workspace_id) is None:
+        raise ValueError(f"Workspace with id {workspace_id} not found")
+
+    yield orjson.dumps(
+        {
+            "format": FORMAT,
+            "version": FORMAT_VERSION,
+            "workspace_id": workspace_id,
+            "exported_at": datetime.now(timezone.utc),
+        },
+        option=orjson.OPT_APPEND_NEWLINE,
+    )
+
+    rows = 0
+    for table in _exported_tables():
+        result = session.execute(
+            _export_query(table, workspace_id),
+            execution_options={"yield_per": BATCH_SIZE},
+        )
+        for partition in result.mappings().partitions():
+            yield b"".join(
+                orjson.dumps(
+                    {"table": table.name, "row": dict(row)},
+                    default=str,
+                    option=orjson.OPT_APPEND_NEWLINE,
+                )
+                for row in partition
+            )
+            rows += len(partition)
+
+    logger.info(f"Exported workspace {workspace_id} ({rows} rows)")
+
+
+def compress(chunks: Iterable[bytes], level: int = 3) -> Iterator[bytes]:
+    """Compress a stream of chunks with zstd."""
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def read_lines(file: IO[bytes]) -> Iterator[bytes]:
+    """Iterate over the lines of an export, decompressing it if needed."""
+    stream = io.BufferedReader(file) if not hasattr(file, "peek") else file
+    if stream.peek(len(_ZSTD_MAGIC))[: len(_ZSTD_MAGIC)] == _ZSTD_MAGIC:
+        stream = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(stream))
+    for line in stream:
+        if line.strip():
+            yield line
+
+
+def import_workspace(
+    session: Session, lines: Iterable[bytes], user_id: Optional[uuid.UUID] = None
+) -> Workspace:
+    """Restore a workspace from an export.
+
+    Rows keep their ids and identifiers. The owner's identifier counters are
+    moved past the imported identifiers so new entities do not collide.
+
+    Args:
+        session: Database session
+        lines: Lines of the export, e.g. from ``read_lines``
+        user_id: Owner of the restored workspace; defaults to the exported owner
+
+    Returns:
+        Workspace: The restored workspace
+
+    Raises:
+        ValueError: If the export is malformed, references rows outside of
+            it, or the workspace already exists
+    """
+    lines = iter(lines)
+    header = orjson.loads(next(lines, b"{}"))
+    if header.get("format") != FORMAT or header.get("version") != FORMAT_VERSION:
+        raise ValueError("Not a workspace export")
+    workspace_id = uuid.UUID(str(header.get("workspace_id")))
+    if session.get(Workspace, workspace_id) is not None:
+        raise ValueError(f"Workspace with id {workspace_id} already exists")
+
+    tables = _tables_by_name()
+    references = {name: _references(table, tables) for name, table in tables.items()}
+    referenced = {name for columns in references.values() for _, name in columns}
+    # Ids imported so far of the tables that other rows reference
+    imported: Dict[str, Set[str]] = {name: set() for name in referenced}
+    # Self references are set once every row of the table exists
+    deferred: List[Tuple[Table, str, Any, Any]] = []
+    batch: List[Dict[str, Any]] = []
+    table: Optional[Table] = None
+    rows = 0
+
+    def flush() -> None:
+        if batch:
+            session.execute(table.insert(), batch)
+            batch.clear()
+
+    def check_reference(name: str, value: Any) -> None:
+        if value is not None and str(value) not in imported[name]:
+            raise ValueError(f"Row of {table.name} references a {name} not in export")
+
+    try:
+        for line in lines:
+            record = orjson.loads(line)
+            if table is None or record["table"] != table.name:
+                flush()
+                table = tables.get(record["table"])
+                if table is None:
+                    raise ValueError(f"Unknown table in export: {record['table']}")
+
+            row = record["row"]
+            if table.name == Workspace.__tablename__:
+                if row["id"] != str(workspace_id):
+                    raise ValueError("Export contains another workspace")
+            elif "workspace_id" in table.c:
+                row["workspace_id"] = workspace_id
+            if user_id is not None:
+                if "user_id" in row:
+                    row["user_id"] = user_id
+            for column in _self_references(table):
+                if row.get(column) is not None:
+                    deferred.append((table, column, row["id"], row[column]))
+                    row[column] = None
+            for column, name in references[table.name]:
+                if name != table.name:
+                    check_reference(name, row.get(column))
+            if table.name in imported:
+                imported[table.name].add(str(row["id"]))
+            batch.append(row)
+            rows += 1
+            if len(batch) >= BATCH_SIZE:
+                flush()
+        flush()
+
+        for table, column, row_id, value in deferred:
+            check_reference(table.name, value)
+            session.execute(
+                update(table).where(table.c.id == row_id).values({column: value})
+            )
+
+        workspace = session.get(Workspace, workspace_id)
+        if workspace is None:
+            raise ValueError("Export does not contain its workspace")
+        _advance_counters(session, workspace)
+        session.commit()
+    except (KeyError, TypeError, CompileError) as e:
+        session.rollback()
+        raise ValueError(f"Malformed export: {e!r}")
+    except (IntegrityError, DataError) as e:
+        session.rollback()
+        raise ValueError(f"Export does not fit the database: {e.orig}")
+    except Exception:
+        session.rollback()
+        raise
+
+    logger.info(f"Imported workspace {workspace_id} ({rows} rows)")
+    return workspace
+
+
+def _advance_counters(session: Session, workspace: Workspace) -> None:
+    """Move identifier counters past the identifiers of a restored workspace."""
+    number = "COALESCE(max(NULLIF(regexp_replace(identifier, '\\D', '', 'g'), '')::bigint), 0)"
+    for table, (_, counter) in IDENTIFIED_TABLES.items():
+        session.execute(
+            text(
+                f"""
+                INSERT INTO dev.{counter} (user_id, last_value)
+                SELECT :user_id, {number}
+                FROM dev."{table}" WHERE user_id = :user_id
+                ON CONFLICT (user_id) DO UPDATE
+                SET last_value = GREATEST(
+                    dev.{counter}.last_value, EXCLUDED.last_value
+                )
+                """
+            ),
+            {"user_id": workspace.user_id},
+        )
+    session.execute(
+        text(
+            f"""
+            INSERT INTO dev.workspace_turning_point_counter (workspace_id, last_value)
+            SELECT :workspace_id, {number}
+            FROM dev.turning_points WHERE workspace_id = :workspace_id
+            ON CONFLICT (workspace_id) DO UPDATE
+            SET last_value = GREATEST(
+                dev.workspace_turning_point_counter.last_value, EXCLUDED.last_value
+            )
+            """
+        ),
+        {"workspace_id": workspace.id},
+    )
@@ -1,9 +1,18 @@
 import hashlib
+import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import BinaryIO
+from typing import IO, BinaryIO, Callable, Dict, Optional
 
 import boto3
+from botocore.client import BaseClient
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 from src.config import settings
 
@@ -11,52 +20,243 @@ hash_salt = "r2-profile-picture"
 
 LOCAL_UPLOADS_DIR = Path("/app/uploads/profile_pictures")
 
+# Profile picture names embed a digest of their content, so a name always
+# refers to the same bytes and may be cached forever
+PROFILE_PICTURE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_FILENAME_PATTERN = re.compile(r"^[A-Za-z0-9_-][A-Za-z0-9._-]*$")
+_CHUNK_SIZE = 64 * 1024
+
+# How long a cached file handed out to be served is kept from eviction; a
+# FileResponse opens it well within that, and an open file outlives unlink
+SERVE_LEASE_SECONDS = 60
+
 
 def _use_local_storage() -> bool:
     """Returns True if local storage should be used (R2 not configured)."""
     return not settings.cloudflare_account_id
 
 
-def get_s3_resource():
+def get_s3_resource() -> BaseClient:
     return boto3.client(
         "s3",
         endpoint_url=f"https://{settings.cloudflare_account_id}.r2.cloudflarestorage.com",
         aws_access_key_id=settings.r2_access_key_id,
         aws_secret_access_key=settings.r2_secret_access_key,
+        config=Config(max_pool_connections=settings.r2_max_pool_connections),
     )
 
 
+_s3_client: Optional[BaseClient] = None
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client() -> BaseClient:
+    """Return the process-wide S3 client (boto3 clients are thread-safe)."""
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = get_s3_resource()
+    return _s3_client
+
+
+class ProfilePictureDiskCache:
+    """
+    Size-capped local disk cache of R2 objects, evicted least recently used.
+
+    Entries are written to a temporary file and renamed into place, so readers
+    never see a partial download. Recency is tracked in memory and seeded from
+    file modification times, which are bumped on every hit. Each process
+    evicts against its own view of the directory, so workers sharing one
+    directory can briefly exceed the cap between their evictions.
+
+    Every path returned by ``get`` or ``put`` is leased for ``lease_seconds``
+    and not evicted meanwhile, so it is still there when the response serving
+    it opens it. The cap can be exceeded while every old entry is leased.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int,
+        lease_seconds: float = SERVE_LEASE_SECONDS,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.lease_seconds = lease_seconds
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        # Filename -> time.monotonic() until which it is not evicted
+        self._leases: Dict[str, float] = {}
+        self._total_bytes = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def get(self, filename: str) -> Optional[Path]:
+        """Return the cached file for ``filename``, or None on a miss."""
+        path = self.directory / filename
+        with self._lock:
+            self._load()
+            if not path.exists():
+                self._total_bytes -= self._entries.pop(filename, 0)
+                self._leases.pop(filename, None)
+                return None
+            if filename in self._entries:
+                self._entries.move_to_end(filename)
+            else:
+                # Downloaded by another worker process sharing the directory
+                self._entries[filename] = path.stat().st_size
+                self._total_bytes += self._entries[filename]
+            self._lease(filename)
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def put(self, filename: str, download: Callable[[IO[bytes]], None]) -> Path:
+        """Store ``filename`` by letting ``download`` write it, then evict."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / filename
+
+        with NamedTemporaryFile(dir=self.directory, prefix=".", delete=False) as tmp:
+            try:
+                download(tmp)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        os.replace(tmp.name, path)
+        size = path.stat().st_size
+
+        with self._lock:
+            self._load()
+            self._total_bytes += size - self._entries.pop(filename, 0)
+            self._entries[filename] = size
+            self._lease(filename)
+            self._evict(keep=filename)
+        return path
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.directory.exists():
+            return
+
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.startswith("."):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._total_bytes += size
+
+    def _lease(self, filename: str) -> None:
+        self._leases[filename] = time.monotonic() + self.lease_seconds
+
+    def _evict(self, keep: str) -> None:
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        now = time.monotonic()
+        self._leases = {
+            filename: until for filename, until in self._leases.items() if until > now
+        }
+        for filename in list(self._entries):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if filename == keep or filename in self._leases:
+                continue
+            self._total_bytes -= self._entries.pop(filename)
+            try:
+                (self.directory / filename).unlink()
+            except FileNotFoundError:
+                pass
+
+
+profile_picture_cache = ProfilePictureDiskCache(
+    Path(settings.profile_picture_cache_dir), settings.profile_picture_cache_max_bytes
+)
+
+
+def profile_picture_filename(user_id: str, file: BinaryIO) -> str:
+    """
+    Name a profile picture after its owner and its content.
+
+    The file is read to compute the digest and rewound afterwards.
+    """
+    user_hash = hashlib.md5((str(user_id) + hash_salt).encode()).hexdigest()  # nosec
+    content_hash = hashlib.sha256()
+    for chunk in iter(lambda: file.read(_CHUNK_SIZE), b""):
+        content_hash.update(chunk)
+    file.seek(0)
+    return f"{user_hash}-{content_hash.hexdigest()[:16]}.png"
+
+
+def profile_picture_etag(filename: str) -> str:
+    return f'"{Path(filename).stem}"'
+
+
 def upload_profile_picture(user_id: str, file: BinaryIO) -> str:
-    hash_for_file = hashlib.md5(
-        (str(user_id) + hash_salt).encode()
-    ).hexdigest()  # nosec
-    filename = f"{hash_for_file}.png"
+    filename = profile_picture_filename(user_id, file)
 
     if _use_local_storage():
         LOCAL_UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
         filepath = LOCAL_UPLOADS_DIR / filename
         with open(filepath, "wb") as f:
-            f.write(file.read())
+            shutil.copyfileobj(file, f, _CHUNK_SIZE)
         return filename
 
-    s3 = get_s3_resource()
+    s3 = get_s3_client()
     s3.upload_fileobj(file, settings.r2_profile_picture_bucket_name, filename)
 
     return filename
 
 
+def delete_profile_picture(filename: str) -> None:
+    """Delete a replaced profile picture (missing pictures are ignored)."""
+    if _use_local_storage():
+        (LOCAL_UPLOADS_DIR / filename).unlink(missing_ok=True)
+        return
+
+    get_s3_client().delete_object(
+        Bucket=settings.r2_profile_picture_bucket_name, Key=filename
+    )
+
+
 def get_profile_picture(filename: str) -> str:
+    """
+    Return a local path holding the profile picture ``filename``.
+
+    R2 objects are served from the disk cache and downloaded on a miss.
+
+    Raises:
+        FileNotFoundError: If there is no such profile picture
+    """
+    if not _FILENAME_PATTERN.match(filename):
+        raise FileNotFoundError(f"Profile picture not found: {filename}")
+
     if _use_local_storage():
         filepath = LOCAL_UPLOADS_DIR / filename
         if not filepath.exists():
             raise FileNotFoundError(f"Profile picture not found: {filename}")
         return str(filepath)
 
-    s3 = get_s3_resource()
+    cached = profile_picture_cache.get(filename)
+    if cached is not None:
+        return str(cached)
 
-    file = NamedTemporaryFile(delete=False)
+    def download(fileobj: IO[bytes]) -> None:
+        get_s3_client().download_fileobj(
+            settings.r2_profile_picture_bucket_name, filename, fileobj
+        )
 
-    tempfile = open(file.name, "wb")
-    s3.download_fileobj(settings.r2_profile_picture_bucket_name, filename, tempfile)
-    tempfile.flush()
-    return tempfile.name
+    try:
+        return str(profile_picture_cache.put(filename, download))
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+            raise FileNotFoundError(f"Profile picture not found: {filename}") from e
+        raise
@@ -1,7 +1,7 @@
 """Controller for product strategy operations."""
 
 import uuid
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from sqlalchemy.orm import Session, selectinload
 
@@ -9,7 +9,14 @@ from src.strategic_planning.aggregates.product_outcome import ProductOutcome
 from src.strategic_planning.aggregates.product_vision import ProductVision
 from src.strategic_planning.aggregates.strategic_pillar import StrategicPillar
 from src.strategic_planning.models import DomainEvent
-from src.strategic_planning.services.event_publisher import EventPublisher
+from src.strategic_planning.services.event_publisher import (
+    BufferedEventPublisher,
+    EventPublisher,
+)
+from src.strategic_planning.services.event_store import (
+    TimelinePage,
+    get_workspace_timeline,
+)
 
 
 def get_workspace_vision(workspace_id: uuid.UUID, session: Session) -> ProductVision:
@@ -296,7 +303,7 @@ def reorder_strategic_pillars(
         )
 
     # Update display order for each pillar using aggregate method
-    publisher = EventPublisher(session)
+    publisher = BufferedEventPublisher(session)
     for pillar in existing_pillars:
         new_order = pillar_orders[pillar.id]
         if pillar.display_order != new_order:
@@ -541,7 +548,7 @@ def reorder_product_outcomes(
         )
 
     # Update display order for each outcome using aggregate method
-    publisher = EventPublisher(session)
+    publisher = BufferedEventPublisher(session)
     for outcome in existing_outcomes:
         new_order = outcome_orders[outcome.id]
         if outcome.display_order != new_order:
@@ -555,3 +562,30 @@ def reorder_product_outcomes(
         session.refresh(outcome)
 
     return get_product_outcomes(workspace_id, session)
+
+
+def get_workspace_event_timeline(
+    workspace_id: uuid.UUID,
+    session: Session,
+    limit: int,
+    cursor: Optional[str] = None,
+    event_types: Optional[Sequence[str]] = None,
+) -> TimelinePage:
+    """Get a page of the domain events of a workspace, newest first.
+
+    Args:
+        workspace_id: UUID of the workspace
+        session: Database session
+        limit: Maximum number of events to return
+        cursor: Cursor of the page to return, None for the first page
+        event_types: Only return events of these types
+
+    Returns:
+        TimelinePage with the events and the cursor of the next page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    return get_workspace_timeline(
+        session, workspace_id, limit, cursor=cursor, event_types=event_types
+    )
@@ -10,8 +10,10 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from sqlalchemy import (
+    BigInteger,
     DateTime,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     PrimaryKeyConstraint,
@@ -21,6 +23,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import UserDefinedType
 
 from src.db import Base
 
@@ -31,6 +34,15 @@ if TYPE_CHECKING:
     from src.strategic_planning.aggregates.strategic_pillar import StrategicPillar
 
 
+class XID8(UserDefinedType):
+    """Postgres ``xid8`` (64-bit transaction id); values are handled as strings."""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw: Any) -> str:
+        return "xid8"
+
+
 class OutcomePillarLink(Base):
     """Association table linking product outcomes to strategic pillars.
 
@@ -125,13 +137,27 @@ class DomainEvent(Base):
         id: Unique identifier for the event
         event_type: Type of event (e.g., 'VisionDraftCreated', 'StrategicPillarDefined')
         aggregate_id: ID of the aggregate that emitted this event
+        workspace_id: Workspace the event belongs to (None if it has none)
         occurred_at: Timestamp when the event occurred
         payload: JSON payload containing event data
+        transaction_id: Id of the transaction that wrote the event
+        position: Insertion order of the event
+
+    The table is range partitioned by month of occurred_at (one
+    ``domain_events_YYYY_MM`` partition per month plus a default partition),
+    so the primary key includes occurred_at and expired months are dropped
+    whole; see ``services/event_store.py``.
+
+    Projections read events in (transaction_id, position) order: a
+    transaction still in flight always has a higher id than every
+    transaction older than the snapshot xmin, so reading only below that
+    xmin never skips an event that commits later.
     """
 
     __tablename__ = "domain_events"
     __table_args__ = (
         Index("ix_domain_events_aggregate_id", "aggregate_id"),
+        Index("ix_domain_events_transaction_id_position", "transaction_id", "position"),
         Index("ix_domain_events_event_type", "event_type"),
         Index(
             "ix_domain_events_occurred_at",
@@ -139,7 +165,15 @@ class DomainEvent(Base):
             postgresql_using="btree",
             postgresql_ops={"occurred_at": "DESC"},
         ),
-        {"schema": "dev"},
+        Index(
+            "ix_domain_events_workspace_id_occurred_at",
+            "workspace_id",
+            "occurred_at",
+            "id",
+            postgresql_using="btree",
+            postgresql_ops={"occurred_at": "DESC", "id": "DESC"},
+        ),
+        {"schema": "dev", "postgresql_partition_by": "RANGE (occurred_at)"},
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -165,9 +199,14 @@ class DomainEvent(Base):
         nullable=False,
     )
 
+    workspace_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=True,
+    )
+
     occurred_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        nullable=False,
+        primary_key=True,
         default=lambda: datetime.now(timezone.utc),
         server_default=text("CURRENT_TIMESTAMP"),
     )
@@ -176,3 +215,84 @@ class DomainEvent(Base):
         JSONB,
         nullable=False,
     )
+
+    transaction_id: Mapped[str] = mapped_column(
+        XID8,
+        nullable=False,
+        server_default=text("pg_current_xact_id()"),
+    )
+
+    position: Mapped[int] = mapped_column(
+        BigInteger,
+        Identity(always=False),
+        nullable=False,
+    )
+
+
+class ProjectionCheckpoint(Base):
+    """How far a projection has read the domain_events stream.
+
+    Attributes:
+        projection_name: Name of the projection
+        last_transaction_id: transaction_id of the last event applied
+        last_position: position of the last event applied
+        updated_at: When the checkpoint last moved
+    """
+
+    __tablename__ = "projection_checkpoints"
+    __table_args__ = {"schema": "private"}
+
+    projection_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    last_transaction_id: Mapped[str] = mapped_column(
+        XID8,
+        nullable=False,
+        server_default=text("'0'::xid8"),
+    )
+
+    last_position: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        server_default=text("0"),
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=text("CURRENT_TIMESTAMP"),
+    )
+
+
+class WorkspaceProjection(Base):
+    """Precomputed read model of one projection for one workspace.
+
+    Attributes:
+        projection_name: Name of the projection
+        workspace_id: Workspace the read model describes
+        data: The read model, as built by the projection
+        updated_at: When the read model was last rebuilt
+    """
+
+    __tablename__ = "workspace_projections"
+    __table_args__ = (
+        PrimaryKeyConstraint("projection_name", "workspace_id"),
+        {"schema": "private"},
+    )
+
+    projection_name: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    workspace_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("dev.workspace.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    data: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=text("CURRENT_TIMESTAMP"),
+    )
@@ -5,14 +5,43 @@ to the database and emitting structured logs for searchability.
 """
 
 import logging
-from typing import Optional
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, List, Optional, Set, Tuple
 
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from src.strategic_planning.models import DomainEvent
 
 logger = logging.getLogger(__name__)
 
+# Called with the workspace_id (None when unknown) of published events once
+# the transaction holding them commits, e.g. to invalidate read caches
+CommitListener = Callable[[Optional[str]], None]
+
+_commit_listeners: List[CommitListener] = []
+
+_PENDING_WORKSPACES_KEY = "event_publisher_pending_workspaces"
+_LISTENING_KEY = "event_publisher_listening"
+_BUFFER_KEY = "event_publisher_buffer"
+_WRITTEN_KEY = "event_publisher_written"
+
+BufferedEvent = Tuple[DomainEvent, Optional[str]]
+
+
+def on_events_committed(listener: CommitListener) -> CommitListener:
+    """Register ``listener`` for committed domain events (usable as a decorator)."""
+    _commit_listeners.append(listener)
+    return listener
+
+
+def has_uncommitted_events(session: Session, workspace_id: Optional[str]) -> bool:
+    """True if ``session`` published events for the workspace not yet committed."""
+    pending = session.info.get(_PENDING_WORKSPACES_KEY)
+    return bool(pending) and (str(workspace_id) in pending or None in pending)
+
 
 class EventPublisher:
     """Publishes domain events to database and structured logs.
@@ -51,16 +80,144 @@ class EventPublisher:
             ... )
             >>> publisher.publish(event, workspace_id=workspace.id)
         """
+        _assign_workspace(event, workspace_id)
         self.db.add(event)
         self.db.flush()
 
-        logger.info(
-            f"Domain event published: {event.event_type}",
-            extra={
-                "event_type": event.event_type,
-                "aggregate_id": str(event.aggregate_id),
-                "workspace_id": workspace_id,
-                "occurred_at": event.occurred_at.isoformat(),
-                "event_data": event.payload,
-            },
+        _log_published(event, workspace_id)
+
+        self._track_pending_workspace(workspace_id)
+
+    def _track_pending_workspace(self, workspace_id: Optional[str]) -> None:
+        pending: Set[Optional[str]] = self.db.info.setdefault(
+            _PENDING_WORKSPACES_KEY, set()
+        )
+        pending.add(str(workspace_id) if workspace_id is not None else None)
+
+        if not self.db.info.get(_LISTENING_KEY):
+            self.db.info[_LISTENING_KEY] = True
+            sqlalchemy_event.listen(self.db, "before_commit", _write_buffered)
+            sqlalchemy_event.listen(self.db, "after_commit", _notify_committed)
+            sqlalchemy_event.listen(self.db, "after_transaction_end", _discard_pending)
+
+
+class BufferedEventPublisher(EventPublisher):
+    """Publishes domain events as one batch when the unit of work commits.
+
+    EventPublisher flushes once per event, so an operation that touches many
+    entities (e.g. reordering pillars) pays a round trip per event. This
+    publisher buffers events on the session instead, writes them with a
+    single multi-row INSERT just before the session commits, and emits their
+    structured logs once the commit succeeds. A rollback discards them.
+
+    Buffered events are not visible to queries before the commit (or an
+    explicit ``flush()``), so use the plain EventPublisher where rows
+    reference the events they publish, e.g. turning points.
+    """
+
+    def publish(self, event: DomainEvent, workspace_id: Optional[str] = None) -> None:
+        """Buffer a domain event until the session commits.
+
+        Args:
+            event: DomainEvent instance to publish
+            workspace_id: Optional workspace ID for log searchability
+        """
+        # Assigned now rather than at INSERT time so callers can use them
+        if event.id is None:
+            event.id = uuid.uuid4()
+        if event.occurred_at is None:
+            event.occurred_at = datetime.now(timezone.utc)
+        _assign_workspace(event, workspace_id)
+
+        # Tie the buffer to a transaction so it is discarded when that ends,
+        # even if nothing reached the database (begin() does not connect)
+        if not self.db.in_transaction():
+            self.db.begin()
+
+        buffer: List[BufferedEvent] = self.db.info.setdefault(_BUFFER_KEY, [])
+        buffer.append((event, workspace_id))
+
+        self._track_pending_workspace(workspace_id)
+
+    def flush(self) -> None:
+        """Write the buffered events now, e.g. before querying for them."""
+        _write_buffered(self.db)
+
+
+def _assign_workspace(event: DomainEvent, workspace_id: Optional[str]) -> None:
+    """Fill in the event's workspace_id from the argument or its payload."""
+    if event.workspace_id is not None:
+        return
+    value = workspace_id or (event.payload or {}).get("workspace_id")
+    try:
+        event.workspace_id = uuid.UUID(str(value)) if value else None
+    except ValueError:
+        pass
+
+
+def _log_published(event: DomainEvent, workspace_id: Optional[str]) -> None:
+    logger.info(
+        f"Domain event published: {event.event_type}",
+        extra={
+            "event_type": event.event_type,
+            "aggregate_id": str(event.aggregate_id),
+            "workspace_id": workspace_id,
+            "occurred_at": event.occurred_at.isoformat(),
+            "event_data": event.payload,
+        },
+    )
+
+
+def _write_buffered(session: Session) -> None:
+    buffer: Optional[List[BufferedEvent]] = session.info.pop(_BUFFER_KEY, None)
+    if not buffer:
+        return
+
+    # before_commit runs ahead of the commit's own flush; write the pending
+    # entities first so the events land after the rows they describe
+    session.flush()
+    session.execute(
+        insert(DomainEvent).values(
+            [
+                {
+                    "id": event.id,
+                    "user_id": event.user_id,
+                    "event_type": event.event_type,
+                    "aggregate_id": event.aggregate_id,
+                    "workspace_id": event.workspace_id,
+                    "occurred_at": event.occurred_at,
+                    "payload": event.payload,
+                }
+                for event, _ in buffer
+            ]
         )
+    )
+    # Logged after commit, so the logs never describe rolled back events
+    session.info.setdefault(_WRITTEN_KEY, []).extend(buffer)
+
+
+def _notify_committed(session: Session) -> None:
+    for event, workspace_id in session.info.pop(_WRITTEN_KEY, None) or []:
+        _log_published(event, workspace_id)
+
+    pending = session.info.pop(_PENDING_WORKSPACES_KEY, None)
+    if not pending:
+        return
+    for workspace_id in pending:
+        for listener in _commit_listeners:
+            try:
+                listener(workspace_id)
+            except Exception as e:
+                logger.error(f"Domain event commit listener failed: {str(e)}")
+
+
+def _discard_pending(session: Session, transaction: Any) -> None:
+    # Runs after every commit, rollback or close of the session's transaction;
+    # a committed transaction has already handed its events on by now. Flushes
+    # and savepoints run in inner transactions that end first, and the events
+    # belong to the outermost one
+    if transaction.parent is not None:
+        return
+    session.info.pop(_PENDING_WORKSPACES_KEY, None)
+    session.info.pop(_BUFFER_KEY, None)
+    session.info.pop(_WRITTEN_KEY, None)
@@ -0,0 +1,292 @@
+"""Partition maintenance, retention and timeline reads of the domain event store.
+
+``dev.domain_events`` is range partitioned by month of ``occurred_at``: one
+``domain_events_YYYY_MM`` partition per month, plus a default partition that
+catches events outside them. Partitions are created a few months ahead by the
+``maintain_domain_events`` command, and months older than the retention
+window are dropped (or detached into the private schema as an archive) whole,
+instead of deleting rows one by one.
+
+Timeline reads are keyset paginated on (occurred_at, id) over the
+(workspace_id, occurred_at DESC, id DESC) index, so every page costs the same
+however much history a workspace has.
+"""
+
+import base64
+import logging
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import text, tuple_
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.strategic_planning.models import DomainEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARTITION = "domain_events_default"
+ARCHIVE_SCHEMA = "private"
+
+_PARTITION_PATTERN = re.compile(r"^domain_events_(\d{4})_(\d{2})$")
+
+
+@dataclass
+class TimelinePage:
+    """One page of a workspace's event timeline, newest first.
+
+    Attributes:
+        events: Events of the page
+        next_cursor: Cursor of the following page, None on the last page
+    """
+
+    events: List[DomainEvent]
+    next_cursor: Optional[str]
+
+
+def partition_name(month: date) -> str:
+    return f"domain_events_{month.year:04d}_{month.month:02d}"
+
+
+def list_event_partitions(session: Session) -> List[date]:
+    """Return the first day of every month that has a partition, oldest first."""
+    names = session.execute(
+        text(
+            """
+            SELECT c.relname
+            FROM pg_inherits AS i
+            JOIN pg_class AS c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'dev.domain_events'::regclass
+            """
+        )
+    ).scalars()
+
+    months = []
+    for name in names:
+        match = _PARTITION_PATTERN.match(name)
+        if match:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+def ensure_event_partitions(
+    session: Session,
+    months_ahead: Optional[int] = None,
+    today: Optional[date] = None,
+) -> List[str]:
+    """Create the partitions of the current month and ``months_ahead`` after it.
+
+    Events that landed in the default partition for lack of a monthly
+    partition are moved into the partition created for their month.
+
+    Args:
+        session: Database session
+        months_ahead: Months to create ahead (default: from settings)
+        today: Date used as the current day (default: today)
+
+    Returns:
+        List[str]: Names of the partitions created
+    """
+    if months_ahead is None:
+        months_ahead = settings.domain_event_partitions_ahead
+    start = _month_start(today or datetime.now(timezone.utc).date())
+    existing = set(list_event_partitions(session))
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = _add_months(start, offset)
+        if month not in existing:
+            _create_partition(session, month)
+            created.append(partition_name(month))
+
+    # Months in the past are only created when the default partition holds
+    # their events, e.g. after the command did not run for a while
+    stray_months = session.execute(
+        text(
+            f"""
+            SELECT DISTINCT date_trunc('month', occurred_at)::date
+            FROM dev.{DEFAULT_PARTITION}
+            """
+        )
+    ).scalars()
+    for month in sorted(stray_months):
+        if month not in existing and partition_name(month) not in created:
+            _create_partition(session, month)
+            created.append(partition_name(month))
+
+    session.commit()
+    if created:
+        logger.info(f"Created domain event partitions: {', '.join(created)}")
+    return created
+
+
+def apply_event_retention(
+    session: Session,
+    retention_months: int,
+    archive: bool = False,
+    today: Optional[date] = None,
+) -> List[str]:
+    """Remove the partitions of months older than the retention window.
+
+    The current month and the ``retention_months`` before it are kept. Expired
+    partitions are dropped, or with ``archive`` detached and moved to the
+    private schema as ``domain_events_archive_YYYY_MM``, where they no longer
+    slow down reads but can still be exported or restored.
+
+    Turning points keep their narrative when their event is dropped; only
+    the reference to the event is cleared.
+
+    Returns:
+        List[str]: Names of the partitions removed
+    """
+    if retention_months < 0:
+        raise ValueError("retention_months must not be negative")
+
+    cutoff = _add_months(
+        _month_start(today or datetime.now(timezone.utc).date()), -retention_months
+    )
+    expired = [month for month in list_event_partitions(session) if month < cutoff]
+
+    removed = []
+    for month in expired:
+        name = partition_name(month)
+        session.execute(
+            text(f"ALTER TABLE dev.domain_events DETACH PARTITION dev.{name}")
+        )
+        if archive:
+            archive_name = f"domain_events_archive_{month.year:04d}_{month.month:02d}"
+            session.execute(text(f"ALTER TABLE dev.{name} RENAME TO {archive_name}"))
+            session.execute(
+                text(f"ALTER TABLE dev.{archive_name} SET SCHEMA {ARCHIVE_SCHEMA}")
+            )
+        else:
+            session.execute(
+                text(
+                    f"""
+                    UPDATE dev.turning_points
+                    SET domain_event_id = NULL
+                    WHERE domain_event_id IN (SELECT id FROM dev.{name})
+                    """
+                )
+            )
+            session.execute(text(f"DROP TABLE dev.{name}"))
+        # One transaction per month, so a failure keeps the months already done
+        session.commit()
+        removed.append(name)
+
+    if removed:
+        action = "Archived" if archive else "Dropped"
+        logger.info(f"{action} domain event partitions: {', '.join(removed)}")
+    return removed
+
+
+def get_workspace_timeline(
+    session: Session,
+    workspace_id: uuid.UUID,
+    limit: int,
+    cursor: Optional[str] = None,
+    event_types: Optional[Sequence[str]] = None,
+) -> TimelinePage:
+    """Return a page of a workspace's domain events, newest first.
+
+    Args:
+        session: Database session
+        workspace_id: UUID of the workspace
+        limit: Maximum number of events on the page
+        cursor: ``next_cursor`` of the previous page, None for the first page
+        event_types: Only return events of these types
+
+    Returns:
+        TimelinePage: The events and the cursor of the next page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    query = session.query(DomainEvent).filter(DomainEvent.workspace_id == workspace_id)
+    if event_types:
+        query = query.filter(DomainEvent.event_type.in_(event_types))
+    if cursor:
+        occurred_at, event_id = decode_timeline_cursor(cursor)
+        query = query.filter(
+            tuple_(DomainEvent.occurred_at, DomainEvent.id) < (occurred_at, event_id)
+        )
+
+    events = (
+        query.order_by(DomainEvent.occurred_at.desc(), DomainEvent.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        next_cursor = encode_timeline_cursor(events[-1])
+    return TimelinePage(events=events, next_cursor=next_cursor)
+
+
+def encode_timeline_cursor(event: DomainEvent) -> str:
+    value = f"{event.occurred_at.isoformat()}|{event.id}"
+    return base64.urlsafe_b64encode(value.encode()).decode().rstrip("=")
+
+
+def decode_timeline_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a timeline cursor into the (occurred_at, id) it continues after.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        occurred_at, event_id = (
+            base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        )
+        return datetime.fromisoformat(occurred_at), uuid.UUID(event_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid timeline cursor: {cursor}") from e
+
+
+def _create_partition(session: Session, month: date) -> None:
+    name = partition_name(month)
+    upper = _add_months(month, 1)
+    bounds = f"FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+
+    # Attaching checks that the default partition holds no event of the
+    # month, so those are moved into the new partition first
+    session.execute(
+        text(
+            f"""
+            CREATE TABLE dev.{name}
+                (LIKE dev.domain_events INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+            """
+        )
+    )
+    session.execute(
+        text(
+            f"""
+            WITH moved AS (
+                DELETE FROM dev.{DEFAULT_PARTITION}
+                WHERE occurred_at >= :lower AND occurred_at < :upper
+                RETURNING *
+            )
+            INSERT INTO dev.{name} SELECT * FROM moved
+            """
+        ),
+        {"lower": month, "upper": upper},
+    )
+    session.execute(
+        text(
+            f"ALTER TABLE dev.domain_events ATTACH PARTITION dev.{name} FOR VALUES {bounds}"
+        )
+    )
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
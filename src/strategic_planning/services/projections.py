@@ -0,0 +1,420 @@
+"""Checkpointed projections of the domain_events stream.
+
+A projection keeps one denormalized read model per workspace in
+``private.workspace_projections``, so expensive read paths can serve a single
+precomputed row instead of recomputing from the normalized tables.
+
+The runner tails ``domain_events`` in (transaction_id, position) order from a
+per-projection checkpoint, only reading events of transactions older than the
+current snapshot's xmin, so an event that commits late is never skipped. Every
+workspace touched by a relevant event has its read model rebuilt from the
+normalized tables; that makes applying an event idempotent, so replaying
+history or re-reading a batch after a crash is always safe.
+
+Readers call ``get_workspace_projection``, which returns None when the read
+model is missing or relevant events for the workspace have not been applied
+yet, and fall back to computing the data live. Its probe for pending events
+only looks at events that occurred after the checkpoint last moved (less
+``settings.projection_pending_events_slack_seconds`` for transactions that
+were in flight then), so it only touches the newest domain_events partitions.
+
+Freshness is judged by domain_events alone, so a write that publishes no
+event (PostgREST writes, or rows a projection reads that no event covers)
+goes unseen. To bound that staleness, read models older than
+``settings.projection_max_age_seconds`` are not served, and
+``refresh_expired_read_models`` rebuilds them once they are half that old.
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set
+
+import sentry_sdk
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.models import Workspace
+from src.strategic_planning.models import ProjectionCheckpoint, WorkspaceProjection
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+STRATEGIC_CONTEXT_PROJECTION = "strategic_context"
+ROADMAP_SUMMARY_PROJECTION = "roadmap_summary"
+
+ProjectionBuilder = Callable[[uuid.UUID, Session], Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Projection:
+    """A per-workspace read model and the events that invalidate it.
+
+    Attributes:
+        name: Unique name, used as the checkpoint and read model key
+        event_types: Event types after which the read model is rebuilt
+        build: Computes the (JSON-serializable) read model of a workspace
+    """
+
+    name: str
+    event_types: FrozenSet[str]
+    build: ProjectionBuilder
+
+
+_projections: Dict[str, Projection] = {}
+
+
+def register_projection(projection: Projection) -> Projection:
+    _projections[projection.name] = projection
+    return projection
+
+
+def get_projection(name: str) -> Projection:
+    """Return the registered projection called ``name``.
+
+    Raises:
+        KeyError: If no such projection is registered
+    """
+    return _projections[name]
+
+
+def get_projections() -> List[Projection]:
+    return list(_projections.values())
+
+
+def get_workspace_projection(
+    session: Session, name: str, workspace_id: uuid.UUID
+) -> Optional[Dict[str, Any]]:
+    """Return the read model of a workspace if it is up to date.
+
+    Args:
+        session: Database session
+        name: Name of the projection
+        workspace_id: UUID of the workspace
+
+    Returns:
+        The read model, or None if it has not been built yet, is older than
+        ``settings.projection_max_age_seconds``, or events for the workspace
+        are still waiting to be applied
+    """
+    row = session.get(WorkspaceProjection, (name, workspace_id))
+    max_age = timedelta(seconds=settings.projection_max_age_seconds)
+    if row is None or row.updated_at < datetime.now(timezone.utc) - max_age:
+        return None
+
+    pending = session.execute(
+        text(
+            """
+            SELECT 1
+            FROM dev.domain_events AS e
+            JOIN private.projection_checkpoints AS c
+                ON c.projection_name = :name
+            WHERE (e.transaction_id, e.position)
+                    > (c.last_transaction_id, c.last_position)
+                AND e.workspace_id = :workspace_id
+                AND e.event_type = ANY(:event_types)
+                -- An init plan, so partitions before it are pruned at run time
+                AND e.occurred_at >= (
+                    SELECT updated_at - make_interval(secs => :slack_seconds)
+                    FROM private.projection_checkpoints
+                    WHERE projection_name = :name
+                )
+            LIMIT 1
+            """
+        ),
+        {
+            "name": name,
+            "workspace_id": workspace_id,
+            "event_types": sorted(get_projection(name).event_types),
+            "slack_seconds": settings.projection_pending_events_slack_seconds,
+        },
+    ).first()
+    return None if pending else row.data
+
+
+def run_projection(
+    session: Session, projection: Projection, batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """Apply every readable event after the projection's checkpoint.
+
+    Each batch is applied and checkpointed in its own transaction. If another
+    runner is applying the same projection, this one returns immediately.
+
+    Returns:
+        int: Number of events read
+    """
+    events_read = 0
+    while True:
+        checkpoint = _lock_checkpoint(session, projection.name, wait=False)
+        if checkpoint is None:
+            session.rollback()
+            return events_read
+
+        events = session.execute(
+            text(
+                """
+                SELECT transaction_id::text AS transaction_id, position, event_type,
+                    workspace_id
+                FROM dev.domain_events
+                WHERE (transaction_id, position)
+                        > (CAST(:transaction_id AS xid8), :position)
+                    AND transaction_id < pg_snapshot_xmin(pg_current_snapshot())
+                ORDER BY transaction_id, position
+                LIMIT :batch_size
+                """
+            ),
+            {
+                "transaction_id": checkpoint.last_transaction_id,
+                "position": checkpoint.last_position,
+                "batch_size": batch_size,
+            },
+        ).all()
+        if not events:
+            session.rollback()
+            return events_read
+
+        workspace_ids: Set[uuid.UUID] = {
+            event.workspace_id
+            for event in events
+            if event.event_type in projection.event_types
+            and event.workspace_id is not None
+        }
+
+        for workspace_id in workspace_ids:
+            _refresh_workspace(session, projection, workspace_id)
+
+        checkpoint.last_transaction_id = events[-1].transaction_id
+        checkpoint.last_position = events[-1].position
+        checkpoint.updated_at = datetime.now(timezone.utc)
+        session.commit()
+
+        events_read += len(events)
+        logger.info(
+            f"Projection {projection.name}: applied {len(events)} events, "
+            f"refreshed {len(workspace_ids)} workspaces"
+        )
+        if len(events) < batch_size:
+            return events_read
+
+
+def refresh_expired_read_models(
+    session: Session, projection: Projection, batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """Rebuild read models that are past half their maximum age, oldest first.
+
+    This bounds how long a change that published no domain event stays
+    invisible to readers, and keeps read models of quiet workspaces servable.
+
+    Returns:
+        int: Number of read models rebuilt
+    """
+    max_age = timedelta(seconds=settings.projection_max_age_seconds)
+    expired = (
+        session.query(WorkspaceProjection.workspace_id)
+        .filter(
+            WorkspaceProjection.projection_name == projection.name,
+            WorkspaceProjection.updated_at < datetime.now(timezone.utc) - max_age / 2,
+        )
+        .order_by(WorkspaceProjection.updated_at)
+        .limit(batch_size)
+        .all()
+    )
+    for (workspace_id,) in expired:
+        _refresh_workspace(session, projection, workspace_id)
+    session.commit()
+
+    if expired:
+        logger.info(
+            f"Projection {projection.name}: refreshed {len(expired)} expired read models"
+        )
+    return len(expired)
+
+
+def replay_projection(
+    session: Session, projection: Projection, batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """Re-apply the projection's whole event history over its read models.
+
+    Returns:
+        int: Number of events read
+    """
+    checkpoint = _lock_checkpoint(session, projection.name, wait=True)
+    checkpoint.last_transaction_id = "0"
+    checkpoint.last_position = 0
+    checkpoint.updated_at = datetime.now(timezone.utc)
+    session.commit()
+
+    return run_projection(session, projection, batch_size)
+
+
+def rebuild_projection(session: Session, projection: Projection) -> int:
+    """Drop the projection's read models and rebuild them from zero.
+
+    Every workspace is rebuilt in one transaction, so readers keep seeing the
+    previous read models until the rebuild commits. The checkpoint moves to
+    the newest readable event; later events are applied by the next run.
+
+    Returns:
+        int: Number of workspaces rebuilt
+    """
+    checkpoint = _lock_checkpoint(session, projection.name, wait=True)
+
+    head = session.execute(
+        text(
+            """
+            SELECT transaction_id::text AS transaction_id, position
+            FROM dev.domain_events
+            WHERE transaction_id < pg_snapshot_xmin(pg_current_snapshot())
+            ORDER BY transaction_id DESC, position DESC
+            LIMIT 1
+            """
+        )
+    ).first()
+
+    session.query(WorkspaceProjection).filter(
+        WorkspaceProjection.projection_name == projection.name
+    ).delete(synchronize_session=False)
+
+    workspace_ids = [
+        workspace_id for (workspace_id,) in session.query(Workspace.id).all()
+    ]
+    for workspace_id in workspace_ids:
+        _refresh_workspace(session, projection, workspace_id)
+
+    if head is not None:
+        checkpoint.last_transaction_id = head.transaction_id
+        checkpoint.last_position = head.position
+    checkpoint.updated_at = datetime.now(timezone.utc)
+    session.commit()
+
+    logger.info(
+        f"Projection {projection.name}: rebuilt {len(workspace_ids)} workspaces"
+    )
+    return len(workspace_ids)
+
+
+def _lock_checkpoint(
+    session: Session, name: str, wait: bool
+) -> Optional[ProjectionCheckpoint]:
+    session.execute(
+        insert(ProjectionCheckpoint)
+        .values(projection_name=name)
+        .on_conflict_do_nothing(index_elements=["projection_name"])
+    )
+    return (
+        session.query(ProjectionCheckpoint)
+        .filter(ProjectionCheckpoint.projection_name == name)
+        .with_for_update(skip_locked=not wait)
+        .populate_existing()
+        .first()
+    )
+
+
+def _refresh_workspace(
+    session: Session, projection: Projection, workspace_id: uuid.UUID
+) -> None:
+    """Rebuild one workspace's read model (deleted workspaces are skipped)."""
+    if session.get(Workspace, workspace_id) is None:
+        return
+
+    try:
+        with session.begin_nested():
+            data = projection.build(workspace_id, session)
+            statement = insert(WorkspaceProjection).values(
+                projection_name=projection.name,
+                workspace_id=workspace_id,
+                data=data,
+                updated_at=datetime.now(timezone.utc),
+            )
+            session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["projection_name", "workspace_id"],
+                    set_={
+                        "data": statement.excluded.data,
+                        "updated_at": statement.excluded.updated_at,
+                    },
+                )
+            )
+    except Exception as e:
+        # Drop the stale read model so readers fall back to live data
+        logger.error(
+            f"Error building projection {projection.name} for workspace {workspace_id}: {str(e)}"
+        )
+        sentry_sdk.capture_exception(e)
+        session.query(WorkspaceProjection).filter(
+            WorkspaceProjection.projection_name == projection.name,
+            WorkspaceProjection.workspace_id == workspace_id,
+        ).delete(synchronize_session=False)
+
+
+def _build_strategic_context(
+    workspace_id: uuid.UUID, session: Session
+) -> Dict[str, Any]:
+    from src.mcp_server.strategic_context_resource import build_strategic_context
+
+    return build_strategic_context(workspace_id, session)
+
+
+def _build_roadmap_summary(workspace_id: uuid.UUID, session: Session) -> Dict[str, Any]:
+    from src.roadmap_intelligence.controller import build_roadmap_summary
+
+    return build_roadmap_summary(workspace_id, session)
+
+
+_THEME_EVENT_TYPES = frozenset(
+    {
+        "ThemeDefined",
+        "ThemeUpdated",
+        "ThemeOutcomesLinked",
+        "RoadmapThemeDeleted",
+        "ThemePrioritized",
+        "ThemeDeprioritized",
+        "PrioritizedThemesReordered",
+    }
+)
+
+register_projection(
+    Projection(
+        name=STRATEGIC_CONTEXT_PROJECTION,
+        event_types=_THEME_EVENT_TYPES
+        | {
+            "VisionDraftCreated",
+            "VisionRefined",
+            "StrategicPillarDefined",
+            "StrategicPillarUpdated",
+            "StrategicPillarDeleted",
+            "StrategicPillarsReordered",
+            "OutcomeMapped",
+            "OutcomeUpdated",
+            "OutcomePillarsLinked",
+            "OutcomeReordered",
+            "ProductOutcomeDeleted",
+            "HeroDefined",
+            "HeroUpdated",
+            "HeroDeleted",
+            "VillainIdentified",
+            "VillainUpdated",
+            "VillainDefeated",
+            "VillainDeleted",
+        },
+        build=_build_strategic_context,
+    )
+)
+
+register_projection(
+    Projection(
+        name=ROADMAP_SUMMARY_PROJECTION,
+        # Themes list the outcomes, heroes and villains they link to
+        event_types=_THEME_EVENT_TYPES
+        | {
+            "ProductOutcomeDeleted",
+            "HeroDeleted",
+            "VillainDeleted",
+        },
+        build=_build_roadmap_summary,
+    )
+)
@@ -3,9 +3,9 @@
 import logging
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Query
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.orm import Session
 
@@ -632,3 +632,63 @@ async def delete_product_outcome(
     except Exception as e:
         logger.error(f"Error deleting outcome: {e}")
         raise HTTPException(status_code=500, detail="Failed to delete outcome")
+
+
+class EventResponse(BaseModel):
+    """Response model for a domain event."""
+
+    model_config = ConfigDict(
+        from_attributes=True, json_encoders={datetime: lambda v: v.isoformat()}
+    )
+
+    id: uuid.UUID
+    event_type: str
+    aggregate_id: uuid.UUID
+    user_id: uuid.UUID
+    occurred_at: datetime
+    payload: Dict[str, Any]
+
+
+class EventTimelineResponse(BaseModel):
+    """Response model for a page of a workspace's event timeline."""
+
+    events: List[EventResponse]
+    next_cursor: Optional[str] = None
+
+
+@app.get(
+    "/api/workspaces/{workspace_id}/events",
+    response_model=EventTimelineResponse,
+    tags=["product-strategy"],
+)
+async def get_workspace_event_timeline(
+    workspace_id: uuid.UUID,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    event_type: Optional[List[str]] = Query(None),
+    user: User = Depends(dependency_to_override),
+    session: Session = Depends(get_db),
+) -> EventTimelineResponse:
+    """Get the domain events of a workspace, newest first.
+
+    Pages are keyset paginated: pass the returned next_cursor to get the
+    following page; it is null on the last page.
+    """
+    try:
+        page = product_strategy_controller.get_workspace_event_timeline(
+            workspace_id,
+            session,
+            limit,
+            cursor=cursor,
+            event_types=event_type,
+        )
+
+        return EventTimelineResponse(
+            events=[EventResponse.model_validate(event) for event in page.events],
+            next_cursor=page.next_cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error getting event timeline: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get event timeline")
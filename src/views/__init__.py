@@ -1,10 +1,20 @@
 import logging
+from typing import Annotated, Optional
 from urllib.parse import quote_plus, urlencode
 
-from fastapi import Depends, Form, Request, Response
+from fastapi import (
+    BackgroundTasks,
+    Depends,
+    Form,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+)
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse
 from fastapi_csrf_protect import CsrfProtect
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from src import controller
 
@@ -92,9 +102,15 @@ async def changelog(
 
 @app.get("/account", response_class=HTMLResponse)
 async def account(
-    request: Request, user=Depends(dependency_to_override), session=Depends(get_db)
+    request: Request,
+    background_tasks: BackgroundTasks,
+    user=Depends(dependency_to_override),
+    session=Depends(get_db),
 ) -> HTMLResponse:
-    return controller.get_account_template(request, user, session)
+    # A cold repository listing is fetched from GitHub; keep it off the event loop
+    return await run_in_threadpool(
+        controller.get_account_template, request, user, session, background_tasks
+    )
 
 
 @app.get("/logout", response_class=RedirectResponse)
@@ -128,8 +144,10 @@ def renew_jwt_view(request: Request) -> JSONResponse:
 
 
 @app.get("/profile-picture/{filename}", response_class=FileResponse)
-def get_profile_picture(filename: str) -> FileResponse:
-    return controller.get_profile_picture(filename)
+def get_profile_picture(
+    filename: str, if_none_match: Annotated[Optional[str], Header()] = None
+) -> Response:
+    return controller.get_profile_picture(filename, if_none_match)
 
 
 @app.post("/upload-profile-picture", response_class=Response)
@@ -138,9 +156,21 @@ async def upload_profile_picture(
     user=Depends(dependency_to_override),
     db: Session = Depends(get_db),  # added dependency for db session
 ) -> Response:
-    form = await request.form()
-    file = form["file"]
-    return controller.upload_profile_picture(user, file, db)
+    try:
+        form = await controller.read_profile_picture_form(request)
+    except HTTPException as e:
+        return Response(status_code=e.status_code, content=e.detail)
+
+    try:
+        file = form.get("file")
+        if file is None:
+            return Response(status_code=400, content="Missing file")
+        # Storage I/O blocks; keep it off the event loop
+        return await run_in_threadpool(
+            controller.upload_profile_picture, user, file, db
+        )
+    finally:
+        await form.close()
 
 
 @app.get("/delete-account", response_class=HTMLResponse)
@@ -174,6 +204,7 @@ async def delete_account(
 @app.post("/confirm-delete-account", response_class=RedirectResponse)
 async def confirm_delete_account(
     request: Request,
+    background_tasks: BackgroundTasks,
     csrf_protect: CsrfProtect = Depends(),
     user=Depends(dependency_to_override),
     db: Session = Depends(get_db),
@@ -191,7 +222,9 @@ async def confirm_delete_account(
         csrf_protect.unset_csrf_cookie(response)  # prevent token reuse
         return response
 
-    controller.confirm_delete_account(user, reason, db)
+    controller.confirm_delete_account(
+        user, reason, db, background_tasks=background_tasks
+    )
 
     response = RedirectResponse(url="/", status_code=302)
     csrf_protect.unset_csrf_cookie(response)
@@ -59,6 +59,13 @@ class TaskStatusMoveRequest(BaseModel):
     )
 
 
+class TaskBulkStatusMoveRequest(BaseModel):
+    task_ids: List[uuid.UUID] = Field(
+        min_length=1, max_length=1000, description="IDs of tasks to move"
+    )
+    new_status: TaskStatus = Field(description="New status for the tasks")
+
+
 class OrderingResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -211,3 +218,23 @@ async def move_task_to_status(
 
     except Exception as e:
         raise _handle_controller_error(e)
+
+
+@app.put("/api/tasks/status", response_model=List[TaskResponse])
+async def move_tasks_to_status(
+    request: TaskBulkStatusMoveRequest,
+    user: User = Depends(dependency_to_override),
+    db: Session = Depends(get_db),
+) -> List[TaskResponse]:
+    try:
+        controller = TaskController(db)
+        tasks = controller.move_tasks_to_status(
+            task_ids=request.task_ids,
+            user_id=user.id,
+            new_status=request.new_status,
+        )
+
+        return [TaskResponse.model_validate(task) for task in tasks]
+
+    except Exception as e:
+        raise _handle_controller_error(e)
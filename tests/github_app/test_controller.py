@@ -1,8 +1,9 @@
+import asyncio
 from typing import Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
 from fastapi.responses import HTMLResponse
 from hamcrest import assert_that, equal_to, is_, not_
 from pydantic import ValidationError
@@ -23,6 +24,8 @@ from src.github_app.models import RepositoryFileIndex
 from src.github_app.webhook_controller import handle_github_webhook
 from src.models import GitHubInstallation, User, Workspace
 
+AUTH_HEADERS = {"Authorization": "Bearer ghs_test"}
+
 
 @pytest.fixture
 def github_installation(session: Session, user: User, workspace: Workspace):
@@ -45,7 +48,7 @@ class TestGetRepositoriesTemplate:
         return_value=HTMLResponse("<html></html>"),
     )
     @patch(
-        "src.github_app.github_service.GitHubService.get_user_repositories",
+        "src.github_app.github_service.GitHubService.list_installation_repositories",
         return_value=[{"name": "test-repo"}],
     )
     def test_get_repositories_template_with_installation(
@@ -57,6 +60,7 @@ class TestGetRepositoriesTemplate:
         # Mock a GitHub installation
         github_installation = MagicMock()
         github_installation.installation_id = "12345"
+        github_installation.repositories_cache = None
 
         # Setup the db query to return the installation
         db.query.return_value.filter.return_value.first.return_value = (
@@ -104,7 +108,7 @@ class TestGetRepositoriesTemplate:
         assert isinstance(result, HTMLResponse)
 
     @patch("src.main.templates.TemplateResponse")
-    @patch("src.github_app.github_service.GitHubService.get_user_repositories")
+    @patch("src.github_app.github_service.GitHubService.list_installation_repositories")
     def test_rendering_the_user_repositories(
         self,
         mockGetUserRepos: MagicMock,
@@ -229,6 +233,37 @@ class TestHandleInstallationCallback:
                 session=session,
             )
 
+    @patch("src.github_app.controller.populate_initial_file_index")
+    @patch("src.github_app.github_service.GitHubService.get_installation_token")
+    def test_handle_installation_callback_indexes_in_the_background(
+        self,
+        mock_get_token: MagicMock,
+        mock_populate_index: MagicMock,
+        session: Session,
+        user: User,
+    ):
+        """Test that repositories are indexed after the response is sent."""
+        mock_get_token.return_value = {"token": "ghs_valid_token"}
+        indexed = []
+        mock_populate_index.side_effect = lambda installation, db: indexed.append(
+            installation.installation_id
+        )
+        background_tasks = BackgroundTasks()
+
+        handle_installation_callback(
+            callback_payload=GithubAppInstallationCallback(
+                installation_id="12345", code="abc", setup_action="install"
+            ),
+            user=user,
+            session=session,
+            background_tasks=background_tasks,
+        )
+
+        mock_populate_index.assert_not_called()
+        assert_that(len(background_tasks.tasks), equal_to(1))
+        asyncio.run(background_tasks())
+        assert_that(indexed, equal_to(["12345"]))
+
 
 class TestGetInstallationToken:
     @patch("src.github_app.github_service.GitHubService.get_installation_token")
@@ -470,16 +505,22 @@ class TestHandleGithubWebhook:
 
 
 class TestPopulateInitialFileIndex:
-    @patch("src.github_app.github_service.GitHubService.generate_file_search_string")
+    @pytest.fixture(autouse=True)
+    def auth_headers(self):
+        with patch(
+            "src.github_app.github_service.GitHubService._get_auth_headers",
+            return_value=AUTH_HEADERS,
+        ):
+            yield
+
     @patch("src.github_app.github_service.GitHubService.get_user_repositories")
-    @patch("src.github_app.github_service.GitHubService.get_file_tree")
+    @patch("src.github_app.github_service.GitHubService.get_file_tree_async")
     @patch("src.github_app.github_service.GitHubService.extract_file_paths")
     def test_populate_initial_file_index_multiple_repos(
         self,
         mock_extract_file_paths: MagicMock,
         mock_get_file_tree: MagicMock,
         mock_get_repositories: MagicMock,
-        mock_generate_file_search_string: MagicMock,
         session: Session,
         user: User,
         workspace: Workspace,
@@ -517,37 +558,20 @@ class TestPopulateInitialFileIndex:
         # Mock search string generation
         mock_extract_file_paths.return_value = ["README.md", "src/main.py"]
 
-        # Mock generate_file_search_string to return different values based on prefixing
-        def generate_search_string_side_effect(
-            file_tree_response, repo_name, use_repo_prefix
-        ):
-            files = ["README.md", "src/main.py"]
-            if use_repo_prefix:
-                return "\n".join([f"@{repo_name}/{file}" for file in files])
-            else:
-                return "\n".join([f"@{file}" for file in files])
-
-        mock_generate_file_search_string.side_effect = (
-            generate_search_string_side_effect
-        )
-
         # Call the function
         populate_initial_file_index(github_installation, session)
         session.commit()
 
-        # Verify API calls were made correctly - should be called for both repos during initial creation
-        # and then again for each repo during prefixing strategy update (4 total)
+        # Verify API calls were made correctly - one concurrent tree fetch per
+        # repo, sharing one set of auth headers
         mock_get_repositories.assert_called_once_with("12345")
-        assert (
-            mock_get_file_tree.call_count == 4
-        )  # 2 initial + 2 during prefixing update
+        assert mock_get_file_tree.call_count == 2
         mock_get_file_tree.assert_any_call(
-            "12345", "test-user", "test-repo", recursive=True
+            "12345", "test-user", "test-repo", AUTH_HEADERS, ref=None
         )
         mock_get_file_tree.assert_any_call(
-            "12345", "test-user", "another-repo", recursive=True
+            "12345", "test-user", "another-repo", AUTH_HEADERS, ref=None
         )
-        assert mock_generate_file_search_string.call_count == 4
 
         # Verify two repository file indexes were created
         repo_indexes = session.query(RepositoryFileIndex).all()
@@ -583,7 +607,7 @@ class TestPopulateInitialFileIndex:
 
     @patch("src.github_app.webhook_controller._update_prefixing_strategy")
     @patch("src.github_app.github_service.GitHubService.get_user_repositories")
-    @patch("src.github_app.github_service.GitHubService.get_file_tree")
+    @patch("src.github_app.github_service.GitHubService.get_file_tree_async")
     @patch("src.github_app.github_service.GitHubService.extract_file_paths")
     def test_populate_initial_file_index_single_repo(
         self,
@@ -634,7 +658,7 @@ class TestPopulateInitialFileIndex:
         # Verify API calls were made correctly
         mock_get_repositories.assert_called_once_with("12345")
         mock_get_file_tree.assert_called_once_with(
-            "12345", "test-user", "test-repo", recursive=True
+            "12345", "test-user", "test-repo", AUTH_HEADERS, ref=None
         )
         mock_generate_search_string.assert_called_once_with(mock_file_tree)
 
@@ -689,7 +713,7 @@ class TestPopulateInitialFileIndex:
 
     @patch("src.github_app.webhook_controller._update_prefixing_strategy")
     @patch("src.github_app.github_service.GitHubService.get_user_repositories")
-    @patch("src.github_app.github_service.GitHubService.get_file_tree")
+    @patch("src.github_app.github_service.GitHubService.get_file_tree_async")
     def test_populate_initial_file_index_api_error(
         self,
         mock_get_file_tree: MagicMock,
@@ -730,7 +754,7 @@ class TestPopulateInitialFileIndex:
         # Verify API calls were made but prefixing update was not (no successful repos)
         mock_get_repositories.assert_called_once_with("12345")
         mock_get_file_tree.assert_called_once_with(
-            "12345", "test-user", "test-repo", recursive=True
+            "12345", "test-user", "test-repo", AUTH_HEADERS, ref=None
         )
         mock_update_prefixing.assert_not_called()
 
@@ -808,7 +832,7 @@ class TestPopulateInitialFileIndex:
 
     @patch("src.github_app.github_service.GitHubService.get_installation_token")
     @patch("src.github_app.github_service.GitHubService.get_user_repositories")
-    @patch("src.github_app.github_service.GitHubService.get_file_tree")
+    @patch("src.github_app.github_service.GitHubService.get_file_tree_async")
     @patch("src.github_app.github_service.GitHubService.extract_file_paths")
     def test_handle_installation_callback_full_integration(
         self,
@@ -1677,3 +1701,101 @@ class TestGetInstallationStatus:
         # Verify response - should not see other user's installation
         assert_that(result["has_installation"], equal_to(False))
         assert_that(result["repository_count"], equal_to(0))
+
+
+class TestSearchFilePathsForUser:
+    """Test server-side file path autocomplete."""
+
+    def test_search_across_repositories(
+        self, session: Session, user: User, github_installation: GitHubInstallation
+    ):
+        from src.github_app.controller import search_file_paths_for_user
+
+        session.add_all(
+            [
+                RepositoryFileIndex(
+                    github_installation_id=github_installation.id,
+                    repository_full_name="owner/api",
+                    file_search_string="@api/src/main.py\n@api/src/models.py",
+                    last_indexed_commit_sha="sha-api",
+                    uses_repo_prefix=True,
+                ),
+                RepositoryFileIndex(
+                    github_installation_id=github_installation.id,
+                    repository_full_name="owner/web",
+                    file_search_string="@web/main.tsx\n@web/package.json",
+                    last_indexed_commit_sha="sha-web",
+                    uses_repo_prefix=True,
+                ),
+            ]
+        )
+        session.commit()
+
+        result = search_file_paths_for_user(user, "main", session, limit=5)
+
+        assert_that(
+            [(match.repository_full_name, match.path) for match in result.matches],
+            equal_to(
+                [("owner/web", "@web/main.tsx"), ("owner/api", "@api/src/main.py")]
+            ),
+        )
+
+    def test_index_is_rebuilt_after_new_commit(
+        self, session: Session, user: User, github_installation: GitHubInstallation
+    ):
+        from src.github_app.controller import search_file_paths_for_user
+
+        repo_index = RepositoryFileIndex(
+            github_installation_id=github_installation.id,
+            repository_full_name="owner/api",
+            file_search_string="@old.py",
+            last_indexed_commit_sha="sha-1",
+        )
+        session.add(repo_index)
+        session.commit()
+
+        search_file_paths_for_user(user, "py", session)
+        repo_index.file_search_string = "@new.py"
+        repo_index.last_indexed_commit_sha = "sha-2"
+        session.commit()
+
+        result = search_file_paths_for_user(
+            user, "py", session, repository_full_name="owner/api"
+        )
+
+        assert_that([match.path for match in result.matches], equal_to(["@new.py"]))
+
+    def test_no_installation_returns_no_matches(self, session: Session, user: User):
+        from src.github_app.controller import search_file_paths_for_user
+
+        result = search_file_paths_for_user(user, "main", session)
+
+        assert_that(result.matches, equal_to([]))
+
+
+class TestGetFileSearchStringsEtag:
+    def test_etag_changes_with_indexed_commit(
+        self, session: Session, user: User, github_installation: GitHubInstallation
+    ):
+        from src.github_app.controller import get_file_search_strings_etag
+
+        repo_index = RepositoryFileIndex(
+            github_installation_id=github_installation.id,
+            repository_full_name="owner/api",
+            file_search_string="@main.py",
+            last_indexed_commit_sha="sha-1",
+        )
+        session.add(repo_index)
+        session.commit()
+
+        first = get_file_search_strings_etag(user, session)
+        again = get_file_search_strings_etag(user, session, "owner/api")
+        repo_index.last_indexed_commit_sha = "sha-2"
+        session.commit()
+        second = get_file_search_strings_etag(user, session)
+
+        assert_that(first, equal_to(again))
+        assert_that(first, not_(equal_to(second)))
+        assert_that(
+            get_file_search_strings_etag(user, session, "owner/missing"), is_(None)
+        )
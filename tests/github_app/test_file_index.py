@@ -0,0 +1,143 @@
+from hamcrest import assert_that, equal_to, none
+
+from src.github_app.file_index import (
+    GITHUB_PUSH_COMMIT_LIMIT,
+    NULL_SHA,
+    apply_push_commits,
+    compress_file_search_string,
+    count_file_search_string_paths,
+    decompress_file_search_string,
+    parse_file_search_string,
+    push_requires_full_reindex,
+    render_file_search_string,
+    reprefix_file_search_string,
+)
+
+
+class TestSearchStringRoundTrip:
+    def test_single_repo_prefix(self):
+        paths = parse_file_search_string("@README.md\n@src/a.py", "repo", False)
+
+        assert_that(paths, equal_to(["README.md", "src/a.py"]))
+        assert_that(
+            render_file_search_string(paths, "repo", False),
+            equal_to("@README.md\n@src/a.py"),
+        )
+
+    def test_multi_repo_prefix(self):
+        paths = parse_file_search_string(
+            "@repo/README.md\n@repo/src/a.py", "repo", True
+        )
+
+        assert_that(paths, equal_to(["README.md", "src/a.py"]))
+        assert_that(
+            render_file_search_string(paths, "repo", True),
+            equal_to("@repo/README.md\n@repo/src/a.py"),
+        )
+
+    def test_empty_string(self):
+        assert_that(parse_file_search_string("", "repo", False), equal_to([]))
+
+    def test_reprefix_switches_strategy(self):
+        single = "@README.md\n@repo/nested.py"
+
+        multi = reprefix_file_search_string(single, "repo", False, True)
+
+        assert_that(multi, equal_to("@repo/README.md\n@repo/repo/nested.py"))
+        assert_that(
+            reprefix_file_search_string(multi, "repo", True, False), equal_to(single)
+        )
+
+
+class TestPushRequiresFullReindex:
+    def _payload(self, **overrides):
+        payload = {"before": "base", "after": "head", "commits": [{"added": []}]}
+        payload.update(overrides)
+        return payload
+
+    def test_complete_payload_can_be_applied(self):
+        assert_that(push_requires_full_reindex(self._payload(), "base"), none())
+
+    def test_missing_base_commit(self):
+        assert_that(
+            push_requires_full_reindex(self._payload(), None),
+            equal_to("index has no base commit"),
+        )
+
+    def test_forced_push(self):
+        assert_that(
+            push_requires_full_reindex(self._payload(forced=True), "base"),
+            equal_to("force push"),
+        )
+
+    def test_base_mismatch(self):
+        assert_that(
+            push_requires_full_reindex(self._payload(), "other"),
+            equal_to("base commit does not match indexed commit"),
+        )
+
+    def test_new_branch(self):
+        assert_that(
+            push_requires_full_reindex(self._payload(before=NULL_SHA), NULL_SHA),
+            equal_to("base commit does not match indexed commit"),
+        )
+
+    def test_truncated_commit_list(self):
+        commits = [{"added": []}] * GITHUB_PUSH_COMMIT_LIMIT
+
+        assert_that(
+            push_requires_full_reindex(self._payload(commits=commits), "base"),
+            equal_to("commit list truncated"),
+        )
+        assert_that(
+            push_requires_full_reindex(self._payload(commits_truncated=True), "base"),
+            equal_to("commit list truncated"),
+        )
+
+
+class TestApplyPushCommits:
+    def test_adds_and_removes_keep_list_sorted(self):
+        paths = ["a.py", "c.py", "e.py"]
+
+        changed = apply_push_commits(
+            paths, [{"added": ["d.py", "b.py"], "removed": ["c.py"], "modified": []}]
+        )
+
+        assert_that(changed, equal_to(True))
+        assert_that(paths, equal_to(["a.py", "b.py", "d.py", "e.py"]))
+
+    def test_commits_are_applied_in_order(self):
+        paths = ["a.py"]
+
+        apply_push_commits(
+            paths,
+            [
+                {"added": ["tmp.py"], "removed": []},
+                {"added": [], "removed": ["tmp.py"]},
+            ],
+        )
+
+        assert_that(paths, equal_to(["a.py"]))
+
+    def test_modified_only_is_unchanged(self):
+        paths = ["a.py"]
+
+        changed = apply_push_commits(paths, [{"modified": ["a.py"]}])
+
+        assert_that(changed, equal_to(False))
+        assert_that(paths, equal_to(["a.py"]))
+
+
+class TestCompression:
+    def test_round_trip(self):
+        file_search_string = "@README.md\n@src/ünïcode.py"
+
+        compressed = compress_file_search_string(file_search_string)
+
+        assert_that(
+            decompress_file_search_string(compressed), equal_to(file_search_string)
+        )
+
+    def test_count_ignores_blank_lines(self):
+        assert_that(count_file_search_string_paths("@a\n\n@b\n"), equal_to(2))
+        assert_that(count_file_search_string_paths(""), equal_to(0))
@@ -1,3 +1,5 @@
+import time
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,7 +11,7 @@ from src.github_app.github_service import GitHubService
 
 class TestGitHubService:
     @patch("src.github_app.github_service.jwt.encode")
-    @patch("src.github_app.github_service.requests.post")
+    @patch("src.github_app.github_service.github_http_client.post")
     def test_get_installation_token(self, mock_post, mock_jwt_encode):
         # Mock the JWT encoding
         mock_jwt_encode.return_value = "mocked.jwt.token"
@@ -39,6 +41,7 @@ class TestGitHubService:
                 "Accept": "application/vnd.github.v3+json",
             },
             timeout=settings.internal_request_timeout,
+            rate_limit_scope="app",
         )
 
         # Verify the result contains the expected token
@@ -84,7 +87,7 @@ class TestGitHubService:
         assert_that(result["error"], equal_to("API rate limit exceeded"))
 
     @patch("src.github_app.github_service.GitHubService.get_installation_token")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_user_repositories_success(self, mock_get, mock_get_installation_token):
         # Mock the installation token
         mock_get_installation_token.return_value = {
@@ -119,10 +122,11 @@ class TestGitHubService:
                 "X-GitHub-Api-Version": "2022-11-28",
             },
             timeout=settings.internal_request_timeout,
+            etag_scope="12345",
         )
 
     @patch("src.github_app.github_service.GitHubService.get_installation_token")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_user_repositories_error(self, mock_get, mock_get_installation_token):
         # Mock the installation token
         mock_get_installation_token.return_value = {
@@ -141,8 +145,22 @@ class TestGitHubService:
         # Verify an empty list is returned on error
         assert_that(len(result), equal_to(0))
 
+    @patch("src.github_app.github_service.GitHubService.get_installation_token")
+    @patch("src.github_app.github_service.github_http_client.get")
+    def test_list_installation_repositories_raises_on_error(
+        self, mock_get, mock_get_installation_token
+    ):
+        mock_get_installation_token.return_value = {"token": "ghs_test"}
+        mock_response = MagicMock()
+        mock_response.status_code = 403
+        mock_response.text = "Permission denied"
+        mock_get.return_value = mock_response
+
+        with pytest.raises(Exception, match="403 Permission denied"):
+            GitHubService.list_installation_repositories("12345")
+
     @patch("src.github_app.github_service.jwt.encode")
-    @patch("src.github_app.github_service.requests.delete")
+    @patch("src.github_app.github_service.github_http_client.delete")
     def test_revoke_installation_access_success(self, mock_delete, mock_jwt_encode):
         # Mock the JWT encoding
         mock_jwt_encode.return_value = "mocked.jwt.token"
@@ -167,13 +185,14 @@ class TestGitHubService:
                 "X-GitHub-Api-Version": "2022-11-28",
             },
             timeout=settings.internal_request_timeout,
+            rate_limit_scope="app",
         )
 
         # Verify the result is True for success
         assert_that(result, equal_to(True))
 
     @patch("src.github_app.github_service.jwt.encode")
-    @patch("src.github_app.github_service.requests.delete")
+    @patch("src.github_app.github_service.github_http_client.delete")
     def test_revoke_installation_access_failure(self, mock_delete, mock_jwt_encode):
         # Mock the JWT encoding
         mock_jwt_encode.return_value = "mocked.jwt.token"
@@ -190,7 +209,7 @@ class TestGitHubService:
         assert_that(result, equal_to(False))
 
     @patch("src.github_app.github_service.jwt.encode")
-    @patch("src.github_app.github_service.requests.delete")
+    @patch("src.github_app.github_service.github_http_client.delete")
     def test_revoke_installation_access_exception(self, mock_delete, mock_jwt_encode):
         # Mock the JWT encoding
         mock_jwt_encode.return_value = "mocked.jwt.token"
@@ -205,7 +224,7 @@ class TestGitHubService:
         assert_that(result, equal_to(False))
 
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_repository_metadata_success(self, mock_get, mock_get_auth_headers):
         # Mock the auth headers
         mock_get_auth_headers.return_value = {
@@ -234,6 +253,7 @@ class TestGitHubService:
             "https://api.github.com/repos/owner/test-repo",
             headers=mock_get_auth_headers.return_value,
             timeout=settings.internal_request_timeout,
+            etag_scope="12345",
         )
 
         # Verify the result contains the expected metadata
@@ -242,7 +262,7 @@ class TestGitHubService:
         assert_that(result["default_branch"], equal_to("main"))
 
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_repository_metadata_error(self, mock_get, mock_get_auth_headers):
         # Mock the auth headers
         mock_get_auth_headers.return_value = {
@@ -270,7 +290,7 @@ class TestGitHubService:
         )
 
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_file_content_success(self, mock_get, mock_get_auth_headers):
         # Mock the auth headers
         mock_get_auth_headers.return_value = {
@@ -305,6 +325,7 @@ class TestGitHubService:
             "https://api.github.com/repos/owner/repo/contents/README.md",
             headers=mock_get_auth_headers.return_value,
             timeout=settings.internal_request_timeout,
+            rate_limit_scope="12345",
         )
 
         # Verify the result contains the expected content
@@ -318,7 +339,7 @@ class TestGitHubService:
         )
 
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_file_content_with_ref(self, mock_get, mock_get_auth_headers):
         # Mock the auth headers
         mock_get_auth_headers.return_value = {
@@ -348,10 +369,11 @@ class TestGitHubService:
             "https://api.github.com/repos/owner/repo/contents/README.md?ref=develop",
             headers=mock_get_auth_headers.return_value,
             timeout=settings.internal_request_timeout,
+            rate_limit_scope="12345",
         )
 
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_file_content_error(self, mock_get, mock_get_auth_headers):
         # Mock the auth headers
         mock_get_auth_headers.return_value = {
@@ -378,7 +400,7 @@ class TestGitHubService:
         )
 
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_directory_content_success(self, mock_get, mock_get_auth_headers):
         # Mock the auth headers
         mock_get_auth_headers.return_value = {
@@ -412,6 +434,7 @@ class TestGitHubService:
             "https://api.github.com/repos/owner/repo/contents",
             headers=mock_get_auth_headers.return_value,
             timeout=settings.internal_request_timeout,
+            rate_limit_scope="12345",
         )
 
         # Verify the result contains the expected content
@@ -422,7 +445,7 @@ class TestGitHubService:
         assert_that(result[1]["type"], equal_to("dir"))
 
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_directory_content_with_path_and_ref(
         self, mock_get, mock_get_auth_headers
     ):
@@ -460,6 +483,7 @@ class TestGitHubService:
             "https://api.github.com/repos/owner/repo/contents/src?ref=develop",
             headers=mock_get_auth_headers.return_value,
             timeout=settings.internal_request_timeout,
+            rate_limit_scope="12345",
         )
 
         # Verify the result contains the expected content
@@ -468,7 +492,7 @@ class TestGitHubService:
         assert_that(result[1]["name"], equal_to("file2.py"))
 
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_directory_content_error(self, mock_get, mock_get_auth_headers):
         # Mock the auth headers
         mock_get_auth_headers.return_value = {
@@ -493,7 +517,7 @@ class TestGitHubService:
 
     @patch("src.github_app.github_service.GitHubService.get_repository_metadata")
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_file_tree_success(
         self, mock_get, mock_get_auth_headers, mock_get_repo_metadata
     ):
@@ -538,7 +562,7 @@ class TestGitHubService:
         }
 
         # Set up the mock to return different responses for different URLs
-        def mock_get_side_effect(url, headers, timeout):
+        def mock_get_side_effect(url, headers, timeout, etag_scope=None):
             if "commits" in url:
                 return mock_commit_response
             elif "trees" in url:
@@ -555,11 +579,13 @@ class TestGitHubService:
             "https://api.github.com/repos/owner/repo/commits/main",
             headers=mock_get_auth_headers.return_value,
             timeout=settings.internal_request_timeout,
+            etag_scope="12345",
         )
         mock_get.assert_any_call(
             "https://api.github.com/repos/owner/repo/git/trees/commit-sha-123?recursive=1",
             headers=mock_get_auth_headers.return_value,
             timeout=settings.internal_request_timeout,
+            etag_scope="12345",
         )
 
         # Verify the result contains the expected tree
@@ -570,7 +596,7 @@ class TestGitHubService:
 
     @patch("src.github_app.github_service.GitHubService.get_repository_metadata")
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_file_tree_with_ref(
         self, mock_get, mock_get_auth_headers, mock_get_repo_metadata
     ):
@@ -621,11 +647,12 @@ class TestGitHubService:
             "https://api.github.com/repos/owner/repo/commits/develop",
             headers=mock_get_auth_headers.return_value,
             timeout=settings.internal_request_timeout,
+            etag_scope="12345",
         )
 
     @patch("src.github_app.github_service.GitHubService.get_repository_metadata")
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_file_tree_error(
         self, mock_get, mock_get_auth_headers, mock_get_repo_metadata
     ):
@@ -653,7 +680,7 @@ class TestGitHubService:
         assert_that(result["error"], equal_to("Failed to get commit: 404 Not Found"))
 
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_branches_success(self, mock_get, mock_get_auth_headers):
         # Mock the auth headers
         mock_get_auth_headers.return_value = {
@@ -693,6 +720,7 @@ class TestGitHubService:
             "https://api.github.com/repos/owner/repo/branches",
             headers=mock_get_auth_headers.return_value,
             timeout=settings.internal_request_timeout,
+            etag_scope="12345",
         )
 
         # Verify the result contains the expected branches
@@ -701,7 +729,7 @@ class TestGitHubService:
         assert_that(result[1]["name"], equal_to("develop"))
 
     @patch("src.github_app.github_service.GitHubService._get_auth_headers")
-    @patch("src.github_app.github_service.requests.get")
+    @patch("src.github_app.github_service.github_http_client.get")
     def test_get_branches_error(self, mock_get, mock_get_auth_headers):
         # Mock the auth headers
         mock_get_auth_headers.return_value = {
@@ -974,3 +1002,45 @@ class TestGitHubService:
         # Verify special characters are preserved
         expected = "@files with spaces.txt\n@special-chars@#$.py\n@unicode_文件.txt"
         assert_that(result, equal_to(expected))
+
+
+class TestInstallationTokenCache:
+    @pytest.fixture(autouse=True)
+    def clear_tokens(self):
+        GitHubService.clear_installation_tokens()
+        yield
+        GitHubService.clear_installation_tokens()
+
+    @staticmethod
+    def _token(token: str, expires_in: float) -> dict:
+        expires_at = datetime.fromtimestamp(time.time() + expires_in, timezone.utc)
+        return {
+            "token": token,
+            "expires_at": expires_at.isoformat().replace("+00:00", "Z"),
+        }
+
+    @patch("src.github_app.github_service.GitHubService.get_installation_token")
+    def test_token_is_reused_until_close_to_expiry(self, mock_get_installation_token):
+        mock_get_installation_token.return_value = self._token("ghs_first", 3600)
+
+        first = GitHubService._get_auth_headers("12345")
+        second = GitHubService._get_auth_headers("12345")
+
+        assert_that(second, equal_to(first))
+        assert_that(mock_get_installation_token.call_count, equal_to(1))
+
+        mock_get_installation_token.return_value = self._token("ghs_other", 3600)
+        GitHubService._get_auth_headers("67890")
+        assert_that(mock_get_installation_token.call_count, equal_to(2))
+
+    @patch("src.github_app.github_service.GitHubService.get_installation_token")
+    def test_token_close_to_expiry_is_replaced(self, mock_get_installation_token):
+        mock_get_installation_token.side_effect = [
+            self._token("ghs_expiring", 60),
+            self._token("ghs_fresh", 3600),
+        ]
+
+        GitHubService._get_auth_headers("12345")
+        headers = GitHubService._get_auth_headers("12345")
+
+        assert_that(headers["Authorization"], equal_to("Bearer ghs_fresh"))
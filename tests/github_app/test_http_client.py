@@ -0,0 +1,340 @@
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+import pytest
+from hamcrest import assert_that, equal_to, greater_than, less_than
+
+from src.github_app.http_client import (
+    DEFAULT_SCOPE,
+    AsyncGitHubHttpClient,
+    ETagCache,
+    GitHubHttpClient,
+    RateLimitTracker,
+)
+
+
+class _StubGitHubHandler(BaseHTTPRequestHandler):
+    """
+    Minimal GitHub-like endpoint that honours If-None-Match.
+
+    Like GitHub, the body (and so the ETag) depends on who is asking.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_StubGitHubServer"
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = json.dumps(
+            {
+                "path": self.path,
+                "caller": self.headers.get("Authorization"),
+                "tree": ["a"] * 50,
+            }
+        ).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self.server.record(self)
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        if self.server.rate_limit_next > 0:
+            self.server.rate_limit_next -= 1
+            self._send(403, b"{}", {"X-RateLimit-Remaining": "0", "Retry-After": "0"})
+            return
+
+        if self.headers.get("If-None-Match") == etag:
+            self.server.not_modified += 1
+            self._send(304, b"", {"ETag": etag})
+            return
+
+        # GitHub only charges rate limit for non-304 responses
+        self.server.quota_used += 1
+        self._send(
+            200,
+            body,
+            {
+                "ETag": etag,
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": str(5000 - self.server.quota_used),
+                "X-RateLimit-Reset": str(int(time.time()) + 3600),
+            },
+        )
+
+    def _send(self, status: int, body: bytes, headers: Dict[str, str]) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class _StubGitHubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), _StubGitHubHandler)
+        self.latency = latency
+        self.quota_used = 0
+        self.not_modified = 0
+        self.rate_limit_next = 0
+        self.connections: set = set()
+        self.requests: List[str] = []
+        self._lock = threading.Lock()
+
+    def record(self, handler: _StubGitHubHandler) -> None:
+        with self._lock:
+            self.connections.add(handler.client_address)
+            self.requests.append(handler.path)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+@pytest.fixture
+def stub_server():
+    server = _StubGitHubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _make_client() -> GitHubHttpClient:
+    return GitHubHttpClient(
+        pool_maxsize=4,
+        etag_cache_max_bytes=1024 * 1024,
+        rate_limit_low_watermark=10,
+        rate_limit_max_backoff_seconds=0.01,
+    )
+
+
+class TestETagCache:
+    def test_evicts_least_recently_used(self):
+        cache: ETagCache[str] = ETagCache(max_bytes=200)
+        cache.set("1", "/a", '"a"', "A", 100)
+        cache.set("1", "/b", '"b"', "B", 100)
+        cache.get("1", "/a")
+        cache.set("1", "/c", '"c"', "C", 100)
+
+        assert_that(cache.get("1", "/b"), equal_to(None))
+        assert_that(cache.get("1", "/a").response, equal_to("A"))
+        assert_that(len(cache), equal_to(2))
+
+    def test_bounded_by_bytes(self):
+        cache: ETagCache[str] = ETagCache(max_bytes=200)
+        cache.set("1", "/small", '"s"', "S", 50)
+        cache.set("1", "/tree", '"t"', "T", 150)
+        cache.set("1", "/tree", '"t2"', "T2", 120)
+        cache.set("1", "/huge", '"h"', "H", 500)
+
+        assert_that(cache.get("1", "/huge"), equal_to(None))
+        assert_that(cache.get("1", "/tree").response, equal_to("T2"))
+        assert_that(cache.size_bytes, equal_to(170))
+
+        cache.set("1", "/other", '"o"', "O", 100)
+
+        assert_that(cache.get("1", "/small"), equal_to(None))
+        assert_that(cache.get("1", "/tree"), equal_to(None))
+        assert_that(cache.size_bytes, equal_to(100))
+
+    def test_entries_are_scoped(self):
+        cache: ETagCache[str] = ETagCache(max_bytes=1000)
+        cache.set("1", "/a", '"a"', "A", 1)
+
+        assert_that(cache.get("2", "/a"), equal_to(None))
+
+
+class TestRateLimitTracker:
+    def test_no_backoff_above_watermark(self):
+        tracker = RateLimitTracker(low_watermark=100, max_backoff_seconds=5)
+        tracker.update(
+            "1", {"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "9999999999"}
+        )
+
+        assert_that(tracker.backoff_seconds("1"), equal_to(0.0))
+
+    def test_backoff_spreads_remaining_budget(self):
+        tracker = RateLimitTracker(low_watermark=100, max_backoff_seconds=60)
+        tracker.update(
+            "1", {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "1100"}
+        )
+
+        assert_that(tracker.backoff_seconds("1", now=1000), equal_to(10.0))
+
+    def test_backoff_is_capped(self):
+        tracker = RateLimitTracker(low_watermark=100, max_backoff_seconds=2)
+        tracker.update("1", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1100"})
+
+        assert_that(tracker.backoff_seconds("1", now=1000), equal_to(2))
+
+    def test_retry_after_cleared_by_next_response(self):
+        tracker = RateLimitTracker(low_watermark=100, max_backoff_seconds=60)
+        tracker.update("1", {"Retry-After": "30"})
+        tracker.update("1", {})
+
+        assert_that(tracker.backoff_seconds("1"), equal_to(0.0))
+
+    def test_detects_secondary_rate_limit(self):
+        tracker = RateLimitTracker(low_watermark=100, max_backoff_seconds=60)
+
+        assert_that(tracker.is_rate_limited(429, {}), equal_to(True))
+        assert_that(tracker.is_rate_limited(403, {"Retry-After": "1"}), equal_to(True))
+        assert_that(tracker.is_rate_limited(403, {}), equal_to(False))
+
+
+class TestGitHubHttpClient:
+    def test_conditional_get_served_from_cache(self, stub_server):
+        client = _make_client()
+        url = f"{stub_server.url}/repos/owner/repo"
+
+        first = client.get(url, headers={}, timeout=5, etag_scope="1")
+        second = client.get(url, headers={}, timeout=5, etag_scope="1")
+
+        assert_that(first.status_code, equal_to(200))
+        assert_that(second.status_code, equal_to(200))
+        assert_that(second.json(), equal_to(first.json()))
+        assert_that(stub_server.quota_used, equal_to(1))
+        assert_that(stub_server.not_modified, equal_to(1))
+        assert_that(client.not_modified_count, equal_to(1))
+
+    def test_installations_never_see_each_others_responses(self, stub_server):
+        client = _make_client()
+        url = f"{stub_server.url}/repos/owner/repo"
+        first = {"Authorization": "Bearer ghs_first"}
+        second = {"Authorization": "Bearer ghs_second"}
+
+        client.get(url, headers=first, timeout=5, etag_scope="1")
+        other = client.get(url, headers=second, timeout=5, etag_scope="2")
+        again = client.get(url, headers=first, timeout=5, etag_scope="1")
+
+        assert_that(other.json()["caller"], equal_to("Bearer ghs_second"))
+        assert_that(again.json()["caller"], equal_to("Bearer ghs_first"))
+        assert_that(stub_server.quota_used, equal_to(2))
+        assert_that(stub_server.not_modified, equal_to(1))
+
+    def test_unscoped_get_is_not_conditional(self, stub_server):
+        client = _make_client()
+        url = f"{stub_server.url}/repos/owner/repo"
+
+        client.get(url, headers={}, timeout=5)
+        client.get(url, headers={}, timeout=5)
+
+        assert_that(stub_server.quota_used, equal_to(2))
+
+    def test_connections_are_reused(self, stub_server):
+        client = _make_client()
+
+        for i in range(10):
+            client.get(f"{stub_server.url}/repos/owner/repo{i}", timeout=5)
+
+        assert_that(len(stub_server.connections), equal_to(1))
+
+    def test_retries_once_when_rate_limited(self, stub_server):
+        client = _make_client()
+        stub_server.rate_limit_next = 1
+
+        response = client.get(f"{stub_server.url}/repos/owner/repo", timeout=5)
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(len(stub_server.requests), equal_to(2))
+
+    async def test_does_not_wait_or_retry_on_an_event_loop(self, stub_server):
+        client = _make_client()
+        stub_server.rate_limit_next = 1
+
+        response = client.get(f"{stub_server.url}/repos/owner/repo", timeout=5)
+
+        assert_that(response.status_code, equal_to(403))
+        assert_that(len(stub_server.requests), equal_to(1))
+
+    def test_unscoped_get_tracks_rate_limit_under_its_scope(self, stub_server):
+        client = _make_client()
+
+        client.get(
+            f"{stub_server.url}/repos/owner/repo", timeout=5, rate_limit_scope="2"
+        )
+
+        assert_that(client.rate_limits.state("2").remaining, equal_to(4999))
+        assert_that(client.rate_limits.state(DEFAULT_SCOPE), equal_to(None))
+
+    @pytest.mark.performance
+    def test_multi_repo_reindex_wall_time_and_quota(self):
+        """
+        Re-index 20 repositories twice against a stub with 5ms latency.
+
+        Compares bare per-call connections against the pooled conditional client.
+        """
+        import requests
+
+        server = _StubGitHubServer(latency=0.005)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            paths = []
+            for i in range(20):
+                paths += [
+                    f"/repos/owner/repo{i}",
+                    f"/repos/owner/repo{i}/commits/main",
+                    f"/repos/owner/repo{i}/git/trees/sha?recursive=1",
+                ]
+
+            start = time.perf_counter()
+            for _ in range(2):
+                for path in paths:
+                    requests.get(f"{server.url}{path}", timeout=5)
+            bare_seconds = time.perf_counter() - start
+            bare_quota = server.quota_used
+
+            server.quota_used = 0
+            client = _make_client()
+            start = time.perf_counter()
+            for _ in range(2):
+                for path in paths:
+                    client.get(f"{server.url}{path}", timeout=5, etag_scope="1")
+            pooled_seconds = time.perf_counter() - start
+            pooled_quota = server.quota_used
+
+            print(
+                f"\nbare: {bare_seconds:.3f}s / {bare_quota} quota, "
+                f"pooled: {pooled_seconds:.3f}s / {pooled_quota} quota"
+            )
+            assert_that(pooled_quota, equal_to(len(paths)))
+            assert_that(bare_quota, equal_to(2 * len(paths)))
+            assert_that(pooled_seconds, less_than(bare_seconds * 1.5))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestAsyncGitHubHttpClient:
+    async def test_conditional_get_served_from_cache(self, stub_server):
+        client = AsyncGitHubHttpClient(
+            pool_maxsize=4,
+            etag_cache_max_bytes=1024 * 1024,
+            rate_limit_low_watermark=10,
+            rate_limit_max_backoff_seconds=0.01,
+        )
+        url = f"{stub_server.url}/repos/owner/repo/branches"
+        try:
+            first = await client.get(url, timeout=5, etag_scope="1")
+            second = await client.get(url, timeout=5, etag_scope="1")
+        finally:
+            await client.aclose()
+
+        assert_that(second.json(), equal_to(first.json()))
+        assert_that(stub_server.quota_used, equal_to(1))
+        assert_that(client.request_count, greater_than(1))
@@ -0,0 +1,58 @@
+from hamcrest import assert_that, equal_to, less_than
+from sqlalchemy.orm import Session
+
+from src.github_app.models import RepositoryFileIndex
+from src.models import GitHubInstallation, User
+
+
+class TestRepositoryFileIndexStorage:
+    def _create(self, session: Session, user: User, file_search_string: str):
+        installation = GitHubInstallation(user=user, installation_id="12345")
+        session.add(installation)
+        session.commit()
+
+        repo_index = RepositoryFileIndex(
+            github_installation_id=installation.id,
+            repository_full_name="owner/repo",
+            file_search_string=file_search_string,
+        )
+        session.add(repo_index)
+        session.commit()
+        return repo_index
+
+    def test_round_trips_through_compressed_column(self, session: Session, user: User):
+        paths = "\n".join(f"@src/components/module_{i}/index.ts" for i in range(2000))
+        repo_index = self._create(session, user, paths)
+
+        session.expire_all()
+        loaded = session.get(RepositoryFileIndex, repo_index.id)
+
+        assert_that(loaded.file_search_string, equal_to(paths))
+        assert_that(loaded.file_count, equal_to(2000))
+        assert_that(
+            len(loaded.compressed_file_search_string), less_than(len(paths) // 5)
+        )
+
+    def test_assignment_updates_count_and_decoded_value(
+        self, session: Session, user: User
+    ):
+        repo_index = self._create(session, user, "@a.py\n@b.py")
+
+        repo_index.file_search_string = "@c.py"
+        session.commit()
+        session.refresh(repo_index)
+
+        assert_that(repo_index.file_search_string, equal_to("@c.py"))
+        assert_that(repo_index.file_count, equal_to(1))
+        assert_that(
+            repr(repo_index),
+            equal_to("<RepositoryFileIndex(repository='owner/repo', files=1)>"),
+        )
+
+    def test_empty_index(self, session: Session, user: User):
+        repo_index = self._create(session, user, "")
+
+        session.refresh(repo_index)
+
+        assert_that(repo_index.file_search_string, equal_to(""))
+        assert_that(repo_index.file_count, equal_to(0))
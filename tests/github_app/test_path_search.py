@@ -0,0 +1,195 @@
+import random
+import string
+import time
+from unittest.mock import patch
+
+import pytest
+from hamcrest import assert_that, equal_to, less_than
+
+from src.github_app.path_search import (
+    BASENAME_PREFIX_MATCH,
+    FUZZY_MATCH,
+    SEGMENT_PREFIX_MATCH,
+    SUBSTRING_MATCH,
+    PathSearchIndex,
+    PathSearchIndexCache,
+    merge_ranked_paths,
+)
+
+PATHS = [
+    "@README.md",
+    "@docs/readme_extra.md",
+    "@src/components/Button.tsx",
+    "@src/components/ButtonGroup.tsx",
+    "@src/hooks/useButton.ts",
+    "@src/utils/strings.py",
+]
+
+
+class TestPathSearchIndex:
+    def test_ranks_basename_prefix_before_substring(self):
+        index = PathSearchIndex(PATHS)
+
+        results = index.search("button", 10)
+
+        assert_that(
+            results,
+            equal_to(
+                [
+                    (BASENAME_PREFIX_MATCH, 26, "@src/components/Button.tsx"),
+                    (BASENAME_PREFIX_MATCH, 31, "@src/components/ButtonGroup.tsx"),
+                    (SUBSTRING_MATCH, 23, "@src/hooks/useButton.ts"),
+                ]
+            ),
+        )
+
+    def test_segment_prefix_and_case_insensitivity(self):
+        index = PathSearchIndex(PATHS)
+
+        paths = [path for _, _, path in index.search("COMPONENTS/", 10)]
+
+        assert_that(
+            paths,
+            equal_to(["@src/components/Button.tsx", "@src/components/ButtonGroup.tsx"]),
+        )
+        assert_that(index.search("src", 1)[0][0], equal_to(SEGMENT_PREFIX_MATCH))
+
+    def test_query_with_leading_at_matches_line_start(self):
+        index = PathSearchIndex(PATHS)
+
+        results = index.search("@readme", 10)
+
+        assert_that(
+            results,
+            equal_to(
+                [
+                    (BASENAME_PREFIX_MATCH, 10, "@README.md"),
+                    (FUZZY_MATCH, 21, "@docs/readme_extra.md"),
+                ]
+            ),
+        )
+
+    def test_fuzzy_fallback(self):
+        index = PathSearchIndex(PATHS)
+
+        results = index.search("sutstr", 10)
+
+        assert_that(results, equal_to([(FUZZY_MATCH, 21, "@src/utils/strings.py")]))
+
+    def test_fuzzy_scan_is_linear_for_near_misses(self):
+        # A backtracking regex takes seconds on these; the scan must not
+        index = PathSearchIndex(["@" + "a" * 200 + str(n) for n in range(1000)])
+
+        start = time.perf_counter()
+        results = index.search("a" * 100 + "b", 10)
+
+        assert_that(results, equal_to([]))
+        assert_that(time.perf_counter() - start, less_than(0.5))
+
+    def test_limit_and_empty_query(self):
+        index = PathSearchIndex(PATHS)
+
+        assert_that(len(index.search("s", 2)), equal_to(2))
+        assert_that(index.search("   ", 10), equal_to([]))
+        assert_that(PathSearchIndex([]).search("a", 10), equal_to([]))
+
+    def test_prefix_matches_skip_the_substring_scan(self):
+        index = PathSearchIndex(PATHS)
+
+        with patch.object(
+            PathSearchIndex,
+            "_scan",
+            autospec=True,
+            side_effect=PathSearchIndex._scan,
+        ) as scan:
+            results = index.search("button", 2)
+            index.search("button", 3)
+
+        assert_that(
+            [path for _, _, path in results],
+            equal_to(["@src/components/Button.tsx", "@src/components/ButtonGroup.tsx"]),
+        )
+        scanned = [call.args[1] for call in scan.call_args_list]
+        assert_that(scanned.count("button"), equal_to(1))
+
+    def test_lowercase_paths_are_stored_once(self):
+        index = PathSearchIndex(["@src/app.py", "@src/lib.py"])
+
+        assert_that(index._haystack is index._paths, equal_to(True))
+        assert_that(index.search("lib", 1)[0][2], equal_to("@src/lib.py"))
+
+    def test_paths_that_lengthen_when_lowercased(self):
+        index = PathSearchIndex(["@docs/İstanbul.md", "@docs/Readme.md"])
+
+        assert_that(index.search("readme", 1)[0][2], equal_to("@docs/Readme.md"))
+        assert_that(index.search("docs/", 2)[0][2], equal_to("@docs/Readme.md"))
+
+    @pytest.mark.performance
+    def test_large_repository_search_is_fast(self):
+        random.seed(1)
+        dirs = ["src", "lib", "components", "utils", "tests", "api", "hooks"]
+        paths = sorted(
+            {
+                "@"
+                + "/".join(
+                    f"{random.choice(dirs)}{random.randint(0, 30)}"
+                    for _ in range(random.randint(1, 5))
+                )
+                + "/"
+                + "".join(random.choices(string.ascii_lowercase, k=8))
+                + random.choice([".py", ".ts", ".md"])
+                for _ in range(100_000)
+            }
+        )
+
+        start = time.perf_counter()
+        index = PathSearchIndex(paths)
+        build_seconds = time.perf_counter() - start
+
+        timings = {}
+        for query in ["src", "utils3/", ".md", "abcdef", "zzqx"]:
+            start = time.perf_counter()
+            index.search(query, 20)
+            timings[query] = time.perf_counter() - start
+
+        print(f"\nbuild: {build_seconds * 1000:.1f}ms, search: {timings}")
+        assert_that(build_seconds, less_than(1.0))
+        assert_that(max(timings.values()), less_than(0.25))
+
+
+class TestPathSearchIndexCache:
+    def test_rebuilds_only_when_version_changes(self):
+        cache = PathSearchIndexCache(max_entries=10)
+        loads = []
+
+        def load():
+            loads.append(1)
+            return "@a.py\n@b.py"
+
+        first = cache.get_or_build("repo", "sha1", load)
+        second = cache.get_or_build("repo", "sha1", load)
+        third = cache.get_or_build("repo", "sha2", load)
+
+        assert_that(second is first, equal_to(True))
+        assert_that(third is first, equal_to(False))
+        assert_that(len(loads), equal_to(2))
+
+    def test_evicts_least_recently_used(self):
+        cache = PathSearchIndexCache(max_entries=1)
+        cache.get_or_build("a", "v", lambda: "@a.py")
+        cache.get_or_build("b", "v", lambda: "@b.py")
+
+        assert_that(len(cache), equal_to(1))
+
+
+class TestMergeRankedPaths:
+    def test_merges_across_repositories(self):
+        merged = merge_ranked_paths(
+            [
+                ("owner/one", [(SUBSTRING_MATCH, 5, "@one/x")]),
+                ("owner/two", [(BASENAME_PREFIX_MATCH, 9, "@two/long")]),
+            ],
+            limit=1,
+        )
+
+        assert_that(merged, equal_to([("owner/two", "@two/long")]))
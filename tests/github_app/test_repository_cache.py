@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from fastapi import BackgroundTasks
+from hamcrest import assert_that, equal_to, has_length, none, not_none
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.github_app import repository_cache
+from src.github_app.repository_cache import (
+    get_installation_repositories,
+    refresh_installation_repositories,
+)
+from src.github_app.webhook_controller import handle_github_webhook
+from src.models import GitHubInstallation, User
+
+LIST_REPOSITORIES = (
+    "src.github_app.repository_cache.GitHubService.list_installation_repositories"
+)
+
+GITHUB_REPOSITORY = {
+    "id": 1,
+    "name": "repo",
+    "full_name": "owner/repo",
+    "private": True,
+    "description": "A repository",
+    "html_url": "https://github.com/owner/repo",
+    "updated_at": "2026-10-01T12:00:00Z",
+    "owner": {"login": "owner", "avatar_url": "https://example.com/a.png"},
+    "hooks_url": "https://api.github.com/repos/owner/repo/hooks",
+}
+
+
+@pytest.fixture
+def installation(session: Session, user: User) -> GitHubInstallation:
+    installation = GitHubInstallation(user=user, installation_id="12345")
+    session.add(installation)
+    session.commit()
+    yield installation
+    repository_cache._refreshes_in_flight.clear()
+
+
+class TestGetInstallationRepositories:
+    @patch(LIST_REPOSITORIES, return_value=[GITHUB_REPOSITORY])
+    def test_cold_cache_fetches_and_stores_listing(
+        self, mock_list, session: Session, installation: GitHubInstallation
+    ):
+        repositories = get_installation_repositories(installation, session)
+
+        mock_list.assert_called_once_with("12345")
+        assert_that(
+            repositories,
+            equal_to(
+                [
+                    {
+                        "id": 1,
+                        "name": "repo",
+                        "full_name": "owner/repo",
+                        "private": True,
+                        "description": "A repository",
+                        "html_url": "https://github.com/owner/repo",
+                        "updated_at": "2026-10-01T12:00:00Z",
+                        "owner": {"login": "owner"},
+                    }
+                ]
+            ),
+        )
+        session.refresh(installation)
+        assert_that(installation.repositories_cache, equal_to(repositories))
+        assert_that(installation.repositories_cached_at, not_none())
+
+    @patch(LIST_REPOSITORIES, side_effect=Exception("rate limited"))
+    def test_cold_cache_renders_empty_listing_when_github_fails(
+        self, mock_list, session: Session, installation: GitHubInstallation
+    ):
+        repositories = get_installation_repositories(installation, session)
+
+        assert_that(repositories, equal_to([]))
+        assert_that(installation.repositories_cache, none())
+
+    @patch(LIST_REPOSITORIES)
+    def test_fresh_cache_is_served_without_github(
+        self, mock_list, session: Session, installation: GitHubInstallation
+    ):
+        installation.repositories_cache = [{"name": "cached"}]
+        installation.repositories_cached_at = datetime.now()
+        background_tasks = BackgroundTasks()
+
+        repositories = get_installation_repositories(
+            installation, session, background_tasks
+        )
+
+        assert_that(repositories, equal_to([{"name": "cached"}]))
+        assert_that(background_tasks.tasks, has_length(0))
+        mock_list.assert_not_called()
+
+    @patch(LIST_REPOSITORIES)
+    def test_stale_cache_is_served_and_refreshed_once_in_background(
+        self, mock_list, session: Session, installation: GitHubInstallation
+    ):
+        installation.repositories_cache = [{"name": "cached"}]
+        installation.repositories_cached_at = datetime.now() - timedelta(
+            seconds=settings.github_repository_list_cache_ttl_seconds + 1
+        )
+        background_tasks = BackgroundTasks()
+
+        first = get_installation_repositories(installation, session, background_tasks)
+        get_installation_repositories(installation, session, background_tasks)
+
+        assert_that(first, equal_to([{"name": "cached"}]))
+        assert_that(background_tasks.tasks, has_length(1))
+        assert_that(background_tasks.tasks[0].args, equal_to(("12345",)))
+        mock_list.assert_not_called()
+
+
+class TestRefreshInstallationRepositories:
+    @patch(LIST_REPOSITORIES, side_effect=Exception("rate limited"))
+    def test_failed_refresh_keeps_stored_listing(
+        self, mock_list, session: Session, installation: GitHubInstallation
+    ):
+        installation.repositories_cache = [{"name": "cached"}]
+        session.commit()
+
+        result = refresh_installation_repositories(installation, session)
+
+        assert_that(result, none())
+        assert_that(installation.repositories_cache, equal_to([{"name": "cached"}]))
+
+    @patch("src.github_app.webhook_controller.index_repositories", return_value=0)
+    @patch(LIST_REPOSITORIES, return_value=[GITHUB_REPOSITORY])
+    def test_repositories_added_webhook_refreshes_listing(
+        self,
+        mock_list,
+        mock_index,
+        session: Session,
+        installation: GitHubInstallation,
+    ):
+        payload = {
+            "action": "added",
+            "installation": {"id": 12345},
+            "repositories_added": [{"full_name": "owner/repo"}],
+        }
+
+        handle_github_webhook(payload, "installation_repositories", session)
+
+        session.refresh(installation)
+        assert_that(installation.repositories_cache, has_length(1))
+        assert_that(
+            installation.repositories_cache[0]["full_name"], equal_to("owner/repo")
+        )
@@ -0,0 +1,215 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from hamcrest import assert_that, equal_to, is_, less_than, less_than_or_equal_to
+from sqlalchemy.orm import Session
+
+from src.github_app.http_client import async_github_http_client
+from src.github_app.models import RepositoryFileIndex
+from src.github_app.repository_indexer import (
+    close_indexing_loop,
+    fetch_repository_trees,
+    index_repositories,
+    run_sync,
+)
+from src.models import GitHubInstallation, User
+
+AUTH_HEADERS = {"Authorization": "Bearer ghs_test"}
+
+
+def _tree(*paths: str, commit_sha: str = "commit-sha") -> dict:
+    return {
+        "sha": "tree-sha",
+        "commit_sha": commit_sha,
+        "tree": [{"path": path, "type": "blob"} for path in paths],
+    }
+
+
+@pytest.fixture
+def installation(session: Session, user: User) -> GitHubInstallation:
+    installation = GitHubInstallation(user=user, installation_id="12345")
+    session.add(installation)
+    session.commit()
+    return installation
+
+
+@pytest.fixture(autouse=True)
+def auth_headers():
+    with patch(
+        "src.github_app.github_service.GitHubService._get_auth_headers",
+        return_value=AUTH_HEADERS,
+    ) as mock_headers:
+        yield mock_headers
+
+
+class TestIndexRepositories:
+    @patch("src.github_app.github_service.GitHubService.get_file_tree_async")
+    def test_indexes_all_repositories_in_one_batch(
+        self, mock_get_tree, session: Session, installation, auth_headers
+    ):
+        mock_get_tree.side_effect = [
+            _tree("b.py", "a.py", commit_sha="sha-1"),
+            _tree("README.md", commit_sha="sha-2"),
+        ]
+
+        count = index_repositories(
+            "12345",
+            [
+                {"full_name": "owner/one", "default_branch": "main"},
+                {"full_name": "owner/two"},
+            ],
+            session,
+        )
+
+        assert_that(count, equal_to(2))
+        auth_headers.assert_called_once_with("12345")
+        mock_get_tree.assert_any_call("12345", "owner", "one", AUTH_HEADERS, ref="main")
+        mock_get_tree.assert_any_call("12345", "owner", "two", AUTH_HEADERS, ref=None)
+
+        indexes = {
+            index.repository_full_name: index
+            for index in session.query(RepositoryFileIndex).all()
+        }
+        assert_that(
+            indexes["owner/one"].file_search_string, equal_to("@one/a.py\n@one/b.py")
+        )
+        assert_that(indexes["owner/one"].file_count, equal_to(2))
+        assert_that(indexes["owner/one"].uses_repo_prefix, equal_to(True))
+        assert_that(indexes["owner/one"].last_indexed_commit_sha, equal_to("sha-1"))
+        assert_that(indexes["owner/two"].file_search_string, equal_to("@two/README.md"))
+
+    @patch("src.github_app.github_service.GitHubService.get_file_tree_async")
+    def test_single_repository_uses_plain_prefix(
+        self, mock_get_tree, session: Session, installation
+    ):
+        mock_get_tree.return_value = _tree("app.py")
+
+        index_repositories("12345", [{"full_name": "owner/one"}], session)
+
+        repo_index = session.query(RepositoryFileIndex).one()
+        assert_that(repo_index.file_search_string, equal_to("@app.py"))
+        assert_that(repo_index.uses_repo_prefix, equal_to(False))
+
+    @patch("src.github_app.github_service.GitHubService.get_file_tree_async")
+    def test_existing_indexes_are_skipped_and_failures_left_out(
+        self, mock_get_tree, session: Session, installation
+    ):
+        session.add(
+            RepositoryFileIndex(
+                github_installation_id=installation.id,
+                repository_full_name="owner/existing",
+                file_search_string="@keep.py",
+            )
+        )
+        session.commit()
+        mock_get_tree.side_effect = [_tree("new.py"), {"error": "Not Found"}]
+
+        count = index_repositories(
+            "12345",
+            [
+                {"full_name": "owner/existing"},
+                {"full_name": "owner/new"},
+                {"full_name": "owner/broken"},
+            ],
+            session,
+        )
+
+        assert_that(count, equal_to(2))
+        assert_that(mock_get_tree.call_count, equal_to(2))
+        names = sorted(
+            name for (name,) in session.query(RepositoryFileIndex.repository_full_name)
+        )
+        assert_that(names, equal_to(["owner/existing", "owner/new"]))
+
+    def test_unknown_installation(self, session: Session):
+        assert_that(
+            index_repositories("missing", [{"full_name": "owner/one"}], session),
+            equal_to(0),
+        )
+
+
+class TestFetchRepositoryTrees:
+    def test_concurrency_is_capped(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_get_tree(installation_id, owner, name, headers, ref=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _tree(f"{name}.py")
+
+        repositories = [{"full_name": f"owner/repo{i}"} for i in range(12)]
+        with patch(
+            "src.github_app.github_service.GitHubService.get_file_tree_async",
+            side_effect=fake_get_tree,
+        ):
+            trees = run_sync(
+                fetch_repository_trees(
+                    "12345", repositories, AUTH_HEADERS, concurrency=3
+                )
+            )
+
+        assert_that(len(trees), equal_to(12))
+        assert_that(
+            [tree.repo_name for tree in trees],
+            equal_to([f"repo{i}" for i in range(12)]),
+        )
+        assert_that(max_in_flight, less_than_or_equal_to(3))
+
+    @pytest.mark.performance
+    def test_parallel_fetch_wall_time(self):
+        """Index 40 repositories with 50ms of GitHub latency each."""
+
+        async def slow_get_tree(installation_id, owner, name, headers, ref=None):
+            await asyncio.sleep(0.05)
+            return _tree("a.py")
+
+        repositories = [{"full_name": f"owner/repo{i}"} for i in range(40)]
+        with patch(
+            "src.github_app.github_service.GitHubService.get_file_tree_async",
+            side_effect=slow_get_tree,
+        ):
+            start = time.perf_counter()
+            run_sync(
+                fetch_repository_trees(
+                    "12345", repositories, AUTH_HEADERS, concurrency=8
+                )
+            )
+            elapsed = time.perf_counter() - start
+
+        print(f"\n40 repositories: {elapsed:.3f}s (sequential would be ~2.0s)")
+        assert_that(elapsed, less_than(0.6))
+
+
+class TestRunSync:
+    def test_runs_without_event_loop(self):
+        async def answer():
+            return 42
+
+        assert_that(run_sync(answer()), equal_to(42))
+
+    async def test_refuses_to_block_a_running_event_loop(self):
+        async def answer():
+            return 42
+
+        with pytest.raises(RuntimeError):
+            run_sync(answer())
+
+    def test_shared_client_lives_until_the_loop_is_closed(self):
+        async def client():
+            return async_github_http_client.client
+
+        first = run_sync(client())
+        second = run_sync(client())
+
+        assert_that(second, is_(first))
+        assert_that(first.is_closed, equal_to(False))
+
+        asyncio.run(close_indexing_loop())
+
+        assert_that(first.is_closed, equal_to(True))
@@ -9,18 +9,18 @@ from fastapi.responses import JSONResponse, RedirectResponse
 from hamcrest import assert_that, equal_to
 
 from src.config import settings
+from src.github_app.models import GitHubWebhookDelivery, WebhookDeliveryStatus
 
 
-@pytest.mark.skip("Test is failing")
-@patch("src.github_app.controller.handle_github_webhook")
-def test_github_webhook_valid_signature(mock_handle_webhook, test_client):
+@patch("src.github_app.webhook_queue.handle_github_webhook")
+def test_github_webhook_valid_signature(mock_handle_webhook, test_client, session):
     mock_handle_webhook.return_value = Response("Success", status_code=200)
 
     # Create payload and signature
     payload = {
-        "action": "opened",
-        "repositories": [{"full_name": "test/repo"}],
-        "installation": {"id": "1234"},
+        "action": "added",
+        "repositories_added": [{"full_name": "test/repo"}],
+        "installation": {"id": 1234},
     }
     payload_bytes = json.dumps(payload).encode()
     signature = (
@@ -33,20 +33,24 @@ def test_github_webhook_valid_signature(mock_handle_webhook, test_client):
     # Send request
     response = test_client.post(
         "/github/webhook",
-        json=payload,
-        headers={"X-Hub-Signature-256": signature, "X-GitHub-Event": "push"},
+        content=payload_bytes,
+        headers={
+            "Content-Type": "application/json",
+            "X-Hub-Signature-256": signature,
+            "X-GitHub-Event": "installation_repositories",
+            "X-GitHub-Delivery": "delivery-1",
+        },
         follow_redirects=False,
     )
 
-    # Assertions
-    assert_that(response.status_code, equal_to(200))
-    # Check that the controller function was called with the parsed payload object, event type, and db session
+    # The delivery is acknowledged, then processed by the background task
+    # (which the test client runs before returning)
+    assert_that(response.status_code, equal_to(202))
     mock_handle_webhook.assert_called_once_with(
-        # Payload is now converted from dict to GithubWebhookPayload in the view
-        ANY,  # This corresponds to the GithubWebhookPayload object
-        "push",  # This corresponds to x_github_event
-        ANY,  # This corresponds to the db session
+        payload, "installation_repositories", ANY
     )
+    delivery = session.query(GitHubWebhookDelivery).one()
+    assert_that(delivery.status, equal_to(WebhookDeliveryStatus.PROCESSED))
 
 
 @pytest.mark.skip("Test is failing")
@@ -468,3 +472,66 @@ def test_get_github_installation_status_internal_error(
     assert_that(response.status_code, equal_to(500))
     assert_that(response.json()["detail"], equal_to("Internal server error"))
     mock_controller_func.assert_called_once()
+
+
+def test_get_all_file_search_strings_not_modified(test_client, session, user):
+    """Test that a matching If-None-Match skips sending the full list"""
+    from src.models import GitHubInstallation, RepositoryFileIndex
+
+    installation = GitHubInstallation(user=user, installation_id="12345")
+    session.add(installation)
+    session.commit()
+    session.add(
+        RepositoryFileIndex(
+            github_installation_id=installation.id,
+            repository_full_name="owner/repo",
+            file_search_string="@README.md",
+            last_indexed_commit_sha="abc123",
+        )
+    )
+    session.commit()
+
+    first = test_client.get("/api/github/file-search-strings")
+    etag = first.headers["ETag"]
+    second = test_client.get(
+        "/api/github/file-search-strings", headers={"If-None-Match": etag}
+    )
+
+    assert_that(first.status_code, equal_to(200))
+    assert_that(second.status_code, equal_to(304))
+    assert_that(second.headers["ETag"], equal_to(etag))
+    assert_that(second.content, equal_to(b""))
+
+
+@patch("src.github_app.controller.search_file_paths_for_user")
+def test_search_file_paths_success(mock_controller_func, test_client):
+    """Test the server-side file path autocomplete endpoint"""
+    from src.github_app.views import FilePathMatch, FilePathSearchResponse
+
+    mock_controller_func.return_value = FilePathSearchResponse(
+        query="main",
+        matches=[FilePathMatch(repository_full_name="owner/repo", path="@main.py")],
+        success=True,
+    )
+
+    response = test_client.get("/api/github/file-search?q=main&limit=5")
+
+    assert_that(response.status_code, equal_to(200))
+    assert_that(
+        response.json()["matches"],
+        equal_to([{"repository_full_name": "owner/repo", "path": "@main.py"}]),
+    )
+    mock_controller_func.assert_called_once_with(
+        ANY, "main", ANY, repository_full_name=None, limit=5
+    )
+
+
+def test_search_file_paths_requires_query(test_client):
+    """Test that the autocomplete endpoint validates its query"""
+    response = test_client.get("/api/github/file-search?q=")
+
+    assert_that(response.status_code, equal_to(422))
+
+    response = test_client.get("/api/github/file-search", params={"q": "a" * 257})
+
+    assert_that(response.status_code, equal_to(422))
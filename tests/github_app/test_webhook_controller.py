@@ -248,14 +248,14 @@ class TestHandleInstallationEvent:
                 "src.github_app.webhook_controller.GitHubService.get_user_repositories"
             ) as mock_get_repos,
             patch(
-                "src.github_app.webhook_controller._create_repository_file_index"
-            ) as mock_create_index,
+                "src.github_app.webhook_controller.index_repositories"
+            ) as mock_index_repositories,
             patch(
                 "src.github_app.webhook_controller._update_prefixing_strategy"
             ) as mock_update_prefixing,
         ):
             mock_get_repos.return_value = mock_repositories
-            mock_create_index.return_value = True
+            mock_index_repositories.return_value = 2
 
             response = handle_installation_event(payload, session)
 
@@ -266,13 +266,9 @@ class TestHandleInstallationEvent:
             # Verify GitHub API was called
             mock_get_repos.assert_called_once_with("12345")
 
-            # Verify helper functions were called
-            assert mock_create_index.call_count == 2
-            mock_create_index.assert_any_call(
-                "12345", "owner/repo1", session, commit=False
-            )
-            mock_create_index.assert_any_call(
-                "12345", "owner/repo2", session, commit=False
+            # Verify all repositories were indexed in one batch
+            mock_index_repositories.assert_called_once_with(
+                "12345", mock_repositories, session
             )
             mock_update_prefixing.assert_called_once_with("12345", session)
 
@@ -363,13 +359,13 @@ class TestHandleInstallationRepositoriesEvent:
         # Mock the helper functions to avoid GitHub API calls
         with (
             patch(
-                "src.github_app.webhook_controller._create_repository_file_index"
-            ) as mock_create_index,
+                "src.github_app.webhook_controller.index_repositories"
+            ) as mock_index_repositories,
             patch(
                 "src.github_app.webhook_controller._update_prefixing_strategy"
             ) as mock_update_prefixing,
         ):
-            mock_create_index.return_value = True
+            mock_index_repositories.return_value = 2
 
             response = handle_installation_repositories_event(payload, session)
 
@@ -753,6 +749,159 @@ class TestHandlePushEvent:
                 mock_file_tree_response, "repo1", True
             )
 
+    def _create_indexed_repo(self, session: Session, user: User) -> RepositoryFileIndex:
+        installation = GitHubInstallation(user=user, installation_id="12345")
+        session.add(installation)
+        session.commit()
+
+        repo_index = RepositoryFileIndex(
+            github_installation_id=installation.id,
+            repository_full_name="owner/repo",
+            file_search_string="@README.md\n@src/old.py\n@src/keep.py",
+            last_indexed_commit_sha="old_commit_sha",
+        )
+        session.add(repo_index)
+        session.commit()
+        return repo_index
+
+    def test_push_event_applies_commits_incrementally(
+        self, session: Session, user: User
+    ):
+        """Test that a complete push payload updates the index without GitHub calls."""
+        repo_index = self._create_indexed_repo(session, user)
+
+        payload = {
+            "repository": {"full_name": "owner/repo", "default_branch": "main"},
+            "before": "old_commit_sha",
+            "after": "new_commit_sha",
+            "ref": "refs/heads/main",
+            "commits": [
+                {"added": ["src/new.py"], "removed": ["src/old.py"], "modified": []},
+                {"added": ["docs/guide.md"], "removed": [], "modified": ["README.md"]},
+            ],
+        }
+
+        with patch(
+            "src.github_app.webhook_controller.GitHubService.get_file_tree"
+        ) as mock_get_file_tree:
+            response = handle_push_event(payload, session)
+
+            assert response.status_code == 200
+            mock_get_file_tree.assert_not_called()
+
+        session.refresh(repo_index)
+        assert repo_index.last_indexed_commit_sha == "new_commit_sha"
+        assert repo_index.file_search_string == (
+            "@README.md\n@docs/guide.md\n@src/keep.py\n@src/new.py"
+        )
+
+    def test_push_event_modifying_files_leaves_index_untouched(
+        self, session: Session, user: User
+    ):
+        """Test that a push that only modifies files never decompresses the index."""
+        repo_index = self._create_indexed_repo(session, user)
+        compressed = repo_index.compressed_file_search_string
+        session.expire_all()
+
+        payload = {
+            "repository": {"full_name": "owner/repo", "default_branch": "main"},
+            "before": "old_commit_sha",
+            "after": "new_commit_sha",
+            "ref": "refs/heads/main",
+            "commits": [{"added": [], "removed": [], "modified": ["README.md"]}],
+        }
+
+        with patch(
+            "src.github_app.models.decompress_file_search_string"
+        ) as mock_decompress:
+            response = handle_push_event(payload, session)
+
+            assert response.status_code == 200
+            mock_decompress.assert_not_called()
+
+        session.refresh(repo_index)
+        assert repo_index.last_indexed_commit_sha == "new_commit_sha"
+        assert repo_index.compressed_file_search_string == compressed
+
+    def test_push_event_forced_push_falls_back_to_full_reindex(
+        self, session: Session, user: User
+    ):
+        """Test that a force-push re-fetches the full tree."""
+        repo_index = self._create_indexed_repo(session, user)
+
+        payload = {
+            "repository": {"full_name": "owner/repo", "default_branch": "main"},
+            "before": "old_commit_sha",
+            "after": "new_commit_sha",
+            "ref": "refs/heads/main",
+            "forced": True,
+            "commits": [{"added": ["src/new.py"], "removed": [], "modified": []}],
+        }
+
+        with patch(
+            "src.github_app.webhook_controller.GitHubService.get_file_tree"
+        ) as mock_get_file_tree:
+            mock_get_file_tree.return_value = {
+                "tree": [{"path": "only.py", "type": "blob"}]
+            }
+
+            response = handle_push_event(payload, session)
+
+            assert response.status_code == 200
+            mock_get_file_tree.assert_called_once()
+
+        session.refresh(repo_index)
+        assert repo_index.file_search_string == "@only.py"
+
+    def test_push_event_base_mismatch_falls_back_to_full_reindex(
+        self, session: Session, user: User
+    ):
+        """Test that a push not starting at the indexed commit re-fetches the tree."""
+        self._create_indexed_repo(session, user)
+
+        payload = {
+            "repository": {"full_name": "owner/repo", "default_branch": "main"},
+            "before": "some_other_sha",
+            "after": "new_commit_sha",
+            "ref": "refs/heads/main",
+            "commits": [{"added": ["src/new.py"], "removed": [], "modified": []}],
+        }
+
+        with patch(
+            "src.github_app.webhook_controller.GitHubService.get_file_tree"
+        ) as mock_get_file_tree:
+            mock_get_file_tree.return_value = {"tree": []}
+
+            handle_push_event(payload, session)
+
+            mock_get_file_tree.assert_called_once()
+
+    def test_push_event_non_default_branch_is_ignored(
+        self, session: Session, user: User
+    ):
+        """Test that pushes to other branches leave the index untouched."""
+        repo_index = self._create_indexed_repo(session, user)
+
+        payload = {
+            "repository": {"full_name": "owner/repo", "default_branch": "main"},
+            "before": "old_commit_sha",
+            "after": "feature_sha",
+            "ref": "refs/heads/feature",
+            "commits": [{"added": ["src/new.py"], "removed": [], "modified": []}],
+        }
+
+        with patch(
+            "src.github_app.webhook_controller.GitHubService.get_file_tree"
+        ) as mock_get_file_tree:
+            response = handle_push_event(payload, session)
+
+            assert response.status_code == 200
+            assert "non-default branch" in response.body.decode()
+            mock_get_file_tree.assert_not_called()
+
+        session.refresh(repo_index)
+        assert repo_index.last_indexed_commit_sha == "old_commit_sha"
+
 
 # Tests for new helper functions and enhanced webhook handlers
 
@@ -826,14 +975,14 @@ class TestInstallationSuspensionHelpers:
                 "src.github_app.webhook_controller.GitHubService.get_user_repositories"
             ) as mock_get_repos,
             patch(
-                "src.github_app.webhook_controller._create_repository_file_index"
-            ) as mock_create_index,
+                "src.github_app.webhook_controller.index_repositories"
+            ) as mock_index_repositories,
             patch(
                 "src.github_app.webhook_controller._update_prefixing_strategy"
             ) as mock_update_prefixing,
         ):
             mock_get_repos.return_value = mock_repositories
-            mock_create_index.return_value = True
+            mock_index_repositories.return_value = 2
 
             response = _handle_installation_unsuspended(12345, session)
 
@@ -843,7 +992,9 @@ class TestInstallationSuspensionHelpers:
 
             # Verify helper functions were called correctly
             mock_get_repos.assert_called_once_with("12345")
-            assert mock_create_index.call_count == 2
+            mock_index_repositories.assert_called_once_with(
+                "12345", mock_repositories, session
+            )
             mock_update_prefixing.assert_called_once_with("12345", session)
 
     def test_handle_installation_unsuspended_not_found(self, session: Session):
@@ -1039,67 +1190,64 @@ class TestRepositoryFileIndexHelpers:
         session.commit()
         session.refresh(github_installation)
 
-        # Create multiple repository file indexes
+        # Create multiple repository file indexes, one still single-repo prefixed
         repo_index1 = RepositoryFileIndex(
             github_installation_id=github_installation.id,
             repository_full_name="owner/repo1",
-            file_search_string="@old_file1.py",
+            file_search_string="@README.md\n@src/main.py",
+            uses_repo_prefix=False,
         )
         repo_index2 = RepositoryFileIndex(
             github_installation_id=github_installation.id,
             repository_full_name="owner/repo2",
-            file_search_string="@old_file2.py",
+            file_search_string="@repo2/src/test.py",
+            uses_repo_prefix=True,
         )
         session.add_all([repo_index1, repo_index2])
         session.commit()
 
-        # Mock GitHub API responses
-        mock_file_tree_response1 = {
-            "tree": [{"path": "src/main.py", "type": "blob"}],
-            "sha": "abc123",
-        }
-        mock_file_tree_response2 = {
-            "tree": [{"path": "src/test.py", "type": "blob"}],
-            "sha": "def456",
-        }
-
-        with (
-            patch(
-                "src.github_app.webhook_controller.GitHubService.get_file_tree"
-            ) as mock_get_file_tree,
-            patch(
-                "src.github_app.webhook_controller.GitHubService.generate_file_search_string"
-            ) as mock_generate_search_string,
-        ):
-            # Mock file tree responses for each repo
-            mock_get_file_tree.side_effect = [
-                mock_file_tree_response1,
-                mock_file_tree_response2,
-            ]
-            # Mock search string generation with multi-repo prefix
-            mock_generate_search_string.side_effect = [
-                "@repo1/src/main.py",
-                "@repo2/src/test.py",
-            ]
-
+        with patch(
+            "src.github_app.webhook_controller.GitHubService.get_file_tree"
+        ) as mock_get_file_tree:
             # Update prefixing strategy
             result = _update_prefixing_strategy("12345", session)
             assert result is True
 
-            # Verify prefixing was updated (multi-repo format)
-            session.refresh(repo_index1)
-            session.refresh(repo_index2)
-            assert repo_index1.file_search_string == "@repo1/src/main.py"
-            assert repo_index2.file_search_string == "@repo2/src/test.py"
+            # Verify prefixes were re-derived locally without GitHub calls
+            mock_get_file_tree.assert_not_called()
 
-            # Verify generate_file_search_string was called with use_repo_prefix=True
-            assert mock_generate_search_string.call_count == 2
-            mock_generate_search_string.assert_any_call(
-                mock_file_tree_response1, "repo1", True
-            )
-            mock_generate_search_string.assert_any_call(
-                mock_file_tree_response2, "repo2", True
-            )
+        # Verify prefixing was updated (multi-repo format)
+        session.refresh(repo_index1)
+        session.refresh(repo_index2)
+        assert repo_index1.file_search_string == "@repo1/README.md\n@repo1/src/main.py"
+        assert repo_index1.uses_repo_prefix is True
+        assert repo_index2.file_search_string == "@repo2/src/test.py"
+
+    def test_update_prefixing_strategy_back_to_single_repo(
+        self, session: Session, user: User
+    ):
+        """Test that a lone remaining repository drops its @RepoName/ prefix."""
+        from src.github_app.webhook_controller import _update_prefixing_strategy
+
+        github_installation = GitHubInstallation(user=user, installation_id="12345")
+        session.add(github_installation)
+        session.commit()
+
+        repo_index = RepositoryFileIndex(
+            github_installation_id=github_installation.id,
+            repository_full_name="owner/repo1",
+            file_search_string="@repo1/README.md\n@repo1/src/main.py",
+            uses_repo_prefix=True,
+        )
+        session.add(repo_index)
+        session.commit()
+
+        result = _update_prefixing_strategy("12345", session)
+
+        assert result is True
+        session.refresh(repo_index)
+        assert repo_index.file_search_string == "@README.md\n@src/main.py"
+        assert repo_index.uses_repo_prefix is False
 
 
 class TestEnhancedWebhookHandlers:
@@ -1122,13 +1270,13 @@ class TestEnhancedWebhookHandlers:
 
         with (
             patch(
-                "src.github_app.webhook_controller._create_repository_file_index"
-            ) as mock_create_index,
+                "src.github_app.webhook_controller.index_repositories"
+            ) as mock_index_repositories,
             patch(
                 "src.github_app.webhook_controller._update_prefixing_strategy"
             ) as mock_update_prefixing,
         ):
-            mock_create_index.return_value = True
+            mock_index_repositories.return_value = 2
 
             response = _handle_repositories_added(12345, repositories, session)
 
@@ -1136,10 +1284,10 @@ class TestEnhancedWebhookHandlers:
             assert response.status_code == 200
             assert "2/2 repositories processed successfully" in response.body.decode()
 
-            # Verify helper functions were called
-            assert mock_create_index.call_count == 2
-            mock_create_index.assert_any_call("12345", "owner/repo1", session)
-            mock_create_index.assert_any_call("12345", "owner/repo2", session)
+            # Verify all repositories were indexed in one batch
+            mock_index_repositories.assert_called_once_with(
+                "12345", repositories, session
+            )
             mock_update_prefixing.assert_called_once_with("12345", session)
 
     def test_handle_repositories_removed_success(self, session: Session, user: User):
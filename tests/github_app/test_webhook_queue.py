@@ -0,0 +1,348 @@
+import hashlib
+import hmac
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from fastapi import Response
+from hamcrest import assert_that, equal_to, has_length
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.github_app.models import GitHubWebhookDelivery, WebhookDeliveryStatus
+from src.github_app.webhook_queue import (
+    coalesce_push_payloads,
+    drain_webhook_queue,
+    enqueue_webhook_delivery,
+    process_pending_webhook_deliveries,
+    purge_old_webhook_deliveries,
+)
+
+
+def _push_payload(before: str, after: str, files: list) -> dict:
+    return {
+        "repository": {"full_name": "owner/repo"},
+        "before": before,
+        "after": after,
+        "ref": "refs/heads/main",
+        "commits": [{"id": after, "added": files, "removed": [], "modified": []}],
+    }
+
+
+def _deliveries(session: Session):
+    return (
+        session.query(GitHubWebhookDelivery)
+        .order_by(GitHubWebhookDelivery.received_at)
+        .all()
+    )
+
+
+class TestEnqueueWebhookDelivery:
+    def test_enqueue_persists_pending_delivery(self, session: Session):
+        payload = _push_payload("a", "b", ["x.py"])
+
+        queued = enqueue_webhook_delivery("delivery-1", "push", payload, session)
+
+        assert_that(queued, equal_to(True))
+        deliveries = _deliveries(session)
+        assert_that(deliveries, has_length(1))
+        assert_that(deliveries[0].status, equal_to(WebhookDeliveryStatus.PENDING))
+        assert_that(deliveries[0].repository_full_name, equal_to("owner/repo"))
+        assert_that(deliveries[0].payload, equal_to(payload))
+
+    def test_duplicate_delivery_is_ignored(self, session: Session):
+        payload = _push_payload("a", "b", ["x.py"])
+
+        enqueue_webhook_delivery("delivery-1", "push", payload, session)
+        queued = enqueue_webhook_delivery("delivery-1", "push", payload, session)
+
+        assert_that(queued, equal_to(False))
+        assert_that(_deliveries(session), has_length(1))
+
+    def test_non_push_events_have_no_repository_key(self, session: Session):
+        enqueue_webhook_delivery(
+            "delivery-1",
+            "repository",
+            {"action": "deleted", "repository": {"full_name": "owner/repo"}},
+            session,
+        )
+
+        assert_that(_deliveries(session)[0].repository_full_name, equal_to(None))
+
+
+class TestProcessPendingWebhookDeliveries:
+    @patch("src.github_app.webhook_queue.handle_github_webhook")
+    def test_pushes_are_coalesced_per_repository(self, mock_handle, session: Session):
+        mock_handle.return_value = Response("ok", status_code=200)
+        for i, sha in enumerate(["b", "c", "d"]):
+            enqueue_webhook_delivery(
+                f"delivery-{i}",
+                "push",
+                _push_payload(chr(ord(sha) - 1), sha, [f"{sha}.py"]),
+                session,
+            )
+
+        claimed = process_pending_webhook_deliveries(session)
+
+        assert_that(claimed, equal_to(3))
+        assert_that(mock_handle.call_count, equal_to(1))
+        payload, event_type, _ = mock_handle.call_args.args
+        assert_that(event_type, equal_to("push"))
+        assert_that(payload["before"], equal_to("a"))
+        assert_that(payload["after"], equal_to("d"))
+        assert_that(payload["commits"], has_length(3))
+
+        statuses = [delivery.status for delivery in _deliveries(session)]
+        assert_that(
+            statuses,
+            equal_to(
+                [
+                    WebhookDeliveryStatus.SUPERSEDED,
+                    WebhookDeliveryStatus.SUPERSEDED,
+                    WebhookDeliveryStatus.PROCESSED,
+                ]
+            ),
+        )
+
+    @patch("src.github_app.webhook_queue.handle_github_webhook")
+    def test_pushes_to_other_branches_are_not_coalesced(
+        self, mock_handle, session: Session
+    ):
+        mock_handle.return_value = Response("ok", status_code=200)
+        default_push = _push_payload("a", "b", ["b.py"])
+        default_push["repository"]["default_branch"] = "main"
+        feature_push = _push_payload("x", "y", ["y.py"])
+        feature_push["repository"]["default_branch"] = "main"
+        feature_push["ref"] = "refs/heads/feature"
+        enqueue_webhook_delivery("delivery-1", "push", default_push, session)
+        enqueue_webhook_delivery("delivery-2", "push", feature_push, session)
+        enqueue_webhook_delivery(
+            "delivery-3", "push", _push_payload("b", "c", ["c.py"]), session
+        )
+
+        process_pending_webhook_deliveries(session)
+
+        handled = [
+            (call.args[0]["ref"], call.args[0]["before"], call.args[0]["after"])
+            for call in mock_handle.call_args_list
+        ]
+        assert_that(
+            sorted(handled),
+            equal_to([("refs/heads/feature", "x", "y"), ("refs/heads/main", "a", "c")]),
+        )
+        assert_that(
+            [delivery.status for delivery in _deliveries(session)],
+            equal_to(
+                [
+                    WebhookDeliveryStatus.SUPERSEDED,
+                    WebhookDeliveryStatus.PROCESSED,
+                    WebhookDeliveryStatus.PROCESSED,
+                ]
+            ),
+        )
+        assert_that(_deliveries(session)[1].repository_full_name, equal_to(None))
+
+    @patch("src.github_app.webhook_queue.handle_github_webhook")
+    def test_other_events_are_processed_individually(
+        self, mock_handle, session: Session
+    ):
+        mock_handle.return_value = Response("ok", status_code=200)
+        enqueue_webhook_delivery(
+            "delivery-1", "installation", {"action": "created"}, session
+        )
+        enqueue_webhook_delivery(
+            "delivery-2", "installation", {"action": "suspend"}, session
+        )
+
+        process_pending_webhook_deliveries(session)
+
+        assert_that(mock_handle.call_count, equal_to(2))
+        assert_that(
+            [delivery.status for delivery in _deliveries(session)],
+            equal_to([WebhookDeliveryStatus.PROCESSED] * 2),
+        )
+
+    @patch("src.github_app.webhook_queue.handle_github_webhook")
+    def test_deliveries_are_processed_in_received_order(
+        self, mock_handle, session: Session
+    ):
+        mock_handle.return_value = Response("ok", status_code=200)
+        enqueue_webhook_delivery(
+            "delivery-1", "push", _push_payload("a", "b", ["b.py"]), session
+        )
+        enqueue_webhook_delivery(
+            "delivery-2",
+            "installation_repositories",
+            {
+                "action": "removed",
+                "repositories_removed": [{"full_name": "owner/repo"}],
+            },
+            session,
+        )
+        enqueue_webhook_delivery(
+            "delivery-3", "push", _push_payload("b", "c", ["c.py"]), session
+        )
+
+        process_pending_webhook_deliveries(session)
+
+        handled = [
+            (call.args[1], call.args[0].get("after"))
+            for call in mock_handle.call_args_list
+        ]
+        assert_that(
+            handled,
+            equal_to(
+                [("push", "b"), ("installation_repositories", None), ("push", "c")]
+            ),
+        )
+        assert_that(
+            [delivery.status for delivery in _deliveries(session)],
+            equal_to([WebhookDeliveryStatus.PROCESSED] * 3),
+        )
+
+    @patch("src.github_app.webhook_queue.handle_github_webhook")
+    def test_failed_delivery_is_retried_then_marked_failed(
+        self, mock_handle, session: Session
+    ):
+        mock_handle.return_value = Response("boom", status_code=500)
+        enqueue_webhook_delivery(
+            "delivery-1", "installation", {"action": "created"}, session
+        )
+
+        drain_webhook_queue(session)
+
+        delivery = _deliveries(session)[0]
+        assert_that(
+            mock_handle.call_count, equal_to(settings.github_webhook_max_attempts)
+        )
+        assert_that(delivery.status, equal_to(WebhookDeliveryStatus.FAILED))
+        assert_that(delivery.error, equal_to("boom"))
+
+    @patch("src.github_app.webhook_queue.handle_github_webhook")
+    def test_older_push_is_superseded_by_processed_newer_push(
+        self, mock_handle, session: Session
+    ):
+        mock_handle.return_value = Response("ok", status_code=200)
+        now = datetime.now()
+        session.add_all(
+            [
+                GitHubWebhookDelivery(
+                    delivery_id="old",
+                    event_type="push",
+                    payload=_push_payload("a", "b", []),
+                    repository_full_name="owner/repo",
+                    status=WebhookDeliveryStatus.PENDING,
+                    received_at=now - timedelta(seconds=10),
+                ),
+                GitHubWebhookDelivery(
+                    delivery_id="new",
+                    event_type="push",
+                    payload=_push_payload("b", "c", []),
+                    repository_full_name="owner/repo",
+                    status=WebhookDeliveryStatus.PROCESSED,
+                    received_at=now,
+                ),
+            ]
+        )
+        session.commit()
+
+        process_pending_webhook_deliveries(session)
+
+        mock_handle.assert_not_called()
+        assert_that(
+            _deliveries(session)[0].status, equal_to(WebhookDeliveryStatus.SUPERSEDED)
+        )
+
+    def test_empty_queue(self, session: Session):
+        assert_that(process_pending_webhook_deliveries(session), equal_to(0))
+
+
+class TestCoalescePushPayloads:
+    def test_single_payload_is_returned_unchanged(self):
+        payload = _push_payload("a", "b", ["x.py"])
+
+        assert_that(coalesce_push_payloads([payload]), equal_to(payload))
+
+    def test_forced_push_anywhere_marks_result_forced(self):
+        first = _push_payload("a", "b", [])
+        second = {**_push_payload("b", "c", []), "forced": True}
+
+        merged = coalesce_push_payloads([first, second])
+
+        assert_that(merged["forced"], equal_to(True))
+        assert_that(merged["commits_truncated"], equal_to(False))
+
+
+class TestPurgeOldWebhookDeliveries:
+    def test_only_old_finished_deliveries_are_purged(self, session: Session):
+        old = datetime.now() - timedelta(
+            days=settings.github_webhook_delivery_retention_days + 1
+        )
+        session.add_all(
+            [
+                GitHubWebhookDelivery(
+                    delivery_id="old-processed",
+                    event_type="push",
+                    payload={},
+                    status=WebhookDeliveryStatus.PROCESSED,
+                    received_at=old,
+                ),
+                GitHubWebhookDelivery(
+                    delivery_id="old-pending",
+                    event_type="push",
+                    payload={},
+                    status=WebhookDeliveryStatus.PENDING,
+                    received_at=old,
+                ),
+                GitHubWebhookDelivery(
+                    delivery_id="recent-processed",
+                    event_type="push",
+                    payload={},
+                    status=WebhookDeliveryStatus.PROCESSED,
+                ),
+            ]
+        )
+        session.commit()
+
+        deleted = purge_old_webhook_deliveries(session)
+
+        assert_that(deleted, equal_to(1))
+        assert_that(
+            sorted(delivery.delivery_id for delivery in _deliveries(session)),
+            equal_to(["old-pending", "recent-processed"]),
+        )
+
+
+class TestWebhookEndpoint:
+    def _post(self, test_client, payload: dict, delivery_id: str):
+        body = json.dumps(payload).encode()
+        signature = (
+            "sha256="
+            + hmac.new(
+                settings.github_webhook_secret.encode(), body, hashlib.sha256
+            ).hexdigest()
+        )
+        return test_client.post(
+            "/github/webhook",
+            content=body,
+            headers={
+                "Content-Type": "application/json",
+                "X-Hub-Signature-256": signature,
+                "X-GitHub-Event": "push",
+                "X-GitHub-Delivery": delivery_id,
+            },
+        )
+
+    @patch("src.github_app.views._drain_webhook_queue")
+    def test_webhook_is_queued_and_acknowledged(
+        self, mock_drain, test_client, session: Session
+    ):
+        payload = _push_payload("a", "b", ["x.py"])
+
+        response = self._post(test_client, payload, "delivery-1")
+        duplicate = self._post(test_client, payload, "delivery-1")
+
+        assert_that(response.status_code, equal_to(202))
+        assert_that(duplicate.status_code, equal_to(202))
+        assert_that(mock_drain.call_count, equal_to(1))
+        assert_that(_deliveries(session), has_length(1))
@@ -0,0 +1,211 @@
+import io
+import json
+from contextlib import contextmanager
+
+from hamcrest import assert_that, contains_exactly, equal_to, has_length
+from sqlalchemy import event
+
+from src.initiative_management.backlog_import import (
+    BacklogImportError,
+    BacklogRecord,
+    import_backlog,
+    parse_file,
+)
+from src.initiative_management.initiative_controller import InitiativeController
+from src.initiative_management.task_controller import TaskController
+from src.models import (
+    ContextType,
+    EntityType,
+    Initiative,
+    InitiativeStatus,
+    Ordering,
+    Task,
+    TaskStatus,
+)
+
+CSV = """record,ref,parent,title,description,status,type,checklist
+initiative,auth,,Login,Let users sign in,in_progress,,
+task,,auth,Password form,,,CODING,"Design
+[x] Build"
+task,,auth,Reset password,,DONE,,
+"""
+
+
+@contextmanager
+def count_queries(session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+class TestBacklogImport:
+
+    def _import(self, session, user, workspace, data, filename):
+        records = parse_file(io.BytesIO(data.encode()), filename)
+        return import_backlog(session, workspace.id, user.id, records)
+
+    def test_import_csv(self, session, user, workspace):
+        result = self._import(session, user, workspace, CSV, "backlog.csv")
+
+        assert_that(result.errors, equal_to([]))
+        assert_that(
+            (result.initiatives, result.tasks, result.checklist_items),
+            equal_to((1, 2, 2)),
+        )
+        initiative = (
+            session.query(Initiative).filter_by(workspace_id=workspace.id).one()
+        )
+        assert_that(initiative.identifier, equal_to("I-001"))
+        assert_that(initiative.status, equal_to(InitiativeStatus.IN_PROGRESS))
+        tasks = session.query(Task).order_by(Task.identifier).all()
+        assert_that(
+            [(t.identifier, t.title, t.status) for t in tasks],
+            contains_exactly(
+                ("TM-001", "Password form", TaskStatus.TO_DO),
+                ("TM-002", "Reset password", TaskStatus.DONE),
+            ),
+        )
+        assert_that(tasks[0].initiative_id, equal_to(initiative.id))
+        assert_that(
+            sorted((c.order, c.title, c.is_complete) for c in tasks[0].checklist),
+            equal_to([(0, "Design", False), (1, "Build", True)]),
+        )
+
+    def test_import_json(self, session, user, workspace):
+        data = {
+            "initiatives": [
+                {
+                    "title": "Login",
+                    "tasks": [
+                        {
+                            "title": "Password form",
+                            "checklist": [
+                                "Design",
+                                {"title": "Build", "is_complete": True},
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+        result = self._import(session, user, workspace, json.dumps(data), "b.json")
+
+        assert_that(
+            (result.initiatives, result.tasks, result.checklist_items),
+            equal_to((1, 1, 2)),
+        )
+        task = session.query(Task).one()
+        assert_that(task.initiative.status, equal_to(InitiativeStatus.BACKLOG))
+
+    def test_items_continue_the_identifiers_and_status_lists(
+        self, session, user, workspace
+    ):
+        existing = InitiativeController(session).create_initiative(
+            title="Existing", description="", user_id=user.id, workspace_id=workspace.id
+        )
+        TaskController(session).create_task(
+            title="Existing task",
+            user_id=user.id,
+            workspace_id=workspace.id,
+            initiative_id=existing.id,
+        )
+        csv = CSV + f"task,,{existing.identifier},Follow-up,,,,\n"
+
+        self._import(session, user, workspace, csv, "backlog.csv")
+
+        initiatives = [
+            i.identifier
+            for i in session.query(Initiative).order_by(Initiative.identifier)
+        ]
+        assert_that(initiatives, equal_to(["I-001", "I-002"]))
+        follow_up = session.query(Task).filter_by(title="Follow-up").one()
+        assert_that(follow_up.initiative_id, equal_to(existing.id))
+        assert_that(follow_up.identifier, equal_to("TM-004"))
+
+        orderings = (
+            session.query(Ordering)
+            .filter_by(
+                context_type=ContextType.STATUS_LIST, entity_type=EntityType.TASK
+            )
+            .order_by(Ordering.position)
+            .all()
+        )
+        assert_that(
+            [o.task.title for o in orderings],
+            equal_to(["Existing task", "Password form", "Reset password", "Follow-up"]),
+        )
+
+        # The ordering service keeps appending after imported items
+        task = TaskController(session).create_task(
+            title="Later",
+            user_id=user.id,
+            workspace_id=workspace.id,
+            initiative_id=existing.id,
+        )
+        last = (
+            session.query(Ordering)
+            .filter_by(entity_type=EntityType.TASK)
+            .order_by(Ordering.position.desc())
+            .first()
+        )
+        assert_that(last.task_id, equal_to(task.id))
+
+    def test_invalid_records_are_reported_and_nothing_is_imported(
+        self, session, user, workspace
+    ):
+        csv = CSV + (
+            "task,,missing,Orphan,,,,\n"
+            "initiative,auth,,Duplicate,,,,\n"
+            "initiative,,,,,,,\n"
+            "task,,auth,Bad status,,SOMEDAY,,\n"
+            "epic,,,Unknown record,,,,\n"
+        )
+
+        result = self._import(session, user, workspace, csv, "backlog.csv")
+
+        assert_that(
+            result.errors,
+            equal_to(
+                [
+                    BacklogImportError("line 6", "unknown initiative 'missing'"),
+                    BacklogImportError("line 7", "duplicate ref 'auth'"),
+                    BacklogImportError("line 8", "title is required"),
+                    BacklogImportError("line 9", "unknown task status 'SOMEDAY'"),
+                    BacklogImportError(
+                        "line 10", 'record must be "initiative" or "task"'
+                    ),
+                ]
+            ),
+        )
+        assert_that(session.query(Initiative).count(), equal_to(0))
+        assert_that(session.query(Task).count(), equal_to(0))
+
+    def test_query_count_does_not_grow_with_the_import(self, session, user, workspace):
+        def records(count):
+            yield BacklogRecord("1", "initiative", "Initiative", ref="i")
+            for i in range(count):
+                yield BacklogRecord(
+                    str(i), "task", f"Task {i}", parent="i", checklist=["a", "b"]
+                )
+
+        workspace_id, user_id = workspace.id, user.id
+        with count_queries(session) as few:
+            import_backlog(session, workspace_id, user_id, records(1))
+        with count_queries(session) as many:
+            result = import_backlog(session, workspace_id, user_id, records(500))
+
+        assert_that(result.checklist_items, equal_to(1000))
+        assert_that(len(many), equal_to(len(few)))
+        assert_that(
+            session.query(Task).filter_by(workspace_id=workspace_id).all(),
+            has_length(501),
+        )
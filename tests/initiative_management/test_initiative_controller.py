@@ -1,8 +1,10 @@
 import uuid
+from contextlib import contextmanager
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from hamcrest import assert_that, calling, equal_to, is_, is_not, raises
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -11,6 +13,7 @@ from src.initiative_management.initiative_controller import (
     InitiativeControllerError,
     InitiativeNotFoundError,
 )
+from src.initiative_management.task_controller import TaskController
 from src.models import (
     ContextType,
     Group,
@@ -18,11 +21,29 @@ from src.models import (
     Initiative,
     InitiativeGroup,
     InitiativeStatus,
+    Task,
+    TaskStatus,
     User,
     UserAccountDetails,
     Workspace,
 )
 from src.services.ordering_service import OrderingServiceError
+from src.strategic_planning.models import DomainEvent
+
+
+@contextmanager
+def count_queries(session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
 
 
 class TestInitiativeController:
@@ -880,3 +901,153 @@ class TestInitiativeController:
         controller.complete_onboarding_if_first_initiative(user.id)
 
         mock_complete_onboarding.assert_not_called()
+
+    def test_move_initiatives_to_status(
+        self, controller: InitiativeController, user, workspace, session
+    ):
+        initiatives = [
+            controller.create_initiative(
+                title=f"Initiative {i}",
+                description="",
+                user_id=user.id,
+                workspace_id=workspace.id,
+            )
+            for i in range(2)
+        ]
+        ids = [initiative.id for initiative in initiatives]
+
+        result = controller.move_initiatives_to_status(
+            list(reversed(ids)), user.id, InitiativeStatus.ARCHIVED
+        )
+
+        assert_that([i.id for i in result], equal_to(list(reversed(ids))))
+        assert_that(
+            [i.status for i in result], equal_to([InitiativeStatus.ARCHIVED] * 2)
+        )
+        events = (
+            session.query(DomainEvent)
+            .filter(DomainEvent.event_type == "InitiativeStatusChanged")
+            .all()
+        )
+        assert_that(
+            {(e.aggregate_id, e.payload["to_status"]) for e in events},
+            equal_to({(ids[0], "ARCHIVED"), (ids[1], "ARCHIVED")}),
+        )
+
+    def test_move_initiatives_to_status_not_found(
+        self, controller: InitiativeController, user, other_user, workspace, session
+    ):
+        initiative = controller.create_initiative(
+            title="Mine",
+            description="",
+            user_id=user.id,
+            workspace_id=workspace.id,
+        )
+
+        assert_that(
+            calling(controller.move_initiatives_to_status).with_args(
+                [initiative.id], other_user.id, InitiativeStatus.DONE
+            ),
+            raises(InitiativeNotFoundError),
+        )
+
+    @pytest.fixture
+    def board_initiatives(self, controller: InitiativeController, user, workspace):
+        initiatives = [
+            controller.create_initiative(
+                title=title,
+                description="",
+                user_id=user.id,
+                workspace_id=workspace.id,
+                status=InitiativeStatus.TO_DO,
+            )
+            for title in ("First", "Second", "Third")
+        ]
+        # Second goes to the top of its column
+        controller.move_initiative(
+            initiatives[1].id, user.id, after_id=None, before_id=initiatives[0].id
+        )
+        controller.move_initiative_to_status(
+            initiatives[2].id, user.id, InitiativeStatus.DONE, None, None
+        )
+        return initiatives
+
+    def test_get_board(
+        self,
+        controller: InitiativeController,
+        board_initiatives,
+        user,
+        workspace,
+        session,
+    ):
+        first, second, third = board_initiatives
+        session.add_all(
+            Task(
+                title=f"Task {n}",
+                status=task_status,
+                user_id=user.id,
+                workspace_id=workspace.id,
+                initiative_id=first.id,
+            )
+            for n, task_status in enumerate(
+                [TaskStatus.TO_DO, TaskStatus.TO_DO, TaskStatus.DONE]
+            )
+        )
+        session.commit()
+        user_id, workspace_id = user.id, workspace.id
+
+        with count_queries(session) as statements:
+            board = controller.get_board(user_id, workspace_id)
+            columns = {
+                column_status: [
+                    (item.initiative.title, item.task_counts, item.tasks)
+                    for item in items
+                ]
+                for column_status, items in board.items()
+            }
+
+        assert_that(len(statements), equal_to(2))
+        assert_that(list(board), equal_to(list(InitiativeStatus)))
+        assert_that(
+            columns[InitiativeStatus.TO_DO],
+            equal_to(
+                [
+                    ("Second", {}, None),
+                    ("First", {TaskStatus.TO_DO: 2, TaskStatus.DONE: 1}, None),
+                ]
+            ),
+        )
+        assert_that(columns[InitiativeStatus.DONE], equal_to([("Third", {}, None)]))
+        assert_that(columns[InitiativeStatus.BACKLOG], equal_to([]))
+
+    def test_get_board_with_tasks(
+        self,
+        controller: InitiativeController,
+        board_initiatives,
+        user,
+        workspace,
+        session,
+    ):
+        first = board_initiatives[0]
+        task_controller = TaskController(session)
+        tasks = [
+            task_controller.create_task(
+                title=title,
+                user_id=user.id,
+                workspace_id=workspace.id,
+                initiative_id=first.id,
+            )
+            for title in ("One", "Two")
+        ]
+        task_controller.move_task(tasks[1].id, user.id, None, tasks[0].id)
+        user_id, workspace_id = user.id, workspace.id
+
+        with count_queries(session) as statements:
+            board = controller.get_board(user_id, workspace_id, include_tasks=True)
+            items = {
+                item.initiative.title: [task.title for task in item.tasks]
+                for item in board[InitiativeStatus.TO_DO]
+            }
+
+        assert_that(len(statements), equal_to(3))
+        assert_that(items, equal_to({"Second": [], "First": ["Two", "One"]}))
@@ -4,7 +4,14 @@ from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
-from hamcrest import assert_that, equal_to, has_entries, has_items, is_
+from hamcrest import (
+    assert_that,
+    contains_exactly,
+    equal_to,
+    has_entries,
+    has_items,
+    is_,
+)
 from sqlalchemy.orm import Session
 
 from src.main import app
@@ -14,6 +21,8 @@ from src.models import (
     Initiative,
     InitiativeStatus,
     Ordering,
+    Task,
+    TaskStatus,
     User,
     Workspace,
 )
@@ -350,6 +359,45 @@ class TestInitiativeViews:
             before_id=None,
         )
 
+    @patch("src.initiative_management.views.InitiativeController")
+    def test_move_initiatives_to_status(
+        self, mock_initiative_controller, client, user, workspace, test_initiative
+    ):
+        mock_initiative = Initiative(
+            id=test_initiative.id,
+            identifier=test_initiative.identifier,
+            title=test_initiative.title,
+            description="",
+            user_id=user.id,
+            workspace_id=workspace.id,
+            status=InitiativeStatus.DONE,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            properties={},
+        )
+        mock_initiative_controller_instance = mock_initiative_controller.return_value
+        mock_initiative_controller_instance.move_initiatives_to_status.return_value = [
+            mock_initiative
+        ]
+
+        response = client.put(
+            "/api/initiatives/status",
+            json={"initiative_ids": [str(test_initiative.id)], "new_status": "DONE"},
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            response.json(),
+            contains_exactly(
+                has_entries({"id": str(test_initiative.id), "status": "DONE"})
+            ),
+        )
+        mock_initiative_controller_instance.move_initiatives_to_status.assert_called_once_with(
+            initiative_ids=[test_initiative.id],
+            user_id=user.id,
+            new_status=InitiativeStatus.DONE,
+        )
+
     @patch("src.initiative_management.views.InitiativeController")
     def test_move_initiative_to_status_not_found(
         self, mock_initiative_controller, client, user
@@ -654,3 +702,136 @@ class TestInitiativeViews:
 
         assert_that(response.status_code, equal_to(404))
         mock_initiative_controller_instance.move_initiative_in_group.assert_called_once()
+
+    def test_import_backlog_success(self, client, workspace, session):
+        csv = b"record,ref,parent,title\ninitiative,a,,Login\ntask,,a,Password form\n"
+
+        response = client.post(
+            "/api/initiatives/import",
+            data={"workspace_id": str(workspace.id)},
+            files={"file": ("backlog.csv", csv)},
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            response.json(),
+            has_entries({"initiatives": 1, "tasks": 1, "errors": []}),
+        )
+
+    def test_import_backlog_reports_invalid_records(self, client, workspace):
+        csv = b"record,ref,parent,title\ntask,,missing,Orphan\n"
+
+        response = client.post(
+            "/api/initiatives/import",
+            data={"workspace_id": str(workspace.id)},
+            files={"file": ("backlog.csv", csv)},
+        )
+
+        assert_that(response.status_code, equal_to(422))
+        assert_that(
+            response.json()["errors"],
+            equal_to(
+                [{"location": "line 2", "message": "unknown initiative 'missing'"}]
+            ),
+        )
+
+    def test_import_backlog_into_another_users_workspace(self, client):
+        response = client.post(
+            "/api/initiatives/import",
+            data={"workspace_id": str(uuid.uuid4())},
+            files={"file": ("backlog.csv", b"record,title\n")},
+        )
+
+        assert_that(response.status_code, equal_to(404))
+
+    def test_get_initiative_dependencies(self, client, user, workspace, session):
+        blocker = Initiative(
+            title="Blocker", description="", user_id=user.id, workspace_id=workspace.id
+        )
+        session.add(blocker)
+        session.commit()
+        blocked = Initiative(
+            title="Blocked",
+            description="",
+            user_id=user.id,
+            workspace_id=workspace.id,
+            blocked_by_id=blocker.id,
+        )
+        session.add(blocked)
+        session.commit()
+
+        response = client.get(
+            f"/api/workspaces/{workspace.id}/initiatives/dependencies"
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            response.json()["critical_path"],
+            equal_to([str(blocker.id), str(blocked.id)]),
+        )
+
+        response = client.get(f"/api/workspaces/{workspace.id}/initiatives/unblocked")
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            response.json(),
+            contains_exactly(has_entries({"id": str(blocker.id), "title": "Blocker"})),
+        )
+
+    def test_get_initiative_dependencies_of_another_users_workspace(self, client):
+        response = client.get(
+            f"/api/workspaces/{uuid.uuid4()}/initiatives/dependencies"
+        )
+
+        assert_that(response.status_code, equal_to(404))
+
+    def test_get_initiative_board(self, client, user, workspace, session):
+        from src.initiative_management.initiative_controller import InitiativeController
+
+        initiative = InitiativeController(session).create_initiative(
+            title="On the board",
+            description="",
+            user_id=user.id,
+            workspace_id=workspace.id,
+            status=InitiativeStatus.IN_PROGRESS,
+        )
+        session.add(
+            Task(
+                title="Task",
+                status=TaskStatus.DONE,
+                user_id=user.id,
+                workspace_id=workspace.id,
+                initiative_id=initiative.id,
+            )
+        )
+        session.commit()
+
+        response = client.get(f"/api/workspaces/{workspace.id}/initiatives/board")
+
+        assert_that(response.status_code, equal_to(200))
+        columns = {c["status"]: c["initiatives"] for c in response.json()["columns"]}
+        assert_that(
+            columns["IN_PROGRESS"],
+            contains_exactly(
+                has_entries(
+                    {
+                        "title": "On the board",
+                        "task_counts": {"DONE": 1},
+                        "tasks": None,
+                    }
+                )
+            ),
+        )
+        assert_that(columns["BACKLOG"], equal_to([]))
+
+        response = client.get(
+            f"/api/workspaces/{workspace.id}/initiatives/board",
+            params={"include_tasks": True},
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        columns = {c["status"]: c["initiatives"] for c in response.json()["columns"]}
+        assert_that(
+            columns["IN_PROGRESS"][0]["tasks"],
+            contains_exactly(has_entries({"title": "Task", "status": "DONE"})),
+        )
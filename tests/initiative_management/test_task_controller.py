@@ -1,7 +1,18 @@
 import uuid
+from contextlib import contextmanager
 
 import pytest
-from hamcrest import assert_that, calling, equal_to, has_length, is_, not_none, raises
+from hamcrest import (
+    assert_that,
+    calling,
+    equal_to,
+    has_length,
+    is_,
+    not_none,
+    raises,
+    starts_with,
+)
+from sqlalchemy import event
 
 from src.initiative_management.task_controller import (
     ChecklistItemData,
@@ -11,6 +22,30 @@ from src.initiative_management.task_controller import (
 )
 from src.models import ChecklistItem, ContextType, Ordering, Task, TaskStatus
 from src.services.ordering_service import OrderingService
+from src.strategic_planning.models import DomainEvent
+
+
+@contextmanager
+def count_queries(session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _writes(statements):
+    return [
+        s
+        for s in statements
+        if s.lstrip().split(" ", 1)[0] in ("INSERT", "UPDATE", "DELETE")
+    ]
 
 
 class TestTaskController:
@@ -354,3 +389,168 @@ class TestTaskController:
         item2 = ChecklistItemData("Another item")
         assert_that(item2.is_complete, is_(False))
         assert_that(item2.order, equal_to(0))
+
+    def _task_with_checklist(self, controller, user, workspace, test_initiative):
+        return controller.create_task(
+            title="Task with Checklist",
+            user_id=user.id,
+            workspace_id=workspace.id,
+            initiative_id=test_initiative.id,
+            checklist=[
+                ChecklistItemData("Item 1", False, 0),
+                ChecklistItemData("Item 2", False, 1),
+                ChecklistItemData("Item 3", False, 2),
+            ],
+        )
+
+    def _checklist(self, session, task):
+        return (
+            session.query(ChecklistItem)
+            .filter_by(task_id=task.id)
+            .order_by(ChecklistItem.order)
+            .all()
+        )
+
+    def test_update_checklist_updates_changed_items_in_place(
+        self, controller, session, user, workspace, test_initiative
+    ):
+        task = self._task_with_checklist(controller, user, workspace, test_initiative)
+        items = self._checklist(session, task)
+        ids = [item.id for item in items]
+
+        with count_queries(session) as statements:
+            controller.update_checklist(
+                user.id,
+                task.id,
+                [
+                    ChecklistItemData(item.title, item.order == 1, item.order, item.id)
+                    for item in items
+                ],
+            )
+
+        assert_that(_writes(statements), has_length(1))
+        assert_that(_writes(statements)[0].lstrip(), starts_with("UPDATE"))
+        session.expire_all()
+        updated = self._checklist(session, task)
+        assert_that([item.id for item in updated], equal_to(ids))
+        assert_that(
+            [item.is_complete for item in updated], equal_to([False, True, False])
+        )
+
+    def test_update_checklist_adds_and_removes_items(
+        self, controller, session, user, workspace, test_initiative
+    ):
+        task = self._task_with_checklist(controller, user, workspace, test_initiative)
+        first, second, _ = self._checklist(session, task)
+
+        with count_queries(session) as statements:
+            controller.update_checklist(
+                user.id,
+                task.id,
+                [
+                    # Matched by title when no id is sent
+                    ChecklistItemData("Item 2", True, 0),
+                    ChecklistItemData("Item 1", False, 1, first.id),
+                    ChecklistItemData("Item 4", False, 2),
+                ],
+            )
+
+        assert_that(
+            [s.lstrip().split(" ", 1)[0] for s in _writes(statements)],
+            equal_to(["UPDATE", "INSERT", "DELETE"]),
+        )
+        session.expire_all()
+        updated = self._checklist(session, task)
+        assert_that(
+            [(item.title, item.is_complete) for item in updated],
+            equal_to([("Item 2", True), ("Item 1", False), ("Item 4", False)]),
+        )
+        assert_that(updated[0].id, equal_to(second.id))
+        assert_that(updated[1].id, equal_to(first.id))
+
+    def test_update_checklist_without_changes_writes_nothing(
+        self, controller, session, user, workspace, test_initiative
+    ):
+        task = self._task_with_checklist(controller, user, workspace, test_initiative)
+        items = [
+            ChecklistItemData(item.title, item.is_complete, item.order, item.id)
+            for item in self._checklist(session, task)
+        ]
+
+        with count_queries(session) as statements:
+            result = controller.update_checklist(user.id, task.id, items)
+
+        assert_that(result.id, equal_to(task.id))
+        assert_that(_writes(statements), has_length(0))
+
+    def test_move_tasks_to_status_moves_them_in_one_batch(
+        self, controller, session, user, workspace, test_initiative
+    ):
+        tasks = [
+            controller.create_task(
+                title=f"Task {i}",
+                user_id=user.id,
+                workspace_id=workspace.id,
+                initiative_id=test_initiative.id,
+                status=TaskStatus.DONE if i == 1 else TaskStatus.TO_DO,
+            )
+            for i in range(3)
+        ]
+        first, done, last = [task.id for task in tasks]
+
+        with count_queries(session) as statements:
+            result = controller.move_tasks_to_status(
+                [last, done, first], user.id, TaskStatus.DONE
+            )
+
+        # One statement each for statuses, positions and events
+        writes = [" ".join(s.split()[:3]) for s in _writes(statements)]
+        assert_that(
+            writes,
+            equal_to(
+                [
+                    "UPDATE dev.task SET",
+                    "UPDATE orderings SET",
+                    "INSERT INTO dev.domain_events",
+                ]
+            ),
+        )
+        assert_that([task.id for task in result], equal_to([last, done, first]))
+        assert_that({task.status for task in result}, equal_to({TaskStatus.DONE}))
+
+        # Moved tasks go to the end of the status list, in the order given
+        positions = {
+            ordering.task_id: ordering.position
+            for ordering in session.query(Ordering).filter(
+                Ordering.context_type == ContextType.STATUS_LIST,
+                Ordering.task_id.isnot(None),
+            )
+        }
+        assert_that(sorted(positions, key=positions.get), equal_to([done, last, first]))
+
+        events = session.query(DomainEvent).filter(
+            DomainEvent.event_type == "TaskStatusChanged"
+        )
+        assert_that(
+            {(e.aggregate_id, e.payload["from_status"]) for e in events},
+            equal_to({(last, "TO_DO"), (first, "TO_DO")}),
+        )
+
+    def test_move_tasks_to_status_requires_every_task(
+        self, controller, session, user, workspace, test_initiative
+    ):
+        task = controller.create_task(
+            title="Task",
+            user_id=user.id,
+            workspace_id=workspace.id,
+            initiative_id=test_initiative.id,
+        )
+
+        assert_that(
+            calling(controller.move_tasks_to_status).with_args(
+                [task.id, uuid.uuid4()], user.id, TaskStatus.DONE
+            ),
+            raises(TaskNotFoundError),
+        )
+        session.expire_all()
+        assert_that(session.get(Task, task.id).status, equal_to(TaskStatus.TO_DO))
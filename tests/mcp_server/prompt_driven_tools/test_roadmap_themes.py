@@ -510,9 +510,9 @@ class TestQueryRoadmapThemesList:
             mock_session_local.return_value = mock_session
 
             with patch(
-                "src.mcp_server.prompt_driven_tools.roadmap_themes.roadmap_controller.get_roadmap_themes"
-            ) as mock_get_themes:
-                mock_get_themes.return_value = []
+                "src.mcp_server.prompt_driven_tools.roadmap_themes.WorkspaceStrategyGraph.load"
+            ) as mock_load_graph:
+                mock_load_graph.return_value.themes = []
 
                 result = await query_roadmap_themes.fn()
 
@@ -558,9 +558,9 @@ class TestQueryRoadmapThemesList:
             mock_session_local.return_value = mock_session
 
             with patch(
-                "src.mcp_server.prompt_driven_tools.roadmap_themes.roadmap_controller.get_roadmap_themes"
-            ) as mock_get_themes:
-                mock_get_themes.side_effect = Exception("Database error")
+                "src.mcp_server.prompt_driven_tools.roadmap_themes.WorkspaceStrategyGraph.load"
+            ) as mock_load_graph:
+                mock_load_graph.side_effect = Exception("Database error")
 
                 result = await query_roadmap_themes.fn()
 
@@ -14,6 +14,7 @@ from src.initiative_management.aggregates.strategic_initiative import (
 from src.mcp_server.prompt_driven_tools.strategic_initiatives import (
     delete_strategic_initiative,
     get_strategic_initiative_definition_framework,
+    query_initiative_dependencies,
     query_strategic_initiatives,
     submit_strategic_initiative,
 )
@@ -1617,3 +1618,66 @@ class TestDescriptionFieldsSeparation:
         )
         assert strategic_init is not None
         assert strategic_init.description is None
+
+
+class TestQueryInitiativeDependencies:
+    """Test suite for query_initiative_dependencies tool."""
+
+    @pytest.fixture
+    def chain(self, session: Session, user: User, workspace: Workspace):
+        """First blocks Second blocks Third."""
+        initiatives = []
+        for title in ("First", "Second", "Third"):
+            initiative = Initiative(
+                title=title,
+                description="",
+                user_id=user.id,
+                workspace_id=workspace.id,
+                status=InitiativeStatus.TO_DO,
+                blocked_by_id=initiatives[-1].id if initiatives else None,
+            )
+            session.add(initiative)
+            session.commit()
+            initiatives.append(initiative)
+        return initiatives
+
+    @pytest.mark.asyncio
+    async def test_query_dependency_graph(self, chain: List[Initiative]):
+        result = await query_initiative_dependencies.fn()
+
+        assert_that(
+            result, has_entries({"status": "success", "type": "strategic_initiative"})
+        )
+        assert_that(
+            result["data"]["critical_path"],
+            equal_to([str(initiative.id) for initiative in chain]),
+        )
+
+    @pytest.mark.asyncio
+    async def test_query_dependencies_of_one_initiative(self, chain: List[Initiative]):
+        first, second, third = chain
+
+        result = await query_initiative_dependencies.fn(identifier=third.identifier)
+
+        assert_that(
+            [blocker["identifier"] for blocker in result["data"]["blocked_by"]],
+            equal_to([second.identifier, first.identifier]),
+        )
+        assert_that(result["data"]["blocking"], equal_to([]))
+
+    @pytest.mark.asyncio
+    async def test_query_unblocked_initiatives(self, chain: List[Initiative]):
+        result = await query_initiative_dependencies.fn(unblocked_only=True)
+
+        assert_that(
+            [initiative["title"] for initiative in result["data"]["initiatives"]],
+            equal_to(["First"]),
+        )
+
+    @pytest.mark.asyncio
+    async def test_query_dependencies_of_unknown_initiative(self):
+        result = await query_initiative_dependencies.fn(identifier="I-999")
+
+        assert_that(
+            result, has_entries({"status": "error", "type": "strategic_initiative"})
+        )
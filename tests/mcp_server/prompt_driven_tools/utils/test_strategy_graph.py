@@ -0,0 +1,211 @@
+"""Tests for WorkspaceStrategyGraph.
+
+Uses user and workspace fixtures from root conftest.py.
+"""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+from hamcrest import assert_that, contains_exactly, equal_to, has_length
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.initiative_management.aggregates.strategic_initiative import (
+    StrategicInitiative,
+)
+from src.mcp_server.prompt_driven_tools.utils import (
+    WorkspaceStrategyGraph,
+    serialize_conflict,
+    serialize_outcome,
+    serialize_pillar,
+    serialize_strategic_initiative,
+    serialize_theme,
+)
+from src.models import Initiative, InitiativeStatus, User, Workspace
+from src.narrative.aggregates.conflict import Conflict, ConflictStatus
+from src.narrative.aggregates.hero import Hero
+from src.narrative.aggregates.villain import Villain
+from src.roadmap_intelligence import controller as roadmap_controller
+from src.roadmap_intelligence.aggregates.roadmap_theme import RoadmapTheme
+from src.strategic_planning.aggregates.product_outcome import ProductOutcome
+from src.strategic_planning.aggregates.strategic_pillar import StrategicPillar
+
+
+@contextmanager
+def count_queries(session: Session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+class TestWorkspaceStrategyGraph:
+    """Unit tests for WorkspaceStrategyGraph.load."""
+
+    def _create_strategy(
+        self, workspace: Workspace, user: User, session: Session, index: int
+    ) -> RoadmapTheme:
+        """Create a pillar, outcome, theme, hero, villain, conflict and initiative."""
+        owned = {"workspace_id": workspace.id, "user_id": user.id}
+        pillar = StrategicPillar(name=f"Pillar {index}", display_order=index, **owned)
+        outcome = ProductOutcome(name=f"Outcome {index}", display_order=index, **owned)
+        hero = Hero(name=f"Hero {index}", description="Developer", **owned)
+        villain = Villain(
+            name=f"Villain {index}",
+            villain_type="WORKFLOW",
+            description="Interruptions",
+            severity=3,
+            **owned,
+        )
+        theme = RoadmapTheme(name=f"Theme {index}", description="Problem", **owned)
+        initiative = Initiative(
+            title=f"Initiative {index}",
+            description="Description",
+            status=InitiativeStatus.BACKLOG,
+            **owned,
+        )
+        session.add_all([pillar, outcome, hero, villain, theme, initiative])
+        session.flush()
+
+        conflict = Conflict(
+            hero_id=hero.id,
+            villain_id=villain.id,
+            story_arc_id=theme.id,
+            description=f"Conflict {index}",
+            status=ConflictStatus.OPEN.value,
+            **owned,
+        )
+        strategic_initiative = StrategicInitiative(
+            initiative_id=initiative.id,
+            pillar_id=pillar.id,
+            theme_id=theme.id,
+            description="Strategic context",
+            **owned,
+        )
+        session.add_all([conflict, strategic_initiative])
+        session.flush()
+
+        publisher = MagicMock()
+        outcome.link_to_pillars([pillar.id], user.id, session, publisher)
+        theme.link_to_outcomes([outcome.id], session, publisher)
+        theme.link_heroes([hero.id], session)
+        theme.link_villains([villain.id], session)
+        strategic_initiative.link_heroes([hero.id], session)
+        strategic_initiative.link_villains([villain.id], session)
+        strategic_initiative.link_conflicts([conflict.id], session)
+        session.commit()
+        return theme
+
+    def _serialize_everything(self, graph: WorkspaceStrategyGraph) -> list:
+        return (
+            [serialize_pillar(p) for p in graph.pillars]
+            + [serialize_outcome(o) for o in graph.outcomes]
+            + [serialize_theme(t) for t in graph.themes]
+            + [serialize_conflict(c) for c in graph.conflicts]
+            + [serialize_strategic_initiative(si) for si in graph.strategic_initiatives]
+        )
+
+    def test_load_wires_every_relationship(
+        self, workspace: Workspace, user: User, session: Session
+    ):
+        self._create_strategy(workspace, user, session, 0)
+        session.expire_all()
+
+        graph = WorkspaceStrategyGraph.load(session, workspace.id)
+        with count_queries(session) as statements:
+            self._serialize_everything(graph)
+            si = graph.strategic_initiatives[0]
+            backrefs = [
+                graph.heroes[0].conflicts,
+                graph.villains[0].roadmap_themes,
+                graph.pillars[0].strategic_initiatives,
+                graph.outcomes[0].themes,
+                si.initiative.title,
+            ]
+
+        assert_that(statements, equal_to([]))
+        assert_that(si.strategic_pillar, equal_to(graph.pillars[0]))
+        assert_that(si.conflicts, contains_exactly(graph.conflicts[0]))
+        assert_that(graph.themes[0].outcomes, contains_exactly(graph.outcomes[0]))
+        assert_that(graph.conflicts[0].story_arc, equal_to(graph.themes[0]))
+        assert_that(backrefs[0], contains_exactly(graph.conflicts[0]))
+        assert_that(backrefs[2], contains_exactly(si))
+        assert_that(
+            graph.pillars_by_identifier[graph.pillars[0].identifier],
+            equal_to(graph.pillars[0]),
+        )
+        assert_that(graph.alignment_score(graph.themes[0]), equal_to(1.0))
+
+    def test_load_cost_does_not_grow_with_the_workspace(
+        self, workspace: Workspace, user: User, session: Session
+    ):
+        workspace_id = workspace.id
+        self._create_strategy(workspace, user, session, 0)
+        session.expire_all()
+        with count_queries(session) as few:
+            self._serialize_everything(
+                WorkspaceStrategyGraph.load(session, workspace_id)
+            )
+
+        for index in range(1, 4):
+            self._create_strategy(workspace, user, session, index)
+        session.expire_all()
+        with count_queries(session) as many:
+            graph = WorkspaceStrategyGraph.load(session, workspace_id)
+            self._serialize_everything(graph)
+
+        assert_that(graph.strategic_initiatives, has_length(4))
+        assert_that(len(many), equal_to(len(few)))
+        assert_that(len(many), equal_to(10))
+
+    def test_linked_entities_keep_the_load_order(
+        self, workspace: Workspace, user: User, session: Session
+    ):
+        workspace_id = workspace.id
+        for index in range(3):
+            self._create_strategy(workspace, user, session, index)
+        graph = WorkspaceStrategyGraph.load(session, workspace_id)
+        graph.themes[0].link_to_outcomes(
+            [outcome.id for outcome in reversed(graph.outcomes)], session, MagicMock()
+        )
+        session.commit()
+        session.expire_all()
+
+        graph = WorkspaceStrategyGraph.load(session, workspace_id)
+
+        assert_that(graph.themes[0].outcomes, equal_to(graph.outcomes))
+        assert_that(graph.outcomes[2].themes, contains_exactly(*graph.themes[:3:2]))
+
+    def test_prioritized_themes_follow_the_roadmap(
+        self, workspace: Workspace, user: User, session: Session
+    ):
+        themes = [
+            self._create_strategy(workspace, user, session, index) for index in range(3)
+        ]
+        roadmap_controller.prioritize_roadmap_theme(
+            theme_id=themes[2].id,
+            new_order=0,
+            workspace_id=workspace.id,
+            session=session,
+        )
+        roadmap_controller.prioritize_roadmap_theme(
+            theme_id=themes[0].id,
+            new_order=1,
+            workspace_id=workspace.id,
+            session=session,
+        )
+
+        graph = WorkspaceStrategyGraph.load(session, workspace.id)
+
+        assert_that(
+            [theme.id for theme in graph.prioritized_themes],
+            equal_to([themes[2].id, themes[0].id]),
+        )
+        assert_that(graph.is_prioritized(graph.themes[1]), equal_to(False))
@@ -8,8 +8,16 @@ import pytest
 from hamcrest import assert_that, has_entries, has_key
 from sqlalchemy.orm import Session
 
-from src.initiative_management.task_controller import TaskControllerError
-from src.mcp_server.task_tools import TaskChecklistItem, query_tasks, submit_task
+from src.initiative_management.task_controller import (
+    TaskController,
+    TaskControllerError,
+)
+from src.mcp_server.task_tools import (
+    TaskChecklistItem,
+    move_tasks_to_status,
+    query_tasks,
+    submit_task,
+)
 from src.models import ChecklistItem, Initiative, Task, TaskStatus, User, Workspace
 from src.strategic_planning.exceptions import DomainException
 
@@ -1032,3 +1040,82 @@ class TestSubmitTask:
 
         assert result["status"] == "error"
         assert result["error_type"] == "not_found"
+
+
+class TestMoveTasksToStatus:
+    """Test suite for move_tasks_to_status MCP tool."""
+
+    @pytest.fixture
+    def tasks(
+        self, user: User, workspace: Workspace, initiative: Initiative, session: Session
+    ) -> List[Task]:
+        tasks = [
+            TaskController(session).create_task(
+                title=f"Task {i}",
+                user_id=user.id,
+                workspace_id=workspace.id,
+                initiative_id=initiative.id,
+            )
+            for i in range(3)
+        ]
+        return tasks
+
+    @pytest.mark.asyncio
+    async def test_move_tasks_by_identifier(
+        self, tasks: List[Task], session: Session, mock_get_auth_context: MagicMock
+    ):
+        identifiers = [tasks[2].identifier, tasks[0].identifier]
+
+        result = await move_tasks_to_status.fn(
+            status="DONE", task_identifiers=identifiers
+        )
+
+        assert result["status"] == "success"
+        assert [t["identifier"] for t in result["data"]["tasks"]] == identifiers
+        session.expire_all()
+        assert [session.get(Task, t.id).status for t in tasks] == [
+            TaskStatus.DONE,
+            TaskStatus.TO_DO,
+            TaskStatus.DONE,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_move_initiative_tasks(
+        self, tasks: List[Task], session: Session, mock_get_auth_context: MagicMock
+    ):
+        result = await move_tasks_to_status.fn(
+            status="ARCHIVED", initiative_identifier="I-001"
+        )
+
+        assert result["status"] == "success"
+        assert len(result["data"]["tasks"]) == 3
+        session.expire_all()
+        assert {session.get(Task, t.id).status for t in tasks} == {TaskStatus.ARCHIVED}
+
+    @pytest.mark.asyncio
+    async def test_move_tasks_unknown_identifier(
+        self, tasks: List[Task], session: Session, mock_get_auth_context: MagicMock
+    ):
+        result = await move_tasks_to_status.fn(
+            status="DONE", task_identifiers=[tasks[0].identifier, "TM-999"]
+        )
+
+        assert_that(
+            result,
+            has_entries({"status": "error", "error_type": "not_found"}),
+        )
+        session.expire_all()
+        assert session.get(Task, tasks[0].id).status == TaskStatus.TO_DO
+
+    @pytest.mark.asyncio
+    async def test_move_tasks_invalid_status(
+        self, tasks: List[Task], mock_get_auth_context: MagicMock
+    ):
+        result = await move_tasks_to_status.fn(
+            status="FINISHED", task_identifiers=[tasks[0].identifier]
+        )
+
+        assert_that(
+            result,
+            has_entries({"status": "error", "error_type": "validation_error"}),
+        )
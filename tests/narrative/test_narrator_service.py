@@ -0,0 +1,363 @@
+"""Unit tests for NarratorService.
+
+Tests verify the "Previously on..." recap content, that building it costs a
+constant number of queries, and that the per-workspace recap cache is
+invalidated when domain events for the workspace commit.
+"""
+
+import uuid
+from contextlib import contextmanager
+
+import pytest
+from hamcrest import assert_that, contains_inanyorder, equal_to, has_length, none
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.models import User, Workspace
+from src.narrative.aggregates.conflict import Conflict
+from src.narrative.aggregates.hero import Hero
+from src.narrative.aggregates.turning_point import Significance, TurningPoint
+from src.narrative.aggregates.villain import Villain, VillainType
+from src.narrative.services.narrator_service import (
+    NarratorService,
+    PreviouslyOnCache,
+    previously_on_cache,
+)
+from src.roadmap_intelligence.aggregates.roadmap_theme import RoadmapTheme
+from src.strategic_planning.models import DomainEvent
+from src.strategic_planning.services.event_publisher import EventPublisher
+
+
+@contextmanager
+def count_queries(session: Session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+class TestNarratorService:
+    """Unit tests for NarratorService.generate_previously_on."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        previously_on_cache.clear()
+        yield
+        previously_on_cache.clear()
+
+    @pytest.fixture
+    def workspace(self, user: User, session: Session):
+        """Create a workspace for testing."""
+        workspace = Workspace(
+            id=uuid.uuid4(),
+            name="Test Workspace",
+            description="A test workspace",
+            user_id=user.id,
+        )
+        session.add(workspace)
+        session.commit()
+        session.refresh(workspace)
+        return workspace
+
+    @pytest.fixture
+    def publisher(self, session: Session):
+        return EventPublisher(session)
+
+    @pytest.fixture
+    def hero(
+        self,
+        workspace: Workspace,
+        user: User,
+        session: Session,
+        publisher: EventPublisher,
+    ):
+        hero = Hero.define_hero(
+            workspace_id=workspace.id,
+            user_id=user.id,
+            name="Sarah, The Solo Builder",
+            description="Sarah is a solo developer.",
+            is_primary=True,
+            session=session,
+            publisher=publisher,
+        )
+        session.commit()
+        return hero
+
+    @pytest.fixture
+    def villain(
+        self,
+        workspace: Workspace,
+        user: User,
+        session: Session,
+        publisher: EventPublisher,
+    ):
+        villain = Villain.define_villain(
+            workspace_id=workspace.id,
+            user_id=user.id,
+            name="Context Switching",
+            villain_type=VillainType.WORKFLOW,
+            description="Jumping between tools breaks flow.",
+            severity=4,
+            session=session,
+            publisher=publisher,
+        )
+        session.commit()
+        return villain
+
+    @pytest.fixture
+    def narrator(self, session: Session):
+        return NarratorService(session)
+
+    def _create_conflict(
+        self,
+        workspace: Workspace,
+        user: User,
+        hero: Hero,
+        villain: Villain,
+        session: Session,
+        publisher: EventPublisher,
+        description: str = "Sarah keeps losing context.",
+    ) -> Conflict:
+        conflict = Conflict.create_conflict(
+            workspace_id=workspace.id,
+            user_id=user.id,
+            hero_id=hero.id,
+            villain_id=villain.id,
+            description=description,
+            roadmap_theme_id=None,
+            session=session,
+            publisher=publisher,
+        )
+        session.commit()
+        return conflict
+
+    def _create_arc(
+        self,
+        workspace: Workspace,
+        user: User,
+        hero: Hero,
+        villain: Villain,
+        session: Session,
+        publisher: EventPublisher,
+        name: str,
+    ) -> RoadmapTheme:
+        arc = RoadmapTheme.define_theme(
+            workspace_id=workspace.id,
+            user_id=user.id,
+            name=name,
+            description="Keep developers in flow.",
+            session=session,
+            publisher=publisher,
+            hero_ids=[hero.id],
+            villain_ids=[villain.id],
+        )
+        session.commit()
+        return arc
+
+    def _create_turning_point(
+        self,
+        workspace: Workspace,
+        user: User,
+        session: Session,
+        conflict: Conflict,
+        arc: RoadmapTheme,
+    ) -> TurningPoint:
+        domain_event = DomainEvent(
+            user_id=user.id,
+            event_type="TaskCompleted",
+            aggregate_id=uuid.uuid4(),
+            payload={"workspace_id": str(workspace.id)},
+        )
+        session.add(domain_event)
+        session.flush()
+        turning_point = TurningPoint.create_from_event(
+            session=session,
+            domain_event=domain_event,
+            narrative_description="Sarah shipped the MCP command.",
+            significance=Significance.MODERATE,
+            conflict_id=conflict.id,
+            story_arc_ids=[arc.id],
+        )
+        session.commit()
+        return turning_point
+
+    def test_recap_includes_hero_arcs_turning_points_and_conflicts(
+        self,
+        workspace: Workspace,
+        user: User,
+        hero: Hero,
+        villain: Villain,
+        session: Session,
+        publisher: EventPublisher,
+        narrator: NarratorService,
+    ):
+        conflict = self._create_conflict(
+            workspace, user, hero, villain, session, publisher
+        )
+        arc = self._create_arc(
+            workspace, user, hero, villain, session, publisher, "Flow State"
+        )
+        turning_point = self._create_turning_point(
+            workspace, user, session, conflict, arc
+        )
+
+        recap = narrator.generate_previously_on(workspace.id)
+
+        assert_that(recap["primary_hero"]["id"], equal_to(str(hero.id)))
+        assert_that(
+            recap["active_arcs"],
+            equal_to(
+                [
+                    {
+                        "id": str(arc.id),
+                        "name": "Flow State",
+                        "hero_ids": [str(hero.id)],
+                        "villain_ids": [str(villain.id)],
+                    }
+                ]
+            ),
+        )
+        assert_that(recap["recent_turning_points"], has_length(1))
+        assert_that(
+            recap["recent_turning_points"][0]["id"], equal_to(str(turning_point.id))
+        )
+        assert_that(
+            recap["recent_turning_points"][0]["story_arc_ids"], equal_to([str(arc.id)])
+        )
+        assert_that(recap["recent_turning_points"][0]["initiative_ids"], equal_to([]))
+        assert_that(recap["open_conflicts"][0]["id"], equal_to(str(conflict.id)))
+        assert "Flow State (helps Sarah, The Solo Builder)" in recap["recap_text"]
+        assert "(fights Context Switching)" in recap["recap_text"]
+
+    def test_recap_without_narrative_data(
+        self, workspace: Workspace, narrator: NarratorService
+    ):
+        recap = narrator.generate_previously_on(workspace.id)
+
+        assert_that(recap["primary_hero"], none())
+        assert_that(recap["active_arcs"], equal_to([]))
+        assert "No primary hero defined yet." in recap["recap_text"]
+
+    def test_query_count_does_not_grow_with_conflicts_and_arcs(
+        self,
+        workspace: Workspace,
+        user: User,
+        hero: Hero,
+        villain: Villain,
+        session: Session,
+        publisher: EventPublisher,
+        narrator: NarratorService,
+    ):
+        workspace_id = workspace.id
+        self._create_conflict(workspace, user, hero, villain, session, publisher)
+        self._create_arc(workspace, user, hero, villain, session, publisher, "Arc 0")
+        session.expire_all()
+        with count_queries(session) as few:
+            narrator.generate_previously_on(workspace_id)
+
+        for i in range(1, 4):
+            self._create_conflict(
+                workspace, user, hero, villain, session, publisher, f"Conflict {i}"
+            )
+            self._create_arc(
+                workspace, user, hero, villain, session, publisher, f"Arc {i}"
+            )
+        session.expire_all()
+        with count_queries(session) as many:
+            recap = narrator.generate_previously_on(workspace_id)
+
+        assert_that(recap["open_conflicts"], has_length(4))
+        assert_that(recap["active_arcs"], has_length(4))
+        assert_that(len(many), equal_to(len(few)))
+        assert_that(len(many), equal_to(5))
+
+    def test_repeated_recap_is_served_from_cache(
+        self,
+        workspace: Workspace,
+        hero: Hero,
+        session: Session,
+        narrator: NarratorService,
+    ):
+        first = narrator.generate_previously_on(workspace.id)
+
+        with count_queries(session) as statements:
+            second = NarratorService(session).generate_previously_on(workspace.id)
+
+        assert_that(statements, has_length(0))
+        assert_that(second, equal_to(first))
+
+    def test_committed_event_invalidates_cached_recap(
+        self,
+        workspace: Workspace,
+        user: User,
+        hero: Hero,
+        villain: Villain,
+        session: Session,
+        publisher: EventPublisher,
+        narrator: NarratorService,
+    ):
+        assert_that(
+            narrator.generate_previously_on(workspace.id)["open_conflicts"],
+            has_length(0),
+        )
+
+        conflict = self._create_conflict(
+            workspace, user, hero, villain, session, publisher
+        )
+
+        recap = narrator.generate_previously_on(workspace.id)
+        assert_that(
+            [c["id"] for c in recap["open_conflicts"]],
+            contains_inanyorder(str(conflict.id)),
+        )
+
+    def test_cached_recaps_expire(self, workspace: Workspace):
+        # Events committed by other processes never invalidate this one
+        cache = PreviouslyOnCache(ttl_seconds=0)
+        key = str(workspace.id)
+        _, generation = cache.get(key)
+        cache.put(key, generation, {"recap_text": "Previously on..."})
+
+        assert_that(cache.get(key)[0], equal_to(None))
+
+    def test_uncommitted_events_bypass_cache(
+        self,
+        workspace: Workspace,
+        user: User,
+        hero: Hero,
+        villain: Villain,
+        session: Session,
+        publisher: EventPublisher,
+        narrator: NarratorService,
+    ):
+        narrator.generate_previously_on(workspace.id)
+
+        Conflict.create_conflict(
+            workspace_id=workspace.id,
+            user_id=user.id,
+            hero_id=hero.id,
+            villain_id=villain.id,
+            description="Not committed yet.",
+            roadmap_theme_id=None,
+            session=session,
+            publisher=publisher,
+        )
+
+        assert_that(
+            narrator.generate_previously_on(workspace.id)["open_conflicts"],
+            has_length(1),
+        )
+
+        session.rollback()
+
+        assert_that(
+            narrator.generate_previously_on(workspace.id)["open_conflicts"],
+            has_length(0),
+        )
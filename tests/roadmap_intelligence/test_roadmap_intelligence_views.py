@@ -769,6 +769,45 @@ class TestThemePrioritizationViews:
         data = response.json()
         assert_that(data, equal_to([]))
 
+    @patch("src.roadmap_intelligence.views.controller.get_unprioritized_themes")
+    @patch("src.roadmap_intelligence.views.controller.get_prioritized_themes")
+    def test_get_roadmap_summary_without_projection(
+        self,
+        mock_get_prioritized,
+        mock_get_unprioritized,
+        test_client,
+        workspace,
+        mock_theme,
+    ):
+        """Test roadmap summary is computed live when no projection exists."""
+        mock_get_prioritized.return_value = []
+        mock_get_unprioritized.return_value = [mock_theme]
+
+        response = test_client.get(f"/api/workspaces/{workspace.id}/roadmap/summary")
+
+        assert_that(response.status_code, equal_to(200))
+        data = response.json()
+        assert_that(data["prioritized_themes"], equal_to([]))
+        assert_that(data["unprioritized_themes"][0]["id"], equal_to(str(mock_theme.id)))
+
+    @patch("src.roadmap_intelligence.views.controller.get_workspace_projection")
+    def test_get_roadmap_summary_from_projection(
+        self, mock_get_projection, test_client, workspace
+    ):
+        """Test roadmap summary is served from an up to date projection."""
+        mock_get_projection.return_value = {
+            "prioritized_themes": [],
+            "unprioritized_themes": [],
+        }
+
+        response = test_client.get(f"/api/workspaces/{workspace.id}/roadmap/summary")
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            response.json(),
+            equal_to({"prioritized_themes": [], "unprioritized_themes": []}),
+        )
+
     @patch("src.roadmap_intelligence.views.controller.prioritize_roadmap_theme")
     def test_prioritize_theme_success(
         self, mock_prioritize, test_client, workspace, mock_theme
@@ -0,0 +1,158 @@
+"""Tests for the initiative dependency graph."""
+
+from contextlib import contextmanager
+
+import pytest
+from hamcrest import assert_that, contains_exactly, equal_to, has_length, is_
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.initiative_management.initiative_controller import InitiativeController
+from src.models import InitiativeStatus, User, Workspace
+from src.services.dependency_graph_service import (
+    DependencyGraphCache,
+    dependency_graph_cache,
+    get_dependency_graph,
+    get_unblocked_initiatives,
+    load_dependency_graph,
+)
+
+
+@contextmanager
+def count_queries(session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+class TestDependencyGraph:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        dependency_graph_cache.clear()
+        yield
+        dependency_graph_cache.clear()
+
+    @pytest.fixture
+    def initiatives(self, session: Session, user: User, workspace: Workspace):
+        """A blocks B blocks C, D blocks E, F stands alone."""
+        controller = InitiativeController(session)
+        created = {
+            name: controller.create_initiative(
+                title=name,
+                description="",
+                user_id=user.id,
+                workspace_id=workspace.id,
+                status=InitiativeStatus.TO_DO,
+            )
+            for name in "ABCDEF"
+        }
+        created["B"].blocked_by_id = created["A"].id
+        created["C"].blocked_by_id = created["B"].id
+        created["E"].blocked_by_id = created["D"].id
+        session.commit()
+        return created
+
+    def test_graph_is_loaded_with_one_query(
+        self, session: Session, workspace: Workspace, initiatives
+    ):
+        a, b, c, d, e, f = (initiatives[name].id for name in "ABCDEF")
+        workspace_id = workspace.id
+
+        with count_queries(session) as statements:
+            graph = load_dependency_graph(session, workspace_id)
+
+        assert_that(statements, has_length(1))
+        assert_that(graph.nodes[c].blockers, equal_to((b, a)))
+        assert_that(graph.topological_order, equal_to([a, d, f, b, e, c]))
+        assert_that(graph.critical_path, equal_to([a, b, c]))
+        assert_that(graph.cycles, equal_to([]))
+        assert_that([n.id for n in graph.blocking(a)], contains_exactly(b, c))
+
+    def test_resolved_initiatives_leave_the_critical_path(
+        self, session: Session, workspace: Workspace, initiatives
+    ):
+        initiatives["A"].status = InitiativeStatus.DONE
+        initiatives["E"].status = InitiativeStatus.DONE
+        session.commit()
+        a, b, c = (initiatives[name].id for name in "ABC")
+
+        graph = load_dependency_graph(session, workspace.id)
+
+        assert_that(graph.critical_path, equal_to([b, c]))
+        assert_that([n.id for n in graph.open_blockers(c)], equal_to([b]))
+
+    def test_cycles_are_detected(
+        self, session: Session, workspace: Workspace, initiatives
+    ):
+        # A -> B -> C -> A, and nothing else can start before them
+        initiatives["A"].blocked_by_id = initiatives["C"].id
+        session.commit()
+        a, b, c, d, e, f = (initiatives[name].id for name in "ABCDEF")
+
+        graph = load_dependency_graph(session, workspace.id)
+
+        assert_that(graph.cycles, has_length(1))
+        assert_that(set(graph.cycles[0]), equal_to({a, b, c}))
+        assert_that(graph.nodes[a].in_cycle, is_(True))
+        assert_that(graph.nodes[e].in_cycle, is_(False))
+        assert_that(graph.topological_order, equal_to([d, f, e]))
+
+    def test_cached_graph_is_invalidated_by_blocked_by_changes(
+        self, session: Session, workspace: Workspace, initiatives
+    ):
+        workspace_id = workspace.id
+        graph = get_dependency_graph(session, workspace_id)
+        with count_queries(session) as statements:
+            assert_that(get_dependency_graph(session, workspace_id), is_(graph))
+        assert_that(statements, has_length(0))
+
+        initiatives["F"].blocked_by_id = initiatives["C"].id
+        session.commit()
+
+        graph = get_dependency_graph(session, workspace.id)
+        assert_that(
+            graph.critical_path,
+            equal_to([initiatives[name].id for name in "ABCF"]),
+        )
+
+    def test_cached_graph_is_invalidated_by_bulk_status_changes(
+        self, session: Session, user: User, workspace: Workspace, initiatives
+    ):
+        get_dependency_graph(session, workspace.id)
+
+        InitiativeController(session).move_initiatives_to_status(
+            [initiatives["A"].id], user.id, InitiativeStatus.DONE
+        )
+
+        graph = get_dependency_graph(session, workspace.id)
+        assert_that(graph.nodes[initiatives["A"].id].is_resolved, is_(True))
+
+    def test_cache_entries_expire(self, session: Session, workspace: Workspace):
+        cache = DependencyGraphCache(ttl_seconds=0)
+        key = str(workspace.id)
+        _, generation = cache.get(key)
+        cache.put(key, generation, load_dependency_graph(session, workspace.id))
+
+        assert_that(cache.get(key)[0], is_(None))
+
+    def test_unblocked_initiatives(
+        self, session: Session, workspace: Workspace, initiatives
+    ):
+        initiatives["D"].status = InitiativeStatus.DONE
+        session.commit()
+        workspace_id = workspace.id
+
+        with count_queries(session) as statements:
+            unblocked = get_unblocked_initiatives(session, workspace_id)
+
+        assert_that(statements, has_length(1))
+        assert_that([i.title for i in unblocked], equal_to(["A", "E", "F"]))
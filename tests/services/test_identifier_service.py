@@ -0,0 +1,102 @@
+"""Tests for block allocation of identifiers."""
+
+from contextlib import contextmanager
+
+from hamcrest import assert_that, equal_to, has_length
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from src.models import Initiative, Task, User, Workspace
+from src.services.identifier_service import (
+    allocate_identifiers,
+    format_identifier,
+    reserve_identifiers,
+)
+
+
+@contextmanager
+def count_queries(session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+class TestIdentifierService:
+
+    def test_reserved_blocks_follow_each_other(self, session: Session, user: User):
+        first = reserve_identifiers(session, "user_task_counter", user.id, 10)
+        second = reserve_identifiers(session, "user_task_counter", user.id, 5)
+
+        assert_that((first, second), equal_to((0, 10)))
+        assert_that(
+            allocate_identifiers(session, "task", user.id, 2),
+            equal_to(["TM-016", "TM-017"]),
+        )
+
+    def test_workspace_counters(self, session: Session, workspace: Workspace):
+        assert_that(
+            allocate_identifiers(session, "turning_points", workspace.id, 2),
+            equal_to(["TP-0001", "TP-0002"]),
+        )
+
+    def test_identifiers_widen_past_the_padding(self, session: Session, user: User):
+        reserve_identifiers(session, "user_task_counter", user.id, 999)
+
+        assert_that(format_identifier("TM-", 1000), equal_to("TM-1000"))
+        assert_that(
+            session.execute(
+                text("SELECT dev.format_identifier('TM-', 1000, 3)")
+            ).scalar(),
+            equal_to("TM-1000"),
+        )
+        assert_that(
+            allocate_identifiers(session, "task", user.id, 1), equal_to(["TM-1000"])
+        )
+
+    def test_trigger_numbers_single_rows(
+        self, session: Session, user: User, workspace: Workspace
+    ):
+        reserve_identifiers(session, "user_initiative_counter", user.id, 999)
+        initiative = Initiative(
+            title="One", description="", user_id=user.id, workspace_id=workspace.id
+        )
+        session.add(initiative)
+        session.commit()
+
+        assert_that(initiative.identifier, equal_to("I-1000"))
+
+    def test_a_flush_of_many_rows_reserves_one_block(
+        self, session: Session, user: User, workspace: Workspace
+    ):
+        owned = {"user_id": user.id, "workspace_id": workspace.id}
+        initiative = Initiative(title="Parent", description="", **owned)
+        session.add(initiative)
+        session.flush()
+        tasks = [
+            Task(title=f"Task {i}", initiative_id=initiative.id, **owned)
+            for i in range(5)
+        ]
+
+        with count_queries(session) as statements:
+            session.add_all(tasks)
+            session.commit()
+
+        reservations = [s for s in statements if "reserve_identifiers" in s]
+        assert_that(reservations, has_length(1))
+        assert_that(
+            [t.identifier for t in tasks],
+            equal_to(["TM-001", "TM-002", "TM-003", "TM-004", "TM-005"]),
+        )
+        # The trigger continues after the block
+        task = Task(title="Next", initiative_id=initiative.id, **owned)
+        session.add(task)
+        session.commit()
+        assert_that(task.identifier, equal_to("TM-006"))
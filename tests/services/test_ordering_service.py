@@ -825,3 +825,39 @@ class TestOrderingServiceIntegration:
 
         # Verify ordering: task1 < task3 < task2
         assert ordering1.position < ordering3.position < ordering2.position
+
+    def test_append_items_full_integration(
+        self, session, user, workspace, test_initiative
+    ):
+        """Test moving several items to the end of a list in one batch."""
+        service = OrderingService(session)
+        tasks = [
+            Task(
+                title=f"Task {i}",
+                user_id=user.id,
+                initiative_id=test_initiative.id,
+                workspace_id=workspace.id,
+            )
+            for i in range(3)
+        ]
+        session.add_all(tasks)
+        session.commit()
+        orderings = [
+            service.add_item(ContextType.STATUS_LIST, None, task) for task in tasks
+        ]
+        session.commit()
+
+        positions = service.append_items(
+            ContextType.STATUS_LIST, None, EntityType.TASK, [tasks[1].id, tasks[0].id]
+        )
+        session.commit()
+
+        for ordering in orderings:
+            session.refresh(ordering)
+        assert [o.position for o in (orderings[1], orderings[0])] == positions
+        assert orderings[2].position < orderings[1].position < orderings[0].position
+
+        with pytest.raises(EntityNotFoundError):
+            service.append_items(
+                ContextType.STATUS_LIST, None, EntityType.TASK, [uuid.uuid4()]
+            )
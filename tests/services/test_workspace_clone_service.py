@@ -0,0 +1,243 @@
+"""Tests for server-side workspace cloning."""
+
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from hamcrest import assert_that, contains_exactly, equal_to, has_length
+from sqlalchemy.orm import Session
+
+from src.initiative_management.aggregates.strategic_initiative import (
+    StrategicInitiative,
+)
+from src.models import (
+    ChecklistItem,
+    ContextType,
+    Group,
+    GroupType,
+    Initiative,
+    InitiativeGroup,
+    Ordering,
+    Task,
+    User,
+    Workspace,
+)
+from src.narrative.aggregates.conflict import Conflict, ConflictStatus
+from src.narrative.aggregates.hero import Hero
+from src.narrative.aggregates.villain import Villain
+from src.roadmap_intelligence import controller as roadmap_controller
+from src.roadmap_intelligence.aggregates.prioritized_roadmap import PrioritizedRoadmap
+from src.roadmap_intelligence.aggregates.roadmap_theme import RoadmapTheme
+from src.services.ordering_service import OrderingService
+from src.services.workspace_clone_service import clone_workspace
+from src.strategic_planning.aggregates.product_outcome import ProductOutcome
+from src.strategic_planning.aggregates.product_vision import ProductVision
+from src.strategic_planning.aggregates.strategic_pillar import StrategicPillar
+
+
+class TestCloneWorkspace:
+    """Unit tests for clone_workspace."""
+
+    @pytest.fixture
+    def source(self, session: Session, user: User, workspace: Workspace) -> Workspace:
+        """A workspace with a backlog, a strategy and a narrative."""
+        owned = {"workspace_id": workspace.id, "user_id": user.id}
+        workspace.vision.vision_text = "Developers never lose focus"
+
+        blocker = Initiative(title="Blocker", description="", **owned)
+        session.add(blocker)
+        session.flush()
+        initiative = Initiative(
+            title="Focus mode", description="", blocked_by_id=blocker.id, **owned
+        )
+        session.add(initiative)
+        session.flush()
+        task = Task(title="Mute alerts", initiative_id=initiative.id, **owned)
+        session.add(task)
+        session.flush()
+        session.add_all(
+            [
+                ChecklistItem(title="Design", task_id=task.id, user_id=user.id),
+                ChecklistItem(title="Build", task_id=task.id, user_id=user.id),
+            ]
+        )
+        group = Group(name="Now", group_type=GroupType.EXPLICIT, **owned)
+        session.add(group)
+        session.flush()
+        session.add(
+            InitiativeGroup(
+                initiative_id=initiative.id, group_id=group.id, user_id=user.id
+            )
+        )
+        OrderingService(session).add_item(ContextType.GROUP, group.id, initiative)
+
+        pillar = StrategicPillar(name="Deep work", display_order=0, **owned)
+        outcome = ProductOutcome(name="Adoption", display_order=0, **owned)
+        hero = Hero(name="Sarah", description="Developer", **owned)
+        villain = Villain(
+            name="Context switching",
+            villain_type="WORKFLOW",
+            description="Interruptions",
+            severity=4,
+            **owned,
+        )
+        themes = [
+            RoadmapTheme(name=f"Theme {i}", description="Problem", **owned)
+            for i in range(2)
+        ]
+        session.add_all([pillar, outcome, hero, villain, *themes])
+        session.flush()
+        conflict = Conflict(
+            hero_id=hero.id,
+            villain_id=villain.id,
+            story_arc_id=themes[0].id,
+            description="Sarah battles interruptions",
+            status=ConflictStatus.OPEN.value,
+            **owned,
+        )
+        strategic_initiative = StrategicInitiative(
+            initiative_id=initiative.id,
+            pillar_id=pillar.id,
+            theme_id=themes[0].id,
+            description="Strategic context",
+            **owned,
+        )
+        session.add_all([conflict, strategic_initiative])
+        session.flush()
+
+        publisher = MagicMock()
+        outcome.link_to_pillars([pillar.id], user.id, session, publisher)
+        themes[0].link_to_outcomes([outcome.id], session, publisher)
+        themes[0].link_heroes([hero.id], session)
+        themes[0].link_villains([villain.id], session)
+        strategic_initiative.link_heroes([hero.id], session)
+        strategic_initiative.link_conflicts([conflict.id], session)
+        session.commit()
+
+        for order, theme in enumerate(reversed(themes)):
+            roadmap_controller.prioritize_roadmap_theme(
+                theme_id=theme.id,
+                new_order=order,
+                workspace_id=workspace.id,
+                session=session,
+            )
+        return workspace
+
+    def _clone(self, session: Session, source: Workspace, owner: User) -> Workspace:
+        return clone_workspace(
+            session,
+            source_workspace_id=source.id,
+            user_id=owner.id,
+            name="Demo",
+            description="Seeded",
+        )
+
+    def test_copies_the_backlog(
+        self, session: Session, source: Workspace, other_user: User
+    ):
+        clone = self._clone(session, source, other_user)
+
+        initiatives = (
+            session.query(Initiative)
+            .filter_by(workspace_id=clone.id)
+            .order_by(Initiative.identifier)
+            .all()
+        )
+        assert_that(
+            [(i.identifier, i.title) for i in initiatives],
+            equal_to([("I-001", "Blocker"), ("I-002", "Focus mode")]),
+        )
+        assert_that(initiatives[1].blocked_by_id, equal_to(initiatives[0].id))
+        assert_that(
+            all(i.user_id == other_user.id for i in initiatives), equal_to(True)
+        )
+
+        task = session.query(Task).filter_by(workspace_id=clone.id).one()
+        assert_that(task.identifier, equal_to("TM-001"))
+        assert_that(task.initiative_id, equal_to(initiatives[1].id))
+        assert_that(
+            sorted(item.title for item in task.checklist), equal_to(["Build", "Design"])
+        )
+
+        group = session.query(Group).filter_by(workspace_id=clone.id).one()
+        assert_that(
+            [i.id for i in group.initiatives], contains_exactly(initiatives[1].id)
+        )
+        ordering = session.query(Ordering).filter_by(workspace_id=clone.id).one()
+        assert_that(ordering.context_id, equal_to(group.id))
+        assert_that(ordering.initiative_id, equal_to(initiatives[1].id))
+
+    def test_copies_the_strategy_and_narrative(
+        self, session: Session, source: Workspace, other_user: User
+    ):
+        clone = self._clone(session, source, other_user)
+
+        vision = session.query(ProductVision).filter_by(workspace_id=clone.id).one()
+        assert_that(vision.vision_text, equal_to("Developers never lose focus"))
+
+        themes = (
+            session.query(RoadmapTheme)
+            .filter_by(workspace_id=clone.id)
+            .order_by(RoadmapTheme.identifier)
+            .all()
+        )
+        roadmap = (
+            session.query(PrioritizedRoadmap).filter_by(workspace_id=clone.id).one()
+        )
+        assert_that(
+            roadmap.get_prioritized_themes(), equal_to([themes[1].id, themes[0].id])
+        )
+        assert_that([o.name for o in themes[0].outcomes], contains_exactly("Adoption"))
+        assert_that(
+            [p.name for p in themes[0].outcomes[0].pillars],
+            contains_exactly("Deep work"),
+        )
+
+        conflict = session.query(Conflict).filter_by(workspace_id=clone.id).one()
+        assert_that(conflict.story_arc_id, equal_to(themes[0].id))
+        assert_that(conflict.hero.workspace_id, equal_to(clone.id))
+
+        strategic_initiative = (
+            session.query(StrategicInitiative).filter_by(workspace_id=clone.id).one()
+        )
+        assert_that(strategic_initiative.initiative.workspace_id, equal_to(clone.id))
+        assert_that(strategic_initiative.roadmap_theme, equal_to(themes[0]))
+        assert_that(strategic_initiative.conflicts, contains_exactly(conflict))
+        assert_that(strategic_initiative.heroes, has_length(1))
+
+    def test_leaves_the_source_untouched(
+        self, session: Session, source: Workspace, user: User, other_user: User
+    ):
+        self._clone(session, source, other_user)
+
+        assert_that(
+            session.query(Initiative).filter_by(workspace_id=source.id).count(),
+            equal_to(2),
+        )
+        assert_that(
+            session.query(Initiative).filter_by(user_id=user.id).count(), equal_to(2)
+        )
+
+    def test_continues_the_owner_identifier_sequence(
+        self, session: Session, source: Workspace, other_user: User
+    ):
+        clone = self._clone(session, source, other_user)
+        session.add(
+            Initiative(
+                title="Next",
+                description="",
+                workspace_id=clone.id,
+                user_id=other_user.id,
+            )
+        )
+        session.commit()
+
+        identifiers = [
+            i.identifier
+            for i in session.query(Initiative).filter_by(workspace_id=clone.id)
+        ]
+        assert_that(sorted(identifiers), equal_to(["I-001", "I-002", "I-003"]))
+
+    def test_unknown_source_is_rejected(self, session: Session, other_user: User):
+        with pytest.raises(ValueError):
+            clone_workspace(session, uuid.uuid4(), other_user.id, name="Demo")
@@ -0,0 +1,238 @@
+"""Tests for deleting workspaces and accounts in chunks."""
+
+import json
+import uuid
+from contextlib import contextmanager
+
+from fastapi import BackgroundTasks
+from hamcrest import assert_that, equal_to, has_length, is_, not_none
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from src import controller
+from src.initiative_management.initiative_controller import InitiativeController
+from src.initiative_management.task_controller import TaskController
+from src.models import ChecklistItem, Initiative, Ordering, Task, User, Workspace
+from src.services.workspace_deletion_service import (
+    mark_user_for_deletion,
+    mark_workspace_for_deletion,
+    purge_deleted_users,
+    purge_deleted_workspaces,
+    purge_user,
+    purge_workspace,
+    purge_workspace_in_background,
+)
+
+
+@contextmanager
+def count_queries(session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _fill(session: Session, workspace: Workspace, tasks: int) -> None:
+    """Add a blocked initiative with tasks and checklists to a workspace."""
+    initiatives = InitiativeController(session)
+    blocker = initiatives.create_initiative(
+        title="Blocker",
+        description="",
+        user_id=workspace.user_id,
+        workspace_id=workspace.id,
+    )
+    initiative = initiatives.create_initiative(
+        title="Blocked",
+        description="",
+        user_id=workspace.user_id,
+        workspace_id=workspace.id,
+    )
+    initiative.blocked_by_id = blocker.id
+    session.commit()
+    for i in range(tasks):
+        task = TaskController(session).create_task(
+            title=f"Task {i}",
+            user_id=workspace.user_id,
+            workspace_id=workspace.id,
+            initiative_id=initiative.id,
+        )
+        session.add(
+            ChecklistItem(title="Item", task_id=task.id, user_id=workspace.user_id)
+        )
+    session.commit()
+
+
+def _count(session: Session, model, workspace_id) -> int:
+    return session.query(model).filter(model.workspace_id == workspace_id).count()
+
+
+class TestWorkspaceDeletion:
+
+    def test_delete_hides_the_workspace_and_purges_it_after_the_response(
+        self, session: Session, user: User, workspace: Workspace
+    ):
+        _fill(session, workspace, tasks=3)
+        workspace_id = workspace.id
+        background_tasks = BackgroundTasks()
+
+        controller.delete_workspace(
+            user, str(workspace_id), session, background_tasks=background_tasks
+        )
+
+        # Hidden at once, purged by the scheduled task
+        session.expire_all()
+        assert_that(session.get(Workspace, workspace_id).deleting_at, is_(not_none()))
+        assert_that(_count(session, Task, workspace_id), equal_to(3))
+        assert_that(background_tasks.tasks, has_length(1))
+        task = background_tasks.tasks[0]
+        assert_that(task.func, equal_to(purge_workspace_in_background))
+
+        task.func(*task.args)
+
+        session.expire_all()
+        assert_that(session.get(Workspace, workspace_id), is_(None))
+        assert_that(_count(session, Initiative, workspace_id), equal_to(0))
+        assert_that(session.query(ChecklistItem).count(), equal_to(0))
+
+    def test_deleted_workspace_frees_the_users_workspace(
+        self, session: Session, user: User, workspace: Workspace
+    ):
+        controller.delete_workspace(
+            user, str(workspace.id), session, background_tasks=BackgroundTasks()
+        )
+
+        new_workspace = controller.create_workspace(user, "New", None, None, session)
+
+        workspaces = (
+            session.query(Workspace)
+            .filter(Workspace.user_id == user.id, Workspace.deleting_at.is_(None))
+            .all()
+        )
+        assert_that([w.id for w in workspaces], equal_to([new_workspace.id]))
+
+    def test_marked_workspace_is_hidden_from_postgrest(
+        self, session: Session, user: User, workspace: Workspace
+    ):
+        _fill(session, workspace, tasks=1)
+        mark_workspace_for_deletion(session, workspace)
+        user_id = user.id
+
+        # PostgREST runs requests as the authenticated role, under RLS
+        session.execute(text("SET LOCAL ROLE test_authenticated"))
+        session.execute(
+            text("SELECT set_config('request.jwt.claims', :claims, true)"),
+            {"claims": json.dumps({"sub": str(user_id)})},
+        )
+        try:
+            visible = {
+                table: session.execute(
+                    text(f"SELECT count(*) FROM dev.{table}")
+                ).scalar_one()
+                for table in ("workspace", "initiative", "task", "orderings")
+            }
+            session.execute(
+                text("INSERT INTO dev.workspace (id, name) VALUES (:id, 'New')"),
+                {"id": uuid.uuid4()},
+            )
+        finally:
+            session.rollback()
+
+        assert_that(
+            visible,
+            equal_to({"workspace": 0, "initiative": 0, "task": 0, "orderings": 0}),
+        )
+
+    def test_purge_deletes_in_chunks_and_leaves_other_workspaces(
+        self, session: Session, user: User, other_user: User, workspace: Workspace
+    ):
+        other = Workspace(name="Other", user_id=other_user.id)
+        session.add(other)
+        session.commit()
+        _fill(session, workspace, tasks=5)
+        _fill(session, other, tasks=1)
+        workspace_id, other_id = workspace.id, other.id
+
+        with count_queries(session) as statements:
+            purge_workspace(session, workspace_id, chunk_size=2)
+
+        task_deletes = [s for s in statements if s.startswith("DELETE FROM dev.task ")]
+        assert_that(task_deletes, has_length(3))
+        session.expire_all()
+        assert_that(session.get(Workspace, workspace_id), is_(None))
+        for model in (Initiative, Task, Ordering):
+            assert_that(_count(session, model, workspace_id), equal_to(0))
+        assert_that(_count(session, Task, other_id), equal_to(1))
+        assert_that(session.query(ChecklistItem).count(), equal_to(1))
+
+    def test_purge_deleted_workspaces_picks_up_marked_workspaces(
+        self, session: Session, workspace: Workspace
+    ):
+        _fill(session, workspace, tasks=1)
+        workspace_id = workspace.id
+        workspace.deleting_at = workspace.created_at
+        session.commit()
+
+        assert_that(purge_deleted_workspaces(session), equal_to(1))
+        assert_that(purge_deleted_workspaces(session), equal_to(0))
+        session.expire_all()
+        assert_that(session.get(Workspace, workspace_id), is_(None))
+
+
+class TestAccountDeletion:
+
+    def test_delete_account_deactivates_the_user_and_purges_after_the_response(
+        self, session: Session, user: User, workspace: Workspace
+    ):
+        _fill(session, workspace, tasks=2)
+        user_id, workspace_id = user.id, workspace.id
+        background_tasks = BackgroundTasks()
+
+        controller.confirm_delete_account(
+            user, "Moving on", session, background_tasks=background_tasks
+        )
+
+        session.expire_all()
+        assert_that(session.get(User, user_id).is_active, equal_to(False))
+        assert_that(session.get(User, user_id).deleting_at, is_(not_none()))
+        assert_that(session.get(Workspace, workspace_id).deleting_at, is_(not_none()))
+
+        task = background_tasks.tasks[0]
+        task.func(*task.args)
+
+        session.expire_all()
+        assert_that(session.get(User, user_id), is_(None))
+        assert_that(session.get(Workspace, workspace_id), is_(None))
+
+    def test_purge_user(self, session: Session, user: User, workspace: Workspace):
+        _fill(session, workspace, tasks=1)
+        user_id = user.id
+
+        purge_user(session, user_id, chunk_size=1)
+
+        session.expire_all()
+        assert_that(session.get(User, user_id), is_(None))
+        assert_that(session.query(Task).count(), equal_to(0))
+
+    def test_purge_deleted_users_picks_up_marked_accounts(
+        self, session: Session, user: User, other_user: User, workspace: Workspace
+    ):
+        _fill(session, workspace, tasks=1)
+        user_id, workspace_id = user.id, workspace.id
+        # Deactivated without being deleted
+        other_user.is_active = False
+        session.commit()
+        mark_user_for_deletion(session, user)
+
+        assert_that(purge_deleted_users(session), equal_to(1))
+        assert_that(purge_deleted_users(session), equal_to(0))
+        session.expire_all()
+        assert_that(session.get(User, user_id), is_(None))
+        assert_that(session.get(Workspace, workspace_id), is_(None))
+        assert_that(session.get(User, other_user.id), is_(not_none()))
@@ -0,0 +1,211 @@
+"""Tests for streaming workspace export and import."""
+
+import io
+import uuid
+
+import orjson
+import pytest
+from hamcrest import assert_that, equal_to, has_item, has_length
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from src.models import (
+    ChecklistItem,
+    Initiative,
+    InitiativeStatus,
+    Task,
+    User,
+    Workspace,
+)
+from src.roadmap_intelligence.aggregates.roadmap_theme import RoadmapTheme
+from src.services.workspace_export_service import (
+    compress,
+    export_workspace,
+    import_workspace,
+    read_lines,
+)
+
+
+class TestWorkspaceExport:
+    """Round trips through export_workspace and import_workspace."""
+
+    @pytest.fixture
+    def source(self, session: Session, user: User, workspace: Workspace) -> Workspace:
+        owned = {"workspace_id": workspace.id, "user_id": user.id}
+        initiative = Initiative(
+            title="Focus mode",
+            description="",
+            status=InitiativeStatus.IN_PROGRESS,
+            **owned,
+        )
+        session.add(initiative)
+        session.flush()
+        blocker = Initiative(title="Blocker", description="", **owned)
+        session.add(blocker)
+        session.flush()
+        initiative.blocked_by_id = blocker.id
+        task = Task(title="Mute alerts", initiative_id=initiative.id, **owned)
+        session.add_all(
+            [task, RoadmapTheme(name="Theme", description="Problem", **owned)]
+        )
+        session.flush()
+        session.add(ChecklistItem(title="Design", task_id=task.id, user_id=user.id))
+        session.commit()
+        return workspace
+
+    def _export(self, session: Session, workspace_id: uuid.UUID) -> bytes:
+        return b"".join(export_workspace(session, workspace_id))
+
+    def _delete(self, session: Session, workspace: Workspace) -> None:
+        session.execute(delete(Workspace).where(Workspace.id == workspace.id))
+        session.commit()
+
+    def test_export_is_ndjson_in_foreign_key_order(
+        self, session: Session, source: Workspace
+    ):
+        lines = [
+            orjson.loads(line)
+            for line in self._export(session, source.id).split(b"\n")
+            if line
+        ]
+
+        assert_that(lines[0]["workspace_id"], equal_to(str(source.id)))
+        tables = [line["table"] for line in lines[1:]]
+        assert_that(tables[0], equal_to("workspace"))
+        assert_that(tables.index("task") > tables.index("initiative"), equal_to(True))
+        assert_that(tables.index("checklist") > tables.index("task"), equal_to(True))
+        initiative = next(
+            line["row"]
+            for line in lines
+            if line.get("table") == "initiative"
+            and line["row"]["title"] == "Focus mode"
+        )
+        assert_that(initiative["status"], equal_to("IN_PROGRESS"))
+
+    def test_round_trip_restores_the_workspace(
+        self, session: Session, source: Workspace, user: User
+    ):
+        workspace_id = source.id
+        data = self._export(session, workspace_id)
+        self._delete(session, source)
+
+        workspace = import_workspace(session, read_lines(io.BytesIO(data)))
+
+        assert_that(workspace.id, equal_to(workspace_id))
+        initiatives = {
+            i.title: i
+            for i in session.query(Initiative).filter_by(workspace_id=workspace_id)
+        }
+        assert_that(
+            initiatives["Focus mode"].blocked_by_id,
+            equal_to(initiatives["Blocker"].id),
+        )
+        assert_that(
+            initiatives["Focus mode"].status, equal_to(InitiativeStatus.IN_PROGRESS)
+        )
+        task = session.query(Task).filter_by(workspace_id=workspace_id).one()
+        assert_that(task.checklist, has_length(1))
+
+        # New entities continue after the restored identifiers
+        session.add(
+            Initiative(
+                title="Next", description="", workspace_id=workspace_id, user_id=user.id
+            )
+        )
+        session.commit()
+        identifiers = [
+            i.identifier
+            for i in session.query(Initiative).filter_by(workspace_id=workspace_id)
+        ]
+        assert_that(identifiers, has_item("I-003"))
+
+    def test_round_trip_through_zstd(
+        self, session: Session, source: Workspace, other_user: User
+    ):
+        workspace_id = source.id
+        data = b"".join(compress(export_workspace(session, workspace_id)))
+        self._delete(session, source)
+
+        workspace = import_workspace(
+            session, read_lines(io.BytesIO(data)), user_id=other_user.id
+        )
+
+        assert_that(workspace.user_id, equal_to(other_user.id))
+        assert_that(
+            session.query(Initiative).filter_by(user_id=other_user.id).count(),
+            equal_to(2),
+        )
+
+    def test_import_rejects_an_existing_workspace(
+        self, session: Session, source: Workspace
+    ):
+        data = self._export(session, source.id)
+
+        with pytest.raises(ValueError):
+            import_workspace(session, read_lines(io.BytesIO(data)))
+
+    def _edit(self, data: bytes, table: str, **changes) -> bytes:
+        lines = [orjson.loads(line) for line in data.split(b"\n") if line]
+        for line in lines:
+            if line.get("table") == table:
+                line["row"].update(changes)
+        return b"".join(orjson.dumps(line) + b"\n" for line in lines)
+
+    def test_import_keeps_rows_in_the_exported_workspace(
+        self, session: Session, source: Workspace
+    ):
+        workspace_id = source.id
+        data = self._edit(
+            self._export(session, workspace_id),
+            "initiative",
+            workspace_id=str(uuid.uuid4()),
+        )
+        self._delete(session, source)
+
+        import_workspace(session, read_lines(io.BytesIO(data)))
+
+        assert_that(
+            session.query(Initiative).filter_by(workspace_id=workspace_id).count(),
+            equal_to(2),
+        )
+
+    def test_import_rejects_references_outside_the_export(
+        self, session: Session, source: Workspace, other_user: User
+    ):
+        other_workspace = Workspace(name="Other", user_id=other_user.id)
+        session.add(other_workspace)
+        session.flush()
+        owned = {"workspace_id": other_workspace.id, "user_id": other_user.id}
+        other_initiative = Initiative(title="Theirs", description="", **owned)
+        session.add(other_initiative)
+        session.flush()
+        other_task = Task(title="Theirs", initiative_id=other_initiative.id, **owned)
+        session.add(other_task)
+        session.commit()
+        workspace_id = source.id
+        data = self._edit(
+            self._export(session, workspace_id), "checklist", task_id=str(other_task.id)
+        )
+        self._delete(session, source)
+
+        with pytest.raises(ValueError, match="references a task not in export"):
+            import_workspace(session, read_lines(io.BytesIO(data)))
+
+        assert_that(session.get(Workspace, workspace_id), equal_to(None))
+
+    def test_import_rejects_malformed_rows(self, session: Session, source: Workspace):
+        workspace_id = source.id
+        lines = self._export(session, workspace_id).split(b"\n")
+        self._delete(session, source)
+        data = b"\n".join(lines[:2] + [b'{"row": {}}'])
+
+        with pytest.raises(ValueError, match="Malformed export"):
+            import_workspace(session, read_lines(io.BytesIO(data)))
+
+    def test_import_rejects_other_files(self, session: Session):
+        with pytest.raises(ValueError):
+            import_workspace(session, read_lines(io.BytesIO(b'{"hello": 1}\n')))
+
+    def test_export_of_unknown_workspace_fails(self, session: Session):
+        with pytest.raises(ValueError):
+            self._export(session, uuid.uuid4())
@@ -9,10 +9,18 @@ from datetime import datetime
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy.orm import Session
 
+from src.models import User, Workspace
 from src.strategic_planning.models import DomainEvent
-from src.strategic_planning.services.event_publisher import EventPublisher
+from src.strategic_planning.services.event_publisher import (
+    BufferedEventPublisher,
+    EventPublisher,
+    _commit_listeners,
+    has_uncommitted_events,
+    on_events_committed,
+)
 
 
 class TestEventPublisher:
@@ -192,3 +200,198 @@ class TestEventPublisher:
 
         assert saved_event.occurred_at is not None
         assert isinstance(saved_event.occurred_at, datetime)
+
+    def test_commit_notifies_listeners_with_workspace_id(
+        self, event_publisher: EventPublisher, sample_event: DomainEvent, session
+    ):
+        """Test that commit listeners hear about workspaces with committed events."""
+        notified = []
+        on_events_committed(notified.append)
+        try:
+            event_publisher.publish(sample_event, workspace_id="workspace-789")
+            assert has_uncommitted_events(session, "workspace-789")
+            assert notified == []
+
+            session.commit()
+        finally:
+            _commit_listeners.remove(notified.append)
+
+        assert notified == ["workspace-789"]
+        assert not has_uncommitted_events(session, "workspace-789")
+
+    def test_flushes_before_commit_keep_pending_notifications(
+        self, event_publisher: EventPublisher, sample_event: DomainEvent, session
+    ):
+        """Test that listeners still hear about events when later writes flush."""
+        notified = []
+        on_events_committed(notified.append)
+        try:
+            event_publisher.publish(sample_event, workspace_id="workspace-789")
+            session.add(
+                DomainEvent(
+                    user_id=uuid.uuid4(),
+                    event_type="VisionRefined",
+                    aggregate_id=uuid.uuid4(),
+                    payload={},
+                )
+            )
+            session.flush()
+            session.commit()
+        finally:
+            _commit_listeners.remove(notified.append)
+
+        assert notified == ["workspace-789"]
+
+    def test_rollback_discards_pending_notifications(
+        self, event_publisher: EventPublisher, sample_event: DomainEvent, session
+    ):
+        """Test that rolled back events never reach commit listeners."""
+        notified = []
+        on_events_committed(notified.append)
+        try:
+            event_publisher.publish(sample_event, workspace_id="workspace-789")
+            session.rollback()
+            session.commit()
+        finally:
+            _commit_listeners.remove(notified.append)
+
+        assert notified == []
+        assert not has_uncommitted_events(session, "workspace-789")
+
+
+class TestBufferedEventPublisher:
+    """Unit tests for BufferedEventPublisher."""
+
+    @pytest.fixture
+    def buffered_publisher(self, session: Session):
+        """BufferedEventPublisher instance with real database session."""
+        return BufferedEventPublisher(session)
+
+    def _event(self, order: int) -> DomainEvent:
+        return DomainEvent(
+            user_id=uuid.uuid4(),
+            event_type="StrategicPillarsReordered",
+            aggregate_id=uuid.uuid4(),
+            payload={"new_order": order},
+        )
+
+    def test_events_are_written_with_one_insert_at_commit(
+        self, buffered_publisher: BufferedEventPublisher, session: Session
+    ):
+        """Test that buffered events reach the database in a single INSERT."""
+        events = [self._event(order) for order in range(10)]
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = session.get_bind()
+        sqlalchemy_event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            for event in events:
+                buffered_publisher.publish(event, workspace_id="workspace-123")
+            assert statements == []
+            session.commit()
+        finally:
+            sqlalchemy_event.remove(
+                engine, "before_cursor_execute", before_cursor_execute
+            )
+
+        inserts = [s for s in statements if "INSERT INTO dev.domain_events" in s]
+        assert len(inserts) == 1
+        saved = (
+            session.query(DomainEvent)
+            .filter(DomainEvent.id.in_([event.id for event in events]))
+            .all()
+        )
+        assert sorted(e.payload["new_order"] for e in saved) == list(range(10))
+
+    @patch("src.strategic_planning.services.event_publisher.logger")
+    def test_logs_are_emitted_after_commit(
+        self,
+        mock_logger,
+        buffered_publisher: BufferedEventPublisher,
+        session: Session,
+    ):
+        """Test that structured logs are deferred until the commit succeeds."""
+        event = self._event(0)
+
+        buffered_publisher.publish(event, workspace_id="workspace-123")
+        mock_logger.info.assert_not_called()
+        assert event.id is not None
+
+        session.commit()
+
+        mock_logger.info.assert_called_once()
+        extra_fields = mock_logger.info.call_args[1]["extra"]
+        assert extra_fields["aggregate_id"] == str(event.aggregate_id)
+        assert extra_fields["workspace_id"] == "workspace-123"
+
+    @patch("src.strategic_planning.services.event_publisher.logger")
+    def test_logs_are_emitted_when_the_commit_flushes_other_changes(
+        self,
+        mock_logger,
+        buffered_publisher: BufferedEventPublisher,
+        session: Session,
+    ):
+        """Test that the commit's own flush does not discard the written events."""
+        event = self._event(0)
+
+        buffered_publisher.publish(event, workspace_id="workspace-123")
+        session.add(self._event(1))
+        session.commit()
+
+        mock_logger.info.assert_called_once()
+
+    def test_events_are_written_after_the_pending_entities(
+        self, buffered_publisher: BufferedEventPublisher, session: Session, user: User
+    ):
+        """Test that the commit flushes pending entities before the events."""
+        workspace = Workspace(id=uuid.uuid4(), name="Events", user_id=user.id)
+        session.add(workspace)
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = session.get_bind()
+        sqlalchemy_event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            buffered_publisher.publish(self._event(0), workspace_id=str(workspace.id))
+            session.commit()
+        finally:
+            sqlalchemy_event.remove(
+                engine, "before_cursor_execute", before_cursor_execute
+            )
+
+        inserts = [s.split()[2] for s in statements if s.startswith("INSERT INTO")]
+        assert inserts[0] == "dev.workspace"
+        assert inserts[-1] == "dev.domain_events"
+
+    @patch("src.strategic_planning.services.event_publisher.logger")
+    def test_rollback_discards_buffered_events(
+        self,
+        mock_logger,
+        buffered_publisher: BufferedEventPublisher,
+        session: Session,
+    ):
+        """Test that rolled back events are neither written nor logged."""
+        event = self._event(0)
+
+        buffered_publisher.publish(event)
+        session.rollback()
+        session.commit()
+
+        mock_logger.info.assert_not_called()
+        assert session.query(DomainEvent).filter_by(id=event.id).first() is None
+
+    def test_flush_writes_buffered_events_before_commit(
+        self, buffered_publisher: BufferedEventPublisher, session: Session
+    ):
+        """Test that flush() makes buffered events visible to queries."""
+        event = self._event(0)
+
+        buffered_publisher.publish(event)
+        buffered_publisher.flush()
+
+        assert session.query(DomainEvent).filter_by(id=event.id).first() is not None
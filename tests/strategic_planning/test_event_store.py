@@ -0,0 +1,188 @@
+"""Unit tests for the partitioned domain event store."""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from hamcrest import assert_that, contains_exactly, equal_to, has_item, none
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.models import User, Workspace
+from src.narrative.aggregates.turning_point import Significance, TurningPoint
+from src.strategic_planning.models import DomainEvent
+from src.strategic_planning.services.event_publisher import (
+    BufferedEventPublisher,
+    EventPublisher,
+)
+from src.strategic_planning.services.event_store import (
+    apply_event_retention,
+    decode_timeline_cursor,
+    ensure_event_partitions,
+    get_workspace_timeline,
+    list_event_partitions,
+)
+
+# Months used by these tests lie long before any real event, so creating and
+# dropping their partitions never touches the partitions of other tests
+PAST_MONTH = date(2000, 1, 1)
+
+
+def _event(user: User, workspace: Workspace, occurred_at: datetime) -> DomainEvent:
+    return DomainEvent(
+        user_id=user.id,
+        event_type="ThemeDefined",
+        aggregate_id=uuid.uuid4(),
+        workspace_id=workspace.id,
+        occurred_at=occurred_at,
+        payload={"workspace_id": str(workspace.id)},
+    )
+
+
+class TestEventStore:
+    """Unit tests for partition maintenance, retention and the timeline."""
+
+    @pytest.fixture(autouse=True)
+    def drop_past_partitions(self, session: Session):
+        yield
+        session.rollback()
+        apply_event_retention(session, 0, today=date(2001, 1, 1))
+        for month in ("1999_12", "2000_01"):
+            session.execute(
+                text(f"DROP TABLE IF EXISTS private.domain_events_archive_{month}")
+            )
+        session.commit()
+
+    def test_publishers_record_the_workspace(
+        self, session: Session, user: User, workspace: Workspace
+    ):
+        event = DomainEvent(
+            user_id=user.id,
+            event_type="HeroDefined",
+            aggregate_id=uuid.uuid4(),
+            payload={},
+        )
+        EventPublisher(session).publish(event, workspace_id=str(workspace.id))
+
+        buffered = DomainEvent(
+            user_id=user.id,
+            event_type="HeroDefined",
+            aggregate_id=uuid.uuid4(),
+            payload={"workspace_id": str(workspace.id)},
+        )
+        BufferedEventPublisher(session).publish(buffered)
+        session.commit()
+
+        workspace_ids = session.execute(
+            text("SELECT workspace_id FROM dev.domain_events")
+        ).scalars()
+        assert_that(list(workspace_ids), equal_to([workspace.id, workspace.id]))
+
+    def test_ensure_moves_stray_events_into_their_month(
+        self, session: Session, user: User, workspace: Workspace
+    ):
+        event = _event(user, workspace, datetime(1999, 12, 15, tzinfo=timezone.utc))
+        session.add(event)
+        session.commit()
+
+        created = ensure_event_partitions(session, months_ahead=1, today=PAST_MONTH)
+
+        assert_that(
+            created,
+            contains_exactly(
+                "domain_events_2000_01",
+                "domain_events_2000_02",
+                "domain_events_1999_12",
+            ),
+        )
+        partition = session.execute(
+            text("SELECT tableoid::regclass::text FROM dev.domain_events")
+        ).scalar()
+        assert_that(partition, equal_to("domain_events_1999_12"))
+        assert_that(
+            ensure_event_partitions(session, months_ahead=1, today=PAST_MONTH),
+            equal_to([]),
+        )
+
+    def test_retention_drops_expired_months(
+        self, session: Session, user: User, workspace: Workspace
+    ):
+        ensure_event_partitions(session, months_ahead=2, today=PAST_MONTH)
+        event = _event(user, workspace, datetime(2000, 1, 10, tzinfo=timezone.utc))
+        session.add(event)
+        session.flush()
+        turning_point = TurningPoint.create_from_event(
+            session=session,
+            domain_event=event,
+            narrative_description="Sarah shipped the MCP command.",
+            significance=Significance.MODERATE,
+        )
+        session.commit()
+
+        removed = apply_event_retention(session, 1, today=date(2000, 3, 5))
+
+        assert_that(removed, equal_to(["domain_events_2000_01"]))
+        assert_that(list_event_partitions(session), has_item(date(2000, 2, 1)))
+        assert_that(session.query(DomainEvent).count(), equal_to(0))
+        session.refresh(turning_point)
+        assert_that(turning_point.domain_event_id, none())
+
+    def test_retention_can_archive_expired_months(
+        self, session: Session, user: User, workspace: Workspace
+    ):
+        ensure_event_partitions(session, months_ahead=1, today=PAST_MONTH)
+        session.add(_event(user, workspace, datetime(2000, 1, 10, tzinfo=timezone.utc)))
+        session.commit()
+
+        apply_event_retention(session, 0, archive=True, today=date(2000, 2, 1))
+
+        assert_that(session.query(DomainEvent).count(), equal_to(0))
+        archived = session.execute(
+            text("SELECT count(*) FROM private.domain_events_archive_2000_01")
+        ).scalar()
+        assert_that(archived, equal_to(1))
+
+    def test_timeline_pages_through_workspace_events(
+        self, session: Session, user: User, workspace: Workspace
+    ):
+        now = datetime.now(timezone.utc)
+        events = [_event(user, workspace, now - timedelta(minutes=i)) for i in range(5)]
+        other_workspace_event = _event(user, workspace, now)
+        other_workspace_event.workspace_id = uuid.uuid4()
+        session.add_all(events + [other_workspace_event])
+        session.commit()
+
+        first = get_workspace_timeline(session, workspace.id, limit=2)
+        second = get_workspace_timeline(
+            session, workspace.id, limit=2, cursor=first.next_cursor
+        )
+        last = get_workspace_timeline(
+            session, workspace.id, limit=2, cursor=second.next_cursor
+        )
+
+        pages = [first.events, second.events, last.events]
+        assert_that(
+            [event.id for page in pages for event in page],
+            equal_to([event.id for event in events]),
+        )
+        assert_that(last.next_cursor, none())
+
+    def test_timeline_filters_by_event_type(
+        self, session: Session, user: User, workspace: Workspace
+    ):
+        now = datetime.now(timezone.utc)
+        theme_event = _event(user, workspace, now)
+        hero_event = _event(user, workspace, now)
+        hero_event.event_type = "HeroDefined"
+        session.add_all([theme_event, hero_event])
+        session.commit()
+
+        page = get_workspace_timeline(
+            session, workspace.id, limit=10, event_types=["HeroDefined"]
+        )
+
+        assert_that([event.id for event in page.events], equal_to([hero_event.id]))
+
+    def test_malformed_cursor_is_rejected(self):
+        with pytest.raises(ValueError):
+            decode_timeline_cursor("not-a-cursor")
@@ -0,0 +1,300 @@
+"""Unit tests for the checkpointed domain event projections."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+import pytest
+from hamcrest import assert_that, equal_to, has_length, none, not_none
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.models import User, Workspace
+from src.roadmap_intelligence.aggregates.roadmap_theme import RoadmapTheme
+from src.strategic_planning.models import (
+    DomainEvent,
+    ProjectionCheckpoint,
+    WorkspaceProjection,
+)
+from src.strategic_planning.services.event_publisher import EventPublisher
+from src.strategic_planning.services.projections import (
+    ROADMAP_SUMMARY_PROJECTION,
+    STRATEGIC_CONTEXT_PROJECTION,
+    Projection,
+    get_projection,
+    get_workspace_projection,
+    rebuild_projection,
+    refresh_expired_read_models,
+    replay_projection,
+    run_projection,
+)
+
+
+class TestProjections:
+    """Unit tests for running, replaying and rebuilding projections."""
+
+    @pytest.fixture
+    def publisher(self, session: Session) -> EventPublisher:
+        return EventPublisher(session)
+
+    @pytest.fixture
+    def counting_projection(self) -> Projection:
+        """Projection that records which workspaces it built."""
+        built = MagicMock(side_effect=lambda workspace_id, session: {"built": True})
+        return Projection(
+            name="test_projection",
+            event_types=frozenset({"ThemeDefined"}),
+            build=built,
+        )
+
+    def _define_theme(
+        self,
+        workspace: Workspace,
+        user: User,
+        session: Session,
+        publisher: EventPublisher,
+        name: str = "First Week Magic",
+    ) -> RoadmapTheme:
+        theme = RoadmapTheme.define_theme(
+            workspace_id=workspace.id,
+            user_id=user.id,
+            name=name,
+            description="Users fail to integrate in their first week.",
+            session=session,
+            publisher=publisher,
+        )
+        session.commit()
+        return theme
+
+    def _publish(
+        self,
+        session: Session,
+        publisher: EventPublisher,
+        user: User,
+        event_type: str,
+        payload: Dict[str, Any],
+    ) -> None:
+        publisher.publish(
+            DomainEvent(
+                user_id=user.id,
+                event_type=event_type,
+                aggregate_id=uuid.uuid4(),
+                payload=payload,
+            )
+        )
+        session.commit()
+
+    def test_run_builds_read_models_and_advances_checkpoint(
+        self,
+        session: Session,
+        workspace: Workspace,
+        user: User,
+        publisher: EventPublisher,
+    ):
+        theme = self._define_theme(workspace, user, session, publisher)
+        projection = get_projection(ROADMAP_SUMMARY_PROJECTION)
+
+        events_read = run_projection(session, projection)
+
+        assert_that(events_read, equal_to(1))
+        summary = get_workspace_projection(
+            session, ROADMAP_SUMMARY_PROJECTION, workspace.id
+        )
+        assert_that(summary["prioritized_themes"], equal_to([]))
+        assert_that(summary["unprioritized_themes"], has_length(1))
+        assert_that(summary["unprioritized_themes"][0]["id"], equal_to(str(theme.id)))
+
+        checkpoint = session.get(ProjectionCheckpoint, ROADMAP_SUMMARY_PROJECTION)
+        assert_that(checkpoint.last_position, not_none())
+        assert_that(run_projection(session, projection), equal_to(0))
+
+    def test_read_model_is_not_served_while_events_are_pending(
+        self,
+        session: Session,
+        workspace: Workspace,
+        user: User,
+        publisher: EventPublisher,
+    ):
+        self._define_theme(workspace, user, session, publisher)
+        projection = get_projection(ROADMAP_SUMMARY_PROJECTION)
+        run_projection(session, projection)
+
+        self._define_theme(workspace, user, session, publisher, name="Second Theme")
+
+        assert_that(
+            get_workspace_projection(session, ROADMAP_SUMMARY_PROJECTION, workspace.id),
+            none(),
+        )
+
+        run_projection(session, projection)
+
+        summary = get_workspace_projection(
+            session, ROADMAP_SUMMARY_PROJECTION, workspace.id
+        )
+        assert_that(summary["unprioritized_themes"], has_length(2))
+
+    def test_pending_probe_only_reads_events_after_the_checkpoint_moved(
+        self,
+        session: Session,
+        workspace: Workspace,
+        user: User,
+        publisher: EventPublisher,
+    ):
+        self._define_theme(workspace, user, session, publisher)
+        projection = get_projection(ROADMAP_SUMMARY_PROJECTION)
+        run_projection(session, projection)
+        self._define_theme(workspace, user, session, publisher, name="Second Theme")
+
+        # Pretend the checkpoint moved long after the pending event started
+        checkpoint = session.get(ProjectionCheckpoint, ROADMAP_SUMMARY_PROJECTION)
+        checkpoint.updated_at = datetime.now(timezone.utc) + timedelta(
+            seconds=settings.projection_pending_events_slack_seconds + 60
+        )
+        session.commit()
+
+        assert_that(
+            get_workspace_projection(session, ROADMAP_SUMMARY_PROJECTION, workspace.id),
+            not_none(),
+        )
+
+    def test_expired_read_model_is_not_served(
+        self,
+        session: Session,
+        workspace: Workspace,
+        user: User,
+        publisher: EventPublisher,
+    ):
+        self._define_theme(workspace, user, session, publisher)
+        run_projection(session, get_projection(ROADMAP_SUMMARY_PROJECTION))
+
+        row = session.get(
+            WorkspaceProjection, (ROADMAP_SUMMARY_PROJECTION, workspace.id)
+        )
+        row.updated_at = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.projection_max_age_seconds + 60
+        )
+        session.commit()
+
+        assert_that(
+            get_workspace_projection(session, ROADMAP_SUMMARY_PROJECTION, workspace.id),
+            none(),
+        )
+
+    def test_refresh_rebuilds_read_models_past_half_their_max_age(
+        self,
+        session: Session,
+        workspace: Workspace,
+        user: User,
+        publisher: EventPublisher,
+        counting_projection: Projection,
+    ):
+        payload = {"workspace_id": str(workspace.id)}
+        self._publish(session, publisher, user, "ThemeDefined", payload)
+        run_projection(session, counting_projection)
+        assert_that(
+            refresh_expired_read_models(session, counting_projection), equal_to(0)
+        )
+
+        row = session.get(WorkspaceProjection, ("test_projection", workspace.id))
+        row.updated_at = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.projection_max_age_seconds / 2 + 60
+        )
+        session.commit()
+
+        assert_that(
+            refresh_expired_read_models(session, counting_projection), equal_to(1)
+        )
+        assert_that(counting_projection.build.call_count, equal_to(2))
+        assert_that(
+            refresh_expired_read_models(session, counting_projection), equal_to(0)
+        )
+
+    def test_only_relevant_events_rebuild_read_models(
+        self,
+        session: Session,
+        workspace: Workspace,
+        user: User,
+        publisher: EventPublisher,
+        counting_projection: Projection,
+    ):
+        payload = {"workspace_id": str(workspace.id)}
+        self._publish(session, publisher, user, "HeroDefined", payload)
+        self._publish(session, publisher, user, "ThemeDefined", payload)
+        self._publish(session, publisher, user, "ThemeDefined", payload)
+
+        events_read = run_projection(session, counting_projection, batch_size=2)
+
+        assert_that(events_read, equal_to(3))
+        # One build per workspace and batch, not per event
+        assert_that(counting_projection.build.call_count, equal_to(2))
+
+        self._publish(session, publisher, user, "HeroDefined", payload)
+        assert_that(run_projection(session, counting_projection), equal_to(1))
+        assert_that(counting_projection.build.call_count, equal_to(2))
+
+    def test_failed_build_drops_read_model(
+        self,
+        session: Session,
+        workspace: Workspace,
+        user: User,
+        publisher: EventPublisher,
+        counting_projection: Projection,
+    ):
+        payload = {"workspace_id": str(workspace.id)}
+        self._publish(session, publisher, user, "ThemeDefined", payload)
+        run_projection(session, counting_projection)
+        assert_that(
+            session.get(WorkspaceProjection, ("test_projection", workspace.id)),
+            not_none(),
+        )
+
+        counting_projection.build.side_effect = RuntimeError("bad data")
+        self._publish(session, publisher, user, "ThemeDefined", payload)
+        run_projection(session, counting_projection)
+
+        session.expire_all()
+        assert_that(
+            session.get(WorkspaceProjection, ("test_projection", workspace.id)),
+            none(),
+        )
+        assert_that(run_projection(session, counting_projection), equal_to(0))
+
+    def test_replay_reapplies_history(
+        self,
+        session: Session,
+        workspace: Workspace,
+        user: User,
+        publisher: EventPublisher,
+        counting_projection: Projection,
+    ):
+        payload = {"workspace_id": str(workspace.id)}
+        self._publish(session, publisher, user, "ThemeDefined", payload)
+        run_projection(session, counting_projection)
+
+        events_read = replay_projection(session, counting_projection)
+
+        assert_that(events_read, equal_to(1))
+        assert_that(counting_projection.build.call_count, equal_to(2))
+
+    def test_rebuild_recomputes_every_workspace_from_zero(
+        self,
+        session: Session,
+        workspace: Workspace,
+        user: User,
+        publisher: EventPublisher,
+    ):
+        self._define_theme(workspace, user, session, publisher)
+        projection = get_projection(STRATEGIC_CONTEXT_PROJECTION)
+
+        rebuilt = rebuild_projection(session, projection)
+
+        assert_that(rebuilt, equal_to(1))
+        context = get_workspace_projection(
+            session, STRATEGIC_CONTEXT_PROJECTION, workspace.id
+        )
+        assert_that(context["pillars"], equal_to([]))
+        assert_that(context["themes"], has_length(1))
+        assert_that(context["themes"][0]["name"], equal_to("First Week Magic"))
+        # Events up to the rebuild are already reflected
+        assert_that(run_projection(session, projection), equal_to(0))
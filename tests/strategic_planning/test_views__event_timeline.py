@@ -0,0 +1,77 @@
+"""Tests for the workspace event timeline view."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from hamcrest import assert_that, equal_to, none
+from sqlalchemy.orm import Session
+
+from src.models import User, Workspace
+from src.strategic_planning.models import DomainEvent
+
+
+class TestEventTimelineViews:
+    def _add_events(
+        self, session: Session, user: User, workspace: Workspace, count: int
+    ):
+        now = datetime.now(timezone.utc)
+        events = [
+            DomainEvent(
+                user_id=user.id,
+                event_type="ThemeDefined",
+                aggregate_id=uuid.uuid4(),
+                workspace_id=workspace.id,
+                occurred_at=now - timedelta(minutes=i),
+                payload={"workspace_id": str(workspace.id), "name": f"Theme {i}"},
+            )
+            for i in range(count)
+        ]
+        session.add_all(events)
+        session.commit()
+        return events
+
+    def test_get_timeline_unauthorized(
+        self, test_client_no_user: TestClient, workspace: Workspace
+    ):
+        response = test_client_no_user.get(f"/api/workspaces/{workspace.id}/events")
+        assert_that(response.status_code, equal_to(401))
+
+    def test_get_timeline_pages_with_cursor(
+        self,
+        test_client: TestClient,
+        session: Session,
+        user: User,
+        workspace: Workspace,
+    ):
+        events = self._add_events(session, user, workspace, 3)
+
+        first = test_client.get(
+            f"/api/workspaces/{workspace.id}/events", params={"limit": 2}
+        )
+        assert_that(first.status_code, equal_to(200))
+        first_page = first.json()
+        assert_that(
+            [event["id"] for event in first_page["events"]],
+            equal_to([str(event.id) for event in events[:2]]),
+        )
+        assert_that(first_page["events"][0]["payload"]["name"], equal_to("Theme 0"))
+
+        second = test_client.get(
+            f"/api/workspaces/{workspace.id}/events",
+            params={"limit": 2, "cursor": first_page["next_cursor"]},
+        )
+        second_page = second.json()
+        assert_that(
+            [event["id"] for event in second_page["events"]],
+            equal_to([str(events[2].id)]),
+        )
+        assert_that(second_page["next_cursor"], none())
+
+    def test_get_timeline_invalid_cursor(
+        self, test_client: TestClient, workspace: Workspace
+    ):
+        response = test_client.get(
+            f"/api/workspaces/{workspace.id}/events", params={"cursor": "garbage"}
+        )
+        assert_that(response.status_code, equal_to(400))
@@ -0,0 +1,156 @@
+"""Tests for the workspace change feed."""
+
+import asyncio
+import json
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from hamcrest import assert_that, equal_to
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src import controller
+from src.change_feed import RESYNC, ChangeFeed, change_feed
+from src.models import ChecklistItem, Task, Workspace
+
+
+@pytest.fixture
+async def feed():
+    feed = ChangeFeed(change_feed.dsn, queue_size=10, connect_timeout=5)
+    yield feed
+    await feed.close()
+
+
+def _refine_vision(session: Session, workspace: Workspace) -> None:
+    session.execute(
+        text(
+            "UPDATE dev.workspace_vision SET vision_text = 'Ship it' "
+            "WHERE workspace_id = :workspace_id"
+        ),
+        {"workspace_id": workspace.id},
+    )
+    session.commit()
+
+
+class TestChangeFeed:
+    @pytest.mark.asyncio
+    async def test_committed_change_reaches_workspace_subscribers(
+        self, feed: ChangeFeed, session: Session, workspace: Workspace
+    ):
+        async with feed.subscribe(workspace.id) as changes:
+            _refine_vision(session, workspace)
+
+            change = await asyncio.wait_for(changes.get(), 5)
+
+        assert_that(
+            change,
+            equal_to(
+                {
+                    "workspace_id": str(workspace.id),
+                    "entity": "workspace_vision",
+                    "op": "update",
+                }
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_other_workspaces_changes_are_not_delivered(
+        self, feed: ChangeFeed, session: Session, workspace: Workspace
+    ):
+        async with feed.subscribe(uuid.uuid4()) as changes:
+            _refine_vision(session, workspace)
+            await asyncio.sleep(0.2)
+
+            assert_that(changes.empty(), equal_to(True))
+
+    @pytest.mark.asyncio
+    async def test_uncommitted_change_is_not_delivered(
+        self, feed: ChangeFeed, session: Session, workspace: Workspace
+    ):
+        async with feed.subscribe(workspace.id) as changes:
+            session.execute(
+                text("UPDATE dev.workspace_vision SET vision_text = 'Draft'")
+            )
+            session.rollback()
+            await asyncio.sleep(0.2)
+
+            assert_that(changes.empty(), equal_to(True))
+
+    @pytest.mark.asyncio
+    async def test_multi_row_statement_sends_one_change(
+        self, feed: ChangeFeed, session: Session, workspace: Workspace, test_task: Task
+    ):
+        # The fixture leaves the task's ordering uncommitted
+        session.commit()
+        async with feed.subscribe(workspace.id) as changes:
+            session.add_all(
+                ChecklistItem(
+                    title=f"Step {n}", user_id=test_task.user_id, task_id=test_task.id
+                )
+                for n in range(3)
+            )
+            session.commit()
+
+            change = await asyncio.wait_for(changes.get(), 5)
+            await asyncio.sleep(0.2)
+
+            assert_that(changes.empty(), equal_to(True))
+        assert_that(
+            change,
+            equal_to(
+                {
+                    "workspace_id": str(workspace.id),
+                    "entity": "checklist",
+                    "op": "insert",
+                }
+            ),
+        )
+
+    def test_slow_subscriber_gets_a_resync(self):
+        feed = ChangeFeed("postgresql://unused", queue_size=2, connect_timeout=1)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        change = {"workspace_id": "w", "entity": "task", "op": "update"}
+
+        for _ in range(3):
+            feed._offer(queue, change)
+
+        assert_that(queue.qsize(), equal_to(1))
+        assert_that(queue.get_nowait(), equal_to(RESYNC))
+
+    @pytest.mark.asyncio
+    async def test_stream_sends_ready_then_changes(
+        self, session: Session, workspace: Workspace
+    ):
+        stream = controller.stream_workspace_changes(str(workspace.id))
+        try:
+            ready = await asyncio.wait_for(stream.__anext__(), 5)
+            _refine_vision(session, workspace)
+            change = await asyncio.wait_for(stream.__anext__(), 5)
+        finally:
+            await stream.aclose()
+            await change_feed.close()
+
+        assert_that(ready.event, equal_to("ready"))
+        assert_that(change.event, equal_to("change"))
+        assert_that(
+            json.loads(change.data),
+            equal_to({"entity": "workspace_vision", "op": "update"}),
+        )
+
+
+def test_changes_of_unknown_workspace_are_not_streamed(test_client):
+    response = test_client.get(f"/api/workspaces/{uuid.uuid4()}/changes")
+
+    assert_that(response.status_code, equal_to(404))
+
+
+def test_stream_fails_before_starting_when_the_feed_cannot_connect(
+    test_client, workspace
+):
+    with patch.object(
+        change_feed, "start", AsyncMock(side_effect=asyncio.TimeoutError)
+    ):
+        response = test_client.get(f"/api/workspaces/{workspace.id}/changes")
+
+    assert_that(response.status_code, equal_to(503))
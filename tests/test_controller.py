@@ -2,6 +2,7 @@ import datetime
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+from fastapi import BackgroundTasks, HTTPException, Request
 from fastapi.responses import HTMLResponse
 from freezegun import freeze_time
 from hamcrest import assert_that, contains_string, equal_to, is_
@@ -11,6 +12,7 @@ from src.api import WorkspaceUpdate
 from src.config import settings
 from src.controller import (
     PARAMS_FOR_LOGIN_SCRIPT,
+    PROFILE_PICTURE_MAX_BODY_SIZE,
     confirm_delete_account,
     copy_auth0_provided_profile_picture,
     delete_workspace,
@@ -18,6 +20,7 @@ from src.controller import (
     get_changelog_template,
     get_profile_picture,
     get_react_app,
+    read_profile_picture_form,
     update_user,
     update_workspace,
     upload_profile_picture,
@@ -81,7 +84,10 @@ def test_get_account_template(mock_template_response, user, workspace, session):
 @patch(
     "src.main.templates.TemplateResponse", return_value=HTMLResponse("<html></html>")
 )
-@patch("src.controller.GitHubService.get_user_repositories", return_value=[])
+@patch(
+    "src.github_app.repository_cache.GitHubService.list_installation_repositories",
+    return_value=[],
+)
 def test_get_account_template_with_github_installation(
     mock_get_user_repositories, mock_template_response, user, workspace, session
 ):
@@ -118,6 +124,34 @@ def test_get_account_template_with_github_installation(
         },
     )
     assert isinstance(result, HTMLResponse)
+    mock_get_user_repositories.assert_called_once_with("12345")
+    assert_that(
+        github_installation.repositories_cache, equal_to([{"name": "test-repo"}])
+    )
+
+
+@patch(
+    "src.main.templates.TemplateResponse", return_value=HTMLResponse("<html></html>")
+)
+@patch("src.github_app.repository_cache.GitHubService.list_installation_repositories")
+def test_get_account_template_renders_cached_repositories(
+    mock_list_repositories, mock_template_response, user, workspace, session
+):
+    github_installation = GitHubInstallation(
+        user_id=user.id,
+        workspace_id=workspace.id,
+        installation_id="12345",
+        repositories_cache=[{"name": "cached-repo"}],
+        repositories_cached_at=datetime.datetime.now(),
+    )
+    session.add(github_installation)
+    session.commit()
+
+    get_account_template(MagicMock(), user, session, BackgroundTasks())
+
+    mock_list_repositories.assert_not_called()
+    context = mock_template_response.call_args.args[2]
+    assert_that(context["repositories"], equal_to([{"name": "cached-repo"}]))
 
 
 @patch(
@@ -131,6 +165,27 @@ def test_get_profile_picture_returns_file_from_storage_service(
     mock_get_profile_picture.assert_called_once_with("filename")
 
     assert_that(response.path, equal_to("temp_filepath"))
+    assert_that(response.headers["etag"], equal_to('"filename"'))
+    assert_that(response.headers["cache-control"], contains_string("immutable"))
+
+
+@patch("src.controller.storage_service.get_profile_picture")
+def test_get_profile_picture_not_modified(mock_get_profile_picture):
+    response = get_profile_picture("abc-123.png", if_none_match='W/"x", "abc-123"')
+
+    assert_that(response.status_code, equal_to(304))
+    assert_that(response.headers["etag"], equal_to('"abc-123"'))
+    mock_get_profile_picture.assert_not_called()
+
+
+@patch(
+    "src.controller.storage_service.get_profile_picture",
+    side_effect=FileNotFoundError("missing"),
+)
+def test_get_profile_picture_missing(mock_get_profile_picture):
+    response = get_profile_picture("missing.png")
+
+    assert_that(response.status_code, equal_to(404))
 
 
 @patch(
@@ -154,6 +209,27 @@ def test_upload_profile_picture(mock_storage_upload, user):
     assert_that(user.profile_picture_url, equal_to("temp_filepath"))
 
 
+@patch("src.controller.storage_service.delete_profile_picture")
+@patch(
+    "src.controller.storage_service.upload_profile_picture",
+    return_value="new_filename",
+)
+def test_upload_profile_picture_deletes_replaced_picture(
+    mock_storage_upload, mock_delete, user
+):
+    user.profile_picture_url = "old_filename"
+    mock_file = UploadFile(
+        file=MagicMock(),
+        filename="test.png",
+        headers=Headers({"content-type": "image/png"}),
+        size=1024,
+    )
+
+    upload_profile_picture(user, mock_file, db=MagicMock())
+
+    mock_delete.assert_called_once_with("old_filename")
+
+
 @patch(
     "src.controller.storage_service.upload_profile_picture",
     return_value="temp_filepath",
@@ -173,6 +249,46 @@ def test_profile_picture_max_size(mock_storage_upload, user):
     assert_that(response.status_code, equal_to(400))
 
 
+def _multipart_request(body: bytes, chunk_size: int = 64 * 1024) -> Request:
+    chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+    async def receive():
+        chunk = chunks.pop(0) if chunks else b""
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(b"content-type", b"multipart/form-data; boundary=boundary")],
+    }
+    return Request(scope, receive)
+
+
+def _multipart_body(content: bytes) -> bytes:
+    return (
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="a.png"\r\n'
+        b"Content-Type: image/png\r\n\r\n" + content + b"\r\n--boundary--\r\n"
+    )
+
+
+async def test_read_profile_picture_form_parses_upload():
+    form = await read_profile_picture_form(_multipart_request(_multipart_body(b"png")))
+
+    assert_that(await form["file"].read(), equal_to(b"png"))
+    await form.close()
+
+
+async def test_read_profile_picture_form_stops_reading_oversized_stream():
+    body = _multipart_body(b"x" * (PROFILE_PICTURE_MAX_BODY_SIZE + 1))
+    request = _multipart_request(body)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await read_profile_picture_form(request)
+
+    assert_that(exc_info.value.status_code, equal_to(413))
+
+
 @patch(
     "src.controller.storage_service.upload_profile_picture",
     return_value="temp_filepath",
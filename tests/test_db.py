@@ -35,10 +35,19 @@ def test_tables_in_public_schema(session: Session):
     )
     assert_that(result.fetchone()[0], is_(True))
 
-    # Check that the tables in the public schema are present
+    # Check that the tables in the public schema are present (partitions are
+    # only reached through their partitioned table, so they are not counted)
     result = session.execute(
         text(
-            f"SELECT table_name FROM information_schema.tables WHERE table_schema = '{SCHEMA_NAME}'"
+            f"""
+            SELECT table_name FROM information_schema.tables
+            WHERE table_schema = '{SCHEMA_NAME}'
+                AND NOT EXISTS (
+                    SELECT 1 FROM pg_class AS c
+                    WHERE c.oid = (table_schema || '.' || table_name)::regclass
+                        AND c.relispartition
+                )
+            """
         )
     )
     table_names = [row[0] for row in result.fetchall()]
@@ -78,7 +87,7 @@ def test_tables_in_public_schema(session: Session):
 
         user_id_check = "(user_id = get_user_id_from_jwt())"
         workspace_id_check = "(workspace_id IN ( SELECT workspace.id FROM workspace WHERE (workspace.user_id = get_user_id_from_jwt())))"
-        unique_workspace_check = "(NOT (EXISTS ( SELECT 1 FROM workspace ws WHERE (ws.user_id = get_user_id_from_jwt()))))"
+        unique_workspace_check = "(NOT (EXISTS ( SELECT 1 FROM workspace ws WHERE ((ws.user_id = get_user_id_from_jwt()) AND (ws.deleting_at IS NULL)))))"
         assert_that(
             policy,
             any_of(
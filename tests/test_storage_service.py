@@ -1,12 +1,23 @@
+import hashlib
+import io
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import ANY, MagicMock, patch
 
-from hamcrest import assert_that, equal_to, raises
+import pytest
+from botocore.exceptions import ClientError
+from hamcrest import assert_that, equal_to, is_not, raises
 
 from src import storage_service
 from src.config import settings
 
+# md5("user123" + hash_salt)
+USER_HASH = "05db73715990652447f1476a4f3b99c1"
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()[:16]
+
 
 def test_s3_resource_is_setup_correctly():
     expected_endpoint = (
@@ -23,51 +34,127 @@ def test_s3_resource_is_setup_correctly():
             endpoint_url=expected_endpoint,
             aws_access_key_id=settings.r2_access_key_id,
             aws_secret_access_key=settings.r2_secret_access_key,
+            config=ANY,
+        )
+        config = mock_boto3_client.call_args.kwargs["config"]
+        assert_that(
+            config.max_pool_connections, equal_to(settings.r2_max_pool_connections)
         )
         assert_that(s3, equal_to(mock_s3_client))
 
 
-@patch("src.storage_service.NamedTemporaryFile")
-@patch("src.storage_service.get_s3_resource")
-def test_can_get_a_profile_picture_for_a_user(
-    mock_get_s3_resource, mock_named_temporary_file
+def test_s3_client_is_shared():
+    with patch("src.storage_service._s3_client", None):
+        with patch("src.storage_service.get_s3_resource") as mock_get_s3_resource:
+            first = storage_service.get_s3_client()
+            second = storage_service.get_s3_client()
+
+    mock_get_s3_resource.assert_called_once()
+    assert_that(first, equal_to(second))
+
+
+@pytest.fixture
+def profile_picture_cache(tmp_path):
+    cache = storage_service.ProfilePictureDiskCache(tmp_path / "cache", 1024)
+    with patch("src.storage_service.profile_picture_cache", cache):
+        with patch("src.storage_service.settings.cloudflare_account_id", "account"):
+            yield cache
+
+
+@patch("src.storage_service.get_s3_client")
+def test_profile_picture_is_downloaded_once_then_served_from_disk(
+    mock_get_s3_client, profile_picture_cache
 ):
-    filename = "3d6b91ba261ed243ee4a377164a1ab90.png"
-    mock_s3_resource = MagicMock()
-    mock_get_s3_resource.return_value = mock_s3_resource
+    filename = "3d6b91ba261ed243ee4a377164a1ab90-0123456789abcdef.png"
+    mock_s3 = mock_get_s3_client.return_value
+    mock_s3.download_fileobj.side_effect = lambda bucket, key, f: f.write(b"data")
 
-    mock_named_temporary_file.return_value.name = "mock_name"
+    first = storage_service.get_profile_picture(filename)
+    second = storage_service.get_profile_picture(filename)
 
-    mock_returned_file = MagicMock()
-    mock_file = MagicMock()
+    mock_s3.download_fileobj.assert_called_once_with(
+        settings.r2_profile_picture_bucket_name, filename, ANY
+    )
+    assert_that(first, equal_to(second))
+    assert_that(Path(first).read_bytes(), equal_to(b"data"))
 
-    with patch("builtins.open", mock_open(read_data=b"data")) as mock_file_open:
-        mock_file_open.return_value = mock_file
-        mock_s3_resource.download_fileobj.return_value = mock_returned_file
 
-        file = storage_service.get_profile_picture(filename)
+@patch("src.storage_service.get_s3_client")
+def test_missing_r2_profile_picture_raises_file_not_found(
+    mock_get_s3_client, profile_picture_cache
+):
+    mock_get_s3_client.return_value.download_fileobj.side_effect = ClientError(
+        {"Error": {"Code": "404"}}, "HeadObject"
+    )
 
-        mock_s3_resource.download_fileobj.assert_called_once_with(
-            settings.r2_profile_picture_bucket_name, filename, mock_file
-        )
-        mock_file_open.assert_called_once_with("mock_name", "wb")
-        assert_that(file, equal_to(mock_file.name))
+    assert_that(
+        lambda: storage_service.get_profile_picture("missing.png"),
+        raises(FileNotFoundError),
+    )
+    assert_that(
+        [path.name for path in profile_picture_cache.directory.iterdir()],
+        equal_to([]),
+    )
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = storage_service.ProfilePictureDiskCache(tmp_path, 10, lease_seconds=0)
+
+    cache.put("a.png", lambda f: f.write(b"aaaa"))
+    cache.put("b.png", lambda f: f.write(b"bbbb"))
+    cache.get("a.png")
+    cache.put("c.png", lambda f: f.write(b"cccc"))
+
+    assert_that(cache.get("b.png"), equal_to(None))
+    assert_that(cache.get("a.png"), equal_to(tmp_path / "a.png"))
+    assert_that(cache.get("c.png"), equal_to(tmp_path / "c.png"))
+
+
+def test_disk_cache_does_not_evict_files_being_served(tmp_path):
+    cache = storage_service.ProfilePictureDiskCache(tmp_path, 10)
+
+    served = cache.put("a.png", lambda f: f.write(b"aaaa"))
+    cache.put("b.png", lambda f: f.write(b"bbbb"))
+    cache.put("c.png", lambda f: f.write(b"cccc"))
+
+    assert_that(served.read_bytes(), equal_to(b"aaaa"))
+
+    cache.lease_seconds = 0
+    cache.get("a.png")
+    cache.get("b.png")
+    cache.put("d.png", lambda f: f.write(b"dddd"))
+
+    assert_that(cache.get("a.png"), equal_to(None))
+    assert_that(cache.get("b.png"), equal_to(None))
+
+
+def test_profile_picture_filename_changes_with_content():
+    first = io.BytesIO(b"first")
+
+    filename = storage_service.profile_picture_filename("user123", first)
+
+    assert_that(filename, equal_to(USER_HASH + "-" + _digest(b"first") + ".png"))
+    assert_that(first.tell(), equal_to(0))
+    assert_that(
+        storage_service.profile_picture_filename("user123", io.BytesIO(b"second")),
+        is_not(equal_to(filename)),
+    )
 
 
 def test_can_upload_a_profile_picture_for_a_user():
     user_id = "user123"
-    file = MagicMock()
+    file = io.BytesIO(b"fake image data")
 
-    with patch("src.storage_service.get_s3_resource") as mock_get_s3_resource:
+    with patch("src.storage_service.get_s3_client") as mock_get_s3_client:
         mock_s3_resource = MagicMock()
-        mock_get_s3_resource.return_value = mock_s3_resource
+        mock_get_s3_client.return_value = mock_s3_resource
 
         storage_service.upload_profile_picture(user_id, file)
 
         mock_s3_resource.upload_fileobj.assert_called_once_with(
             file,
             settings.r2_profile_picture_bucket_name,
-            "05db73715990652447f1476a4f3b99c1.png",
+            f"{USER_HASH}-{_digest(b'fake image data')}.png",
         )
 
 
@@ -84,8 +171,7 @@ def test_use_local_storage_returns_false_when_cloudflare_configured():
 def test_upload_profile_picture_creates_directory_and_writes_file_locally():
     user_id = "user123"
     file_content = b"fake image data"
-    file = MagicMock()
-    file.read.return_value = file_content
+    file = io.BytesIO(file_content)
 
     with tempfile.TemporaryDirectory() as tmpdir:
         test_uploads_dir = Path(tmpdir) / "uploads" / "profile_pictures"
@@ -93,7 +179,7 @@ def test_upload_profile_picture_creates_directory_and_writes_file_locally():
             with patch("src.storage_service.settings.cloudflare_account_id", ""):
                 filename = storage_service.upload_profile_picture(user_id, file)
 
-                expected_filename = "05db73715990652447f1476a4f3b99c1.png"
+                expected_filename = f"{USER_HASH}-{_digest(file_content)}.png"
                 assert_that(filename, equal_to(expected_filename))
                 assert_that(test_uploads_dir.exists(), equal_to(True))
                 expected_filepath = test_uploads_dir / expected_filename
@@ -131,3 +217,14 @@ def test_get_profile_picture_raises_error_when_file_not_found():
                     lambda: storage_service.get_profile_picture(filename),
                     raises(FileNotFoundError),
                 )
+
+
+def test_delete_profile_picture_removes_local_file(tmp_path):
+    (tmp_path / "old.png").write_bytes(b"old")
+
+    with patch("src.storage_service.LOCAL_UPLOADS_DIR", tmp_path):
+        with patch("src.storage_service.settings.cloudflare_account_id", ""):
+            storage_service.delete_profile_picture("old.png")
+            storage_service.delete_profile_picture("old.png")
+
+    assert_that((tmp_path / "old.png").exists(), equal_to(False))
@@ -141,8 +141,10 @@ def test_redirect_for_unauthenticated(test_client: TestClient):
     return_value=JSONResponse({"message": "Dashboard"}),
 )
 def test_can_get_profile_picture_from_storage(mock_controller, test_client: TestClient):
-    test_client.get("/profile-picture/filename.png")
-    mock_controller.assert_called_once_with("filename.png")
+    test_client.get(
+        "/profile-picture/filename.png", headers={"If-None-Match": '"filename"'}
+    )
+    mock_controller.assert_called_once_with("filename.png", '"filename"')
 
 
 @patch("src.controller.upload_profile_picture", return_value="filename.png")
@@ -152,6 +154,19 @@ def test_update_profile_picture_for_user(mock_controller, test_client: TestClien
     mock_controller.assert_called_once()
 
 
+@patch("src.controller.storage_service.upload_profile_picture")
+def test_oversized_profile_picture_upload_is_rejected(
+    mock_storage_upload, test_client: TestClient
+):
+    response = test_client.post(
+        "/upload-profile-picture",
+        files={"file": ("avatar.png", b"x" * (3 * 1024 * 1024), "image/png")},
+    )
+
+    assert_that(response.status_code, equal_to(413))
+    mock_storage_upload.assert_not_called()
+
+
 def test_displays_github_oauth_accounts_if_used(test_client, user, session):
     github_oauth_account = OAuthAccount(
         user=user,
@@ -214,7 +229,7 @@ def test_confirm_delete_account_route(mock_confirm_delete_account, user):
     assert_that(response.headers["location"], equal_to("/"))
 
     mock_confirm_delete_account.assert_called_once_with(
-        user, "Found a better alternative", ANY
+        user, "Found a better alternative", ANY, background_tasks=ANY
     )
 
     set_cookie = response.headers.get_list("set-cookie")
@@ -4,11 +4,17 @@ Tests verify that the POST /api/workspaces endpoint correctly creates
 workspaces with required dependencies via the SQLAlchemy event listener.
 """
 
+import uuid
+from unittest.mock import patch
+
+import orjson
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 
-from src.models import User
+from src.config import settings
+from src.models import Initiative, User, Workspace
 from src.roadmap_intelligence.aggregates.prioritized_roadmap import PrioritizedRoadmap
 from src.strategic_planning.aggregates.product_vision import ProductVision
 
@@ -133,3 +139,105 @@ def test_create_workspace_with_minimal_data(test_client: TestClient, session: Se
 
     assert prioritized_roadmap is not None
     assert product_vision is not None
+
+
+def test_create_workspace_from_template_requires_a_template(test_client: TestClient):
+    """Test that creating from a template fails when none is configured."""
+    with patch.object(settings, "workspace_template_id", ""):
+        response = test_client.post(
+            "/api/workspaces/from-template", json={"name": "Demo"}
+        )
+
+    assert response.status_code == 400
+
+
+def test_create_workspace_from_template_copies_the_template(
+    test_client: TestClient, session: Session, other_user: User
+):
+    """Test that the new workspace is a copy of the template workspace."""
+    template = Workspace(name="Template", user_id=other_user.id)
+    session.add(template)
+    session.flush()
+    session.add(
+        Initiative(
+            title="Onboarding",
+            description="",
+            workspace_id=template.id,
+            user_id=other_user.id,
+        )
+    )
+    session.commit()
+
+    with patch.object(settings, "workspace_template_id", str(template.id)):
+        response = test_client.post(
+            "/api/workspaces/from-template", json={"name": "Demo"}
+        )
+
+    assert response.status_code == 200
+    workspace_id = response.json()["id"]
+    titles = [
+        i.title for i in session.query(Initiative).filter_by(workspace_id=workspace_id)
+    ]
+    assert titles == ["Onboarding"]
+
+
+def test_export_workspace_streams_ndjson(test_client: TestClient, workspace: Workspace):
+    """Test that a workspace export streams one JSON document per line."""
+    response = test_client.get(f"/api/workspaces/{workspace.id}/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [orjson.loads(line) for line in response.content.splitlines()]
+    assert lines[0]["workspace_id"] == str(workspace.id)
+    assert lines[1] == {"table": "workspace", "row": lines[1]["row"]}
+
+
+def test_export_workspace_of_another_user_is_not_found(
+    test_client: TestClient, session: Session, other_user: User
+):
+    """Test that users cannot export workspaces they do not own."""
+    other_workspace = Workspace(name="Other", user_id=other_user.id)
+    session.add(other_workspace)
+    session.commit()
+
+    response = test_client.get(f"/api/workspaces/{other_workspace.id}/export")
+
+    assert response.status_code == 404
+
+
+def test_import_workspace_restores_a_zstd_export(
+    test_client: TestClient, session: Session, user: User, workspace: Workspace
+):
+    """Test that a compressed export can be restored after deletion."""
+    workspace_id = workspace.id
+    export = test_client.get(
+        f"/api/workspaces/{workspace_id}/export", params={"compression": "zstd"}
+    )
+    assert export.headers["content-type"] == "application/zstd"
+    session.execute(delete(Workspace).where(Workspace.id == workspace_id))
+    session.commit()
+
+    response = test_client.post(
+        "/api/workspaces/import",
+        files={"file": ("workspace.ndjson.zst", export.content)},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["id"] == str(workspace_id)
+    assert session.query(Workspace).filter_by(user_id=user.id).count() == 1
+
+
+def test_import_workspace_rejects_a_malformed_export(test_client: TestClient):
+    """Test that an export with missing keys is a bad request, not a crash."""
+    header = (
+        b'{"format": "openbacklog.workspace", "version": 1, '
+        b'"workspace_id": "' + str(uuid.uuid4()).encode() + b'"}\n'
+    )
+
+    response = test_client.post(
+        "/api/workspaces/import",
+        files={"file": ("workspace.ndjson", header + b'{"table": "workspace"}\n')},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Malformed export")
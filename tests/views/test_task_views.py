@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 from hamcrest import assert_that, equal_to, has_entries, has_items, is_, none, not_
 from sqlalchemy.orm import Session
 
+from src.initiative_management.task_controller import TaskController
 from src.main import app
 from src.models import (
     ChecklistItem,
@@ -366,6 +367,49 @@ class TestTaskViews:
             before_id=None,
         )
 
+    def test_move_tasks_to_status(
+        self, client, user, workspace, session, test_initiative
+    ):
+        controller = TaskController(session)
+        tasks = [
+            controller.create_task(
+                title=f"Task {i}",
+                user_id=user.id,
+                workspace_id=workspace.id,
+                initiative_id=test_initiative.id,
+            )
+            for i in range(2)
+        ]
+
+        response = client.put(
+            "/api/tasks/status",
+            json={
+                "task_ids": [str(task.id) for task in tasks],
+                "new_status": "DONE",
+            },
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            [(t["id"], t["status"]) for t in response.json()],
+            equal_to([(str(task.id), "DONE") for task in tasks]),
+        )
+
+    def test_move_tasks_to_status_not_found(self, client, user):
+        response = client.put(
+            "/api/tasks/status",
+            json={"task_ids": [str(uuid.uuid4())], "new_status": "DONE"},
+        )
+
+        assert_that(response.status_code, equal_to(404))
+
+    def test_move_tasks_to_status_requires_tasks(self, client, user):
+        response = client.put(
+            "/api/tasks/status", json={"task_ids": [], "new_status": "DONE"}
+        )
+
+        assert_that(response.status_code, equal_to(422))
+
     @patch("src.views.task_views.TaskController")
     def test_move_task_to_status_not_found(self, mock_task_controller, client, user):
         from src.initiative_management.task_controller import TaskNotFoundError